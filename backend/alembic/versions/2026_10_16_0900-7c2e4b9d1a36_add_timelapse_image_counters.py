@@ -0,0 +1,56 @@
+"""add_timelapse_image_counters
+
+Revision ID: 7c2e4b9d1a36
+Revises: 39d14c373e84
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e4b9d1a36'
+down_revision: Union[str, None] = '39d14c373e84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Counters maintained by the image insert/delete statements
+    op.add_column('timelapses', sa.Column('flagged_image_count', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('timelapses', sa.Column('total_image_bytes', sa.BigInteger(), nullable=False, server_default='0'))
+    op.add_column('timelapses', sa.Column('first_capture_at', sa.DateTime(), nullable=True))
+
+    # Backfill all counters (image_count was never maintained before)
+    op.execute(
+        """
+        UPDATE timelapses t SET
+            image_count = COALESCE(agg.image_count, 0),
+            flagged_image_count = COALESCE(agg.flagged_image_count, 0),
+            total_image_bytes = COALESCE(agg.total_image_bytes, 0),
+            first_capture_at = agg.first_capture_at,
+            last_capture_at = GREATEST(t.last_capture_at, agg.last_capture_at)
+        FROM timelapses t2
+        LEFT JOIN (
+            SELECT
+                timelapse_id,
+                COUNT(*) AS image_count,
+                COUNT(*) FILTER (WHERE is_flagged) AS flagged_image_count,
+                COALESCE(SUM(file_size), 0) AS total_image_bytes,
+                MIN(captured_at) AS first_capture_at,
+                MAX(captured_at) AS last_capture_at
+            FROM images
+            GROUP BY timelapse_id
+        ) agg ON agg.timelapse_id = t2.id
+        WHERE t.id = t2.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('timelapses', 'first_capture_at')
+    op.drop_column('timelapses', 'total_image_bytes')
+    op.drop_column('timelapses', 'flagged_image_count')
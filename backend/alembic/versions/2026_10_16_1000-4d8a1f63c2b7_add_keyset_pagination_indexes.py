@@ -0,0 +1,38 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 4d8a1f63c2b7
+Revises: 7c2e4b9d1a36
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8a1f63c2b7'
+down_revision: Union[str, None] = '7c2e4b9d1a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination seeks on (captured_at, id) / (timestamp, id) within a filter
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_images_timelapse_captured_id "
+        "ON images (timelapse_id, captured_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_images_camera_captured_id "
+        "ON images (camera_id, captured_at DESC, id DESC)"
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_logs_timestamp_id '
+        'ON logs ("timestamp" DESC, id DESC)'
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_logs_timestamp_id")
+    op.execute("DROP INDEX IF EXISTS idx_images_camera_captured_id")
+    op.execute("DROP INDEX IF EXISTS idx_images_timelapse_captured_id")
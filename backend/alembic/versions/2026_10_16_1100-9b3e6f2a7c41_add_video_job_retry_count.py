@@ -0,0 +1,30 @@
+"""add_video_job_retry_count
+
+Revision ID: 9b3e6f2a7c41
+Revises: 4d8a1f63c2b7
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e6f2a7c41'
+down_revision: Union[str, None] = '4d8a1f63c2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Job claiming counts visibility-timeout reclaims against retry_count,
+    # which thumbnail and overlay jobs already carry
+    op.add_column(
+        "video_generation_jobs",
+        sa.Column("retry_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("video_generation_jobs", "retry_count")
@@ -0,0 +1,35 @@
+"""add_video_job_updated_at
+
+Revision ID: 2f7a9c4e8b15
+Revises: 9b3e6f2a7c41
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2f7a9c4e8b15'
+down_revision: Union[str, None] = '9b3e6f2a7c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Video workers heartbeat updated_at while rendering; job claiming
+    # measures the visibility timeout of processing jobs from it
+    op.add_column(
+        "video_generation_jobs",
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("video_generation_jobs", "updated_at")
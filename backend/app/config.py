@@ -96,6 +96,16 @@ class Settings(BaseSettings):
         """Thumbnails subdirectory path"""
         return str(self.data_path / "thumbnails")
 
+    @property
+    def video_segments_directory(self) -> str:
+        """Encoded video segment cache path"""
+        return str(self.data_path / "video_segments")
+
+    @property
+    def overlay_backfill_directory(self) -> str:
+        """Overlay backfill checkpoint path"""
+        return str(self.data_path / "overlay_backfill")
+
     @property
     def logs_directory(self) -> str:
         """Logs subdirectory path"""
@@ -140,12 +150,30 @@ class Settings(BaseSettings):
         le=20,
         description="Maximum concurrent capture operations",
     )
+    max_concurrent_captures_per_host: int = Field(
+        default=2,
+        ge=1,
+        le=20,
+        description="Maximum concurrent capture operations against one camera host",
+    )
+    capture_start_jitter_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=30.0,
+        description="Maximum random delay applied before a scheduled capture starts",
+    )
     health_check_interval: int = Field(
         default=120,
         ge=30,
         le=3600,
         description="Health check interval in seconds",
     )
+    health_check_max_concurrent: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum camera connectivity probes running at once in a health sweep",
+    )
 
     # Video generation
     video_generation_max_concurrent: int = Field(
@@ -154,6 +182,23 @@ class Settings(BaseSettings):
     video_generation_timeout_minutes: int = Field(
         default=30, ge=5, le=180, description="Video generation timeout in minutes"
     )
+    video_segment_cache_enabled: bool = Field(
+        default=True,
+        description="Render videos from cached segments, re-encoding only new frames",
+    )
+    video_segment_frame_count: int = Field(
+        default=240, ge=24, le=10000, description="Frames per cached video segment"
+    )
+    video_encode_max_parallel_chunks: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Maximum concurrent encoder processes per video (0 = derive from CPU cores)",
+    )
+    video_overlay_streaming_enabled: bool = Field(
+        default=True,
+        description="Draw overlays while encoding instead of reading pre-rendered overlay images",
+    )
 
     # Logging
     log_level: LogLevel = Field(
@@ -130,6 +130,14 @@ ALL_ALLOWED_EXTENSIONS: Set[str] = (
     ALLOWED_IMAGE_EXTENSIONS | ALLOWED_VIDEO_EXTENSIONS | ALLOWED_ARCHIVE_EXTENSIONS
 )
 
+# Already-compressed media is stored in ZIP exports without deflating it again
+ZIP_STORED_EXTENSIONS: Set[str] = (
+    ALLOWED_IMAGE_EXTENSIONS | ALLOWED_VIDEO_EXTENSIONS | ALLOWED_ARCHIVE_EXTENSIONS
+)
+
+# File bytes read per write while streaming a ZIP export
+ZIP_STREAM_CHUNK_SIZE = 1024 * 1024  # 1MB
+
 # ====================================================================
 # SIZE CONSTANTS
 # ====================================================================
@@ -195,6 +203,8 @@ MAX_PAGE_SIZE = 1000
 MAX_BULK_OPERATION_ITEMS = 1000
 DEFAULT_CAMERA_IMAGES_LIMIT = 10
 DEFAULT_TIMELAPSE_IMAGES_LIMIT = 10000
+VIDEO_FRAME_MANIFEST_FETCH_SIZE = 2000  # Rows per server-side cursor fetch
+IMAGE_EXPORT_FETCH_SIZE = 500  # Rows per server-side cursor fetch for ZIP exports
 
 # ====================================================================
 # CACHE CONSTANTS
@@ -571,6 +581,11 @@ DEFAULT_CAPTURE_GRACE_PERIOD_SECONDS = 5
 # Exponential backoff base (seconds)
 RETRY_BACKOFF_BASE = 2
 
+# In-memory handoff of decoded capture frames to downstream processing
+CAPTURED_FRAME_CACHE_MAX_ENTRIES = 8  # Recent frames kept decoded in memory
+CAPTURED_FRAME_CACHE_TTL_SECONDS = 120  # Long enough for queued thumbnail jobs
+CAPTURED_FRAME_DOWNSCALED_SIZE = (800, 600)  # Matches the small image bounds
+
 # ====================================================================
 # TIMEZONE CONSTANTS
 # ====================================================================
@@ -806,6 +821,11 @@ OVERLAY_QUEUE_SIZE_LOW_THRESHOLD = 8  # Reduced threshold for better responsiven
 OVERLAY_PROCESSING_TIME_WARNING_MS = 5000
 OVERLAY_MEMORY_WARNING_THRESHOLD = 100  # MB
 OVERLAY_CONCURRENT_JOBS = 4  # Increased from 3 for better concurrency
+OVERLAY_RENDER_PLAN_CACHE_MAX_ENTRIES = 32  # Compiled overlay plans kept in memory
+OVERLAY_BACKFILL_MAX_PROCESSES = 4  # Render processes for bulk overlay regeneration
+OVERLAY_BACKFILL_SHARD_SIZE = 25  # Images rendered per process task
+OVERLAY_BACKFILL_PAGE_SIZE = 200  # Images per checkpointed page and batched DB write
+OVERLAY_BACKFILL_PROGRESS_INTERVAL_SECONDS = 5  # Min gap between progress events
 
 # Overlay types
 OVERLAY_TYPE_DATE = "date"
@@ -850,6 +870,10 @@ TIMELAPSE_ACTIONS = [
 MAX_SETTING_KEY_LENGTH = 255
 MAX_SETTING_VALUE_LENGTH = 1000
 
+# Settings snapshot (LISTEN/NOTIFY invalidation)
+SETTINGS_NOTIFY_CHANNEL = "settings_changed"  # Payload is the changed key or "*"
+SETTINGS_LISTENER_RECONNECT_SECONDS = 5  # Delay before re-establishing LISTEN
+
 # ====================================================================
 # VIDEO AUTOMATION CONSTANTS
 # ====================================================================
@@ -894,6 +918,14 @@ DEFAULT_IMAGE_EXTENSION = ".jpg"
 DEFAULT_CORRUPTION_SCORE = 100
 DEFAULT_IS_FLAGGED = False
 
+# RTSP session pool (persistent per-camera stream connections)
+RTSP_SESSION_IDLE_TIMEOUT_SECONDS = 900  # Close sessions unused for 15 minutes
+RTSP_SESSION_KEEPALIVE_SECONDS = 45  # Re-validate sessions older than this on use
+RTSP_SESSION_MAX_AGE_SECONDS = 3600  # Reopen sessions after 1 hour to reset decoders
+RTSP_SESSION_MAX_SESSIONS = 64  # Upper bound on concurrently open streams
+RTSP_SESSION_MAX_DRAIN_FRAMES = 30  # Max buffered frames discarded per grab
+RTSP_SESSION_LIVE_FRAME_THRESHOLD_SECONDS = 0.02  # Grab slower than this = live frame
+
 # RTSP connection messages
 CAMERA_CONNECTION_SUCCESS = "Connection successful"
 CAMERA_CONNECTION_FAILED = "Connection failed"
@@ -916,6 +948,13 @@ JOB_PRIORITY_HIGH = JobPriority.HIGH
 JOB_PRIORITY_MEDIUM = JobPriority.MEDIUM
 JOB_PRIORITY_LOW = JobPriority.LOW
 
+# Job claiming (SKIP LOCKED) and queue wake-ups
+JOB_QUEUE_NOTIFY_CHANNEL = "job_queue"  # Payload is the job table name
+JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS = 600  # Older processing jobs are reclaimed
+VIDEO_JOB_VISIBILITY_GRACE_SECONDS = 600  # Added to the video generation timeout
+DEFAULT_VIDEO_JOB_MAX_RETRIES = 3  # Reclaims before a video job is failed
+JOB_QUEUE_LISTENER_RECONNECT_SECONDS = 10  # Delay before re-establishing LISTEN
+
 
 # =============================================================================
 # SSE (SERVER-SENT EVENTS) CONSTANTS
@@ -926,3 +965,14 @@ JOB_PRIORITY_LOW = JobPriority.LOW
 SSE_SOURCE_WORKER = "worker"
 SSE_SOURCE_API = "api"
 SSE_SOURCE_SCHEDULER = "scheduler"
+
+# SSE broker (LISTEN/NOTIFY fan-out)
+SSE_NOTIFY_CHANNEL = "sse_events"  # Postgres channel notified on every event insert
+SSE_BROKER_SUBSCRIBER_QUEUE_SIZE = 256  # Events queued per client before dropping it
+SSE_BROKER_REPLAY_BUFFER_SIZE = 1000  # Recent events kept for Last-Event-ID resume
+SSE_BROKER_FETCH_BATCH_SIZE = 200  # Max events loaded per notification
+SSE_BROKER_RECONNECT_DELAY_SECONDS = 5  # Delay before re-establishing LISTEN
+SSE_BROKER_REPLAY_MAX_AGE_MINUTES = 60  # Oldest events replayed on resume
+SSE_BROKER_GAP_GRACE_SECONDS = 60  # How long a skipped event ID is re-queried
+SSE_BROKER_MAX_PENDING_GAPS = 1000  # Skipped event IDs tracked at most
+SSE_HEARTBEAT_INTERVAL_SECONDS = 15  # Heartbeat sent to idle clients
@@ -0,0 +1,171 @@
+# backend/app/database/bulk_copy.py
+"""
+Bulk ingestion through COPY ... FROM STDIN (FORMAT BINARY).
+
+Append-only tables (logs, SSE events, corruption logs) are written in
+batches whose rows nobody reads back. A multi-row INSERT ... RETURNING * has
+to be parsed, planned and echoed back row by row; binary COPY streams the
+rows in PostgreSQL's wire format and returns nothing, which is several times
+cheaper per row for large batches.
+
+Each table is described once by a CopyTable: the target columns and their
+PostgreSQL type names. Binary COPY has no server-side casts, so the declared
+types must match the column types exactly.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+Row = Sequence[Any]
+
+
+@dataclass(frozen=True)
+class CopyTable:
+    """Target of a binary COPY: table, columns and their PostgreSQL types."""
+
+    table: str
+    columns: Tuple[str, ...]
+    types: Tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        if len(self.columns) != len(self.types):
+            raise ValueError(
+                f"COPY into {self.table}: {len(self.columns)} columns "
+                f"but {len(self.types)} types"
+            )
+
+
+LOGS_COPY_TABLE = CopyTable(
+    table="logs",
+    columns=(
+        "level",
+        "message",
+        "logger_name",
+        "source",
+        "camera_id",
+        "extra_data",
+        "timestamp",
+    ),
+    types=("varchar", "text", "varchar", "text", "int4", "jsonb", "timestamp"),
+)
+
+SSE_EVENTS_COPY_TABLE = CopyTable(
+    table="sse_events",
+    columns=("event_type", "event_data", "priority", "source", "retry_count"),
+    types=("varchar", "jsonb", "varchar", "varchar", "int4"),
+)
+
+CORRUPTION_LOGS_COPY_TABLE = CopyTable(
+    table="corruption_logs",
+    columns=(
+        "camera_id",
+        "image_id",
+        "corruption_score",
+        "fast_score",
+        "heavy_score",
+        "detection_details",
+        "action_taken",
+        "processing_time_ms",
+        "created_at",
+    ),
+    types=(
+        "int4",
+        "int4",
+        "int4",
+        "int4",
+        "int4",
+        "jsonb",
+        "varchar",
+        "int4",
+        "timestamptz",
+    ),
+)
+
+
+def build_copy_query(target: CopyTable) -> str:
+    """
+    Build the COPY statement for a target table.
+
+    Args:
+        target: Table description
+
+    Returns:
+        COPY ... FROM STDIN statement in binary format
+    """
+    columns = ", ".join(f'"{column}"' for column in target.columns)
+    return f"COPY {target.table} ({columns}) FROM STDIN (FORMAT BINARY)"
+
+
+def _naive_timestamp_columns(target: CopyTable) -> Tuple[int, ...]:
+    return tuple(
+        index
+        for index, type_name in enumerate(target.types)
+        if type_name == "timestamp"
+    )
+
+
+def _adapt_row(
+    row: Row, naive_columns: Tuple[int, ...], session_timezone: Optional[tzinfo]
+) -> Row:
+    """
+    Convert aware datetimes bound for timestamp (without time zone) columns.
+
+    An INSERT parameter would be cast by the server into the session time
+    zone; binary COPY sends the raw value, so the same conversion is done
+    here to store identical wall-clock times.
+    """
+    if not naive_columns:
+        return row
+    adapted = list(row)
+    for index in naive_columns:
+        value = adapted[index]
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            adapted[index] = value.astimezone(session_timezone).replace(tzinfo=None)
+    return adapted
+
+
+async def copy_rows(cur: Any, target: CopyTable, rows: Iterable[Row]) -> int:
+    """
+    Stream rows into a table with binary COPY on an async cursor.
+
+    Args:
+        cur: psycopg AsyncCursor (its connection's transaction is used)
+        target: Table description
+        rows: Row tuples in target.columns order; jsonb values as dicts/lists
+
+    Returns:
+        Number of rows copied
+    """
+    naive_columns = _naive_timestamp_columns(target)
+    session_timezone = cur.connection.info.timezone if naive_columns else None
+    count = 0
+    async with cur.copy(build_copy_query(target)) as copy:
+        copy.set_types(list(target.types))
+        for row in rows:
+            await copy.write_row(_adapt_row(row, naive_columns, session_timezone))
+            count += 1
+    return count
+
+
+def copy_rows_sync(cur: Any, target: CopyTable, rows: Iterable[Row]) -> int:
+    """
+    Stream rows into a table with binary COPY on a sync cursor.
+
+    Args:
+        cur: psycopg Cursor (its connection's transaction is used)
+        target: Table description
+        rows: Row tuples in target.columns order; jsonb values as dicts/lists
+
+    Returns:
+        Number of rows copied
+    """
+    naive_columns = _naive_timestamp_columns(target)
+    session_timezone = cur.connection.info.timezone if naive_columns else None
+    count = 0
+    with cur.copy(build_copy_query(target)) as copy:
+        copy.set_types(list(target.types))
+        for row in rows:
+            copy.write_row(_adapt_row(row, naive_columns, session_timezone))
+            count += 1
+    return count
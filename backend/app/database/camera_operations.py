@@ -13,12 +13,13 @@ All operations return proper Pydantic models directly, eliminating Dict[str, Any
 
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 import psycopg
 from pydantic import ValidationError
 
+from ..constants import CAMERA_HEALTH_OFFLINE, CAMERA_HEALTH_ONLINE
 from ..models.camera_model import Camera, ImageForCamera
 from ..models.corruption_model import CorruptionSettingsModel
 from ..models.shared_models import CameraHealthStatus, CameraStatistics
@@ -62,6 +63,19 @@ class CameraQueryBuilder:
         ORDER BY c.id
         """
 
+    @staticmethod
+    def build_capture_success_query():
+        """Build update that records a successful capture and resets failures."""
+        return """
+        UPDATE cameras
+        SET last_capture_at = %(now)s,
+            last_capture_success = true,
+            consecutive_failures = 0,
+            health_status = %(health_status)s,
+            updated_at = %(now_updated)s
+        WHERE id = %(camera_id)s
+        """
+
     @staticmethod
     def build_camera_statistics_query(camera_ids: list):
         """Build optimized query for camera statistics using array aggregation."""
@@ -144,6 +158,53 @@ class CameraQueryBuilder:
         WHERE id = %(camera_id)s
         """
 
+    @staticmethod
+    def build_batch_connectivity_update_query(camera_count: int):
+        """
+        Build one UPDATE applying many connectivity results (VALUES join).
+
+        Only rows whose connectivity changed are written, so a sweep in which
+        nothing changed does not touch updated_at. Returns the updated ids.
+        """
+        values = ", ".join(
+            f"(%(camera_id_{i})s::integer, %(is_connected_{i})s::boolean, "
+            f"%(error_message_{i})s::text)"
+            for i in range(camera_count)
+        )
+        return f"""
+        UPDATE cameras AS c
+        SET is_connected = v.is_connected,
+            last_error = v.error_message,
+            health_status = CASE WHEN v.is_connected
+                THEN %(online)s ELSE %(offline)s END,
+            updated_at = %(now)s
+        FROM (VALUES {values}) AS v(camera_id, is_connected, error_message)
+        WHERE c.id = v.camera_id
+          AND (
+            c.is_connected IS DISTINCT FROM v.is_connected
+            OR c.last_error IS DISTINCT FROM v.error_message
+            OR c.health_status IS DISTINCT FROM
+                CASE WHEN v.is_connected THEN %(online)s ELSE %(offline)s END
+          )
+        RETURNING c.id
+        """
+
+    @staticmethod
+    def get_batch_connectivity_params(
+        updates: List[Tuple[int, bool, Optional[str]]], now: datetime
+    ) -> Dict[str, Any]:
+        """Build named parameters for build_batch_connectivity_update_query()."""
+        params: Dict[str, Any] = {
+            "online": CAMERA_HEALTH_ONLINE,
+            "offline": CAMERA_HEALTH_OFFLINE,
+            "now": now,
+        }
+        for i, (camera_id, is_connected, error_message) in enumerate(updates):
+            params[f"camera_id_{i}"] = camera_id
+            params[f"is_connected_{i}"] = is_connected
+            params[f"error_message_{i}"] = None if is_connected else error_message
+        return params
+
 
 def _prepare_camera_data_shared(
     camera_data: Dict[str, Any], tz: ZoneInfo
@@ -1055,6 +1116,45 @@ class AsyncCameraOperations:
                     return True
                 return False
 
+    async def update_cameras_connectivity(
+        self, updates: List[Tuple[int, bool, Optional[str]]]
+    ) -> List[int]:
+        """
+        Apply connectivity results for many cameras in one statement.
+
+        Args:
+            updates: (camera_id, is_connected, error_message) per camera
+
+        Returns:
+            IDs of cameras whose connectivity changed
+
+        Usage:
+            changed = await db.update_cameras_connectivity([(1, True, None)])
+        """
+        if not updates:
+            return []
+
+        now = utc_now()
+        query = CameraQueryBuilder.build_batch_connectivity_update_query(len(updates))
+        params = CameraQueryBuilder.get_batch_connectivity_params(updates, now)
+
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    rows = await cur.fetchall()
+        except psycopg.Error as e:
+            raise CameraOperationError(
+                f"Failed to update connectivity for {len(updates)} cameras",
+                operation="update_cameras_connectivity",
+                details={"camera_ids": [update[0] for update in updates]},
+            ) from e
+
+        changed_ids = [row["id"] for row in rows]
+        for camera_id in changed_ids:
+            await self._clear_camera_caches(camera_id, updated_at=now)
+        return changed_ids
+
     async def update_camera_capture_stats(
         self,
         camera_id: int,
@@ -1080,15 +1180,7 @@ class AsyncCameraOperations:
 
         if success:
             # Reset consecutive failures and update last success time
-            query = """
-            UPDATE cameras
-            SET last_capture_at = %(now)s,
-                last_capture_success = true,
-                consecutive_failures = 0,
-                health_status = %(health_status)s,
-                updated_at = %(now_updated)s
-            WHERE id = %(camera_id)s
-            """
+            query = CameraQueryBuilder.build_capture_success_query()
             params = {
                 "now": now,
                 "health_status": health_status,
@@ -1655,15 +1747,7 @@ class SyncCameraOperations:
 
         if success:
             # Reset consecutive failures and update last success time
-            query = """
-            UPDATE cameras
-            SET last_capture_at = %(now)s,
-                last_capture_success = true,
-                consecutive_failures = 0,
-                health_status = %(health_status)s,
-                updated_at = %(now_updated)s
-            WHERE id = %(camera_id)s
-            """
+            query = CameraQueryBuilder.build_capture_success_query()
             params = {
                 "now": now,
                 "health_status": health_status,
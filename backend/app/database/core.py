@@ -311,6 +311,36 @@ class SyncDatabaseCore:
             with conn.transaction():
                 yield conn
 
+    @contextmanager
+    def get_pipeline_connection(self) -> Generator[Any, None, None]:
+        """
+        Get a sync database connection in pipeline mode with one transaction.
+
+        BEGIN, the statements executed inside the block and COMMIT are sent
+        without waiting for each other's results; the pipeline is synced once
+        when the transaction commits. Results of cursors created inside the
+        block can be fetched after it exits.
+
+        Yields:
+            Connection: A sync database connection with dict_row factory
+
+        Raises:
+            Exception: If connection pool is not initialized or connection fails
+
+        Usage:
+            with db.get_pipeline_connection() as conn:
+                cur = conn.execute("INSERT ... RETURNING id", params)
+                conn.execute("UPDATE ...", other_params)
+            new_id = cur.fetchone()["id"]
+        """
+        if not self._pool:
+            raise RuntimeError("Database pool not initialized")
+
+        with self._pool.connection() as conn:
+            with conn.pipeline():
+                with conn.transaction():
+                    yield conn
+
 
 # Composition-based database classes for services and routers
 AsyncDatabase = AsyncDatabaseCore
@@ -34,7 +34,9 @@ from ..models.corruption_model import (
 from ..utils.cache_invalidation import CacheInvalidationService
 from ..utils.cache_manager import cache, cached_response, generate_composite_etag
 from ..utils.time_utils import utc_now
+from .bulk_copy import CORRUPTION_LOGS_COPY_TABLE, copy_rows_sync
 from .core import AsyncDatabase, SyncDatabase
+from .exceptions import CorruptionOperationError
 
 
 class CorruptionQueryBuilder:
@@ -120,6 +122,36 @@ class CorruptionQueryBuilder:
             ORDER BY c.last_degraded_at DESC NULLS LAST
         """
 
+    @staticmethod
+    def build_log_detection_query():
+        """Build corruption log insert using named parameters, returning the new row."""
+        return """
+            INSERT INTO corruption_logs (
+                camera_id, image_id, corruption_score, fast_score, heavy_score,
+                detection_details, action_taken, processing_time_ms, created_at
+            ) VALUES (
+                %(camera_id)s, %(image_id)s, %(corruption_score)s, %(fast_score)s, %(heavy_score)s,
+                %(detection_details)s, %(action_taken)s, %(processing_time_ms)s, %(created_at)s
+            ) RETURNING *
+        """
+
+    @staticmethod
+    def build_camera_corruption_stats_query():
+        """Build camera corruption counter update using named parameters."""
+        return """
+            UPDATE cameras
+            SET consecutive_corruption_failures = CASE
+                    WHEN %(is_valid)s THEN 0
+                    ELSE consecutive_corruption_failures + 1
+                END,
+                lifetime_glitch_count = CASE
+                    WHEN NOT %(is_valid)s THEN lifetime_glitch_count + 1
+                    ELSE lifetime_glitch_count
+                END,
+                updated_at = %(now)s
+            WHERE id = %(camera_id)s
+        """
+
     @staticmethod
     def build_quality_stats_query(table_filter: str):
         """Build optimized query for quality statistics using named parameters."""
@@ -773,15 +805,7 @@ class SyncCorruptionOperations:
         Returns:
             Created CorruptionLogEntry model instance
         """
-        query = """
-        INSERT INTO corruption_logs (
-            camera_id, image_id, corruption_score, fast_score, heavy_score,
-            detection_details, action_taken, processing_time_ms, created_at
-        ) VALUES (
-            %(camera_id)s, %(image_id)s, %(corruption_score)s, %(fast_score)s, %(heavy_score)s,
-            %(detection_details)s, %(action_taken)s, %(processing_time_ms)s, %(created_at)s
-        ) RETURNING *
-        """
+        query = CorruptionQueryBuilder.build_log_detection_query()
 
         params = {
             "camera_id": camera_id,
@@ -808,6 +832,49 @@ class SyncCorruptionOperations:
 
                 raise psycopg.DatabaseError("Failed to log corruption detection")
 
+    def log_corruption_detections(self, detections: List[Dict[str, Any]]) -> int:
+        """
+        Log a batch of corruption detection results with binary COPY.
+
+        Args:
+            detections: Dictionaries with the keyword arguments of
+                log_corruption_detection()
+
+        Returns:
+            Number of detections logged
+
+        Raises:
+            CorruptionOperationError: If the batch could not be written
+        """
+        if not detections:
+            return 0
+
+        created_at = utc_now()
+        try:
+            rows = [
+                (
+                    detection["camera_id"],
+                    detection.get("image_id"),
+                    detection["corruption_score"],
+                    detection.get("fast_score"),
+                    detection.get("heavy_score"),
+                    detection["detection_details"],
+                    detection["action_taken"],
+                    detection.get("processing_time_ms"),
+                    created_at,
+                )
+                for detection in detections
+            ]
+
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    return copy_rows_sync(cur, CORRUPTION_LOGS_COPY_TABLE, rows)
+        except (psycopg.Error, KeyError) as e:
+            raise CorruptionOperationError(
+                f"Failed to log {len(detections)} corruption detections",
+                operation="log_corruption_detections",
+            ) from e
+
     def get_camera_corruption_failure_stats(self, camera_id: int) -> Dict[str, Any]:
         """
         Get corruption failure statistics for a camera using optimized query with named parameters.
@@ -1111,19 +1178,7 @@ class SyncCorruptionOperations:
         """
         try:
             # Use single query to handle both valid and invalid cases atomically
-            query = """
-            UPDATE cameras
-            SET consecutive_corruption_failures = CASE
-                    WHEN %(is_valid)s THEN 0
-                    ELSE consecutive_corruption_failures + 1
-                END,
-                lifetime_glitch_count = CASE
-                    WHEN NOT %(is_valid)s THEN lifetime_glitch_count + 1
-                    ELSE lifetime_glitch_count
-                END,
-                updated_at = %(now)s
-            WHERE id = %(camera_id)s
-            """
+            query = CorruptionQueryBuilder.build_camera_corruption_stats_query()
 
             params = {
                 "is_valid": is_valid,
@@ -160,6 +160,12 @@ class ThumbnailOperationError(DatabaseOperationError):
     pass
 
 
+class JobClaimOperationError(DatabaseOperationError):
+    """Job claiming (queue) database operation errors."""
+
+    pass
+
+
 # Convenience mapping for operation types to exception classes
 OPERATION_EXCEPTIONS = {
     "settings": SettingsOperationError,
@@ -6,12 +6,17 @@ injection instead of mixin inheritance, providing type-safe Pydantic model
 interfaces.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import psycopg
 
-from ..constants import DEFAULT_PAGE_SIZE, MAX_BULK_OPERATION_ITEMS
+from ..constants import (
+    DEFAULT_PAGE_SIZE,
+    IMAGE_EXPORT_FETCH_SIZE,
+    MAX_BULK_OPERATION_ITEMS,
+    VIDEO_FRAME_MANIFEST_FETCH_SIZE,
+)
 from ..models.image_model import Image
 from ..utils.cache_invalidation import CacheInvalidationService
 from ..utils.cache_manager import (
@@ -20,6 +25,7 @@ from ..utils.cache_manager import (
     generate_composite_etag,
 )
 from ..utils.database_helpers import DatabaseBusinessLogic
+from ..utils.pagination_helpers import CursorKey
 from ..utils.time_utils import utc_now
 from .core import AsyncDatabase, SyncDatabase
 from .exceptions import ImageOperationError
@@ -76,18 +82,27 @@ class ImageQueryBuilder:
         order_dir: str = "DESC",
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        after: Optional[CursorKey] = None,
+        before: Optional[CursorKey] = None,
     ) -> tuple[str, Dict[str, Any]]:
         """
         Build optimized query for retrieving images using named parameters.
 
+        With a cursor the query pages by keyset on (captured_at, id) instead
+        of OFFSET, so deep pages cost the same as the first. Rows before a
+        cursor are returned nearest-first (reverse listing order); callers
+        flip them.
+
         Args:
             timelapse_id: Optional filter by timelapse ID
             camera_id: Optional filter by camera ID
             include_details: Whether to include JOIN data
-            order_by: Column to order by
+            order_by: Column to order by (forced to captured_at with a cursor)
             order_dir: Sort direction
             limit: Optional limit
-            offset: Optional offset
+            offset: Optional offset (ignored with a cursor)
+            after: Return rows following this (captured_at, id) position
+            before: Return rows preceding this (captured_at, id) position
 
         Returns:
             Tuple of (query_string, named_parameters_dict)
@@ -134,6 +149,22 @@ class ImageQueryBuilder:
             where_clauses.append("i.camera_id = %(camera_id)s")
             params["camera_id"] = camera_id
 
+        cursor = after if after is not None else before
+        if cursor is not None:
+            order_by = "captured_at"
+            offset = None
+            # Rows after the cursor lie further along the listing order;
+            # rows before it are walked backwards from the cursor
+            forward = after is not None
+            comparator = "<" if (order_dir == "DESC") == forward else ">"
+            where_clauses.append(
+                f"(i.captured_at, i.id) {comparator} "
+                "(%(cursor_captured_at)s, %(cursor_id)s)"
+            )
+            params["cursor_captured_at"], params["cursor_id"] = cursor
+            if not forward:
+                order_dir = "ASC" if order_dir == "DESC" else "DESC"
+
         # Build query with named parameters
         query_parts = [
             f"SELECT {', '.join(fields)} FROM {' '.join(['images i'] + joins)}"
@@ -142,7 +173,11 @@ class ImageQueryBuilder:
         if where_clauses:
             query_parts.append(f"WHERE {' AND '.join(where_clauses)}")
 
-        query_parts.append(f"ORDER BY i.{order_by} {order_dir}")
+        if order_by == "captured_at":
+            # id breaks timestamp ties so keyset pages neither skip nor repeat
+            query_parts.append(f"ORDER BY i.captured_at {order_dir}, i.id {order_dir}")
+        else:
+            query_parts.append(f"ORDER BY i.{order_by} {order_dir}")
 
         if limit is not None:
             query_parts.append("LIMIT %(limit)s")
@@ -286,6 +321,288 @@ class ImageQueryBuilder:
         query = " ".join(query_parts)
         return query, params
 
+    @staticmethod
+    def build_video_frames_query(
+        timelapse_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build the ordered frame list query for video generation.
+
+        Selects only the columns a frame manifest and per-frame overlay
+        rendering need, and filters with sargable ranges so
+        idx_images_timelapse_captured serves the query.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            start_date: First capture date to include
+            end_date: Last capture date to include
+            start_day: First day number to include
+            end_day: Last day number to include
+
+        Returns:
+            Tuple of (query_string, named_parameters_dict)
+        """
+        where_clauses = ["timelapse_id = %(timelapse_id)s"]
+        params: Dict[str, Any] = {"timelapse_id": timelapse_id}
+
+        if start_date is not None:
+            where_clauses.append("captured_at >= %(start_date)s")
+            params["start_date"] = start_date
+        if end_date is not None:
+            where_clauses.append("captured_at < %(end_date_exclusive)s")
+            params["end_date_exclusive"] = end_date + timedelta(days=1)
+        if start_day is not None:
+            where_clauses.append("day_number >= %(start_day)s")
+            params["start_day"] = start_day
+        if end_day is not None:
+            where_clauses.append("day_number <= %(end_day)s")
+            params["end_day"] = end_day
+
+        query = f"""
+            SELECT id, camera_id, timelapse_id, file_path, day_number,
+                   overlay_path, has_valid_overlay, overlay_updated_at,
+                   captured_at, created_at, weather_temperature,
+                   weather_conditions, weather_icon, weather_fetched_at
+            FROM images
+            WHERE {' AND '.join(where_clauses)}
+            ORDER BY captured_at ASC, id ASC
+        """
+        return query, params
+
+    @staticmethod
+    def build_export_query(
+        image_ids: Optional[List[int]] = None,
+        timelapse_id: Optional[int] = None,
+        camera_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> tuple[str, Dict[str, Any]]:
+        """
+        Build the ordered image list query for ZIP exports.
+
+        Selects only what an archive entry needs. At least one filter is
+        required so an export never walks the whole table by accident.
+
+        Args:
+            image_ids: Specific images to export
+            timelapse_id: Export the images of one timelapse
+            camera_id: Export the images of one camera
+            start_date: First capture date to include
+            end_date: Last capture date to include
+
+        Returns:
+            Tuple of (query_string, named_parameters_dict)
+
+        Raises:
+            ValueError: If no filter is given
+        """
+        where_clauses = []
+        params: Dict[str, Any] = {}
+
+        if image_ids is not None:
+            where_clauses.append("id = ANY(%(image_ids)s)")
+            params["image_ids"] = list(image_ids)
+        if timelapse_id is not None:
+            where_clauses.append("timelapse_id = %(timelapse_id)s")
+            params["timelapse_id"] = timelapse_id
+        if camera_id is not None:
+            where_clauses.append("camera_id = %(camera_id)s")
+            params["camera_id"] = camera_id
+        if start_date is not None:
+            where_clauses.append("captured_at >= %(start_date)s")
+            params["start_date"] = start_date
+        if end_date is not None:
+            where_clauses.append("captured_at < %(end_date_exclusive)s")
+            params["end_date_exclusive"] = end_date + timedelta(days=1)
+
+        if not where_clauses:
+            raise ValueError("Image export requires at least one filter")
+
+        query = f"""
+            SELECT id, camera_id, timelapse_id, file_path, file_size, captured_at
+            FROM images
+            WHERE {' AND '.join(where_clauses)}
+            ORDER BY captured_at ASC, id ASC
+        """
+        return query, params
+
+    @staticmethod
+    def build_stale_overlay_images_query(count_only: bool = False) -> str:
+        """
+        Build the keyset page query for overlays rendered with an older config.
+
+        Pages are ordered by id and resume after the last id seen, so a
+        backfill can restart from a checkpoint without OFFSET scans.
+
+        Args:
+            count_only: Count the remaining images instead of selecting a page
+
+        Returns:
+            Query string using named parameters (timelapse_id, after_id,
+            config_updated_at and, for pages, limit)
+        """
+        where_clause = """
+            WHERE timelapse_id = %(timelapse_id)s
+              AND id > %(after_id)s
+              AND has_valid_overlay = true
+              AND overlay_updated_at < %(config_updated_at)s
+        """
+        if count_only:
+            return f"SELECT COUNT(*) AS count FROM images {where_clause}"
+        return f"""
+            SELECT * FROM images
+            {where_clause}
+            ORDER BY id ASC
+            LIMIT %(limit)s
+        """
+
+    @staticmethod
+    def build_overlay_status_batch_query() -> str:
+        """
+        Build a single UPDATE that records rendered overlays for many images.
+
+        Image ids and overlay paths are passed as parallel arrays and joined
+        through unnest(), so a batch costs one round trip.
+
+        Returns:
+            Query string using named parameters (image_ids, overlay_paths,
+            overlay_updated_at, updated_at)
+        """
+        return """
+            UPDATE images AS i
+            SET overlay_path = v.overlay_path,
+                has_valid_overlay = true,
+                overlay_updated_at = %(overlay_updated_at)s,
+                updated_at = %(updated_at)s
+            FROM unnest(%(image_ids)s::int[], %(overlay_paths)s::text[])
+                AS v(id, overlay_path)
+            WHERE i.id = v.id
+        """
+
+    @staticmethod
+    def build_record_image_query() -> str:
+        """
+        Build the image insert that also bumps the timelapse counters.
+
+        The counters on timelapses (image_count, flagged_image_count,
+        total_image_bytes, first/last_capture_at) are updated by the same
+        statement, so hot paths can read them instead of COUNT(*) over images.
+
+        Returns:
+            Query string using named parameters, returning the new image row
+        """
+        return """
+        WITH new_image AS (
+            INSERT INTO images (
+                timelapse_id, camera_id, file_path, filename, file_size, captured_at,
+                day_number, thumbnail_path, corruption_detected,
+                corruption_score, is_flagged,
+                weather_temperature, weather_conditions, weather_icon, weather_fetched_at
+            ) VALUES (
+                %(timelapse_id)s, %(camera_id)s, %(file_path)s, %(filename)s, %(file_size)s, %(captured_at)s,
+                %(day_number)s, %(thumbnail_path)s, %(corruption_detected)s,
+                %(corruption_score)s, %(is_flagged)s,
+                %(weather_temperature)s, %(weather_conditions)s, %(weather_icon)s, %(weather_fetched_at)s
+            ) RETURNING *
+        ), counters AS (
+            UPDATE timelapses t SET
+                image_count = t.image_count + 1,
+                flagged_image_count = t.flagged_image_count
+                    + CASE WHEN ni.is_flagged THEN 1 ELSE 0 END,
+                total_image_bytes = t.total_image_bytes + COALESCE(ni.file_size, 0),
+                first_capture_at = LEAST(t.first_capture_at, ni.captured_at),
+                last_capture_at = GREATEST(t.last_capture_at, ni.captured_at)
+            FROM new_image ni
+            WHERE t.id = ni.timelapse_id
+        )
+        SELECT * FROM new_image
+        """
+
+    @staticmethod
+    def build_current_image_id_sql() -> str:
+        """
+        Build the SQL expression for the image id last assigned in this session.
+
+        Statements pipelined behind build_record_image_query() in the same
+        transaction use it to reference the new image without waiting for
+        the RETURNING row.
+
+        Returns:
+            SQL expression evaluating to the new image id
+        """
+        return "currval(pg_get_serial_sequence('images', 'id'))"
+
+    @staticmethod
+    def build_current_image_captured_at_sql() -> str:
+        """
+        Build the SQL expression for the captured_at of the new image.
+
+        Events carry the timestamp as stored by the database, so consumers
+        derive the same ETag from the event as from the image row.
+
+        Returns:
+            SQL expression evaluating to the new image's captured_at
+        """
+        image_id_sql = ImageQueryBuilder.build_current_image_id_sql()
+        return f"(SELECT captured_at FROM images WHERE id = {image_id_sql})"
+
+    @staticmethod
+    def build_delete_images_query(where_clause: str) -> str:
+        """
+        Build an image delete that also decrements the timelapse counters.
+
+        First/last capture times are recomputed from the surviving images of
+        the affected timelapses only (served by idx_images_timelapse_captured).
+
+        Args:
+            where_clause: Filter selecting the images to delete
+
+        Returns:
+            Query string returning a single deleted_count row
+        """
+        return f"""
+        WITH deleted AS (
+            DELETE FROM images
+            WHERE {where_clause}
+            RETURNING id, timelapse_id, is_flagged, file_size
+        ), removed AS (
+            SELECT
+                timelapse_id,
+                COUNT(*) AS image_count,
+                COUNT(*) FILTER (WHERE is_flagged) AS flagged_image_count,
+                COALESCE(SUM(file_size), 0) AS total_image_bytes
+            FROM deleted
+            WHERE timelapse_id IS NOT NULL
+            GROUP BY timelapse_id
+        ), counters AS (
+            UPDATE timelapses t SET
+                image_count = GREATEST(t.image_count - r.image_count, 0),
+                flagged_image_count = GREATEST(
+                    t.flagged_image_count - r.flagged_image_count, 0
+                ),
+                total_image_bytes = GREATEST(
+                    t.total_image_bytes - r.total_image_bytes, 0
+                ),
+                first_capture_at = bounds.first_capture_at,
+                last_capture_at = COALESCE(bounds.last_capture_at, t.last_capture_at)
+            FROM removed r
+            CROSS JOIN LATERAL (
+                SELECT
+                    MIN(i.captured_at) AS first_capture_at,
+                    MAX(i.captured_at) AS last_capture_at
+                FROM images i
+                WHERE i.timelapse_id = r.timelapse_id
+                  AND NOT EXISTS (SELECT 1 FROM deleted d WHERE d.id = i.id)
+            ) bounds
+            WHERE t.id = r.timelapse_id
+        )
+        SELECT COUNT(*) AS deleted_count FROM deleted
+        """
+
 
 class ImageOperations:
     """
@@ -413,6 +730,8 @@ class ImageOperations:
         order_dir: str = "DESC",
         timelapse_id: Optional[int] = None,
         camera_id: Optional[int] = None,
+        after: Optional[CursorKey] = None,
+        before: Optional[CursorKey] = None,
     ) -> List[Image]:
         """
         Retrieve images with pagination, ordering, and optional filtering.
@@ -421,14 +740,16 @@ class ImageOperations:
 
         Args:
             limit: Number of items to return
-            offset: Number of items to skip
+            offset: Number of items to skip (ignored with a cursor)
             order_by: Column to order by
             order_dir: Sort direction (ASC/DESC)
             timelapse_id: Optional filter by timelapse ID
             camera_id: Optional filter by camera ID
+            after: Keyset position (captured_at, id) to page forward from
+            before: Keyset position (captured_at, id) to page backward from
 
         Returns:
-            List of Image model instances
+            List of Image model instances, in listing order
         """
         # Use optimized query builder with named parameters
         query, params = ImageQueryBuilder.build_images_query(
@@ -439,6 +760,8 @@ class ImageOperations:
             order_dir=order_dir,
             limit=limit,
             offset=offset,
+            after=after,
+            before=before,
         )
 
         async with self.db.get_connection() as conn:
@@ -458,6 +781,9 @@ class ImageOperations:
 
                     images.append(base_image)
 
+                if before is not None:
+                    # Rows before a cursor arrive nearest-first
+                    images.reverse()
                 return images
 
     @cached_response(ttl_seconds=300, key_prefix="image")
@@ -469,7 +795,8 @@ class ImageOperations:
         """
         Get total count of images matching the filters.
 
-        Optimized version using ImageQueryBuilder and caching.
+        A timelapse-only filter is served from the timelapse's maintained
+        image counter instead of counting rows.
 
         Args:
             timelapse_id: Optional filter by timelapse ID
@@ -478,6 +805,9 @@ class ImageOperations:
         Returns:
             Total count of matching images
         """
+        if timelapse_id is not None and camera_id is None:
+            return await self.get_image_count_by_timelapse(timelapse_id)
+
         # Use optimized query builder with named parameters
         query, params = ImageQueryBuilder.build_count_query(
             timelapse_id=timelapse_id, camera_id=camera_id
@@ -487,8 +817,7 @@ class ImageOperations:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
                 result = await cur.fetchone()
-                count = result[0] if result else 0
-                return count
+                return result["total"] if result else 0
 
     @cached_response(ttl_seconds=180, key_prefix="image")
     async def get_images_by_timelapse(self, timelapse_id: int) -> List[Image]:
@@ -580,15 +909,15 @@ class ImageOperations:
         Returns:
             Number of images deleted
         """
-        query = """
-        DELETE FROM images
-        WHERE captured_at < %(now)s - INTERVAL %(days)s * INTERVAL '1 day'
-        """
+        query = ImageQueryBuilder.build_delete_images_query(
+            "captured_at < %(now)s - INTERVAL %(days)s * INTERVAL '1 day'"
+        )
         params = {"now": utc_now(), "days": days_to_keep}
         async with self.db.get_connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
-                deleted_count = cur.rowcount or 0
+                result = await cur.fetchone()
+                deleted_count = result["deleted_count"] if result else 0
 
                 # Clear related caches after deletion
                 if deleted_count > 0:
@@ -606,19 +935,7 @@ class ImageOperations:
         Returns:
             Created Image model instance
         """
-        query = """
-        INSERT INTO images (
-            timelapse_id, camera_id, file_path, filename, file_size, captured_at,
-            day_number, thumbnail_path, corruption_detected,
-            corruption_score, is_flagged,
-            weather_temperature, weather_conditions, weather_icon, weather_fetched_at
-        ) VALUES (
-            %(timelapse_id)s, %(camera_id)s, %(file_path)s, %(filename)s, %(file_size)s, %(captured_at)s,
-            %(day_number)s, %(thumbnail_path)s, %(corruption_detected)s,
-            %(corruption_score)s, %(is_flagged)s,
-            %(weather_temperature)s, %(weather_conditions)s, %(weather_icon)s, %(weather_fetched_at)s
-        ) RETURNING *
-        """
+        query = ImageQueryBuilder.build_record_image_query()
 
         async with self.db.get_connection() as conn:
             async with conn.cursor() as cur:
@@ -691,10 +1008,31 @@ class ImageOperations:
                 result = await cur.fetchone()
                 return self._row_to_image(result) if result else None
 
+    async def get_latest_images_by_camera(self) -> List[Image]:
+        """
+        Get the most recent image of every camera in one query.
+
+        DISTINCT ON keeps the first row per camera in (captured_at, id)
+        order, which idx_images_composite serves without a full sort.
+
+        Returns:
+            Latest Image model instance for each camera that has images
+        """
+        query = """
+        SELECT DISTINCT ON (camera_id) *
+        FROM images
+        ORDER BY camera_id, captured_at DESC, id DESC
+        """
+        async with self.db.get_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query)
+                results = await cur.fetchall()
+                return [self._row_to_image(row) for row in results]
+
     @cached_response(ttl_seconds=300, key_prefix="image")
     async def get_image_count_by_timelapse(self, timelapse_id: int) -> int:
         """
-        Get total count of images for a timelapse using named parameters.
+        Get total count of images for a timelapse from its maintained counter.
 
         Args:
             timelapse_id: ID of the timelapse
@@ -702,13 +1040,13 @@ class ImageOperations:
         Returns:
             Total number of images
         """
-        query = "SELECT COUNT(*) FROM images WHERE timelapse_id = %(timelapse_id)s"
+        query = "SELECT image_count FROM timelapses WHERE id = %(timelapse_id)s"
         params = {"timelapse_id": timelapse_id}
         async with self.db.get_connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
                 result = await cur.fetchone()
-                return result[0] if result else 0
+                return result["image_count"] if result else 0
 
     @cached_response(ttl_seconds=60, key_prefix="image")
     async def get_images_without_thumbnails(
@@ -747,12 +1085,13 @@ class ImageOperations:
         Returns:
             True if image was deleted successfully
         """
-        query = "DELETE FROM images WHERE id = %(image_id)s"
+        query = ImageQueryBuilder.build_delete_images_query("id = %(image_id)s")
         params = {"image_id": image_id}
         async with self.db.get_connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
-                success = cur.rowcount > 0
+                result = await cur.fetchone()
+                success = bool(result and result["deleted_count"] > 0)
 
                 # Clear related caches after successful deletion
                 if success:
@@ -770,12 +1109,15 @@ class ImageOperations:
         Returns:
             Number of images deleted
         """
-        query = "DELETE FROM images WHERE timelapse_id = %(timelapse_id)s"
+        query = ImageQueryBuilder.build_delete_images_query(
+            "timelapse_id = %(timelapse_id)s"
+        )
         params = {"timelapse_id": timelapse_id}
         async with self.db.get_connection() as conn:
             async with conn.cursor() as cur:
                 await cur.execute(query, params)
-                deleted_count = cur.rowcount or 0
+                result = await cur.fetchone()
+                deleted_count = result["deleted_count"] if result else 0
 
                 # Clear related caches after deletion
                 if deleted_count > 0:
@@ -848,19 +1190,7 @@ class SyncImageOperations:
         Returns:
             Created Image model instance
         """
-        query = """
-        INSERT INTO images (
-            timelapse_id, camera_id, file_path, filename, file_size, captured_at,
-            day_number, thumbnail_path, corruption_detected,
-            corruption_score, is_flagged,
-            weather_temperature, weather_conditions, weather_icon, weather_fetched_at
-        ) VALUES (
-            %(timelapse_id)s, %(camera_id)s, %(file_path)s, %(filename)s, %(file_size)s, %(captured_at)s,
-            %(day_number)s, %(thumbnail_path)s, %(corruption_detected)s,
-            %(corruption_score)s, %(is_flagged)s,
-            %(weather_temperature)s, %(weather_conditions)s, %(weather_icon)s, %(weather_fetched_at)s
-        ) RETURNING *
-        """
+        query = ImageQueryBuilder.build_record_image_query()
 
         with self.db.get_connection() as conn:
             with conn.cursor() as cur:
@@ -870,7 +1200,7 @@ class SyncImageOperations:
 
     def get_image_count_by_timelapse(self, timelapse_id: int) -> int:
         """
-        Get total count of images for a timelapse using named parameters (sync version).
+        Get total count of images for a timelapse from its maintained counter (sync version).
 
         Args:
             timelapse_id: ID of the timelapse
@@ -878,13 +1208,13 @@ class SyncImageOperations:
         Returns:
             Total number of images
         """
-        query = "SELECT COUNT(*) FROM images WHERE timelapse_id = %(timelapse_id)s"
+        query = "SELECT image_count FROM timelapses WHERE id = %(timelapse_id)s"
         params = {"timelapse_id": timelapse_id}
         with self.db.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params)
                 result = cur.fetchone()
-                return result[0] if result else 0
+                return result["image_count"] if result else 0
 
     def get_images(
         self,
@@ -894,17 +1224,21 @@ class SyncImageOperations:
         order_dir: str = "DESC",
         timelapse_id: Optional[int] = None,
         camera_id: Optional[int] = None,
+        after: Optional[CursorKey] = None,
+        before: Optional[CursorKey] = None,
     ) -> List[Image]:
         """
         Retrieve images with pagination, ordering, and optional filtering (sync version).
 
         Args:
             limit: Number of items to return
-            offset: Number of items to skip
+            offset: Number of items to skip (ignored with a cursor)
             order_by: Column to order by
             order_dir: Sort direction (ASC/DESC)
             timelapse_id: Optional filter by timelapse ID
             camera_id: Optional filter by camera ID
+            after: Keyset position (captured_at, id) to page forward from
+            before: Keyset position (captured_at, id) to page backward from
 
         Returns:
             List of Image model instances
@@ -918,6 +1252,8 @@ class SyncImageOperations:
             order_dir=order_dir,
             limit=limit,
             offset=offset,
+            after=after,
+            before=before,
         )
 
         with self.db.get_connection() as conn:
@@ -942,6 +1278,8 @@ class SyncImageOperations:
 
                     images.append(base_image)
 
+                if before is not None:
+                    images.reverse()
                 return images
 
     def get_images_count(
@@ -1048,6 +1386,51 @@ class SyncImageOperations:
                 results = cur.fetchall()
                 return [self._row_to_image(row) for row in results]
 
+    def iter_video_frames(
+        self,
+        timelapse_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+        fetch_size: int = VIDEO_FRAME_MANIFEST_FETCH_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the ordered frames of a timelapse with a server-side cursor.
+
+        Rows are fetched fetch_size at a time, so memory stays flat no matter
+        how many images the timelapse has. The connection is held until the
+        iterator is exhausted or closed.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            start_date: First capture date to include
+            end_date: Last capture date to include
+            start_day: First day number to include
+            end_day: Last day number to include
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Frame rows (paths, overlay state, capture time and the stored
+            weather used by overlays) in capture order
+        """
+        query, params = ImageQueryBuilder.build_video_frames_query(
+            timelapse_id, start_date, end_date, start_day, end_day
+        )
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor(name=f"video_frames_{timelapse_id}") as cur:
+                    cur.itersize = fetch_size
+                    cur.execute(query, params)
+                    for row in cur:
+                        yield row
+        except psycopg.Error as e:
+            raise ImageOperationError(
+                f"Failed to stream frames for timelapse {timelapse_id}: {e}",
+                operation="iter_video_frames",
+            ) from e
+
     def cleanup_old_images(self, days_to_keep: int) -> int:
         """
         Delete images older than specified days using optimized INTERVAL syntax (sync version).
@@ -1060,15 +1443,15 @@ class SyncImageOperations:
         Returns:
             Number of images deleted
         """
-        query = """
-        DELETE FROM images
-        WHERE captured_at < %(now)s - INTERVAL %(days)s * INTERVAL '1 day'
-        """
+        query = ImageQueryBuilder.build_delete_images_query(
+            "captured_at < %(now)s - INTERVAL %(days)s * INTERVAL '1 day'"
+        )
         params = {"now": utc_now(), "days": days_to_keep}
         with self.db.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, params)
-                return cur.rowcount or 0
+                result = cur.fetchone()
+                return result["deleted_count"] if result else 0
 
     def update_image_thumbnails(
         self, image_id: int, thumbnail_data: Dict[str, Any]
@@ -1139,6 +1522,120 @@ class SyncImageOperations:
                 cur.execute(query, params)
                 return cur.rowcount > 0
 
+    def update_images_overlay_status(
+        self,
+        overlays: List[Tuple[int, str]],
+        overlay_updated_at: datetime,
+    ) -> int:
+        """
+        Record rendered overlays for many images in one statement.
+
+        Args:
+            overlays: (image_id, overlay_path) pairs
+            overlay_updated_at: Timestamp when the overlays were generated
+
+        Returns:
+            Number of images updated
+        """
+        if not overlays:
+            return 0
+
+        params = {
+            "image_ids": [image_id for image_id, _ in overlays],
+            "overlay_paths": [overlay_path for _, overlay_path in overlays],
+            "overlay_updated_at": overlay_updated_at,
+            "updated_at": utc_now(),
+        }
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        ImageQueryBuilder.build_overlay_status_batch_query(), params
+                    )
+                    return cur.rowcount
+        except psycopg.Error as e:
+            raise ImageOperationError(
+                f"Failed to update overlay status for {len(overlays)} images: {e}",
+                operation="update_images_overlay_status",
+            ) from e
+
+    def get_stale_overlay_images(
+        self,
+        timelapse_id: int,
+        config_updated_at: datetime,
+        after_id: int = 0,
+        limit: int = 100,
+    ) -> List[Image]:
+        """
+        Get the next page of images whose overlay predates the current config.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            config_updated_at: When the effective overlay config last changed
+            after_id: Only images with a greater id are returned
+            limit: Maximum number of images
+
+        Returns:
+            Images ordered by id
+        """
+        params = {
+            "timelapse_id": timelapse_id,
+            "config_updated_at": config_updated_at,
+            "after_id": after_id,
+            "limit": limit,
+        }
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        ImageQueryBuilder.build_stale_overlay_images_query(), params
+                    )
+                    return [self._row_to_image(row) for row in cur.fetchall()]
+        except psycopg.Error as e:
+            raise ImageOperationError(
+                f"Failed to get stale overlay images for timelapse {timelapse_id}: {e}",
+                operation="get_stale_overlay_images",
+            ) from e
+
+    def count_stale_overlay_images(
+        self, timelapse_id: int, config_updated_at: datetime, after_id: int = 0
+    ) -> int:
+        """
+        Count images whose overlay predates the current config.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            config_updated_at: When the effective overlay config last changed
+            after_id: Only images with a greater id are counted
+
+        Returns:
+            Number of stale overlays
+        """
+        params = {
+            "timelapse_id": timelapse_id,
+            "config_updated_at": config_updated_at,
+            "after_id": after_id,
+        }
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        ImageQueryBuilder.build_stale_overlay_images_query(
+                            count_only=True
+                        ),
+                        params,
+                    )
+                    result = cur.fetchone()
+                    return result["count"] if result else 0
+        except psycopg.Error as e:
+            raise ImageOperationError(
+                f"Failed to count stale overlay images for timelapse {timelapse_id}: {e}",
+                operation="count_stale_overlay_images",
+            ) from e
+
     def get_image_by_id(self, image_id: int) -> Optional[Image]:
         """Get a specific image by ID using named parameters (sync version)."""
         query = "SELECT * FROM images WHERE id = %(image_id)s"
@@ -1206,7 +1703,7 @@ class SyncImageOperations:
         Args:
             image_id: The ID of the image to delete.
         """
-        query = "DELETE FROM images WHERE id = %(image_id)s"
+        query = ImageQueryBuilder.build_delete_images_query("id = %(image_id)s")
         params = {"image_id": image_id}
         with self.db.get_connection() as conn:
             with conn.cursor() as cur:
@@ -1335,6 +1832,51 @@ class AsyncImageOperations(ImageOperations):
                 results = await cur.fetchall()
                 return [self._row_to_image_with_details(dict(row)) for row in results]
 
+    async def iter_export_images(
+        self,
+        image_ids: Optional[List[int]] = None,
+        timelapse_id: Optional[int] = None,
+        camera_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        fetch_size: int = IMAGE_EXPORT_FETCH_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the images of an export with a server-side cursor.
+
+        Rows are fetched fetch_size at a time, so memory stays flat no matter
+        how many images match. The connection is held until the iterator is
+        exhausted or closed.
+
+        Args:
+            image_ids: Specific images to export
+            timelapse_id: Export the images of one timelapse
+            camera_id: Export the images of one camera
+            start_date: First capture date to include
+            end_date: Last capture date to include
+            fetch_size: Rows fetched per round trip
+
+        Yields:
+            Image rows (id, camera_id, timelapse_id, file_path, file_size,
+            captured_at) in capture order
+        """
+        query, params = ImageQueryBuilder.build_export_query(
+            image_ids, timelapse_id, camera_id, start_date, end_date
+        )
+
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor(name="image_export") as cur:
+                    cur.itersize = fetch_size
+                    await cur.execute(query, params)
+                    async for row in cur:
+                        yield row
+        except psycopg.Error as e:
+            raise ImageOperationError(
+                f"Failed to stream images for export: {e}",
+                operation="iter_export_images",
+            ) from e
+
     async def get_images_by_cameras(
         self, camera_ids: List[int], limit: int = MAX_BULK_OPERATION_ITEMS
     ) -> List[Image]:
@@ -0,0 +1,244 @@
+# backend/app/database/job_claim_operations.py
+"""
+Job Claim Operations - Shared atomic job claiming for all job queue tables.
+
+Responsibilities:
+- Claim pending jobs with UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)
+  so concurrent workers (threads, processes or hosts) never claim the same job
+- Reclaim jobs whose worker died (processing for longer than the visibility timeout,
+  measured from updated_at on tables whose workers heartbeat it), counting each
+  reclaim as a retry and failing jobs that used up their retries
+- NOTIFY idle workers when a job is enqueued
+
+Every job table shares the same shape: status, priority, created_at, started_at,
+completed_at, error_message, retry_count.
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Tuple
+
+import psycopg
+
+from ..constants import (
+    DEFAULT_OVERLAY_MAX_RETRIES,
+    DEFAULT_THUMBNAIL_MAX_RETRIES,
+    DEFAULT_VIDEO_JOB_MAX_RETRIES,
+    JOB_QUEUE_NOTIFY_CHANNEL,
+)
+from ..enums import JobStatus
+from ..utils.time_utils import utc_now
+from .core import AsyncDatabase, SyncDatabase
+from .exceptions import JobClaimOperationError
+
+
+class JobClaimQueryBuilder:
+    """Centralized query builder for job claiming.
+
+    IMPORTANT: For optimal performance, ensure these indexes exist:
+    - CREATE INDEX idx_{table}_status ON {table}(status);
+    - CREATE INDEX idx_{table}_processing_started ON {table}(started_at) WHERE status = 'processing';
+    """
+
+    # Allowed job tables, mapped to whether they carry an updated_at column
+    CLAIMABLE_JOB_TABLES = {
+        "thumbnail_generation_jobs": False,
+        "overlay_generation_jobs": False,
+        "video_generation_jobs": True,
+    }
+
+    # Retries (failed attempts and reclaims) allowed per job table
+    MAX_RETRIES = {
+        "thumbnail_generation_jobs": DEFAULT_THUMBNAIL_MAX_RETRIES,
+        "overlay_generation_jobs": DEFAULT_OVERLAY_MAX_RETRIES,
+        "video_generation_jobs": DEFAULT_VIDEO_JOB_MAX_RETRIES,
+    }
+
+    RETRIES_EXHAUSTED_MESSAGE = "Worker timed out and retries are exhausted"
+
+    @staticmethod
+    def _validate_table_name(table_name: str) -> str:
+        """Validate table name to prevent SQL injection."""
+        if table_name not in JobClaimQueryBuilder.CLAIMABLE_JOB_TABLES:
+            raise ValueError(
+                f"Invalid job table: {table_name}. Must be one of: "
+                f"{sorted(JobClaimQueryBuilder.CLAIMABLE_JOB_TABLES)}"
+            )
+        return table_name
+
+    @staticmethod
+    def build_claim_jobs_query(table_name: str) -> str:
+        """
+        Build the atomic claim query using named parameters.
+
+        Claims pending jobs that are due (created_at <= now; delayed retries
+        move created_at into the future) plus processing jobs whose
+        visibility timeout expired, highest priority and oldest first.
+        Tables with updated_at measure the timeout from the last heartbeat
+        instead of the claim time.
+
+        A reclaim counts as a retry. Expired jobs that already used
+        max_retries are marked failed in the same statement and are not
+        returned, so a job that keeps killing its worker is not reclaimed
+        forever.
+        """
+        validated_table = JobClaimQueryBuilder._validate_table_name(table_name)
+        has_updated_at = JobClaimQueryBuilder.CLAIMABLE_JOB_TABLES[validated_table]
+        updated_at = ", updated_at = %(now)s" if has_updated_at else ""
+        last_alive = "updated_at" if has_updated_at else "started_at"
+        priority_order = """
+            CASE priority
+                WHEN 'high' THEN 1
+                WHEN 'medium' THEN 2
+                WHEN 'low' THEN 3
+                ELSE 4
+            END
+        """
+        reclaimed = "status = %(processing)s"
+        exhausted = f"({reclaimed} AND retry_count >= %(max_retries)s)"
+        return f"""
+            WITH claimed AS (
+                UPDATE {validated_table}
+                SET status = CASE WHEN {exhausted}
+                        THEN %(failed)s ELSE %(processing)s END,
+                    retry_count = CASE WHEN {reclaimed} AND retry_count < %(max_retries)s
+                        THEN retry_count + 1 ELSE retry_count END,
+                    error_message = CASE WHEN {exhausted}
+                        THEN %(exhausted_message)s ELSE error_message END,
+                    completed_at = CASE WHEN {exhausted}
+                        THEN %(now)s ELSE completed_at END,
+                    started_at = CASE WHEN {exhausted}
+                        THEN started_at ELSE %(now)s END{updated_at}
+                WHERE id IN (
+                    SELECT id
+                    FROM {validated_table}
+                    WHERE (status = %(pending)s AND created_at <= %(now)s)
+                        OR (status = %(processing)s AND {last_alive} < %(visibility_cutoff)s)
+                    ORDER BY {priority_order}, created_at ASC
+                    LIMIT %(limit)s
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING *
+            )
+            SELECT * FROM claimed
+            WHERE status = %(processing)s
+            ORDER BY {priority_order}, created_at ASC
+        """
+
+    @staticmethod
+    def build_claim_params(
+        table_name: str, batch_size: int, visibility_timeout_seconds: int
+    ) -> Dict[str, Any]:
+        """Build parameters for the claim query."""
+        validated_table = JobClaimQueryBuilder._validate_table_name(table_name)
+        now = utc_now()
+        return {
+            "pending": JobStatus.PENDING,
+            "processing": JobStatus.PROCESSING,
+            "failed": JobStatus.FAILED,
+            "now": now,
+            "visibility_cutoff": now - timedelta(seconds=visibility_timeout_seconds),
+            "max_retries": JobClaimQueryBuilder.MAX_RETRIES[validated_table],
+            "exhausted_message": JobClaimQueryBuilder.RETRIES_EXHAUSTED_MESSAGE,
+            "limit": batch_size,
+        }
+
+    @staticmethod
+    def build_notify_query() -> str:
+        """Build query that wakes LISTENing workers once the insert commits."""
+        return "SELECT pg_notify(%s, %s)"
+
+    @staticmethod
+    def get_notify_params(table_name: str) -> Tuple[str, str]:
+        """Get NOTIFY parameters for a job table."""
+        return (
+            JOB_QUEUE_NOTIFY_CHANNEL,
+            JobClaimQueryBuilder._validate_table_name(table_name),
+        )
+
+
+class JobClaimOperations:
+    """
+    Async atomic job claiming shared by all job queues.
+    """
+
+    def __init__(self, db: AsyncDatabase) -> None:
+        """Initialize with async database instance."""
+        self.db = db
+
+    async def claim_jobs(
+        self,
+        table_name: str,
+        batch_size: int,
+        visibility_timeout_seconds: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically claim up to batch_size jobs and mark them processing.
+
+        Args:
+            table_name: Job table to claim from
+            batch_size: Maximum number of jobs to claim
+            visibility_timeout_seconds: Processing jobs older than this are reclaimed
+
+        Returns:
+            Claimed job rows (already in 'processing' status)
+        """
+        try:
+            query = JobClaimQueryBuilder.build_claim_jobs_query(table_name)
+            params = JobClaimQueryBuilder.build_claim_params(
+                table_name, batch_size, visibility_timeout_seconds
+            )
+
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, params)
+                    return [dict(row) for row in await cur.fetchall()]
+
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise JobClaimOperationError(
+                f"Failed to claim jobs from {table_name}: {e}",
+                operation="claim_jobs",
+            ) from e
+
+
+class SyncJobClaimOperations:
+    """
+    Sync atomic job claiming shared by all job queues (worker processes).
+    """
+
+    def __init__(self, db: SyncDatabase) -> None:
+        """Initialize with sync database instance."""
+        self.db = db
+
+    def claim_jobs(
+        self,
+        table_name: str,
+        batch_size: int,
+        visibility_timeout_seconds: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Atomically claim up to batch_size jobs and mark them processing.
+
+        Args:
+            table_name: Job table to claim from
+            batch_size: Maximum number of jobs to claim
+            visibility_timeout_seconds: Processing jobs older than this are reclaimed
+
+        Returns:
+            Claimed job rows (already in 'processing' status)
+        """
+        try:
+            query = JobClaimQueryBuilder.build_claim_jobs_query(table_name)
+            params = JobClaimQueryBuilder.build_claim_params(
+                table_name, batch_size, visibility_timeout_seconds
+            )
+
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return [dict(row) for row in cur.fetchall()]
+
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise JobClaimOperationError(
+                f"Failed to claim jobs from {table_name}: {e}",
+                operation="claim_jobs",
+            ) from e
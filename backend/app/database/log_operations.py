@@ -20,7 +20,9 @@ from ..constants import DEFAULT_CORRUPTION_HISTORY_HOURS, DEFAULT_LOG_RETENTION_
 from ..models.log_model import Log, LogCreate
 from ..utils.cache_invalidation import CacheInvalidationService
 from ..utils.cache_manager import cache, cached_response, generate_composite_etag
+from ..utils.pagination_helpers import CursorKey, encode_cursor
 from ..utils.time_utils import utc_now
+from .bulk_copy import LOGS_COPY_TABLE, copy_rows, copy_rows_sync
 from .core import AsyncDatabase, SyncDatabase
 from .exceptions import LogOperationError
 
@@ -28,12 +30,14 @@ from .exceptions import LogOperationError
 class PaginationInfo(TypedDict):
     """Pagination metadata structure."""
 
-    current_page: int
+    current_page: Optional[int]
     page_size: int
-    total_count: int
-    total_pages: int
+    total_count: Optional[int]
+    total_pages: Optional[int]
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
 
 
 class LogsWithPagination(TypedDict):
@@ -43,11 +47,30 @@ class LogsWithPagination(TypedDict):
     pagination: PaginationInfo
 
 
+def _log_copy_rows(
+    log_entries: List[LogCreate], timestamp: datetime
+) -> List[Tuple[Any, ...]]:
+    """Rows for COPY into logs, in LOGS_COPY_TABLE column order."""
+    return [
+        (
+            log_entry.level.upper(),
+            log_entry.message,
+            log_entry.logger_name or "system",
+            log_entry.source or "system",
+            log_entry.camera_id,
+            log_entry.extra_data or None,
+            timestamp,
+        )
+        for log_entry in log_entries
+    ]
+
+
 class LogQueryBuilder:
     """Centralized query builder for log operations.
 
     IMPORTANT: For optimal performance, ensure these indexes exist:
     - CREATE INDEX idx_logs_timestamp ON logs(timestamp DESC);
+    - CREATE INDEX idx_logs_timestamp_id ON logs(timestamp DESC, id DESC);
     - CREATE INDEX idx_logs_camera_id ON logs(camera_id) WHERE camera_id IS NOT NULL;
     - CREATE INDEX idx_logs_level ON logs(level);
     - CREATE INDEX idx_logs_source ON logs(source);
@@ -57,12 +80,24 @@ class LogQueryBuilder:
 
     @staticmethod
     def build_filtered_logs_query(
-        where_conditions: List[str], with_count: bool = False
+        where_conditions: List[str],
+        with_count: bool = False,
+        use_offset: bool = True,
+        reverse: bool = False,
     ):
-        """Build optimized query for filtered logs with optional count."""
+        """Build optimized query for filtered logs with optional count.
+
+        Rows are ordered newest first with id as a tiebreak, so keyset pages
+        (use_offset=False, cursor predicate in where_conditions) are stable.
+        reverse flips the order for pages fetched backwards.
+        """
         where_clause = (
             "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
         )
+        direction = "ASC" if reverse else "DESC"
+        limit_clause = (
+            "LIMIT %(limit)s OFFSET %(offset)s" if use_offset else "LIMIT %(limit)s"
+        )
 
         if with_count:
             # Combined query for both data and count
@@ -81,12 +116,11 @@ class LogQueryBuilder:
                 )
                 SELECT
                     fl.*,
-                    lc.total_count,
-                    ROW_NUMBER() OVER (ORDER BY fl.timestamp DESC) as row_num
+                    lc.total_count
                 FROM filtered_logs fl
                 CROSS JOIN log_count lc
-                ORDER BY fl.timestamp DESC
-                LIMIT %(limit)s OFFSET %(offset)s
+                ORDER BY fl.timestamp {direction}, fl.id {direction}
+                {limit_clause}
             """
         else:
             # Simple data query without count
@@ -97,10 +131,18 @@ class LogQueryBuilder:
                 FROM logs l
                 LEFT JOIN cameras c ON l.camera_id = c.id
                 {where_clause}
-                ORDER BY l.timestamp DESC
-                LIMIT %(limit)s OFFSET %(offset)s
+                ORDER BY l.timestamp {direction}, l.id {direction}
+                {limit_clause}
             """
 
+    @staticmethod
+    def build_logs_count_query(where_conditions: List[str]):
+        """Build count query for filtered logs."""
+        where_clause = (
+            "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        )
+        return f"SELECT COUNT(*) as total_count FROM logs l {where_clause}"
+
     @staticmethod
     def build_camera_logs_query():
         """Build optimized query for camera-specific logs."""
@@ -174,11 +216,16 @@ class LogOperations:
         end_date: Optional[datetime] = None,
         page: int = 1,
         page_size: int = 25,
+        after: Optional[CursorKey] = None,
+        before: Optional[CursorKey] = None,
+        include_total: bool = False,
     ) -> LogsWithPagination:
         """
         Get logs with pagination and filtering.
 
         Uses 10s caching for brief caching to help with rapid pagination.
+        With after/before the page is found by seeking on (timestamp, id)
+        instead of OFFSET, and the total is only counted when requested.
 
         Args:
             camera_id: Filter by camera ID
@@ -187,8 +234,11 @@ class LogOperations:
             search_query: Search in message content
             start_date: Filter by start date
             end_date: Filter by end date
-            page: Page number (1-based)
+            page: Page number (1-based), ignored with a cursor
             page_size: Number of logs per page
+            after: Return logs older than this (timestamp, id) key
+            before: Return logs newer than this (timestamp, id) key
+            include_total: Count matching logs for cursor pages
 
         Returns:
             Dictionary with logs, pagination info, and metadata
@@ -235,6 +285,11 @@ class LogOperations:
 
         # Remove manual caching - now handled by @cached_response decorator
 
+        if after is not None or before is not None:
+            return await self._get_logs_by_cursor(
+                where_conditions, params, page_size, after, before, include_total
+            )
+
         params.update({"limit": page_size, "offset": offset})
 
         # Use optimized query builder that combines count and data in single query
@@ -259,6 +314,8 @@ class LogOperations:
                                 "total_pages": 0,
                                 "has_next": False,
                                 "has_prev": page > 1,
+                                "next_cursor": None,
+                                "prev_cursor": None,
                             },
                         }
                     else:
@@ -276,6 +333,12 @@ class LogOperations:
                                 "total_pages": total_pages,
                                 "has_next": page < total_pages,
                                 "has_prev": page > 1,
+                                "next_cursor": (
+                                    encode_cursor(logs[-1].timestamp, logs[-1].id)
+                                    if page < total_pages
+                                    else None
+                                ),
+                                "prev_cursor": None,
                             },
                         }
 
@@ -286,6 +349,90 @@ class LogOperations:
                 operation="get_logs",
             )
 
+    async def _get_logs_by_cursor(
+        self,
+        where_conditions: List[str],
+        params: Dict[str, Any],
+        page_size: int,
+        after: Optional[CursorKey],
+        before: Optional[CursorKey],
+        include_total: bool,
+    ) -> LogsWithPagination:
+        """Get one keyset page of logs; an extra row tells whether more follow."""
+        forward = after is not None
+        cursor = cast(CursorKey, after if forward else before)
+
+        count_query = LogQueryBuilder.build_logs_count_query(where_conditions)
+        query = LogQueryBuilder.build_filtered_logs_query(
+            where_conditions
+            + [
+                "(l.timestamp, l.id) "
+                f"{'<' if forward else '>'} (%(cursor_timestamp)s, %(cursor_id)s)"
+            ],
+            use_offset=False,
+            reverse=not forward,
+        )
+        query_params = {
+            **params,
+            "cursor_timestamp": cursor[0],
+            "cursor_id": cursor[1],
+            "limit": page_size + 1,
+        }
+
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, query_params)
+                    rows = await cur.fetchall()
+
+                    total_count = None
+                    if include_total:
+                        await cur.execute(count_query, params)
+                        count_row = await cur.fetchone()
+                        total_count = count_row["total_count"] if count_row else 0
+        except (psycopg.Error, KeyError, ValueError, json.JSONDecodeError):
+            raise LogOperationError(
+                "Failed to retrieve logs",
+                operation="get_logs",
+            )
+
+        has_more = len(rows) > page_size
+        logs = [self._row_to_log_with_count(row) for row in rows[:page_size]]
+        if not forward:
+            # Fetched oldest-first from the cursor; present newest first
+            logs.reverse()
+        has_next = has_more if forward else True
+        has_prev = True if forward else has_more
+
+        return cast(
+            LogsWithPagination,
+            {
+                "logs": logs,
+                "pagination": {
+                    "current_page": None,
+                    "page_size": page_size,
+                    "total_count": total_count,
+                    "total_pages": (
+                        (total_count + page_size - 1) // page_size
+                        if total_count is not None
+                        else None
+                    ),
+                    "has_next": has_next,
+                    "has_prev": has_prev,
+                    "next_cursor": (
+                        encode_cursor(logs[-1].timestamp, logs[-1].id)
+                        if has_next and logs
+                        else None
+                    ),
+                    "prev_cursor": (
+                        encode_cursor(logs[0].timestamp, logs[0].id)
+                        if has_prev and logs
+                        else None
+                    ),
+                },
+            },
+        )
+
     async def add_log_entry(
         self,
         level: str,
@@ -413,6 +560,37 @@ class LogOperations:
                 "Failed to bulk create log entries", operation="bulk_create_logs"
             )
 
+    async def copy_logs(self, log_entries: List[LogCreate]) -> int:
+        """
+        Write a batch of log entries with binary COPY.
+
+        Unlike bulk_create_logs nothing is returned or parsed back, which
+        makes this the cheap path for the batching log handler.
+
+        Args:
+            log_entries: List of LogCreate model instances
+
+        Returns:
+            Number of log entries written
+        """
+        if not log_entries:
+            return 0
+
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    count = await copy_rows(
+                        cur, LOGS_COPY_TABLE, _log_copy_rows(log_entries, utc_now())
+                    )
+
+            await self._clear_log_caches()
+            return count
+        except psycopg.Error:
+            raise LogOperationError(
+                f"Failed to copy {len(log_entries)} log entries",
+                operation="copy_logs",
+            )
+
     @cached_response(ttl_seconds=30, key_prefix="log")
     async def get_camera_logs(
         self, camera_id: int, hours: int = DEFAULT_CORRUPTION_HISTORY_HOURS
@@ -657,6 +835,31 @@ class SyncLogOperations:
                 },
             )
 
+    def copy_logs(self, log_entries: List[LogCreate]) -> int:
+        """
+        Write a batch of log entries with binary COPY.
+
+        Args:
+            log_entries: List of LogCreate model instances
+
+        Returns:
+            Number of log entries written
+        """
+        if not log_entries:
+            return 0
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    return copy_rows_sync(
+                        cur, LOGS_COPY_TABLE, _log_copy_rows(log_entries, utc_now())
+                    )
+        except psycopg.Error:
+            raise LogOperationError(
+                f"Failed to copy {len(log_entries)} log entries",
+                operation="copy_logs",
+            )
+
     def cleanup_old_logs(self, days_to_keep: int = DEFAULT_LOG_RETENTION_DAYS) -> int:
         """
         Clean up old log entries.
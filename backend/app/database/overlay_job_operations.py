@@ -16,6 +16,7 @@ import psycopg
 from ..constants import (
     DEFAULT_OVERLAY_JOB_BATCH_SIZE,
     DEFAULT_OVERLAY_MAX_RETRIES,
+    JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS,
     OVERLAY_JOB_RETRY_DELAYS,
 )
 from ..enums import JobStatus
@@ -29,8 +30,15 @@ from ..utils.cache_manager import cache, cached_response, generate_composite_eta
 from ..utils.time_utils import utc_now
 from .core import AsyncDatabase, SyncDatabase
 from .exceptions import OverlayOperationError
+from .job_claim_operations import (
+    JobClaimOperations,
+    JobClaimQueryBuilder,
+    SyncJobClaimOperations,
+)
 from .recovery_operations import RecoveryOperations, SyncRecoveryOperations
 
+OVERLAY_JOB_TABLE = "overlay_generation_jobs"
+
 
 class OverlayJobQueryBuilder:
     """Centralized query builder for overlay job operations.
@@ -171,6 +179,7 @@ class OverlayJobOperations:
         """Initialize with async database instance."""
         self.db = db
         self.recovery_ops = RecoveryOperations(db)
+        self.claim_ops = JobClaimOperations(db)
         self.cache_invalidation = CacheInvalidationService()
 
     async def _clear_overlay_job_caches(
@@ -241,6 +250,11 @@ class OverlayJobOperations:
 
                     row = await cur.fetchone()
                     if row:
+                        # Wake idle workers once the insert commits
+                        await cur.execute(
+                            JobClaimQueryBuilder.build_notify_query(),
+                            JobClaimQueryBuilder.get_notify_params(OVERLAY_JOB_TABLE),
+                        )
                         job = _row_to_overlay_job(dict(row))
                         # Clear related caches after successful creation
                         await self._clear_overlay_job_caches(job.id, job.image_id)
@@ -312,6 +326,37 @@ class OverlayJobOperations:
                 f"Failed to perform operation: {e}", operation="overlay_operation"
             ) from e
 
+    async def claim_jobs(
+        self,
+        limit: int = DEFAULT_OVERLAY_JOB_BATCH_SIZE,
+        visibility_timeout_seconds: int = JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> List[OverlayGenerationJob]:
+        """
+        Atomically claim due jobs for processing (safe across worker processes).
+
+        Claimed jobs are already marked 'processing'. Jobs left in processing
+        longer than the visibility timeout (crashed worker) are claimed again.
+
+        Args:
+            limit: Maximum number of jobs to claim
+            visibility_timeout_seconds: Age after which processing jobs are reclaimed
+
+        Returns:
+            List of claimed jobs ordered by priority then by created_at
+        """
+        try:
+            rows = await self.claim_ops.claim_jobs(
+                OVERLAY_JOB_TABLE, limit, visibility_timeout_seconds
+            )
+            if rows:
+                await self._clear_overlay_job_caches()
+            return [_row_to_overlay_job(row) for row in rows]
+
+        except (KeyError, ValueError) as e:
+            raise OverlayOperationError(
+                f"Failed to claim overlay jobs: {e}", operation="claim_jobs"
+            ) from e
+
     async def update_job_status(
         self,
         job_id: int,
@@ -653,6 +698,7 @@ class SyncOverlayJobOperations:
         """Initialize with sync database instance."""
         self.db = db
         self.recovery_ops = SyncRecoveryOperations(db)
+        self.claim_ops = SyncJobClaimOperations(db)
 
     def create_job(
         self, job_data: OverlayGenerationJobCreate
@@ -678,6 +724,11 @@ class SyncOverlayJobOperations:
 
                     row = cur.fetchone()
                     if row:
+                        # Wake idle workers once the insert commits
+                        cur.execute(
+                            JobClaimQueryBuilder.build_notify_query(),
+                            JobClaimQueryBuilder.get_notify_params(OVERLAY_JOB_TABLE),
+                        )
                         return _row_to_overlay_job(dict(row))
                     return None
 
@@ -705,6 +756,23 @@ class SyncOverlayJobOperations:
                 f"Failed to perform operation: {e}", operation="overlay_operation"
             ) from e
 
+    def claim_jobs(
+        self,
+        limit: int = DEFAULT_OVERLAY_JOB_BATCH_SIZE,
+        visibility_timeout_seconds: int = JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> List[OverlayGenerationJob]:
+        """Atomically claim due overlay jobs for processing (sync)"""
+        try:
+            rows = self.claim_ops.claim_jobs(
+                OVERLAY_JOB_TABLE, limit, visibility_timeout_seconds
+            )
+            return [_row_to_overlay_job(row) for row in rows]
+
+        except (KeyError, ValueError) as e:
+            raise OverlayOperationError(
+                f"Failed to claim overlay jobs: {e}", operation="claim_jobs"
+            ) from e
+
     def mark_job_processing(self, job_id: int) -> bool:
         """Mark job as processing (sync)"""
         try:
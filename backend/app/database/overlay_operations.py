@@ -118,6 +118,35 @@ class OverlayQueryBuilder:
             WHERE timelapse_id = %(timelapse_id)s
         """
 
+    @staticmethod
+    def build_timelapse_overlay_version_query():
+        """Build query for the timestamps that version a timelapse's effective overlay config."""
+        return """
+            SELECT o.enabled, o.preset_id,
+                   o.updated_at AS overlay_updated_at,
+                   p.updated_at AS preset_updated_at
+            FROM timelapse_overlays o
+            LEFT JOIN overlay_presets p ON p.id = o.preset_id
+            WHERE o.timelapse_id = %(timelapse_id)s
+        """
+
+    @staticmethod
+    def build_stale_overlay_timelapses_query():
+        """Build query for enabled timelapses with overlays rendered before their config last changed."""
+        return """
+            SELECT o.timelapse_id
+            FROM timelapse_overlays o
+            LEFT JOIN overlay_presets p ON p.id = o.preset_id
+            WHERE o.enabled = true
+              AND EXISTS (
+                  SELECT 1 FROM images i
+                  WHERE i.timelapse_id = o.timelapse_id
+                    AND i.has_valid_overlay = true
+                    AND i.overlay_updated_at < GREATEST(o.updated_at, p.updated_at)
+              )
+            ORDER BY o.timelapse_id
+        """
+
     @staticmethod
     def build_upsert_timelapse_overlay_query():
         """Build upsert query for timelapse overlay using ON CONFLICT with named parameters."""
@@ -820,6 +849,50 @@ class SyncOverlayOperations:
                 operation="get_timelapse_overlay",
             )
 
+    def get_timelapse_overlay_version(
+        self, timelapse_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the enabled flag and update timestamps of a timelapse overlay and its preset (sync).
+
+        Cheap enough to run per frame; a changed timestamp means the effective
+        configuration must be resolved again.
+        """
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    query = OverlayQueryBuilder.build_timelapse_overlay_version_query()
+                    cur.execute(query, {"timelapse_id": timelapse_id})
+
+                    row = cur.fetchone()
+                    return dict(row) if row else None
+
+        except psycopg.Error:
+            raise OverlayOperationError(
+                "Failed to get timelapse overlay version",
+                operation="get_timelapse_overlay_version",
+            )
+
+    def get_timelapses_with_stale_overlays(self) -> List[int]:
+        """
+        Get timelapses whose existing overlays predate their current config (sync).
+
+        Returns:
+            Timelapse IDs in ascending order
+        """
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    query = OverlayQueryBuilder.build_stale_overlay_timelapses_query()
+                    cur.execute(query)
+                    return [row["timelapse_id"] for row in cur.fetchall()]
+
+        except psycopg.Error:
+            raise OverlayOperationError(
+                "Failed to get timelapses with stale overlays",
+                operation="get_timelapses_with_stale_overlays",
+            )
+
     def get_all_presets(self, include_builtin: bool = True) -> List[OverlayPreset]:
         """Get all overlay presets (sync)"""
         try:
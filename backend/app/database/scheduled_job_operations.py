@@ -150,6 +150,31 @@ class ScheduledJobQueryBuilder:
             WHERE job_id IN ({','.join([f'%(job_id_{i})s' for i in range(job_count)])})
         """
 
+    @staticmethod
+    def build_bulk_timing_update_query():
+        """Build single-statement timing update for many jobs (parallel arrays, NULL = keep)."""
+        return """
+            UPDATE scheduled_jobs AS sj SET
+                next_run_time = COALESCE(v.next_run_time, sj.next_run_time),
+                last_run_time = COALESCE(v.last_run_time, sj.last_run_time),
+                last_success_time = COALESCE(v.last_success_time, sj.last_success_time),
+                last_failure_time = COALESCE(v.last_failure_time, sj.last_failure_time),
+                last_error_message = COALESCE(v.error_message, sj.last_error_message),
+                updated_at = %(updated_at)s
+            FROM unnest(
+                %(job_ids)s::text[],
+                %(next_run_times)s::timestamptz[],
+                %(last_run_times)s::timestamptz[],
+                %(last_success_times)s::timestamptz[],
+                %(last_failure_times)s::timestamptz[],
+                %(error_messages)s::text[]
+            ) AS v(
+                job_id, next_run_time, last_run_time,
+                last_success_time, last_failure_time, error_message
+            )
+            WHERE sj.job_id = v.job_id
+        """
+
 
 class ScheduledJobOperations:
     """
@@ -1049,6 +1074,50 @@ class SyncScheduledJobOperations:
                 operation="scheduled_job_operation",
             )
 
+    def bulk_update_job_timings(self, timings: List[Dict[str, Any]]) -> int:
+        """
+        Update timing information for many jobs with a single statement (sync version).
+
+        Args:
+            timings: One dict per job with job_id and any of next_run_time,
+                last_run_time, last_success_time, last_failure_time and
+                error_message; missing or None fields keep their stored value
+
+        Returns:
+            Number of job rows updated
+        """
+        if not timings:
+            return 0
+
+        try:
+            params = {
+                "updated_at": utc_now(),
+                "job_ids": [timing["job_id"] for timing in timings],
+                "next_run_times": [timing.get("next_run_time") for timing in timings],
+                "last_run_times": [timing.get("last_run_time") for timing in timings],
+                "last_success_times": [
+                    timing.get("last_success_time") for timing in timings
+                ],
+                "last_failure_times": [
+                    timing.get("last_failure_time") for timing in timings
+                ],
+                "error_messages": [timing.get("error_message") for timing in timings],
+            }
+
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        ScheduledJobQueryBuilder.build_bulk_timing_update_query(),
+                        params,
+                    )
+                    return cur.rowcount
+
+        except (psycopg.Error, KeyError, ValueError):
+            raise ScheduledJobOperationError(
+                "Failed to perform operation",
+                operation="scheduled_job_operation",
+            )
+
     def _row_to_scheduled_job(self, row: Dict[str, Any]) -> ScheduledJob:
         """Convert database row to ScheduledJob model."""
         config = json.loads(row["config"]) if row["config"] else {}
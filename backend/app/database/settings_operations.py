@@ -20,6 +20,7 @@ from ..constants import (
     DEFAULT_DEGRADED_MODE_TIME_WINDOW_MINUTES,
     MAX_SETTING_KEY_LENGTH,
     MAX_SETTING_VALUE_LENGTH,
+    SETTINGS_NOTIFY_CHANNEL,
 )
 from ..models.settings_model import Setting
 from ..models.shared_models import CorruptionSettings
@@ -28,7 +29,6 @@ from ..utils.cache_manager import (
     cache,
     cached_response,
     generate_composite_etag,
-    get_setting_cached,
 )
 from ..utils.time_utils import utc_now
 from .core import AsyncDatabase, SyncDatabase
@@ -92,6 +92,28 @@ def _process_corruption_settings_shared(
     return CorruptionSettings.model_validate(result)
 
 
+class SettingsQueryBuilder:
+    """Centralized query builder for settings operations."""
+
+    @staticmethod
+    def build_notify_query() -> str:
+        """Build query that reloads every process's settings snapshot on commit."""
+        return "SELECT pg_notify(%s, %s)"
+
+    @staticmethod
+    def get_notify_params(key: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Get NOTIFY parameters for a settings change.
+
+        Args:
+            key: Changed setting key, or None when several keys changed
+
+        Returns:
+            Channel and payload for build_notify_query()
+        """
+        return (SETTINGS_NOTIFY_CHANNEL, key or "*")
+
+
 class SettingsOperations:
     """Settings database operations using composition pattern."""
 
@@ -142,10 +164,12 @@ class SettingsOperations:
         }
         return Setting(**setting_fields)
 
-    @cached_response(ttl_seconds=300, key_prefix="settings")
     async def get_all_settings(self) -> Dict[str, Any]:
         """
-        Retrieve all settings as a dictionary with sophisticated caching.
+        Retrieve all settings as a dictionary in one query.
+
+        Not cached: this is the load query of the process settings snapshot,
+        which serves repeated reads.
 
         Returns:
             Dictionary containing all settings key-value pairs
@@ -183,20 +207,31 @@ class SettingsOperations:
                 operation="get_all_setting_records",
             ) from e
 
-    @cached_response(ttl_seconds=300, key_prefix="settings")
-    async def get_setting(self, key: str) -> Optional[str]:
+    async def get_setting(
+        self, key: str, default: Optional[str] = None
+    ) -> Optional[str]:
         """
-        Retrieve a specific setting value by key using sophisticated caching.
+        Retrieve a specific setting value by key.
 
         Args:
             key: Setting key to retrieve
+            default: Default value if setting not found
 
         Returns:
-            Setting value, or None if not found
-
-        Note: Uses the sophisticated cache manager's get_setting_cached function
+            Setting value, default value, or None if not found
         """
-        return await get_setting_cached(self, key)
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        "SELECT value FROM settings WHERE key = %s", (key,)
+                    )
+                    results = await cur.fetchall()
+                    return results[0]["value"] if results else default
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise SettingsOperationError(
+                f"Failed to retrieve setting '{key}'", operation="get_setting"
+            ) from e
 
     @cached_response(ttl_seconds=300, key_prefix="settings")
     async def get_setting_record(self, key: str) -> Optional[Setting]:
@@ -251,6 +286,10 @@ class SettingsOperations:
                     """,
                         (key, value, current_time),
                     )
+                    await cur.execute(
+                        SettingsQueryBuilder.build_notify_query(),
+                        SettingsQueryBuilder.get_notify_params(key),
+                    )
 
                     # Clear related caches after successful setting update
                     await self._clear_settings_caches(key, updated_at=current_time)
@@ -291,6 +330,10 @@ class SettingsOperations:
                         for key, value in settings_dict.items()
                     ]
                     await cur.executemany(query, params)
+                    await cur.execute(
+                        SettingsQueryBuilder.build_notify_query(),
+                        SettingsQueryBuilder.get_notify_params(),
+                    )
 
                     # Clear related caches after successful bulk settings update
                     await self._clear_settings_caches(updated_at=current_time)
@@ -318,6 +361,11 @@ class SettingsOperations:
                     affected = cur.rowcount
 
                     if affected and affected > 0:
+                        await cur.execute(
+                            SettingsQueryBuilder.build_notify_query(),
+                            SettingsQueryBuilder.get_notify_params(key),
+                        )
+
                         # Clear related caches after successful deletion
                         await self._clear_settings_caches(key)
                         return True
@@ -491,6 +539,10 @@ class SyncSettingsOperations:
                     """,
                         (key, value, current_time),
                     )
+                    cur.execute(
+                        SettingsQueryBuilder.build_notify_query(),
+                        SettingsQueryBuilder.get_notify_params(key),
+                    )
 
                     return True
         except (psycopg.Error, KeyError, ValueError) as e:
@@ -13,10 +13,12 @@ from typing import Any, Dict, List, Optional
 
 import psycopg
 
+from ..constants import SSE_NOTIFY_CHANNEL
 from ..enums import SSEPriority
 from ..utils.cache_invalidation import CacheInvalidationService
 from ..utils.cache_manager import cache, cached_response, generate_composite_etag
 from ..utils.time_utils import utc_now
+from .bulk_copy import SSE_EVENTS_COPY_TABLE, copy_rows
 from .core import AsyncDatabase, SyncDatabase
 from .exceptions import SSEOperationError
 
@@ -49,6 +51,61 @@ class SSEEventQueryBuilder:
             LIMIT %s
         """
 
+    @staticmethod
+    def build_events_after_query():
+        """Build query for events newer than a known event ID (cursor replay)."""
+        fields = SSEEventQueryBuilder.get_base_select_fields()
+        return f"""
+            SELECT {fields}
+            FROM sse_events
+            WHERE id > %s
+                AND created_at > %s
+            ORDER BY id ASC
+            LIMIT %s
+        """
+
+    @staticmethod
+    def build_last_event_id_query():
+        """Build query for the last event ID assigned in this session."""
+        return "SELECT currval(pg_get_serial_sequence('sse_events', 'id')) AS id"
+
+    @staticmethod
+    def build_notify_query():
+        """Build query that wakes LISTENing SSE brokers once the insert commits."""
+        return "SELECT pg_notify(%s, %s)"
+
+    @staticmethod
+    def build_insert_event_query(computed_fields: Optional[Dict[str, str]] = None):
+        """
+        Build an event insert using named parameters, without RETURNING.
+
+        Args:
+            computed_fields: Extra event_data keys mapped to SQL expressions,
+                e.g. currval() of a row inserted earlier in the same transaction
+
+        Returns:
+            Query string using named parameters (event_type, event_data as
+            JSON text, priority, source)
+        """
+        event_data_sql = "%(event_data)s::jsonb"
+        if computed_fields:
+            pairs = ", ".join(
+                f"'{key}', {expression}" for key, expression in computed_fields.items()
+            )
+            event_data_sql = f"{event_data_sql} || jsonb_build_object({pairs})"
+        return f"""
+            INSERT INTO sse_events (event_type, event_data, priority, source, retry_count)
+            VALUES (%(event_type)s, {event_data_sql}, %(priority)s, %(source)s, 0)
+        """
+
+    @staticmethod
+    def build_notify_last_event_query():
+        """Build query that notifies SSE brokers of the last event inserted in this session."""
+        return (
+            "SELECT pg_notify(%s, "
+            "currval(pg_get_serial_sequence('sse_events', 'id'))::text)"
+        )
+
     @staticmethod
     def build_event_stats_query():
         """Build optimized statistics query using CTEs for better performance."""
@@ -161,6 +218,10 @@ class SSEEventsOperations:
                         event_id = (
                             result["id"] if isinstance(result, dict) else result[0]
                         )
+                        await cur.execute(
+                            SSEEventQueryBuilder.build_notify_query(),
+                            (SSE_NOTIFY_CHANNEL, str(event_id)),
+                        )
                         # logger.debug(
                         #     f"Created SSE event: {event_type} with ID {event_id}",
                         #     emoji=LogEmoji.SUCCESS,
@@ -186,67 +247,54 @@ class SSEEventsOperations:
                 },
             )
 
-    async def create_events_batch(self, events: List[Dict[str, Any]]) -> List[int]:
+    async def create_events_batch(self, events: List[Dict[str, Any]]) -> int:
         """
         Create multiple SSE events in a single transaction for optimal performance.
 
+        Events are streamed with binary COPY; a single notification carrying
+        the batch's highest ID wakes the brokers once the batch commits.
+
         Args:
             events: List of event dictionaries with keys: event_type, event_data, priority, source
 
         Returns:
-            List of created event IDs
+            Number of events created
 
         Raises:
-            Exception: If batch creation fails
+            SSEOperationError: If batch creation fails
         """
         if not events:
-            return []
+            return 0
 
         try:
-            query = """
-                INSERT INTO sse_events (event_type, event_data, priority, source, retry_count)
-                VALUES (%s, %s, %s, %s, %s)
-                RETURNING id
-            """
-
-            # Prepare parameters for batch execution
-            params = []
-            for event in events:
-                params.append(
-                    (
-                        event["event_type"],
-                        json.dumps(event["event_data"]),
-                        event.get("priority", SSEPriority.NORMAL),
-                        event.get("source", "system"),
-                        0,
-                    )
+            rows = [
+                (
+                    event["event_type"],
+                    event["event_data"],
+                    event.get("priority", SSEPriority.NORMAL),
+                    event.get("source", "system"),
+                    0,
                 )
-
-            event_ids = []
+                for event in events
+            ]
 
             async with self.db.get_connection() as conn:
                 async with conn.cursor() as cur:
-                    # Use executemany with returning=True for efficient batch insert
-                    await cur.executemany(query, params, returning=True)
-
-                    # Collect all returned IDs
-                    for result in cur.results():
-                        row = await result.fetchone()
-                        if row:
-                            event_id = row["id"] if isinstance(row, dict) else row[0]
-                            event_ids.append(event_id)
-
-                    if event_ids:
-                        # Clear related caches after successful batch creation
-                        await self._clear_sse_event_caches()
-                        # logger.debug(
-                        #     f"Created {len(event_ids)} SSE events in batch",
-                        #     emoji=LogEmoji.SUCCESS,
-                        # )
+                    count = await copy_rows(cur, SSE_EVENTS_COPY_TABLE, rows)
 
-                    return event_ids
+                    # The session's last sequence value is the batch's highest ID
+                    await cur.execute(SSEEventQueryBuilder.build_last_event_id_query())
+                    row = await cur.fetchone()
+                    await cur.execute(
+                        SSEEventQueryBuilder.build_notify_query(),
+                        (SSE_NOTIFY_CHANNEL, str(row["id"])),
+                    )
 
-        except (psycopg.Error, KeyError, ValueError, json.JSONDecodeError):
+            # Clear related caches after successful batch creation
+            await self._clear_sse_event_caches()
+            return count
+
+        except (psycopg.Error, KeyError, TypeError):
             raise SSEOperationError(
                 f"Failed to create SSE events batch ({len(events)} events)",
                 details={
@@ -315,6 +363,89 @@ class SSEEventsOperations:
                 },
             )
 
+    async def get_events_after(
+        self,
+        after_id: int,
+        limit: int = 100,
+        max_age_minutes: int = 60,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get SSE events with an ID greater than after_id, oldest first.
+
+        Unlike get_pending_events this ignores processed_at, so any number of
+        consumers can read the same events using their own cursor.
+
+        Args:
+            after_id: Last event ID already seen (0 for none)
+            limit: Maximum number of events to return
+            max_age_minutes: Maximum age of events to return
+
+        Returns:
+            List of event dictionaries ordered by ID
+
+        Raises:
+            SSEOperationError: If retrieval fails
+        """
+        try:
+            query = SSEEventQueryBuilder.build_events_after_query()
+            cutoff_time = utc_now() - timedelta(minutes=max_age_minutes)
+
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(query, (after_id, cutoff_time, limit))
+                    rows = await cur.fetchall()
+
+                    return [
+                        {
+                            "id": row["id"],
+                            "type": row["event_type"],
+                            "data": row["event_data"] if row["event_data"] else {},
+                            "timestamp": (
+                                row["created_at"].isoformat()
+                                if row["created_at"]
+                                else None
+                            ),
+                            "priority": row["priority"],
+                            "source": row["source"],
+                        }
+                        for row in rows
+                    ]
+
+        except (psycopg.Error, KeyError, ValueError, json.JSONDecodeError):
+            raise SSEOperationError(
+                f"Failed to get SSE events after ID {after_id}",
+                details={
+                    "operation": "get_events_after",
+                    "after_id": after_id,
+                    "limit": limit,
+                },
+            )
+
+    async def get_latest_event_id(self) -> int:
+        """
+        Get the ID of the newest SSE event.
+
+        Returns:
+            Latest event ID, or 0 if there are no events
+
+        Raises:
+            SSEOperationError: If retrieval fails
+        """
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        "SELECT COALESCE(MAX(id), 0) AS latest_id FROM sse_events"
+                    )
+                    row = await cur.fetchone()
+                    return row["latest_id"] if row else 0
+
+        except (psycopg.Error, KeyError):
+            raise SSEOperationError(
+                "Failed to get latest SSE event ID",
+                details={"operation": "get_latest_event_id"},
+            )
+
     async def mark_events_processed(self, event_ids: List[int]) -> int:
         """
         Mark SSE events as processed (delivered to clients).
@@ -570,6 +701,10 @@ class SyncSSEEventsOperations:
                     result = cur.fetchone()
                     if result:
                         event_id = result["id"]
+                        cur.execute(
+                            SSEEventQueryBuilder.build_notify_query(),
+                            (SSE_NOTIFY_CHANNEL, str(event_id)),
+                        )
                         # logger.debug(
                         #     f"Created SSE event: {event_type} with ID {event_id}",
                         #     emoji=LogEmoji.SUCCESS,
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 
 import psycopg
 
+from ..constants import JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS
 from ..enums import JobStatus
 from ..models.shared_models import ThumbnailGenerationJob, ThumbnailGenerationJobCreate
 from ..utils.cache_invalidation import CacheInvalidationService
@@ -22,8 +23,15 @@ from ..utils.cache_manager import cache, cached_response, generate_composite_eta
 from ..utils.time_utils import utc_now
 from .core import AsyncDatabase, SyncDatabase
 from .exceptions import ThumbnailOperationError
+from .job_claim_operations import (
+    JobClaimOperations,
+    JobClaimQueryBuilder,
+    SyncJobClaimOperations,
+)
 from .recovery_operations import RecoveryOperations, SyncRecoveryOperations
 
+THUMBNAIL_JOB_TABLE = "thumbnail_generation_jobs"
+
 
 class ThumbnailJobQueryBuilder:
     """Centralized query builder for thumbnail job operations."""
@@ -55,6 +63,31 @@ class ThumbnailJobQueryBuilder:
             LIMIT %s
         """
 
+    @staticmethod
+    def build_insert_job_query(image_id_sql: str = "%(image_id)s") -> str:
+        """
+        Build a pending job insert using named parameters.
+
+        Args:
+            image_id_sql: SQL for the image id, e.g. a currval() expression
+                when the image is inserted earlier in the same transaction
+
+        Returns:
+            Query string using named parameters (priority, status, job_type,
+            created_at), returning the new job id
+        """
+        return f"""
+            INSERT INTO thumbnail_generation_jobs
+            (image_id, priority, status, job_type, created_at, retry_count)
+            VALUES ({image_id_sql}, %(priority)s, %(status)s, %(job_type)s, %(created_at)s, 0)
+            RETURNING id
+        """
+
+    @staticmethod
+    def build_current_job_id_sql() -> str:
+        """Build the SQL expression for the job id last assigned in this session."""
+        return "currval(pg_get_serial_sequence('thumbnail_generation_jobs', 'id'))"
+
     @staticmethod
     def build_job_statistics_query():
         """Build optimized statistics query using CTEs for better performance."""
@@ -100,6 +133,7 @@ class ThumbnailJobOperations:
         """Initialize with async database instance."""
         self.db = db
         self.recovery_ops = RecoveryOperations(db)
+        self.claim_ops = JobClaimOperations(db)
         self.cache_invalidation = CacheInvalidationService()
 
     async def _clear_thumbnail_job_caches(
@@ -173,6 +207,12 @@ class ThumbnailJobOperations:
                         ),
                     )
                     result = await cur.fetchone()
+                    if result:
+                        # Wake idle workers once the insert commits
+                        await cur.execute(
+                            JobClaimQueryBuilder.build_notify_query(),
+                            JobClaimQueryBuilder.get_notify_params(THUMBNAIL_JOB_TABLE),
+                        )
 
             if result:
                 job = ThumbnailGenerationJob(**dict(result))
@@ -216,6 +256,37 @@ class ThumbnailJobOperations:
                 f"Failed to get pending jobs: {e}", operation="get_pending_jobs"
             ) from e
 
+    async def claim_jobs(
+        self,
+        batch_size: int = 5,
+        visibility_timeout_seconds: int = JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> List[ThumbnailGenerationJob]:
+        """
+        Atomically claim due jobs for processing (safe across worker processes).
+
+        Claimed jobs are already marked 'processing'. Jobs left in processing
+        longer than the visibility timeout (crashed worker) are claimed again.
+
+        Args:
+            batch_size: Maximum number of jobs to claim
+            visibility_timeout_seconds: Age after which processing jobs are reclaimed
+
+        Returns:
+            List of claimed ThumbnailGenerationJob instances
+        """
+        try:
+            rows = await self.claim_ops.claim_jobs(
+                THUMBNAIL_JOB_TABLE, batch_size, visibility_timeout_seconds
+            )
+            if rows:
+                await self._clear_thumbnail_job_caches()
+            return [ThumbnailGenerationJob(**row) for row in rows]
+
+        except (KeyError, ValueError) as e:
+            raise ThumbnailOperationError(
+                f"Failed to claim jobs: {e}", operation="claim_jobs"
+            ) from e
+
     async def mark_job_started(self, job_id: int) -> bool:
         """
         Mark a job as started (processing).
@@ -724,6 +795,7 @@ class SyncThumbnailJobOperations:
         """Initialize with sync database instance."""
         self.db = db
         self.recovery_ops = SyncRecoveryOperations(db)
+        self.claim_ops = SyncJobClaimOperations(db)
 
     def create_job(
         self, job_data: ThumbnailGenerationJobCreate
@@ -752,6 +824,12 @@ class SyncThumbnailJobOperations:
                         ),
                     )
                     result = cur.fetchone()
+                    if result:
+                        # Wake idle workers once the insert commits
+                        cur.execute(
+                            JobClaimQueryBuilder.build_notify_query(),
+                            JobClaimQueryBuilder.get_notify_params(THUMBNAIL_JOB_TABLE),
+                        )
 
             if result:
                 return ThumbnailGenerationJob(**result)
@@ -792,6 +870,23 @@ class SyncThumbnailJobOperations:
                 f"Failed to perform operation: {e}", operation="thumbnail_operation"
             ) from e
 
+    def claim_jobs(
+        self,
+        batch_size: int = 5,
+        visibility_timeout_seconds: int = JOB_CLAIM_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> List[ThumbnailGenerationJob]:
+        """Synchronous version of claim_jobs."""
+        try:
+            rows = self.claim_ops.claim_jobs(
+                THUMBNAIL_JOB_TABLE, batch_size, visibility_timeout_seconds
+            )
+            return [ThumbnailGenerationJob(**row) for row in rows]
+
+        except (KeyError, ValueError) as e:
+            raise ThumbnailOperationError(
+                f"Failed to claim jobs: {e}", operation="claim_jobs"
+            ) from e
+
     def mark_job_completed(
         self, job_id: int, processing_time_ms: Optional[int] = None
     ) -> bool:
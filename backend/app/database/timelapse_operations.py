@@ -63,31 +63,65 @@ class TimelapseQueryBuilder:
 
     @staticmethod
     def build_timelapses_query(camera_id: Optional[int] = None):
-        """Build optimized query for retrieving timelapses with details."""
+        """
+        Build query for retrieving timelapses with details.
+
+        Image counts and capture bounds come from the counters maintained on
+        timelapses, so no join against images is needed.
+        """
         base_query = """
         SELECT
             t.*,
-            c.name as camera_name,
-            COUNT(i.id) as image_count,
-            COUNT(v.id) as video_count,
-            MIN(i.captured_at) as first_capture_at,
-            MAX(i.captured_at) as last_capture_at,
-            AVG(CASE WHEN i.corruption_score IS NOT NULL THEN i.corruption_score ELSE 100 END) as avg_quality_score,
-            COUNT(CASE WHEN i.is_flagged = true THEN 1 END) as flagged_images,
-            COALESCE(t.glitch_count, 0) as glitch_count
+            c.name as camera_name
         FROM timelapses t
         JOIN cameras c ON t.camera_id = c.id
-        LEFT JOIN images i ON t.id = i.timelapse_id
-        LEFT JOIN videos v ON t.id = v.timelapse_id
         """
 
+        order_by = " ORDER BY t.created_at DESC"
         if camera_id:
-            where_clause = " WHERE t.camera_id = %s"
-            group_by = " GROUP BY t.id, c.name ORDER BY t.created_at DESC"
-            return base_query + where_clause + group_by
-        else:
-            group_by = " GROUP BY t.id, c.name ORDER BY t.created_at DESC"
-            return base_query + group_by
+            return base_query + " WHERE t.camera_id = %s" + order_by
+        return base_query + order_by
+
+    @staticmethod
+    def build_reconcile_image_counters_query(filter_ids: bool = False) -> str:
+        """
+        Build a single UPDATE that resets image counters from the images table.
+
+        Only rows whose counters drifted are written, so a clean run touches
+        nothing and does not bump updated_at.
+        """
+        id_filter = "WHERE t.id = ANY(%(timelapse_ids)s)" if filter_ids else ""
+        return f"""
+        WITH actual AS (
+            SELECT
+                t.id AS timelapse_id,
+                COUNT(i.id) AS image_count,
+                COUNT(i.id) FILTER (WHERE i.is_flagged) AS flagged_image_count,
+                COALESCE(SUM(i.file_size), 0) AS total_image_bytes,
+                MIN(i.captured_at) AS first_capture_at,
+                MAX(i.captured_at) AS last_capture_at
+            FROM timelapses t
+            LEFT JOIN images i ON i.timelapse_id = t.id
+            {id_filter}
+            GROUP BY t.id
+        )
+        UPDATE timelapses t SET
+            image_count = a.image_count,
+            flagged_image_count = a.flagged_image_count,
+            total_image_bytes = a.total_image_bytes,
+            first_capture_at = a.first_capture_at,
+            last_capture_at = COALESCE(a.last_capture_at, t.last_capture_at)
+        FROM actual a
+        WHERE t.id = a.timelapse_id
+          AND (
+              t.image_count, t.flagged_image_count, t.total_image_bytes,
+              t.first_capture_at, t.last_capture_at
+          ) IS DISTINCT FROM (
+              a.image_count, a.flagged_image_count, a.total_image_bytes,
+              a.first_capture_at, COALESCE(a.last_capture_at, t.last_capture_at)
+          )
+        RETURNING t.id
+        """
 
     @staticmethod
     def build_timelapse_statistics_query():
@@ -149,6 +183,34 @@ class TimelapseQueryBuilder:
         CROSS JOIN storage_stats ss
         """
 
+    @staticmethod
+    def build_capture_context_query():
+        """
+        Build single-round-trip query for everything captures need.
+
+        Returns one row per requested timelapse with the timelapse columns,
+        its camera as a JSON object (so the two tables' column names cannot
+        collide) and the requested settings plus all corruption_* settings as
+        a key/value JSON object. The settings are aggregated once per query,
+        however many timelapses are requested.
+        """
+        return """
+        WITH capture_settings AS MATERIALIZED (
+            SELECT COALESCE(jsonb_object_agg(s.key, s.value), '{}'::jsonb) as settings
+            FROM settings s
+            WHERE s.key = ANY(%(setting_keys)s)
+                OR s.key LIKE 'corruption_%%'
+        )
+        SELECT
+            t.*,
+            to_jsonb(c) as camera,
+            cs.settings
+        FROM timelapses t
+        JOIN cameras c ON c.id = t.camera_id
+        CROSS JOIN capture_settings cs
+        WHERE t.id = ANY(%(timelapse_ids)s)
+        """
+
 
 class TimelapseOperations:
     """Async timelapse database operations for FastAPI endpoints."""
@@ -316,24 +378,14 @@ class TimelapseOperations:
         Returns:
             TimelapseWithDetails model instance, or None if not found
         """
-        # Use dedicated query for single timelapse lookup
+        # Counters live on the timelapse row, so this is a single-row lookup
         query = """
         SELECT
             t.*,
-            c.name as camera_name,
-            COUNT(i.id) as image_count,
-            COUNT(v.id) as video_count,
-            MIN(i.captured_at) as first_capture_at,
-            MAX(i.captured_at) as last_capture_at,
-            AVG(CASE WHEN i.corruption_score IS NOT NULL THEN i.corruption_score ELSE 100 END) as avg_quality_score,
-            COUNT(CASE WHEN i.is_flagged = true THEN 1 END) as flagged_images,
-            COALESCE(t.glitch_count, 0) as glitch_count
+            c.name as camera_name
         FROM timelapses t
         JOIN cameras c ON t.camera_id = c.id
-        LEFT JOIN images i ON t.id = i.timelapse_id
-        LEFT JOIN videos v ON t.id = v.timelapse_id
         WHERE t.id = %s
-        GROUP BY t.id, c.name
         """
 
         try:
@@ -352,6 +404,41 @@ class TimelapseOperations:
                 details={"timelapse_id": timelapse_id},
             ) from e
 
+    async def get_capture_context_rows(
+        self, timelapse_ids: List[int], setting_keys: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch timelapses, their cameras and capture settings in one query.
+
+        Args:
+            timelapse_ids: IDs of the timelapses to capture for
+            setting_keys: Settings to include besides the corruption_* settings
+
+        Returns:
+            Raw rows with the timelapse columns plus "camera" (dict) and
+            "settings" (key/value dict); missing timelapses have no row
+        """
+        if not timelapse_ids:
+            return []
+
+        query = TimelapseQueryBuilder.build_capture_context_query()
+
+        try:
+            async with self.db.get_connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(
+                        query,
+                        {"timelapse_ids": timelapse_ids, "setting_keys": setting_keys},
+                    )
+                    results = await cur.fetchall()
+                    return [dict(row) for row in results]
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise TimelapseOperationError(
+                f"Database error getting capture contexts: {e}",
+                operation="get_capture_context_rows",
+                details={"timelapse_ids": timelapse_ids},
+            ) from e
+
     async def create_new_timelapse(
         self, camera_id: int, timelapse_data: TimelapseCreate
     ) -> Timelapse:
@@ -945,6 +1032,38 @@ class SyncTimelapseOperations:
                 details={"timelapse_id": timelapse_id},
             ) from e
 
+    def get_capture_context_row(
+        self, timelapse_id: int, setting_keys: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a timelapse, its camera and capture settings in one query.
+
+        Args:
+            timelapse_id: ID of the timelapse to capture for
+            setting_keys: Settings to include besides the corruption_* settings
+
+        Returns:
+            Raw row with the timelapse columns plus "camera" (dict) and
+            "settings" (key/value dict), or None if the timelapse does not exist
+        """
+        query = TimelapseQueryBuilder.build_capture_context_query()
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        query,
+                        {"timelapse_ids": [timelapse_id], "setting_keys": setting_keys},
+                    )
+                    result = cur.fetchone()
+                    return dict(result) if result else None
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise TimelapseOperationError(
+                f"Database error getting capture context for timelapse {timelapse_id}: {e}",
+                operation="get_capture_context_row",
+                details={"timelapse_id": timelapse_id},
+            ) from e
+
     def update_timelapse_status(self, timelapse_id: int, status: str) -> bool:
         """
         Update timelapse status.
@@ -1130,7 +1249,7 @@ class SyncTimelapseOperations:
 
     def get_timelapse_image_count(self, timelapse_id: int) -> int:
         """
-        Get the current image count for a timelapse.
+        Get the current image count for a timelapse from its maintained counter.
 
         Args:
             timelapse_id: ID of the timelapse
@@ -1138,7 +1257,7 @@ class SyncTimelapseOperations:
         Returns:
             Number of images in the timelapse
         """
-        query = "SELECT COUNT(*) as count FROM images WHERE timelapse_id = %s"
+        query = "SELECT image_count as count FROM timelapses WHERE id = %s"
 
         try:
             with self.db.get_connection() as conn:
@@ -1153,6 +1272,35 @@ class SyncTimelapseOperations:
                 details={"timelapse_id": timelapse_id},
             ) from e
 
+    def reconcile_image_counters(
+        self, timelapse_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        Repair drifted image counters from the images table in one statement.
+
+        Args:
+            timelapse_ids: Limit the repair to these timelapses (all if None)
+
+        Returns:
+            Number of timelapses whose counters were corrected
+        """
+        query = TimelapseQueryBuilder.build_reconcile_image_counters_query(
+            filter_ids=timelapse_ids is not None
+        )
+        params = {"timelapse_ids": timelapse_ids} if timelapse_ids is not None else {}
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    return len(cur.fetchall())
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise TimelapseOperationError(
+                f"Database error reconciling timelapse image counters: {e}",
+                operation="reconcile_image_counters",
+                details={"timelapse_ids": timelapse_ids},
+            ) from e
+
     def get_timelapse_settings(
         self, timelapse_id: int
     ) -> Optional[TimelapseVideoSettings]:
@@ -1339,7 +1487,9 @@ class SyncTimelapseOperations:
         """
         try:
             query = """
-            SELECT id, name, camera_id, status, capture_interval_seconds
+            SELECT id, name, camera_id, status, capture_interval_seconds,
+                   time_window_type, time_window_start, time_window_end,
+                   sunrise_offset_minutes, sunset_offset_minutes
             FROM timelapses
             WHERE status IN ('running', 'paused')
             ORDER BY id
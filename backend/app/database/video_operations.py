@@ -24,8 +24,11 @@ from ..utils.cache_manager import cache, cached_response, generate_composite_eta
 from ..utils.time_utils import utc_now
 from .core import AsyncDatabase, SyncDatabase
 from .exceptions import VideoOperationError
+from .job_claim_operations import JobClaimQueryBuilder, SyncJobClaimOperations
 from .recovery_operations import RecoveryOperations, SyncRecoveryOperations
 
+VIDEO_JOB_TABLE = "video_generation_jobs"
+
 
 class VideoQueryBuilder:
     """Centralized query builder for video operations."""
@@ -518,6 +521,12 @@ class VideoOperations:
                 if results:
                     job = self._row_to_video_generation_job(results[0])
 
+                    # Wake idle workers once the insert commits
+                    await cur.execute(
+                        JobClaimQueryBuilder.build_notify_query(),
+                        JobClaimQueryBuilder.get_notify_params(VIDEO_JOB_TABLE),
+                    )
+
                     # Clear related caches after successful job creation
                     await self._clear_video_caches(
                         timelapse_id=job_data.get("timelapse_id"), updated_at=utc_now()
@@ -746,6 +755,7 @@ class SyncVideoOperations:
         """
         self.db = db
         self.recovery_ops = SyncRecoveryOperations(db)
+        self.claim_ops = SyncJobClaimOperations(db)
 
     def _row_to_video_generation_job_with_details(
         self, row: Dict[str, Any]
@@ -803,6 +813,48 @@ class SyncVideoOperations:
                     for row in results
                 ]
 
+    def claim_next_video_generation_job(
+        self, visibility_timeout_seconds: int
+    ) -> Optional[VideoGenerationJobWithDetails]:
+        """
+        Atomically claim the next due video generation job (highest priority first).
+
+        Safe across worker processes: the job is marked 'processing' in the same
+        statement that selects it. Jobs left processing longer than the
+        visibility timeout (crashed worker) are claimed again.
+
+        Args:
+            visibility_timeout_seconds: Age after which processing jobs are reclaimed
+
+        Returns:
+            Claimed job with timelapse/camera details, or None if the queue is empty
+
+        Usage:
+            job = video_ops.claim_next_video_generation_job(3600)
+        """
+        rows = self.claim_ops.claim_jobs(VIDEO_JOB_TABLE, 1, visibility_timeout_seconds)
+        if not rows:
+            return None
+
+        query = """
+        SELECT
+            vgj.*,
+            t.name as timelapse_name,
+            c.name as camera_name,
+            c.id as camera_id
+        FROM video_generation_jobs vgj
+        JOIN timelapses t ON vgj.timelapse_id = t.id
+        JOIN cameras c ON t.camera_id = c.id
+        WHERE vgj.id = %s
+        """
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (rows[0]["id"],))
+                row = cur.fetchone()
+                if not row:
+                    return None
+                return self._row_to_video_generation_job_with_details(row)
+
     def claim_video_generation_job(self, job_id: int) -> bool:
         """
         Claim a video generation job for processing.
@@ -1057,6 +1109,11 @@ class SyncVideoOperations:
                     result = cur.fetchone()
                     if result:
                         job_id = dict(result)["id"]
+                        # Wake idle workers once the insert commits
+                        cur.execute(
+                            JobClaimQueryBuilder.build_notify_query(),
+                            JobClaimQueryBuilder.get_notify_params(VIDEO_JOB_TABLE),
+                        )
                         conn.commit()
 
                         return job_id
@@ -1484,6 +1541,38 @@ class SyncVideoOperations:
                 details={"job_id": job_id, "status": status},
             ) from e
 
+    def heartbeat_video_generation_job(self, job_id: int) -> Optional[str]:
+        """
+        Record that a video generation job is still being worked on.
+
+        Touches updated_at, which the claim query uses as the job's last sign
+        of life, so long renders are not reclaimed as orphaned.
+
+        Args:
+            job_id: ID of the job being processed
+
+        Returns:
+            Current status of the job (e.g. 'cancelled'), or None if not found
+        """
+        try:
+            query = """
+            UPDATE video_generation_jobs
+            SET updated_at = %s
+            WHERE id = %s
+            RETURNING status
+            """
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (utc_now(), job_id))
+                    row = cur.fetchone()
+                    return row["status"] if row else None
+        except (psycopg.Error, KeyError, ValueError) as e:
+            raise VideoOperationError(
+                f"Error recording video generation job heartbeat: {e}",
+                operation="heartbeat_video_generation_job",
+                details={"job_id": job_id},
+            ) from e
+
     def get_last_scheduled_video(self, timelapse_id: int) -> Optional[Video]:
         """
         Get the most recent video for a timelapse that was triggered by scheduled automation.
@@ -281,6 +281,8 @@ class SSEEvent(str, Enum):
     OVERLAY_GENERATION_STARTED = "overlay_generation_started"
     OVERLAY_GENERATION_COMPLETED = "overlay_generation_completed"
     OVERLAY_GENERATION_FAILED = "overlay_generation_failed"
+    OVERLAY_BACKFILL_PROGRESS = "overlay_backfill_progress"
+    OVERLAY_BACKFILL_COMPLETED = "overlay_backfill_completed"
 
     # Image Service Events
     IMAGE_CREATED = "image_created"
@@ -157,6 +157,28 @@ async def lifespan(_app: FastAPI):
         broadcast_sse=True,
     )
 
+    # Serve settings from a per-process snapshot, reloaded on settings NOTIFY
+    from .services.settings_snapshot import get_settings_snapshot_store
+
+    get_settings_snapshot_store().start(async_db)
+
+    # Start the SSE broker (single LISTEN connection shared by all SSE clients)
+    from .services.sse_broker import get_sse_broker
+
+    await get_sse_broker().start()
+
+    # Seed the latest image registry after the broker so no capture is missed;
+    # if this fails the registry seeds itself on first use
+    from .services.latest_image_registry import get_latest_image_registry
+
+    try:
+        await get_latest_image_registry().seed(async_db)
+    except Exception as e:
+        logger.warning(
+            f"Failed to seed latest image registry: {e}",
+            extra_context={"operation": "latest_image_registry_seed"},
+        )
+
     # ⚠️ IMPORTANT: DO NOT START WORKERS HERE! ⚠️
     # Background workers (ThumbnailWorker, OverlayWorker, CaptureWorker, etc.)
     # are managed by the separate worker.py process. Starting workers here would:
@@ -202,6 +224,10 @@ async def lifespan(_app: FastAPI):
             },
         )
 
+    # Stop SSE broker and settings listener before closing the database
+    await get_sse_broker().stop()
+    await get_settings_snapshot_store().stop()
+
     # Database cleanup
     await async_db.close()
     sync_db.close()
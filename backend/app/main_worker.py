@@ -56,6 +56,7 @@ from .models.health_model import HealthStatus
 # Import necessary services for initialization
 from .services.logger.logger_service import get_service_logger
 from .services.overlay_pipeline.utils.font_cache import preload_overlay_fonts
+from .services.settings_snapshot import get_settings_snapshot_store
 from .utils.time_utils import utc_now
 from .workers.models.main_worker_responses import (
     EcosystemStats,
@@ -64,6 +65,7 @@ from .workers.models.main_worker_responses import (
     WorkerEcosystemStatus,
     WorkerHealthStatus,
 )
+from .workers.utils.job_queue_listener import get_job_queue_listener
 from .workers.utils.worker_status_builder import WorkerStatusBuilder
 
 logger: Optional[Any] = None
@@ -290,6 +292,10 @@ class AsyncTimelapseWorker:
             # Stop all workers
             await self._stop_all_workers()
 
+            # Release the job queue and settings LISTEN connections
+            await get_job_queue_listener().stop()
+            await get_settings_snapshot_store().stop()
+
             # Stop scheduler
             if (
                 hasattr(self.scheduler_worker, "scheduler")
@@ -297,6 +303,9 @@ class AsyncTimelapseWorker:
             ):
                 self.scheduler_worker.stop_scheduler()
 
+            # Release persistent RTSP sessions
+            self.health_worker.rtsp_service.close_all_sessions()
+
             # Close sync database connections
             sync_db.close()
             logger.info(
@@ -371,9 +380,11 @@ class AsyncTimelapseWorker:
         """Capture image from a single camera (delegates to CaptureWorker)."""
         return await self.capture_worker.capture_from_camera(camera_info)
 
-    async def capture_single_timelapse(self, timelapse_id: int):
+    async def capture_single_timelapse(self, timelapse_id: int, capture_context=None):
         """Capture image for a specific timelapse (delegates to CaptureWorker)."""
-        return await self.capture_worker.capture_single_timelapse(timelapse_id)
+        return await self.capture_worker.capture_single_timelapse(
+            timelapse_id, capture_context=capture_context
+        )
 
     async def check_camera_health(self):
         """Check camera health status (delegates to HealthWorker)."""
@@ -662,6 +673,9 @@ class AsyncTimelapseWorker:
                 },
             )
 
+            # Serve settings from a per-process snapshot, reloaded on settings NOTIFY
+            get_settings_snapshot_store().start(async_db)
+
             # Step 2: Start all specialized workers with error handling
             try:
                 await self._start_all_workers()
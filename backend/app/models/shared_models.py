@@ -31,33 +31,36 @@ class ImageStatisticsResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class BulkDownloadResponse(BaseModel):
-    """Response model for bulk image download endpoint"""
-
-    requested_images: int
-    included_images: int
-    filename: str
-    total_size: Optional[int] = None
-    zip_data: Optional[bytes] = None
-    model_config = ConfigDict(from_attributes=True)
-
-
 class PaginatedImagesResponse(BaseModel):
     """Response model for paginated images endpoints"""
 
     images: List["Image"] = Field(
         ..., description="List of images for the current page"
     )
-    total: int = Field(..., description="Total number of images matching the filters")
-    page: int = Field(..., description="Current page number (1-based)")
+    total: Optional[int] = Field(
+        None,
+        description=(
+            "Total number of images matching the filters "
+            "(omitted for cursor pages unless requested)"
+        ),
+    )
+    page: Optional[int] = Field(
+        None, description="Current page number (1-based); None for cursor pages"
+    )
     page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(None, description="Total number of pages")
     has_next: bool = Field(
         ..., description="Whether there are more pages after this one"
     )
     has_previous: bool = Field(
         ..., description="Whether there are pages before this one"
     )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the following page (pass as 'after')"
+    )
+    prev_cursor: Optional[str] = Field(
+        None, description="Cursor for the preceding page (pass as 'before')"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -549,6 +552,18 @@ class CameraLatestImageResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class CameraLatestImagesResponse(BaseModel):
+    """Standardized response for the all-cameras latest image metadata endpoint"""
+
+    success: bool = Field(True, description="Whether the request succeeded")
+    message: str = Field(..., description="Response message")
+    data: List[CameraLatestImageData] = Field(
+        ..., description="Latest image data of every camera that has images"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 # Additional models for RTSPService (consolidated RTSP operations)
 class RTSPCaptureResult(BaseModel):
     """Result of RTSP image capture operation"""
@@ -634,6 +649,7 @@ class CaptureReadinessValidationResult(BaseModel):
     camera: Optional[Any] = None  # Camera model instance
     timelapse: Optional[Any] = None  # Timelapse model instance
     next_capture_time: Optional[datetime] = None
+    capture_context: Optional[Any] = None  # CaptureContext handed to the worker
     # Direct fields for backward compatibility with tests
     camera_id: Optional[int] = None
     timelapse_id: Optional[int] = None
@@ -208,9 +208,13 @@ class Timelapse(TimelapseBase):
             return v
         return str(v)
 
+    # Image counters, maintained by the image insert/delete statements
     image_count: int = 0
+    flagged_image_count: int = 0
+    total_image_bytes: int = 0
     thumbnail_count: int = 0
     small_count: int = 0
+    first_capture_at: Optional[datetime] = None
     last_capture_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
@@ -33,6 +33,7 @@ from ..constants import (
     NO_IMAGES_FOUND,
 )
 from ..dependencies import (
+    AsyncDatabaseDep,
     CameraServiceDep,
     ImageServiceDep,
     SettingsServiceDep,
@@ -54,11 +55,15 @@ from ..models.shared_models import (
     CameraLatestImageData,
     CameraLatestImageMetadata,
     CameraLatestImageResponse,
+    CameraLatestImagesResponse,
     CameraLatestImageUrls,
 )
+from ..services.latest_image_registry import (
+    LatestImageEntry,
+    get_latest_image_registry,
+)
 from ..services.logger import get_service_logger
 from ..utils.cache_manager import (
-    generate_composite_etag,
     generate_content_hash_etag,
     generate_timestamp_etag,
     validate_etag_match,
@@ -85,6 +90,56 @@ logger = get_service_logger(LoggerName.API)
 router = APIRouter(tags=["cameras"])
 
 
+async def _get_latest_image_entry(
+    camera_id: int,
+    camera_service: CameraServiceDep,
+    image_service: ImageServiceDep,
+) -> LatestImageEntry:
+    """
+    Get a camera's latest image from the registry, loading it on a miss.
+
+    Registry hits need no database query, so conditional requests for the
+    latest-image files are answered with a 304 straight from memory.
+
+    Raises:
+        HTTPException: 404 if the camera does not exist or has no images
+    """
+    registry = get_latest_image_registry()
+    entry = registry.get(camera_id)
+    if entry is not None:
+        return entry
+
+    await validate_entity_exists(camera_service.get_camera_by_id, camera_id, "Camera")
+
+    latest_image = await image_service.get_latest_image_for_camera(camera_id)
+    if latest_image is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=NO_IMAGES_FOUND
+        )
+    return registry.record_image(latest_image)
+
+
+def _build_latest_image_data(entry: LatestImageEntry) -> CameraLatestImageData:
+    """Build latest image metadata + URLs from a registry entry."""
+    return CameraLatestImageData(
+        image_id=entry.image_id,
+        captured_at=entry.captured_at.isoformat(),
+        day_number=entry.day_number,
+        timelapse_id=entry.timelapse_id,
+        file_size=entry.file_size,
+        corruption_score=entry.corruption_score,
+        is_flagged=entry.is_flagged,
+        urls=CameraLatestImageUrls(**build_camera_image_urls(entry.camera_id)),
+        metadata=CameraLatestImageMetadata(
+            camera_id=entry.camera_id,
+            has_thumbnail=bool(entry.thumbnail_path),
+            has_small=bool(entry.small_path),
+            thumbnail_size=entry.thumbnail_size,
+            small_size=entry.small_size,
+        ),
+    )
+
+
 # Removed timelapse-stats endpoint per decision: "DEPRECATE BACKEND - Remove broken endpoint"
 # Timelapse statistics are available through the main timelapse endpoints
 
@@ -191,6 +246,41 @@ async def get_cameras(response: Response, camera_service: CameraServiceDep):
     return cameras  # Service returns comprehensive models
 
 
+# ✅ IMPLEMENTED: ETag + 30-second cache for the dashboard grid
+# Registered before /cameras/{camera_id} so the path is not read as an ID
+@router.get("/cameras/latest-images", response_model=CameraLatestImagesResponse)
+@handle_exceptions("get latest images for all cameras")
+async def get_cameras_latest_images(
+    request: Request,
+    response: Response,
+    db: AsyncDatabaseDep,
+):
+    """Get latest image metadata + URLs for every camera in one response"""
+
+    registry = get_latest_image_registry()
+    await registry.ensure_seeded(db)
+    entries = registry.all()
+
+    etag = generate_content_hash_etag({"images": [entry.etag for entry in entries]})
+    cache_control = "public, max-age=30, s-maxage=30"  # 30 seconds
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and validate_etag_match(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+
+    response.headers["Cache-Control"] = cache_control
+    response.headers["ETag"] = etag
+
+    return CameraLatestImagesResponse(
+        success=True,
+        message=f"Latest images retrieved for {len(entries)} cameras",
+        data=[_build_latest_image_data(entry) for entry in entries],
+    )
+
+
 # ✅ IMPLEMENTED: ETag + 5 minute cache for individual camera data
 # ETag = f'"{camera.updated_at.timestamp()}"'
 @router.get("/cameras/{camera_id}", response_model=Camera)
@@ -517,8 +607,11 @@ async def get_camera_latest_image_unified(
             status_code=status.HTTP_404_NOT_FOUND, detail=NO_IMAGES_FOUND
         )
 
+    # Refresh the registry from the row, which also carries variant paths
+    entry = get_latest_image_registry().record_image(latest_image)
+
     # Generate ETag based on image ID and captured timestamp
-    etag = generate_composite_etag(latest_image.id, latest_image.captured_at)
+    etag = entry.etag
 
     # Add cache headers to prevent API flooding with improved ETag
     response.headers["Cache-Control"] = "public, max-age=30, s-maxage=30"  # 30 seconds
@@ -526,31 +619,8 @@ async def get_camera_latest_image_unified(
     response.headers["X-RateLimit-WindowMs"] = "30000"
     response.headers["X-RateLimit-Max"] = "1"
 
-    # Build URLs for image variants using helper
-    url_dict = build_camera_image_urls(camera_id)
-    urls = CameraLatestImageUrls(**url_dict)
-
-    # Build metadata about variants
-    metadata = CameraLatestImageMetadata(
-        camera_id=camera_id,
-        has_thumbnail=bool(getattr(latest_image, "thumbnail_path", None)),
-        has_small=bool(getattr(latest_image, "small_path", None)),
-        thumbnail_size=getattr(latest_image, "thumbnail_size", None),
-        small_size=getattr(latest_image, "small_size", None),
-    )
-
-    # Build core image data
-    image_data = CameraLatestImageData(
-        image_id=latest_image.id,
-        captured_at=latest_image.captured_at.isoformat(),
-        day_number=latest_image.day_number,
-        timelapse_id=latest_image.timelapse_id,
-        file_size=latest_image.file_size,
-        corruption_score=latest_image.corruption_score,
-        is_flagged=latest_image.is_flagged,
-        urls=urls,
-        metadata=metadata,
-    )
+    # Build core image data with variant URLs and metadata
+    image_data = _build_latest_image_data(entry)
 
     # Return proper Pydantic model
     return CameraLatestImageResponse(
@@ -573,17 +643,12 @@ async def serve_camera_latest_image_thumbnail(
 ):
     """Serve latest image thumbnail for a camera (200×150 optimized for dashboard)"""
 
-    # Validate camera exists
-    await validate_entity_exists(camera_service.get_camera_by_id, camera_id, "Camera")
-
-    latest_image = await image_service.get_latest_image_for_camera(camera_id)
-    if latest_image is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=NO_IMAGES_FOUND
-        )
+    latest_image = await _get_latest_image_entry(
+        camera_id, camera_service, image_service
+    )
 
-    # Generate ETag based on image ID and captured timestamp for cache validation
-    etag = generate_composite_etag(latest_image.id, latest_image.captured_at)
+    # ETag based on image ID and captured timestamp for cache validation
+    etag = latest_image.etag
 
     # Check If-None-Match header for 304 Not Modified
     if_none_match = request.headers.get("if-none-match")
@@ -600,7 +665,7 @@ async def serve_camera_latest_image_thumbnail(
     response.headers["ETag"] = etag
 
     return await image_service.serve_image_file(
-        latest_image.id, size_variant="thumbnail"
+        latest_image.image_id, size_variant="thumbnail"
     )
 
 
@@ -617,17 +682,12 @@ async def serve_camera_latest_image_small(
 ):
     """Serve latest image small variant for a camera (800×600 medium quality)"""
 
-    # Validate camera exists
-    await validate_entity_exists(camera_service.get_camera_by_id, camera_id, "Camera")
-
-    latest_image = await image_service.get_latest_image_for_camera(camera_id)
-    if latest_image is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=NO_IMAGES_FOUND
-        )
+    latest_image = await _get_latest_image_entry(
+        camera_id, camera_service, image_service
+    )
 
-    # Generate ETag based on image ID and captured timestamp for better cache validation
-    etag = generate_composite_etag(latest_image.id, latest_image.captured_at)
+    # ETag based on image ID and captured timestamp for better cache validation
+    etag = latest_image.etag
 
     # Check If-None-Match header for 304 Not Modified
     if_none_match = request.headers.get("if-none-match")
@@ -643,7 +703,9 @@ async def serve_camera_latest_image_small(
     response.headers["Cache-Control"] = "public, max-age=300, s-maxage=300"  # 5 minutes
     response.headers["ETag"] = etag
 
-    return await image_service.serve_image_file(latest_image.id, size_variant="small")
+    return await image_service.serve_image_file(
+        latest_image.image_id, size_variant="small"
+    )
 
 
 # IMPLEMENTED: ETag strategy improved - now uses image.id + image.captured_at for proper cache validation
@@ -659,17 +721,12 @@ async def serve_camera_latest_image_full(
 ):
     """Serve latest image full resolution for a camera"""
 
-    # Validate camera exists
-    await validate_entity_exists(camera_service.get_camera_by_id, camera_id, "Camera")
-
-    latest_image = await image_service.get_latest_image_for_camera(camera_id)
-    if latest_image is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=NO_IMAGES_FOUND
-        )
+    latest_image = await _get_latest_image_entry(
+        camera_id, camera_service, image_service
+    )
 
-    # Generate ETag based on image ID and captured timestamp for cache validation
-    etag = generate_composite_etag(latest_image.id, latest_image.captured_at)
+    # ETag based on image ID and captured timestamp for cache validation
+    etag = latest_image.etag
 
     # Check If-None-Match header for 304 Not Modified
     if_none_match = request.headers.get("if-none-match")
@@ -685,7 +742,9 @@ async def serve_camera_latest_image_full(
     response.headers["Cache-Control"] = "public, max-age=60, s-maxage=60"  # 1 minute
     response.headers["ETag"] = etag
 
-    return await image_service.serve_image_file(latest_image.id, size_variant="full")
+    return await image_service.serve_image_file(
+        latest_image.image_id, size_variant="full"
+    )
 
 
 # IMPLEMENTED: ETag based on image.id + image.captured_at for proper cache validation
@@ -705,14 +764,12 @@ async def download_camera_latest_image(
         camera_service.get_camera_by_id, camera_id, "Camera"
     )
 
-    latest_image = await image_service.get_latest_image_for_camera(camera_id)
-    if latest_image is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=NO_IMAGES_FOUND
-        )
+    latest_image = await _get_latest_image_entry(
+        camera_id, camera_service, image_service
+    )
 
-    # Generate ETag based on image ID and captured timestamp for cache validation
-    etag = generate_composite_etag(latest_image.id, latest_image.captured_at)
+    # ETag based on image ID and captured timestamp for cache validation
+    etag = latest_image.etag
 
     # Add caching for downloads with proper ETag
     response.headers["Cache-Control"] = "public, max-age=300, s-maxage=300"  # 5 minutes
@@ -721,7 +778,7 @@ async def download_camera_latest_image(
     # Use the existing serve_image_file but with download disposition
     # Get the file serving data
     serving_data = await image_service.prepare_image_for_serving(
-        latest_image.id, "full"
+        latest_image.image_id, "full"
     )
     if not serving_data.get("success"):
         raise HTTPException(
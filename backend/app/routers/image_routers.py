@@ -10,6 +10,7 @@ Interactions: Uses ImageService for business logic, serves files directly from
 """
 # NOTE: THIS FILE SHOULD NOT CONTAIN ANY BUSINESS LOGIC.
 
+from datetime import date
 from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, Response, status
@@ -19,12 +20,14 @@ from ..constants import CACHE_CONTROL_PUBLIC, IMAGE_SIZE_VARIANTS
 from ..dependencies import ImageServiceDep
 
 # from ..models.image_model import Image
-from ..models.shared_models import BulkDownloadResponse
 from ..utils.cache_manager import (
     generate_composite_etag,
     generate_content_hash_etag,
 )
-from ..utils.file_helpers import create_file_response
+from ..utils.file_helpers import (
+    create_download_stream_response,
+    create_file_response,
+)
 from ..utils.response_helpers import ResponseFormatter
 from ..utils.router_helpers import handle_exceptions
 
@@ -115,6 +118,50 @@ async def get_image_count(
     )
 
 
+# No cache: archives are generated per request and streamed
+@router.get("/images/export")
+@handle_exceptions("export images")
+async def export_images(
+    image_service: ImageServiceDep,
+    timelapse_id: Optional[int] = Query(None, description="Export one timelapse"),
+    camera_id: Optional[int] = Query(None, description="Export one camera"),
+    start_date: Optional[date] = Query(None, description="First capture date"),
+    end_date: Optional[date] = Query(None, description="Last capture date"),
+    zip_filename: Optional[str] = Query(None, description="Custom ZIP filename"),
+):
+    """
+    Export a whole timelapse, a camera or a date range as a streamed ZIP file.
+
+    Filters are combined; at least one is required. Images are read with a
+    server-side cursor, so exports of any size use constant memory.
+    """
+    if not any(
+        value is not None for value in (timelapse_id, camera_id, start_date, end_date)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide timelapse_id, camera_id or a date range to export",
+        )
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date",
+        )
+
+    prefix = f"timelapse_{timelapse_id}_images" if timelapse_id else "timelapser_images"
+    filename = await image_service.get_bulk_download_filename(zip_filename, prefix)
+
+    return create_download_stream_response(
+        image_service.stream_bulk_download(
+            timelapse_id=timelapse_id,
+            camera_id=camera_id,
+            start_date=start_date,
+            end_date=end_date,
+        ),
+        filename,
+    )
+
+
 # IMPLEMENTED: ETag + long cache (image metadata never changes after creation)
 # ETag = f'"{image.id}-{image.updated_at.timestamp()}"'
 @router.get("/images/{image_id}")
@@ -274,7 +321,7 @@ async def get_images_batch(
     )
 
 
-@router.post("/images/bulk/download", response_model=BulkDownloadResponse)
+@router.post("/images/bulk/download")
 @handle_exceptions("bulk download images")
 async def bulk_download_images(
     request: BulkDownloadRequest, image_service: ImageServiceDep
@@ -282,40 +329,14 @@ async def bulk_download_images(
     """
     Download multiple images as a ZIP file.
 
-    Creates a ZIP archive containing the requested images with clean filenames.
-    Supports up to 1000 images per request with proper error handling for
-    missing or inaccessible files.
+    The archive is streamed while it is built, with clean filenames and
+    images in capture order. Supports up to 1000 images per request;
+    missing or inaccessible files are left out.
     """
-    # Delegate to service layer for ZIP preparation
-    bulk_result = await image_service.prepare_bulk_download(
-        image_ids=request.image_ids, zip_filename=request.zip_filename
-    )
-
-    if not bulk_result.get("success"):
-        raise HTTPException(
-            status_code=(
-                status.HTTP_400_BAD_REQUEST
-                if "No image IDs" in bulk_result.get("error", "")
-                else status.HTTP_404_NOT_FOUND
-            ),
-            detail=bulk_result.get("error", "Bulk download preparation failed"),
-        )
-
-    # SSE broadcasting handled by service layer (proper architecture)
+    filename = await image_service.get_bulk_download_filename(request.zip_filename)
 
-    bulk_response = BulkDownloadResponse(
-        requested_images=bulk_result["requested_images"],
-        included_images=bulk_result["included_images"],
-        filename=bulk_result["filename"],
-        total_size=bulk_result.get("total_size"),
-        zip_data=bulk_result.get("zip_data"),
-    )
-
-    return ResponseFormatter.success(
-        message="Bulk download prepared successfully",
-        data=bulk_response.model_dump(),
-        entity_type="bulk_download",
-        operation="create",
+    return create_download_stream_response(
+        image_service.stream_bulk_download(image_ids=request.image_ids), filename
     )
 
 
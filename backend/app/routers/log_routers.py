@@ -102,8 +102,21 @@ async def get_logs(
         None, description="Start date filter (ISO format)"
     ),
     end_date: Optional[str] = Query(None, description="End date filter (ISO format)"),
+    after: Optional[str] = Query(
+        None, description="Cursor from pagination.next_cursor (older logs)"
+    ),
+    before: Optional[str] = Query(
+        None, description="Cursor from pagination.prev_cursor (newer logs)"
+    ),
+    include_total: bool = Query(
+        False, description="Count matching logs when paging by cursor"
+    ),
 ):
-    """Get logs with optional filtering and pagination"""
+    """Get logs with optional filtering and pagination
+
+    Page numbers use OFFSET; for deep paging pass the returned cursors as
+    after/before, which take precedence over page.
+    """
 
     # Validate pagination parameters
     limit, offset = paginate_query_params(page, limit, max_per_page=MAX_LOG_PAGE_SIZE)
@@ -135,27 +148,48 @@ async def get_logs(
             detail=f"Invalid log level. Must be one of: {', '.join(LOG_LEVELS_LIST)}",
         )
 
-    result = await log_service.get_logs(
-        camera_id=camera_id,
-        level=level.upper() if level else None,
-        source=source,
-        search_query=search,
-        start_date=parsed_start_date,
-        end_date=parsed_end_date,
-        page=page,
-        page_size=limit,
-    )
+    try:
+        result = await log_service.get_logs(
+            camera_id=camera_id,
+            level=level.upper() if level else None,
+            source=source,
+            search_query=search,
+            start_date=parsed_start_date,
+            end_date=parsed_end_date,
+            page=page,
+            page_size=limit,
+            after=after,
+            before=before,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        # Malformed cursor
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if after is None and before is None:
+        pagination = create_pagination_metadata(
+            page=page,
+            limit=limit,
+            total_pages=result["total_pages"],
+            total_count=result["total_count"],
+        )
+    else:
+        pagination = {
+            "page": None,
+            "limit": limit,
+            "total_pages": result["total_pages"],
+            "total_items": result["total_count"],
+            "has_next": result["has_next"],
+            "has_previous": result["has_previous"],
+        }
+    pagination["next_cursor"] = result["next_cursor"]
+    pagination["prev_cursor"] = result["prev_cursor"]
 
     return ResponseFormatter.success(
         "Logs fetched successfully",
         data={
             "logs": result["logs"],
-            "pagination": create_pagination_metadata(
-                page=page,
-                limit=limit,
-                total_pages=result["total_pages"],
-                total_count=result["total_count"],
-            ),
+            "pagination": pagination,
             "filters_applied": {
                 "level": level,
                 "camera_id": camera_id,
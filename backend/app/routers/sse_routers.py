@@ -1,24 +1,27 @@
 # backend/app/routers/sse_routers.py
 """
-Server-Sent Events (SSE) HTTP endpoints using simple polling.
+Server-Sent Events (SSE) HTTP endpoints backed by the in-process SSE broker.
 
 Role: Real-time event streaming endpoints
-Responsibilities: Database-driven SSE streaming, event delivery, connection management
-Interactions: Uses SSEEventsOperations for database access, streams events to clients
+Responsibilities: SSE streaming from broker subscriptions, Last-Event-ID resume,
+heartbeats, connection management
+Interactions: Uses SSEBroker for event delivery and SSEEventsOperations for
+stats/cleanup
 """
 
 import asyncio
 import json
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Query, Request
 from fastapi.responses import StreamingResponse
 
+from ..constants import SSE_HEARTBEAT_INTERVAL_SECONDS
 from ..database.sse_events_operations import SSEEventsOperations
 from ..dependencies import AsyncDatabaseDep
 from ..enums import LoggerName
 from ..services.logger import get_service_logger
-from ..utils.cache_invalidation import CacheInvalidationService
+from ..services.sse_broker import get_sse_broker
 from ..utils.response_helpers import ResponseFormatter
 from ..utils.router_helpers import handle_exceptions
 from ..utils.time_utils import utc_now
@@ -28,147 +31,100 @@ router = APIRouter(tags=["sse"])
 logger = get_service_logger(LoggerName.API)
 
 
+def _format_sse_message(event: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """Format an event payload as an SSE message, with id line when resumable."""
+    message = f"data: {json.dumps(event)}\n\n"
+    if event_id is not None:
+        message = f"id: {event_id}\n{message}"
+    return message
+
+
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    """Parse a Last-Event-ID value, ignoring anything that is not an integer."""
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
 @router.get("/events")
 @handle_exceptions("SSE event stream")
-async def sse_event_stream(db: AsyncDatabaseDep):
+async def sse_event_stream(
+    request: Request,
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    last_event_id: Optional[str] = Query(
+        None, description="Resume after this event ID (alternative to the header)"
+    ),
+):
     """
-    Server-Sent Events endpoint for real-time event streaming using database polling.
+    Server-Sent Events endpoint for real-time event streaming.
 
-    This endpoint polls the database every 3 seconds for new events, providing
-    reliable real-time updates with industry-standard polling approach.
+    Events are pushed by the shared SSE broker as soon as they are committed,
+    so the number of connected clients does not add database load. Clients
+    resume after a reconnect with the standard Last-Event-ID header.
 
     Returns:
         StreamingResponse: SSE-formatted event stream
     """
+    broker = get_sse_broker()
+    resume_after = _parse_event_id(last_event_id_header or last_event_id)
 
     async def event_generator() -> AsyncGenerator[str, None]:
         """
-        Generate SSE-formatted events using database polling.
+        Generate SSE-formatted events from a broker subscription.
 
         Yields:
             SSE-formatted event strings
         """
-        logger.info("SSE client connected, starting event stream (polling mode)")
+        logger.info(
+            f"SSE client connected (resume after: {resume_after})", store_in_db=False
+        )
 
-        try:
-            # Send immediate test event to confirm stream is working
-            test_event = {
+        # Send immediate event to confirm stream is working
+        yield _format_sse_message(
+            {
                 "type": "stream_started",
                 "data": {"message": "SSE stream initialized"},
                 "timestamp": utc_now().isoformat(),
             }
-            yield f"data: {json.dumps(test_event)}\n\n"
-            logger.info("🔄 Sent initial test event")
-
-            # Initialize SSE operations after first yield
-            sse_ops = SSEEventsOperations(db)
-            last_heartbeat = utc_now()
-
-            # Process any existing events first
-            existing_events = await sse_ops.get_pending_events(limit=50)
-            if existing_events:
-                for event in existing_events:
-                    # Format as SSE event
-                    event_data = {
-                        "type": event["type"],
-                        "data": event["data"],
-                        "timestamp": event["timestamp"],
-                    }
-
-                    # Trigger cache invalidation for this event
-                    try:
-                        await CacheInvalidationService.handle_sse_event(
-                            event["type"], event["data"]
-                        )
-                    except Exception as cache_error:
-                        logger.warning(
-                            f"Cache invalidation failed for {event['type']}",
-                            exception=cache_error,
-                        )
-
-                    # Yield SSE-formatted data
-                    yield f"data: {json.dumps(event_data)}\n\n"
-
-                # Mark events as processed
-                event_ids = [event["id"] for event in existing_events]
-                await sse_ops.mark_events_processed(event_ids)
-                logger.debug(
-                    f"Streamed {len(existing_events)} existing SSE events to client"
-                )
+        )
 
-            # Main polling loop
-            while True:
+        subscriber = await broker.subscribe(resume_after)
+        try:
+            while not await request.is_disconnected():
                 try:
-                    # Poll for new events every 3 seconds
-                    events = await sse_ops.get_pending_events(limit=10)
-
-                    if events:
-                        # Stream each event to client
-                        event_ids = []
-                        for event in events:
-                            # Format as SSE event
-                            event_data = {
-                                "type": event["type"],
-                                "data": event["data"],
-                                "timestamp": event["timestamp"],
-                            }
-
-                            # Trigger cache invalidation for this event
-                            try:
-                                await CacheInvalidationService.handle_sse_event(
-                                    event["type"], event["data"]
-                                )
-                            except Exception as cache_error:
-                                logger.warning(
-                                    f"Cache invalidation failed for {event['type']}",
-                                    exception=cache_error,
-                                )
-
-                            # Log events for debugging
-                            logger.info(
-                                f"🔄 Sending {event['type']} SSE event: {event_data}"
-                            )
-
-                            # Yield SSE-formatted data
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                            event_ids.append(event["id"])
-
-                        # Mark events as processed
-                        await sse_ops.mark_events_processed(event_ids)
-                        logger.debug(f"Streamed {len(events)} SSE events to client")
-
-                    # Send heartbeat every 5 seconds (temporarily for debugging)
-                    now = utc_now()
-                    if (now - last_heartbeat).total_seconds() > 5:
-                        heartbeat_event = {
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), timeout=SSE_HEARTBEAT_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    now = utc_now().isoformat()
+                    yield _format_sse_message(
+                        {
                             "type": "heartbeat",
-                            "data": {"timestamp": now.isoformat()},
-                            "timestamp": now.isoformat(),
+                            "data": {"timestamp": now},
+                            "timestamp": now,
                         }
-                        yield f"data: {json.dumps(heartbeat_event)}\n\n"
-                        last_heartbeat = now
-                        logger.debug("Sent SSE heartbeat", icon="💓")
-
-                    # Wait 3 seconds before next poll (industry standard)
-                    await asyncio.sleep(3)
-
-                except Exception as e:
-                    logger.error("Error in SSE event generation", exception=e)
-                    # Send error event to client
-                    error_event = {
-                        "type": "error",
-                        "data": {"message": "Event stream error occurred"},
-                        "timestamp": utc_now().isoformat(),
-                    }
-                    yield f"data: {json.dumps(error_event)}\n\n"
-                    await asyncio.sleep(5)  # Wait longer on error
+                    )
+                    continue
+
+                if event is None:
+                    # Broker shutdown or client fell behind; client resumes
+                    break
+
+                yield _format_sse_message(
+                    {
+                        "type": event["type"],
+                        "data": event["data"],
+                        "timestamp": event["timestamp"],
+                    },
+                    event_id=event["id"],
+                )
 
         except asyncio.CancelledError:
-            logger.info("SSE client disconnected")
-            raise
-        except Exception as e:
-            logger.error("Fatal error in SSE stream", exception=e)
+            logger.info("SSE client disconnected", store_in_db=False)
             raise
+        finally:
+            broker.unsubscribe(subscriber)
 
     # Return streaming response with proper SSE headers
     return StreamingResponse(
@@ -178,7 +134,7 @@ async def sse_event_stream(db: AsyncDatabaseDep):
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Cache-Control",
+            "Access-Control-Allow-Headers": "Cache-Control, Last-Event-ID",
         },
     )
 
@@ -196,7 +152,8 @@ async def get_sse_stats(db: AsyncDatabaseDep):
     stats = await sse_ops.get_event_stats()
 
     return ResponseFormatter.success(
-        "SSE event statistics retrieved successfully", data=stats
+        "SSE event statistics retrieved successfully",
+        data={**stats, "broker": get_sse_broker().get_stats()},
     )
 
 
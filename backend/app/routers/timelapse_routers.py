@@ -506,6 +506,12 @@ async def get_timelapse_images(
         100, ge=1, le=1000, description="Maximum number of images to return"
     ),
     offset: int = Query(0, ge=0, description="Number of images to skip"),
+    after: Optional[str] = Query(
+        None, description="Cursor from X-Next-Cursor; returns the following page"
+    ),
+    before: Optional[str] = Query(
+        None, description="Cursor from X-Prev-Cursor; returns the preceding page"
+    ),
 ):
     """
     Get all images for a specific timelapse.
@@ -513,6 +519,10 @@ async def get_timelapse_images(
     Returns all images that belong to this timelapse, following the nested
     resource pattern for clear entity relationships. Supports pagination
     for large image collections.
+
+    Offset paging slows down linearly with depth; for deep scrolling follow
+    the X-Next-Cursor / X-Prev-Cursor response headers with after/before,
+    which take precedence over offset.
     """
     # Validate timelapse exists
     await validate_entity_exists(
@@ -523,13 +533,19 @@ async def get_timelapse_images(
     page = (offset // limit) + 1
 
     # Get images for this timelapse using the existing service method
-    result = await image_service.get_images(
-        timelapse_id=timelapse_id,
-        page=page,
-        page_size=limit,
-        order_by="captured_at",
-        order_dir="DESC",
-    )
+    try:
+        result = await image_service.get_images(
+            timelapse_id=timelapse_id,
+            page=page,
+            page_size=limit,
+            order_by="captured_at",
+            order_dir="DESC",
+            after=after,
+            before=before,
+        )
+    except ValueError as e:
+        # Malformed or tampered cursor
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     images = result.images
 
@@ -538,9 +554,14 @@ async def get_timelapse_images(
         etag = generate_collection_etag([img.captured_at for img in images])
     else:
         etag = generate_content_hash_etag(
-            f"empty-images-{timelapse_id}-{offset}-{limit}"
+            f"empty-images-{timelapse_id}-{offset}-{limit}-{after}-{before}"
         )
 
+    if result.next_cursor:
+        response.headers["X-Next-Cursor"] = result.next_cursor
+    if result.prev_cursor:
+        response.headers["X-Prev-Cursor"] = result.prev_cursor
+
     # Add short cache for image list (changes when new images captured)
     response.headers["Cache-Control"] = "public, max-age=300, s-maxage=300"  # 5 minutes
     response.headers["ETag"] = etag
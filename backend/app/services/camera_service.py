@@ -27,7 +27,7 @@ but delegates all actual capture actions to RTSPService.
 Architecture: Composition-based with dependency injection for type-safe operations.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..constants import (  # Camera health constants
     CAMERA_CAPTURE_READY_STATUSES,
@@ -1380,6 +1380,44 @@ class CameraService:
             )
             raise
 
+    async def update_cameras_connectivity(
+        self, updates: List[Tuple[int, bool, Optional[str]]]
+    ) -> List[int]:
+        """
+        Update connectivity status for many cameras in one database round trip.
+
+        Args:
+            updates: (camera_id, is_connected, error_message) per camera
+
+        Returns:
+            IDs of cameras whose connectivity changed
+        """
+        try:
+            changed_ids = await self.camera_ops.update_cameras_connectivity(updates)
+
+            if changed_ids:
+                logger.debug(
+                    f"Updated connectivity status for {len(changed_ids)} cameras",
+                    extra_context={
+                        "camera_ids": changed_ids,
+                        "checked_count": len(updates),
+                        "operation": "update_cameras_connectivity",
+                    },
+                )
+
+            return changed_ids
+
+        except Exception as e:
+            logger.error(
+                f"Failed to update connectivity for {len(updates)} cameras",
+                extra_context={
+                    "camera_ids": [update[0] for update in updates],
+                    "operation": "update_cameras_connectivity",
+                },
+                exception=e,
+            )
+            raise
+
     # Note: capture_temporary_image() removed - RTSP capture actions now handled directly by RTSPService
 
     async def coordinate_capture_workflow(
@@ -64,6 +64,7 @@ from .capture_transaction_manager import CaptureTransaction, CaptureTransactionM
 from .job_coordination_service import JobCoordinationService
 from .overlay_bridge_service import OverlayBridgeService
 from .rtsp_service import AsyncRTSPService, RTSPService
+from .rtsp_session_pool import RTSPSessionPool, get_rtsp_session_pool
 from .workflow_orchestrator_service import WorkflowOrchestratorService
 
 logger = get_service_logger(LoggerName.CAPTURE_PIPELINE, LogSource.PIPELINE)
@@ -183,6 +184,7 @@ def create_capture_pipeline(
             weather_service=None,  # WeatherManager doesn't match expected type, skip for now
             overlay_service=overlay_service,
             settings_service=settings_service,
+            transaction_manager=CaptureTransactionManager(db),
         )
 
         # Step 6: Validate all services were created successfully
@@ -389,6 +391,8 @@ __all__ = [
     "WorkflowOrchestratorService",
     "RTSPService",
     "AsyncRTSPService",
+    "RTSPSessionPool",
+    "get_rtsp_session_pool",
     # "CorruptionBridgeService",  # Removed - using direct corruption pipeline
     "OverlayBridgeService",
     "JobCoordinationService",
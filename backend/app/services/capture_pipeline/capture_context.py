@@ -0,0 +1,200 @@
+# backend/app/services/capture_pipeline/capture_context.py
+"""
+Capture Context - Immutable snapshot of everything one capture needs.
+
+A scheduled capture used to look up the same timelapse and camera several
+times (scheduler validation, worker existence checks, orchestrator
+prerequisites, day number, image count) and read capture, timezone and
+corruption settings one key at a time. The capture context is loaded with a
+single query (timelapse JOIN camera plus a settings subquery), validated once
+by the scheduler and then handed down unchanged:
+
+    scheduler → capture worker → workflow orchestrator → corruption evaluator
+
+Consumers that receive no context (manual captures, older callers) keep
+working; the orchestrator loads one itself. The scheduler loads the contexts
+of all timelapses due in the same tick at once with load_capture_contexts().
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+from zoneinfo import ZoneInfo
+
+from ...constants import DEFAULT_CAPTURE_GRACE_PERIOD_SECONDS, DEFAULT_TIMEZONE
+from ...database.camera_operations import _prepare_camera_data_shared
+from ...database.core import AsyncDatabase, SyncDatabase
+from ...database.corruption_operations import _process_corruption_settings_rows
+from ...database.timelapse_operations import (
+    SyncTimelapseOperations,
+    TimelapseOperations,
+)
+from ...models.camera_model import Camera
+from ...models.timelapse_model import Timelapse
+from ...utils.database_helpers import DatabaseUtilities
+from ...utils.time_utils import create_timezone_aware_datetime, utc_now
+from .constants import CAPTURE_CONTEXT_SETTING_KEYS
+from .rtsp_service import build_capture_settings
+
+
+@dataclass(frozen=True)
+class CaptureContext:
+    """Validated camera, timelapse and settings for one capture."""
+
+    camera: Camera
+    timelapse: Timelapse
+    timezone: str
+    capture_settings: Mapping[str, Any]
+    corruption_settings: Mapping[str, Any]
+    grace_period_seconds: int
+    loaded_at: datetime
+
+    @property
+    def camera_id(self) -> int:
+        """ID of the camera to capture from."""
+        return self.camera.id
+
+    @property
+    def timelapse_id(self) -> int:
+        """ID of the timelapse the capture belongs to."""
+        return self.timelapse.id
+
+    @property
+    def corruption_detection_heavy(self) -> bool:
+        """Whether heavy corruption detection is enabled for the camera."""
+        return bool(getattr(self.camera, "corruption_detection_heavy", False))
+
+    def now(self) -> datetime:
+        """Current time in the configured timezone."""
+        return create_timezone_aware_datetime(self.timezone)
+
+    def day_number(self, captured_at: datetime) -> int:
+        """1-based day of the timelapse a capture at captured_at falls on."""
+        start_date: Optional[date] = self.timelapse.start_date
+        if not start_date:
+            return 1
+        return DatabaseUtilities.calculate_day_number(start_date, captured_at.date())
+
+
+# Camera timestamp columns; to_jsonb() renders them as ISO 8601 strings
+_CAMERA_DATETIME_FIELDS = (
+    "created_at",
+    "updated_at",
+    "last_capture_at",
+    "next_capture_at",
+    "last_degraded_at",
+)
+
+
+def _parse_int_setting(value: Optional[str], default: int) -> int:
+    """Parse an integer setting value, falling back to default."""
+    try:
+        return int(value) if value else default
+    except (ValueError, TypeError):
+        return default
+
+
+def build_capture_context(row: Dict[str, Any]) -> CaptureContext:
+    """
+    Build a capture context from a capture context row.
+
+    Args:
+        row: Row returned by SyncTimelapseOperations.get_capture_context_row()
+
+    Returns:
+        CaptureContext for the row's timelapse and camera
+    """
+    row = dict(row)
+    camera_data = dict(row.pop("camera") or {})
+    for field in _CAMERA_DATETIME_FIELDS:
+        if isinstance(camera_data.get(field), str):
+            camera_data[field] = datetime.fromisoformat(camera_data[field])
+    settings: Dict[str, str] = dict(row.pop("settings") or {})
+
+    timezone = settings.get("timezone") or DEFAULT_TIMEZONE
+    try:
+        tz = ZoneInfo(timezone)
+    except Exception:
+        timezone = DEFAULT_TIMEZONE
+        tz = ZoneInfo(timezone)
+
+    timelapse = Timelapse(
+        **{k: v for k, v in row.items() if k in Timelapse.model_fields}
+    )
+
+    # Same derived fields as SyncCameraOperations.get_camera_by_id()
+    if timelapse.status in ("running", "paused"):
+        camera_data["active_timelapse_id"] = timelapse.id
+        camera_data["timelapse_status"] = timelapse.status
+    camera = Camera.model_validate(_prepare_camera_data_shared(camera_data, tz))
+
+    corruption_settings = _process_corruption_settings_rows(
+        [
+            {"key": key, "value": value}
+            for key, value in settings.items()
+            if key.startswith("corruption_")
+        ]
+    )
+
+    return CaptureContext(
+        camera=camera,
+        timelapse=timelapse,
+        timezone=timezone,
+        capture_settings=MappingProxyType(
+            build_capture_settings(
+                settings.get("image_quality"), settings.get("rtsp_timeout_seconds")
+            )
+        ),
+        corruption_settings=MappingProxyType(corruption_settings),
+        grace_period_seconds=_parse_int_setting(
+            settings.get("capture_grace_period_seconds"),
+            DEFAULT_CAPTURE_GRACE_PERIOD_SECONDS,
+        ),
+        loaded_at=utc_now(),
+    )
+
+
+def load_capture_context(
+    db: SyncDatabase, timelapse_id: int
+) -> Optional[CaptureContext]:
+    """
+    Load the capture context of a timelapse with one database round trip.
+
+    Args:
+        db: Sync database instance
+        timelapse_id: ID of the timelapse to capture for
+
+    Returns:
+        CaptureContext, or None if the timelapse does not exist
+
+    Raises:
+        TimelapseOperationError: If the query fails
+    """
+    row = SyncTimelapseOperations(db).get_capture_context_row(
+        timelapse_id, list(CAPTURE_CONTEXT_SETTING_KEYS)
+    )
+    return build_capture_context(row) if row else None
+
+
+async def load_capture_contexts(
+    async_db: AsyncDatabase, timelapse_ids: List[int]
+) -> Dict[int, CaptureContext]:
+    """
+    Load the capture contexts of several timelapses with one database round trip.
+
+    Args:
+        async_db: Async database instance
+        timelapse_ids: IDs of the timelapses to capture for
+
+    Returns:
+        Dict mapping timelapse ID to CaptureContext; missing timelapses are absent
+
+    Raises:
+        TimelapseOperationError: If the query fails
+    """
+    rows = await TimelapseOperations(async_db).get_capture_context_rows(
+        list(timelapse_ids), list(CAPTURE_CONTEXT_SETTING_KEYS)
+    )
+    contexts = [build_capture_context(row) for row in rows]
+    return {context.timelapse_id: context for context in contexts}
@@ -8,14 +8,21 @@ Provides transaction safety for capture operations to prevent:
 - Orphaned files without database records
 - Incomplete thumbnail generation states
 - Inconsistent corruption detection records
+
+Database writes of a capture are queued on the transaction and committed
+together through one pipelined connection, so a capture costs one pooled
+connection and roughly one round trip instead of one per write.
 """
 
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence, Union
+
+import psycopg
 
 from ...database.core import SyncDatabase
+from ...database.exceptions import ImageOperationError
 from ...database.image_operations import SyncImageOperations
 from ...enums import LoggerName
 from ...services.logger import get_service_logger
@@ -35,6 +42,16 @@ class FileHelpersProtocol(Protocol):
     pass
 
 
+@dataclass
+class PendingWrite:
+    """A statement queued for the capture commit."""
+
+    name: str
+    query: str
+    params: Union[Dict[str, Any], Sequence[Any]]
+    returns_row: bool = False
+
+
 @dataclass
 class CaptureTransaction:
     """Tracks a capture transaction state."""
@@ -47,12 +64,36 @@ class CaptureTransaction:
     small_path: Optional[Path] = None
     corruption_record_id: Optional[int] = None
     rollback_actions: List[Callable] = field(default_factory=list)
+    writes: List[PendingWrite] = field(default_factory=list)
+    results: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
     committed: bool = False
 
     def add_rollback_action(self, action: Callable) -> None:
         """Add an action to be executed on rollback."""
         self.rollback_actions.append(action)
 
+    def add_write(
+        self,
+        name: str,
+        query: str,
+        params: Union[Dict[str, Any], Sequence[Any]],
+        returns_row: bool = False,
+    ) -> None:
+        """
+        Queue a statement for the capture commit.
+
+        Writes run in the order they were added. A statement that needs the
+        id of a row inserted earlier must compute it in SQL (currval()),
+        since no result is read before the commit.
+
+        Args:
+            name: Key of the returned row in results
+            query: SQL statement
+            params: Statement parameters
+            returns_row: Whether to keep the first returned row in results
+        """
+        self.writes.append(PendingWrite(name, query, params, returns_row))
+
 
 class CaptureTransactionManager:
     """
@@ -99,7 +140,8 @@ class CaptureTransactionManager:
             logger.debug(f"Starting capture transaction for camera {camera_id}")
             yield transaction
 
-            # If we reach here, commit the transaction
+            # If we reach here, send the queued writes and commit the transaction
+            self.commit_writes(transaction)
             transaction.committed = True
             logger.debug(f"Capture transaction committed for camera {camera_id}")
 
@@ -115,6 +157,48 @@ class CaptureTransactionManager:
                 )
                 self._rollback_transaction(transaction)
 
+    def commit_writes(
+        self, transaction: CaptureTransaction
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Send the queued writes of a transaction in one database transaction.
+
+        The writes are pipelined: BEGIN, every statement and COMMIT are sent
+        together and the connection waits for the server once. Either all
+        writes are committed or none are.
+
+        Args:
+            transaction: Transaction whose queued writes are sent
+
+        Returns:
+            Rows of writes queued with returns_row, keyed by write name
+
+        Raises:
+            ImageOperationError: If the writes could not be committed
+        """
+        if not transaction.writes:
+            return transaction.results
+
+        writes, transaction.writes = transaction.writes, []
+        try:
+            with self.db.get_pipeline_connection() as conn:
+                cursors = [conn.execute(write.query, write.params) for write in writes]
+
+            # The pipeline was synced by COMMIT, so every result has arrived
+            for write, cur in zip(writes, cursors):
+                if write.returns_row:
+                    transaction.results[write.name] = cur.fetchone()
+        except psycopg.Error as e:
+            raise ImageOperationError(
+                f"Failed to commit {len(writes)} capture writes for camera {transaction.camera_id}",
+                operation="commit_capture_writes",
+            ) from e
+
+        logger.debug(
+            f"Committed {len(writes)} capture writes for camera {transaction.camera_id}"
+        )
+        return transaction.results
+
     def _rollback_transaction(self, transaction: CaptureTransaction) -> None:
         """
         Rollback a failed transaction.
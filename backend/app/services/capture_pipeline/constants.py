@@ -114,6 +114,19 @@ WORKFLOW_STEP_TIMEOUT_SECONDS = 60
 WORKFLOW_TOTAL_TIMEOUT_SECONDS = 300
 WORKFLOW_CLEANUP_ON_FAILURE = True
 
+# =============================================================================
+# CAPTURE CONTEXT
+# =============================================================================
+
+# Settings loaded into the capture context (corruption_* settings are always
+# included)
+CAPTURE_CONTEXT_SETTING_KEYS = (
+    "timezone",
+    "image_quality",
+    "rtsp_timeout_seconds",
+    "capture_grace_period_seconds",
+)
+
 # =============================================================================
 # JOB QUEUE HEALTH STATUS
 # =============================================================================
@@ -7,6 +7,7 @@ Pure RTSP operations and frame capture functionality within the capture pipeline
 🎯 SERVICE SCOPE: Core RTSP/OpenCV capture operations only
 - RTSP connectivity testing
 - Frame capture with retry logic
+- Persistent per-camera RTSP sessions (via RTSPSessionPool)
 - Image processing pipeline (crop, rotate, save)
 - Resolution detection and validation
 - Processing settings testing
@@ -43,10 +44,49 @@ from ...models.shared_models import CameraConnectivityTestResult, RTSPCaptureRes
 from ...services.logger import get_service_logger
 from ...utils.time_utils import get_timezone_aware_timestamp_sync
 from . import rtsp_utils
+from .rtsp_session_pool import get_rtsp_session_pool
 
 logger = get_service_logger(LoggerName.CAPTURE_PIPELINE, LogSource.PIPELINE)
 
 
+def build_capture_settings(
+    quality_setting: Optional[str], timeout_setting: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build capture settings from raw setting values, with defaults.
+
+    Args:
+        quality_setting: Raw "image_quality" setting value
+        timeout_setting: Raw "rtsp_timeout_seconds" setting value
+
+    Returns:
+        Capture settings dictionary (quality, timeout, max_retries)
+    """
+    quality = DEFAULT_RTSP_QUALITY
+    if quality_setting:
+        try:
+            quality = int(quality_setting)
+        except (ValueError, TypeError):
+            logger.warning(
+                f"Invalid image_quality setting, using default {DEFAULT_RTSP_QUALITY}"
+            )
+
+    timeout = DEFAULT_RTSP_TIMEOUT_SECONDS
+    if timeout_setting:
+        try:
+            timeout = int(timeout_setting)
+        except (ValueError, TypeError):
+            logger.warning(
+                f"Invalid rtsp_timeout_seconds setting, using default {DEFAULT_RTSP_TIMEOUT_SECONDS}"
+            )
+
+    return {
+        "quality": quality,
+        "timeout": timeout,
+        "max_retries": DEFAULT_MAX_RETRIES,
+    }
+
+
 # Use standard logger pattern (already imported at top)
 
 
@@ -134,29 +174,108 @@ class RTSPService:
                 test_timestamp=get_timezone_aware_timestamp_sync(self.settings_service),
             )
 
+    def check_connection_liveness(
+        self, camera_id: int, rtsp_url: str
+    ) -> CameraConnectivityTestResult:
+        """
+        Check camera connectivity, preferring the camera's open RTSP session.
+
+        When the session pool holds a live session for the camera, a single
+        frame grab proves connectivity without a new RTSP handshake. Otherwise
+        falls back to a full connection test.
+
+        Args:
+            camera_id: Camera identifier
+            rtsp_url: RTSP URL to check
+
+        Returns:
+            CameraConnectivityTestResult with test results and timing
+        """
+        try:
+            start_time = time.time()
+            settings = self._get_capture_settings()
+            alive = get_rtsp_session_pool().check_liveness(
+                camera_id, rtsp_url, timeout_seconds=settings["timeout"]
+            )
+
+            if alive:
+                return CameraConnectivityTestResult(
+                    success=True,
+                    camera_id=camera_id,
+                    rtsp_url=rtsp_url,
+                    response_time_ms=(time.time() - start_time) * 1000,
+                    connection_status="online",
+                    error=None,
+                    test_timestamp=get_timezone_aware_timestamp_sync(
+                        self.settings_service
+                    ),
+                )
+        except Exception as e:
+            logger.debug(
+                f"Session liveness check failed for camera {camera_id}, "
+                f"falling back to full connection test: {e}"
+            )
+
+        return self.test_connection(camera_id, rtsp_url)
+
+    def evict_idle_sessions(self) -> int:
+        """
+        Close RTSP sessions that have been idle longer than the pool timeout.
+
+        Returns:
+            Number of sessions evicted
+        """
+        return get_rtsp_session_pool().evict_idle_sessions()
+
+    def close_all_sessions(self) -> None:
+        """Close all persistent RTSP sessions held by this process."""
+        get_rtsp_session_pool().close_all()
+
+    def get_session_pool_stats(self) -> Dict[str, Any]:
+        """Get RTSP session pool statistics for monitoring."""
+        return get_rtsp_session_pool().get_stats()
+
     def capture_frame_raw(
-        self, rtsp_url: str, capture_settings: Dict[str, Any]
+        self,
+        rtsp_url: str,
+        capture_settings: Dict[str, Any],
+        camera_id: Optional[int] = None,
     ) -> Optional[Any]:
         """
         Capture raw frame from RTSP stream.
 
-        Pure frame capture operation without processing or saving.
+        Pure frame capture operation without processing or saving. When a
+        camera_id is provided, the frame is grabbed from the camera's
+        persistent session, falling back to a one-shot capture with retries.
 
         Args:
             rtsp_url: RTSP URL to capture from
             capture_settings: Capture configuration (timeout, quality)
+            camera_id: Optional camera identifier for session reuse
 
         Returns:
             Raw frame data if successful, None if failed
         """
         try:
+            timeout_seconds = capture_settings.get(
+                "timeout", DEFAULT_RTSP_TIMEOUT_SECONDS
+            )
+
+            if camera_id is not None:
+                frame = get_rtsp_session_pool().capture_frame(
+                    camera_id, rtsp_url, timeout_seconds=timeout_seconds
+                )
+                if frame is not None:
+                    return frame
+                logger.debug(
+                    f"Session capture failed for camera {camera_id}, "
+                    "falling back to one-shot capture"
+                )
 
             frame = rtsp_utils.capture_with_retry(
                 rtsp_url=rtsp_url,
                 max_retries=capture_settings.get("max_retries", DEFAULT_MAX_RETRIES),
-                timeout_seconds=capture_settings.get(
-                    "timeout", DEFAULT_RTSP_TIMEOUT_SECONDS
-                ),
+                timeout_seconds=timeout_seconds,
             )
 
             return frame
@@ -185,7 +304,9 @@ class RTSPService:
         """
         try:
             # Capture raw frame
-            frame = self.capture_frame_raw(camera.rtsp_url, capture_settings)
+            frame = self.capture_frame_raw(
+                camera.rtsp_url, capture_settings, camera_id=camera.id
+            )
             if frame is None:
                 return {"success": False, "error": "Failed to capture raw frame"}
 
@@ -221,7 +342,8 @@ class RTSPService:
             quality: JPEG quality setting (1-100)
 
         Returns:
-            Processing result with file size and success status
+            Processing result with file size, success status and the processed
+            frame (``frame``) as written to disk
         """
         try:
 
@@ -237,19 +359,24 @@ class RTSPService:
                 getattr(camera, "rotation", 0) if processing_settings is None else 0
             )
 
-            # Save frame with processing
+            processed_frame = rtsp_utils.process_frame(
+                raw_frame,
+                rotation=legacy_rotation,
+                processing_settings=processing_settings,
+            )
+
+            # Save processed frame (already processed, so no further processing)
             success, file_size = rtsp_utils.save_frame_to_file(
-                frame=raw_frame,
+                frame=processed_frame,
                 filepath=output_path,
                 quality=quality,
-                rotation=legacy_rotation,
-                processing_settings=processing_settings,
             )
 
             if not success:
                 return {"success": False, "error": "Failed to save processed frame"}
 
-            return {"success": True, "file_size": file_size}
+            # Hand the decoded frame back so callers never re-read the JPEG
+            return {"success": True, "file_size": file_size, "frame": processed_frame}
 
         except Exception as e:
             return {"success": False, "error": f"Image processing failed: {e}"}
@@ -534,40 +661,14 @@ class RTSPService:
             Capture settings dictionary with defaults
         """
         try:
-            quality_setting = self.settings_service.get_setting("image_quality")
-            timeout_setting = self.settings_service.get_setting("rtsp_timeout_seconds")
-
-            quality = DEFAULT_RTSP_QUALITY
-            if quality_setting:
-                try:
-                    quality = int(quality_setting)
-                except (ValueError, TypeError):
-                    logger.warning(
-                        f"Invalid image_quality setting, using default {DEFAULT_RTSP_QUALITY}"
-                    )
-
-            timeout = DEFAULT_RTSP_TIMEOUT_SECONDS
-            if timeout_setting:
-                try:
-                    timeout = int(timeout_setting)
-                except (ValueError, TypeError):
-                    logger.warning(
-                        f"Invalid rtsp_timeout_seconds setting, using default {DEFAULT_RTSP_TIMEOUT_SECONDS}"
-                    )
-
-            return {
-                "quality": quality,
-                "timeout": timeout,
-                "max_retries": DEFAULT_MAX_RETRIES,
-            }
+            return build_capture_settings(
+                self.settings_service.get_setting("image_quality"),
+                self.settings_service.get_setting("rtsp_timeout_seconds"),
+            )
 
         except Exception as e:
             logger.warning(f"Failed to get capture settings: {e}", exception=e)
-            return {
-                "quality": DEFAULT_RTSP_QUALITY,
-                "timeout": DEFAULT_RTSP_TIMEOUT_SECONDS,
-                "max_retries": DEFAULT_MAX_RETRIES,
-            }
+            return build_capture_settings(None, None)
 
     def _apply_processing_pipeline(
         self, frame: Any, camera: Camera
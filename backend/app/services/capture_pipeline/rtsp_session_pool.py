@@ -0,0 +1,475 @@
+# backend/app/services/capture_pipeline/rtsp_session_pool.py
+"""
+RTSP Session Pool - Persistent per-camera stream connections.
+
+Opening an RTSP stream (DESCRIBE/SETUP/PLAY handshake plus decoder warm-up)
+dominates capture latency for short capture intervals. The session pool keeps
+one long-lived OpenCV VideoCapture per camera so that captures only need to
+grab the freshest frame, and health checks can confirm liveness on an already
+open session instead of performing a full connection test.
+
+Session lifecycle:
+- Opened lazily on the first capture for a camera
+- Kept warm by a background keepalive thread that grabs a frame from each
+  open session well within the keepalive interval (RTSP servers drop sessions
+  that stop reading, and the grab also drains the stale frame backlog)
+- Reopened on use if the keepalive has not touched the stream within the
+  keepalive interval or the stream stopped delivering frames
+- Reopened after a maximum age to reset long-running decoders
+- Evicted after being idle longer than the idle timeout, or when the pool is
+  full (least recently used first)
+"""
+
+import time
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Optional
+
+import cv2
+
+from ...constants import (
+    DEFAULT_RTSP_TIMEOUT_SECONDS,
+    RTSP_SESSION_IDLE_TIMEOUT_SECONDS,
+    RTSP_SESSION_KEEPALIVE_SECONDS,
+    RTSP_SESSION_MAX_AGE_SECONDS,
+    RTSP_SESSION_MAX_SESSIONS,
+)
+from ...enums import LoggerName
+from ...services.logger import get_service_logger
+from . import rtsp_utils
+
+logger = get_service_logger(LoggerName.CAPTURE_PIPELINE)
+
+
+@dataclass
+class RTSPSessionPoolStats:
+    """Statistics for RTSP session pool monitoring."""
+
+    sessions_opened: int = 0
+    sessions_reused: int = 0
+    sessions_reopened: int = 0
+    sessions_evicted: int = 0
+    frames_captured: int = 0
+    capture_failures: int = 0
+    liveness_checks: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Calculate session reuse ratio as percentage."""
+        total = self.sessions_opened + self.sessions_reused
+        if total == 0:
+            return 0.0
+        return (self.sessions_reused / total) * 100.0
+
+
+class RTSPSession:
+    """
+    A single long-lived RTSP connection for one camera.
+
+    All access to the underlying VideoCapture must happen while holding
+    ``lock`` since OpenCV captures are not thread-safe.
+    """
+
+    def __init__(self, camera_id: int, rtsp_url: str, timeout_seconds: int):
+        self.camera_id = camera_id
+        self.rtsp_url = rtsp_url
+        self.timeout_seconds = timeout_seconds
+        self.lock = Lock()
+        self._cap: Optional[cv2.VideoCapture] = None
+        self.opened_at = 0.0
+        self.last_used_at = time.monotonic()
+        self.last_io_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the session currently holds an opened capture."""
+        return self._cap is not None and self._cap.isOpened()
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the underlying capture was opened."""
+        return time.monotonic() - self.opened_at if self.opened_at else 0.0
+
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the session was last used for a capture or probe."""
+        return time.monotonic() - self.last_used_at
+
+    @property
+    def io_idle_seconds(self) -> float:
+        """Seconds since a frame was last grabbed from the stream."""
+        return time.monotonic() - self.last_io_at
+
+    def open(self, skip_frames: int = 3) -> bool:
+        """
+        Open the stream and discard the initial frames.
+
+        Args:
+            skip_frames: Number of frames to skip past initial codec issues
+
+        Returns:
+            True if the stream was opened successfully
+        """
+        self.close()
+        cap = rtsp_utils.open_rtsp_capture(self.rtsp_url, self.timeout_seconds)
+        if not cap.isOpened():
+            cap.release()
+            return False
+
+        for _ in range(skip_frames):
+            if not cap.grab():
+                break
+
+        self._cap = cap
+        self.opened_at = time.monotonic()
+        self.last_io_at = self.opened_at
+        return True
+
+    def read_latest_frame(self) -> Optional[Any]:
+        """
+        Read the freshest available frame from the open stream.
+
+        Returns:
+            OpenCV frame if successful, None if the stream stopped delivering
+        """
+        if not self.is_open:
+            return None
+
+        assert self._cap is not None
+        if not rtsp_utils.grab_latest_frame(self._cap):
+            return None
+
+        self.last_io_at = time.monotonic()
+        ret, frame = self._cap.retrieve()
+        if not ret or frame is None:
+            return None
+        return frame
+
+    def is_alive(self) -> bool:
+        """
+        Check that the stream is still delivering frames without decoding one.
+
+        Returns:
+            True if a live frame could be grabbed
+        """
+        if not self.is_open:
+            return False
+
+        assert self._cap is not None
+        if not rtsp_utils.grab_latest_frame(self._cap):
+            return False
+        self.last_io_at = time.monotonic()
+        return True
+
+    def close(self) -> None:
+        """Release the underlying capture if open."""
+        if self._cap is not None:
+            try:
+                self._cap.release()
+            except Exception as e:
+                logger.debug(
+                    f"Error releasing RTSP session for camera {self.camera_id}: {e}"
+                )
+            self._cap = None
+            self.opened_at = 0.0
+            self.last_io_at = 0.0
+
+
+class RTSPSessionPool:
+    """
+    Thread-safe pool of persistent RTSP sessions keyed by camera id.
+
+    The pool lock only guards the session mapping; stream I/O happens under the
+    per-session lock so a slow handshake on one camera never blocks captures
+    on other cameras. The keepalive thread is started with the first session
+    and stopped by close_all().
+    """
+
+    def __init__(
+        self,
+        idle_timeout_seconds: int = RTSP_SESSION_IDLE_TIMEOUT_SECONDS,
+        keepalive_seconds: int = RTSP_SESSION_KEEPALIVE_SECONDS,
+        max_age_seconds: int = RTSP_SESSION_MAX_AGE_SECONDS,
+        max_sessions: int = RTSP_SESSION_MAX_SESSIONS,
+    ):
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_sessions = max_sessions
+        self._sessions: Dict[int, RTSPSession] = {}
+        self._pool_lock = Lock()
+        self._keepalive_thread: Optional[Thread] = None
+        self._keepalive_stop = Event()
+        self.stats = RTSPSessionPoolStats()
+
+    def capture_frame(
+        self,
+        camera_id: int,
+        rtsp_url: str,
+        timeout_seconds: int = DEFAULT_RTSP_TIMEOUT_SECONDS,
+    ) -> Optional[Any]:
+        """
+        Capture the freshest frame for a camera, reusing its open session.
+
+        Args:
+            camera_id: Camera identifier used as the session key
+            rtsp_url: RTSP stream URL (a changed URL replaces the session)
+            timeout_seconds: Timeout for connection and read operations
+
+        Returns:
+            OpenCV frame if successful, None if the stream could not be read
+        """
+        session = self._get_or_create_session(camera_id, rtsp_url, timeout_seconds)
+
+        with session.lock:
+            try:
+                frame = None
+                if (
+                    session.is_open
+                    and session.age_seconds < self.max_age_seconds
+                    and session.io_idle_seconds < self.keepalive_seconds
+                ):
+                    frame = session.read_latest_frame()
+                    if frame is not None:
+                        self.stats.sessions_reused += 1
+                    else:
+                        logger.debug(
+                            f"RTSP session for camera {camera_id} stopped delivering "
+                            "frames, reopening"
+                        )
+
+                if frame is None:
+                    was_open = session.opened_at > 0
+                    if not session.open():
+                        logger.debug(
+                            f"Failed to open RTSP session for camera {camera_id}"
+                        )
+                        self._discard_session(camera_id, session)
+                        self.stats.capture_failures += 1
+                        return None
+
+                    if was_open:
+                        self.stats.sessions_reopened += 1
+                    else:
+                        self.stats.sessions_opened += 1
+                    frame = session.read_latest_frame()
+
+                if frame is None:
+                    self._discard_session(camera_id, session)
+                    self.stats.capture_failures += 1
+                    return None
+
+                session.last_used_at = time.monotonic()
+                self.stats.frames_captured += 1
+                return frame
+
+            except Exception as e:
+                logger.warning(
+                    f"RTSP session capture failed for camera {camera_id}: {e}"
+                )
+                self._discard_session(camera_id, session)
+                self.stats.capture_failures += 1
+                return None
+
+    def check_liveness(
+        self, camera_id: int, rtsp_url: str, timeout_seconds: int
+    ) -> Optional[bool]:
+        """
+        Cheap liveness check against an already open session.
+
+        Args:
+            camera_id: Camera identifier
+            rtsp_url: RTSP URL the session must match
+            timeout_seconds: Maximum time to wait for an in-flight capture
+
+        Returns:
+            True if the open session delivered a live frame, None if there is
+            no usable session and a full connection test is required
+        """
+        with self._pool_lock:
+            session = self._sessions.get(camera_id)
+
+        if session is None or session.rtsp_url != rtsp_url:
+            return None
+
+        if not session.lock.acquire(timeout=timeout_seconds):
+            return None
+
+        try:
+            self.stats.liveness_checks += 1
+            if session.is_alive():
+                session.last_used_at = time.monotonic()
+                return True
+        except Exception as e:
+            logger.debug(
+                f"RTSP session liveness check failed for camera {camera_id}: {e}"
+            )
+        finally:
+            session.lock.release()
+
+        # Session is dead; drop it so the next capture starts fresh
+        self.close_session(camera_id)
+        return None
+
+    def evict_idle_sessions(self) -> int:
+        """
+        Close sessions that have not been used within the idle timeout.
+
+        Returns:
+            Number of sessions evicted
+        """
+        with self._pool_lock:
+            idle = [
+                (camera_id, session)
+                for camera_id, session in self._sessions.items()
+                if session.idle_seconds >= self.idle_timeout_seconds
+            ]
+            for camera_id, _ in idle:
+                del self._sessions[camera_id]
+
+        for camera_id, session in idle:
+            self._close_when_free(session)
+            logger.debug(f"Evicted idle RTSP session for camera {camera_id}")
+
+        self.stats.sessions_evicted += len(idle)
+        return len(idle)
+
+    def close_session(self, camera_id: int) -> None:
+        """Close and remove the session for a camera, if any."""
+        with self._pool_lock:
+            session = self._sessions.pop(camera_id, None)
+        if session is not None:
+            self._close_when_free(session)
+
+    def close_all(self) -> None:
+        """Close all sessions and stop the keepalive thread (worker shutdown)."""
+        self._keepalive_stop.set()
+        with self._pool_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._keepalive_thread = None
+        for session in sessions:
+            self._close_when_free(session)
+        if sessions:
+            logger.info(f"Closed {len(sessions)} RTSP sessions")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session pool statistics for monitoring."""
+        with self._pool_lock:
+            open_cameras: List[int] = [
+                camera_id
+                for camera_id, session in self._sessions.items()
+                if session.is_open
+            ]
+        return {
+            "open_sessions": len(open_cameras),
+            "open_camera_ids": open_cameras,
+            "max_sessions": self.max_sessions,
+            "sessions_opened": self.stats.sessions_opened,
+            "sessions_reused": self.stats.sessions_reused,
+            "sessions_reopened": self.stats.sessions_reopened,
+            "sessions_evicted": self.stats.sessions_evicted,
+            "frames_captured": self.stats.frames_captured,
+            "capture_failures": self.stats.capture_failures,
+            "liveness_checks": self.stats.liveness_checks,
+            "reuse_ratio_percent": round(self.stats.reuse_ratio, 2),
+        }
+
+    def _get_or_create_session(
+        self, camera_id: int, rtsp_url: str, timeout_seconds: int
+    ) -> RTSPSession:
+        """Get the session for a camera, replacing it if the URL changed."""
+        stale: List[RTSPSession] = []
+
+        with self._pool_lock:
+            session = self._sessions.get(camera_id)
+            if session is not None and session.rtsp_url != rtsp_url:
+                stale.append(self._sessions.pop(camera_id))
+                session = None
+
+            if session is None:
+                if len(self._sessions) >= self.max_sessions:
+                    lru_camera_id = min(
+                        self._sessions, key=lambda cid: self._sessions[cid].last_used_at
+                    )
+                    stale.append(self._sessions.pop(lru_camera_id))
+                    self.stats.sessions_evicted += 1
+
+                session = RTSPSession(camera_id, rtsp_url, timeout_seconds)
+                self._sessions[camera_id] = session
+                self._ensure_keepalive_thread()
+            else:
+                session.timeout_seconds = timeout_seconds
+
+        for old_session in stale:
+            self._close_when_free(old_session)
+
+        return session
+
+    def _ensure_keepalive_thread(self) -> None:
+        """Start the keepalive thread if it is not running (pool lock held)."""
+        if self._keepalive_thread is not None and self._keepalive_thread.is_alive():
+            return
+
+        self._keepalive_stop = Event()
+        self._keepalive_thread = Thread(
+            target=self._keepalive_loop,
+            args=(self._keepalive_stop,),
+            name="rtsp-session-keepalive",
+            daemon=True,
+        )
+        self._keepalive_thread.start()
+
+    def _keepalive_loop(self, stop_event: Event) -> None:
+        """Keep open sessions warm and evict idle ones until stopped."""
+        interval = max(1.0, self.keepalive_seconds / 3)
+
+        while not stop_event.wait(interval):
+            try:
+                self.evict_idle_sessions()
+
+                with self._pool_lock:
+                    sessions = list(self._sessions.values())
+
+                for session in sessions:
+                    if stop_event.is_set():
+                        return
+                    if not session.is_open or session.io_idle_seconds < interval:
+                        continue
+                    # Skip sessions busy with a capture; that capture keeps them warm
+                    if not session.lock.acquire(blocking=False):
+                        continue
+                    try:
+                        if not session.is_alive():
+                            logger.debug(
+                                f"RTSP keepalive failed for camera {session.camera_id}, "
+                                "session will reopen on next capture"
+                            )
+                            session.close()
+                    finally:
+                        session.lock.release()
+
+            except Exception as e:
+                logger.warning(f"RTSP session keepalive error: {e}")
+
+    def _discard_session(self, camera_id: int, session: RTSPSession) -> None:
+        """Close a failed session (caller holds its lock) and remove it."""
+        session.close()
+        with self._pool_lock:
+            if self._sessions.get(camera_id) is session:
+                del self._sessions[camera_id]
+
+    @staticmethod
+    def _close_when_free(session: RTSPSession) -> None:
+        """Close a session once any in-flight capture has finished with it."""
+        with session.lock:
+            session.close()
+
+
+# Global session pool shared by capture and health monitoring in this process
+rtsp_session_pool = RTSPSessionPool()
+
+
+def get_rtsp_session_pool() -> RTSPSessionPool:
+    """Get the process-wide RTSP session pool."""
+    return rtsp_session_pool
@@ -18,6 +18,8 @@ from ...constants import (
     DEFAULT_RTSP_QUALITY,
     DEFAULT_RTSP_TIMEOUT_SECONDS,
     RETRY_BACKOFF_BASE,
+    RTSP_SESSION_LIVE_FRAME_THRESHOLD_SECONDS,
+    RTSP_SESSION_MAX_DRAIN_FRAMES,
 )
 from ...enums import LoggerName
 from ...exceptions import RTSPCaptureError, RTSPConnectionError
@@ -67,6 +69,71 @@ def configure_rtsp_capture(
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
 
 
+def open_rtsp_capture(
+    rtsp_url: str, timeout_seconds: int = DEFAULT_RTSP_TIMEOUT_SECONDS
+) -> cv2.VideoCapture:
+    """
+    Open and configure a VideoCapture for an RTSP/RTSPS stream.
+
+    The returned capture may not be opened; callers must check ``isOpened()``
+    and are responsible for releasing it.
+
+    Args:
+        rtsp_url: RTSP stream URL
+        timeout_seconds: Timeout for connection and read operations
+
+    Returns:
+        Configured OpenCV VideoCapture object
+    """
+    is_rtsps = rtsp_url.lower().startswith("rtsps://")
+    if is_rtsps:
+        logger.debug("Configuring capture for RTSPS (secure RTSP) connection")
+        # Set FFmpeg options for SSL/TLS RTSP connections
+        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = (
+            "rtsp_transport;tcp|rw_timeout;10000000|stimeout;10000000"
+        )
+
+    # Configure OpenCV for RTSP with HEVC/H.265 optimization
+    cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
+    configure_rtsp_capture(cap, timeout_seconds)
+
+    # Additional configuration for RTSPS streams
+    if is_rtsps:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize buffering for SSL streams
+
+    return cap
+
+
+def grab_latest_frame(
+    cap: cv2.VideoCapture,
+    max_drain_frames: int = RTSP_SESSION_MAX_DRAIN_FRAMES,
+    live_threshold_seconds: float = RTSP_SESSION_LIVE_FRAME_THRESHOLD_SECONDS,
+) -> bool:
+    """
+    Advance an open capture to the most recent frame of a live stream.
+
+    Frames already sitting in the decoder buffer are returned almost instantly,
+    while a live frame has to wait for the camera. Grabbing until a grab takes
+    longer than ``live_threshold_seconds`` discards the stale backlog of a
+    long-lived connection without decoding it.
+
+    Args:
+        cap: Opened OpenCV VideoCapture object
+        max_drain_frames: Upper bound on the number of grabs performed
+        live_threshold_seconds: Grab duration that indicates a live frame
+
+    Returns:
+        True if the last grab succeeded and a frame can be retrieved
+    """
+    for _ in range(max(1, max_drain_frames)):
+        start_time = time.monotonic()
+        if not cap.grab():
+            return False
+        if time.monotonic() - start_time >= live_threshold_seconds:
+            break
+    return True
+
+
 def capture_frame_from_rtsp(
     rtsp_url: str,
     timeout_seconds: int = DEFAULT_RTSP_TIMEOUT_SECONDS,
@@ -93,24 +160,8 @@ def capture_frame_from_rtsp(
     try:
         logger.debug(f"Connecting to RTSP stream: {rtsp_url}")
 
-        # Check if this is an RTSPS (secure) connection
         is_rtsps = rtsp_url.lower().startswith("rtsps://")
-        if is_rtsps:
-            logger.debug("Configuring capture for RTSPS (secure RTSP) connection")
-            # Set FFmpeg options for SSL/TLS RTSP connections
-            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = (
-                "rtsp_transport;tcp|rw_timeout;10000000|stimeout;10000000"
-            )
-
-        # Configure OpenCV for RTSP with HEVC/H.265 optimization
-        cap = cv2.VideoCapture(rtsp_url, cv2.CAP_FFMPEG)
-
-        # Apply RTSP configuration
-        configure_rtsp_capture(cap, timeout_seconds)
-
-        # Additional configuration for RTSPS streams
-        if is_rtsps:
-            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize buffering for SSL streams
+        cap = open_rtsp_capture(rtsp_url, timeout_seconds)
 
         if not cap.isOpened():
             # If RTSPS failed, try fallback approaches
@@ -671,6 +722,33 @@ def get_frame_resolution(frame: Any) -> Tuple[int, int]:
         return 0, 0
 
 
+def process_frame(
+    frame: Any, rotation: int = 0, processing_settings: Optional[dict] = None
+) -> Any:
+    """
+    Apply crop/rotation/aspect ratio processing to a frame without saving it.
+
+    Args:
+        frame: OpenCV frame to process
+        rotation: Rotation angle in degrees (0, 90, 180, 270) - legacy parameter
+        processing_settings: Complete crop/rotation/aspect ratio settings dict
+
+    Returns:
+        Processed frame (the input frame if no processing applies)
+    """
+    # Apply new processing pipeline if settings provided
+    if processing_settings:
+        logger.debug("Applying complete processing pipeline to frame")
+        return apply_processing_pipeline(frame, processing_settings)
+
+    if rotation != 0:
+        # Fallback to legacy rotation parameter
+        logger.debug(f"Applying legacy {rotation}° rotation to frame")
+        return apply_rotation(frame, rotation)
+
+    return frame
+
+
 def save_frame_to_file(
     frame: Any,
     filepath: Path,
@@ -692,16 +770,7 @@ def save_frame_to_file(
         Tuple of (success: bool, file_size: int)
     """
     try:
-        processed_frame = frame
-
-        # Apply new processing pipeline if settings provided
-        if processing_settings:
-            processed_frame = apply_processing_pipeline(frame, processing_settings)
-            logger.debug("Applied complete processing pipeline to frame")
-        elif rotation != 0:
-            # Fallback to legacy rotation parameter
-            processed_frame = apply_rotation(frame, rotation)
-            logger.debug(f"Applied legacy {rotation}° rotation to frame")
+        processed_frame = process_frame(frame, rotation, processing_settings)
 
         encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
         success = cv2.imwrite(str(filepath), processed_frame, encode_params)
@@ -6,6 +6,7 @@ Orchestrates the complete image capture workflow by coordinating existing servic
 This is the main entry point for capture operations.
 """
 
+import json
 import time
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -13,24 +14,41 @@ from typing import Any, Dict, Optional
 from ...constants import (
     CAMERA_CAPTURE_FAILED,
     CAMERA_CAPTURE_SUCCESS,
+    SSE_NOTIFY_CHANNEL,
 )
+from ...database.camera_operations import CameraQueryBuilder
 from ...database.core import SyncDatabase
-from ...database.sse_events_operations import SyncSSEEventsOperations
+from ...database.exceptions import ImageOperationError
+from ...database.image_operations import ImageQueryBuilder
+from ...database.job_claim_operations import JobClaimQueryBuilder
+from ...database.sse_events_operations import (
+    SSEEventQueryBuilder,
+    SyncSSEEventsOperations,
+)
+from ...database.thumbnail_job_operations import (
+    THUMBNAIL_JOB_TABLE,
+    ThumbnailJobQueryBuilder,
+)
 from ...enums import (
+    JobTypes,
     LogEmoji,
     LoggerName,
     SSEEvent,
     SSEEventSource,
     SSEPriority,
     ThumbnailJobPriority,
+    ThumbnailJobStatus,
+    ThumbnailJobType,
 )
 from ...exceptions import RTSPCaptureError
+from ...models.image_model import Image
 from ...models.shared_models import RTSPCaptureResult
 from ...services.camera_service import SyncCameraService
 from ...services.image_service import SyncImageService
 from ...services.logger import get_service_logger
 from ...services.timelapse_service import SyncTimelapseService
 from ...services.weather.service import WeatherManager
+from ...utils.captured_frame import CapturedFrame, get_recent_frame_cache
 from ...utils.database_helpers import DatabaseUtilities
 from ...utils.file_helpers import ensure_entity_directory, get_relative_path
 from ...utils.time_utils import (
@@ -40,6 +58,8 @@ from ...utils.time_utils import (
 from ..corruption_pipeline.services.evaluation_service import (
     SyncCorruptionEvaluationService,
 )
+from .capture_context import CaptureContext, load_capture_context
+from .capture_transaction_manager import CaptureTransaction, CaptureTransactionManager
 from .job_coordination_service import JobCoordinationService
 from .rtsp_service import RTSPService
 from .utils import generate_capture_filename
@@ -75,6 +95,7 @@ class WorkflowOrchestratorService:
         weather_service: Optional["WeatherManager"] = None,  # Optional weather service
         overlay_service=None,  # Optional overlay service
         settings_service=None,  # Settings service for timezone-aware operations
+        transaction_manager: Optional[CaptureTransactionManager] = None,
     ):
         """
         Initialize workflow orchestrator with injected services.
@@ -90,8 +111,11 @@ class WorkflowOrchestratorService:
             sse_ops: SSE event database operations
             weather_service: Optional weather service
             settings_service: Settings service for timezone-aware operations
+            transaction_manager: Capture transaction manager used to commit
+                the writes of each capture (created from db if omitted)
         """
         self.db = db
+        self.transaction_manager = transaction_manager or CaptureTransactionManager(db)
 
         # Assign injected services
         self.image_service = image_service
@@ -125,6 +149,7 @@ class WorkflowOrchestratorService:
         camera_id: int,
         timelapse_id: int,
         workflow_context: Optional[Dict[str, Any]] = None,
+        capture_context: Optional[CaptureContext] = None,
     ) -> RTSPCaptureResult:
         """
         Execute the complete capture workflow using existing services.
@@ -136,6 +161,8 @@ class WorkflowOrchestratorService:
             camera_id: Camera identifier
             timelapse_id: Active timelapse identifier
             workflow_context: Optional context for workflow customization
+            capture_context: Camera, timelapse and settings validated by the
+                scheduler (loaded with a single query if not provided)
 
         Returns:
             RTSPCaptureResult with complete workflow results
@@ -148,26 +175,22 @@ class WorkflowOrchestratorService:
                 emoji=LogEmoji.ROCKET,
             )
 
-            # 1. Validate prerequisites
+            # 1. Validate prerequisites (one query when no context was handed over)
+            if capture_context is None:
+                capture_context = self._load_capture_context(timelapse_id)
+
             validation_result = self._validate_capture_prerequisites(
-                camera_id, timelapse_id
+                camera_id, timelapse_id, capture_context
             )
-            if not validation_result["valid"]:
+            if not validation_result["valid"] or capture_context is None:
                 return RTSPCaptureResult(
                     success=False,
-                    error=validation_result["error"],
+                    error=validation_result.get("error"),
                     message="Capture prerequisites validation failed",
                 )
 
             # 2. Execute RTSP capture using RTSPService
-            # Get camera object and create capture path
-            camera = self.camera_service.get_camera_by_id(camera_id)
-            if not camera:
-                return RTSPCaptureResult(
-                    success=False,
-                    error=f"Camera {camera_id} not found for capture",
-                    message="Camera validation failed",
-                )
+            camera = capture_context.camera
 
             # Create output path for captured image following FILE_STRUCTURE_GUIDE.md
             timestamp = utc_now()
@@ -178,7 +201,7 @@ class WorkflowOrchestratorService:
             output_path = frames_dir / filename
 
             # Prepare capture settings
-            capture_settings = self.rtsp_service._get_capture_settings()
+            capture_settings = dict(capture_context.capture_settings)
             capture_settings.update({"quality": 90})
 
             logger.debug(
@@ -202,14 +225,24 @@ class WorkflowOrchestratorService:
             )
 
             # Convert dict result to RTSPCaptureResult
+            captured_frame: Optional[CapturedFrame] = None
             if capture_result_dict.get("success"):
+                file_size = capture_result_dict.get("file_size", 0)
                 capture_result = RTSPCaptureResult(
                     success=True,
                     message="Capture successful",
                     image_path=str(output_path),
-                    file_size=output_path.stat().st_size if output_path.exists() else 0,
+                    file_size=file_size,
                     metadata=capture_result_dict.get("metadata", {}),
                 )
+
+                # Keep the decoded frame in memory for quality evaluation and
+                # downstream thumbnail/overlay generation (decode once per capture)
+                if capture_result_dict.get("frame") is not None:
+                    captured_frame = CapturedFrame(
+                        capture_result_dict["frame"], output_path, file_size
+                    )
+                    get_recent_frame_cache().put(output_path, captured_frame)
             else:
                 capture_result = RTSPCaptureResult(
                     success=False,
@@ -253,90 +286,124 @@ class WorkflowOrchestratorService:
                     message="Capture validation failed",
                 )
 
-            # 3. Evaluate image quality using CorruptionService
-            logger.debug(
-                "🔍 Evaluating image quality",
-                extra_context={
-                    "camera_id": camera_id,
-                    "timelapse_id": timelapse_id,
-                    "image_path": str(capture_result.image_path),
-                    "operation": "evaluate_image_quality",
-                },
-            )
-            quality_result = self._evaluate_image_quality(
-                camera_id=camera_id, image_path=capture_result.image_path
-            )
-
-            # 4. Handle quality evaluation results
-            if quality_result["should_discard"]:
-                logger.warning(
-                    f"Image discarded due to quality: {quality_result['reason']}",
-                    extra_context={
-                        "camera_id": camera_id,
-                        "timelapse_id": timelapse_id,
-                        "image_path": str(capture_result.image_path),
-                        "discard_reason": quality_result["reason"],
-                        "corruption_score": quality_result.get("corruption_score"),
-                        "operation": "image_quality_discard",
-                    },
-                )
-                # Clean up the captured file
-                self._cleanup_discarded_image(capture_result.image_path)
+            # 3-7. Evaluate, record and announce the capture as one unit. The
+            # database writes are queued on the capture transaction and sent
+            # in a single pipelined commit; if it fails the file is removed.
+            # A quality retry runs only after this capture's unit of work has
+            # committed, so it never nests inside it.
+            retry_capture = False
+            try:
+                with self.transaction_manager.capture_transaction(
+                    camera_id, timelapse_id
+                ) as transaction:
+                    transaction.file_path = Path(capture_result.image_path)
+                    transaction.add_rollback_action(
+                        lambda: get_recent_frame_cache().discard(output_path)
+                    )
 
-                # Check if retry is recommended
-                if quality_result.get("retry_recommended", False):
-                    logger.info(
-                        "Retrying capture due to quality issues",
+                    # 3. Evaluate image quality using CorruptionService
+                    logger.debug(
+                        "🔍 Evaluating image quality",
                         extra_context={
                             "camera_id": camera_id,
                             "timelapse_id": timelapse_id,
-                            "operation": "quality_retry",
-                            "original_reason": quality_result["reason"],
+                            "image_path": str(capture_result.image_path),
+                            "operation": "evaluate_image_quality",
                         },
                     )
-                    return self._retry_capture_workflow(
-                        camera_id, timelapse_id, workflow_context
+                    quality_result = self._evaluate_image_quality(
+                        camera_id=camera_id,
+                        image_path=capture_result.image_path,
+                        captured_frame=captured_frame,
+                        capture_context=capture_context,
+                        capture_transaction=transaction,
                     )
 
-                return RTSPCaptureResult(
-                    success=False,
-                    error=f"Image quality below threshold: {quality_result['final_score']:.1f}",
-                    message="Image discarded due to quality",
-                )
-
-            # 5. Create image record using ImageService
-            logger.debug("💾 Creating image record")
-            image_record = self._create_image_record(
-                camera_id=camera_id,
-                timelapse_id=timelapse_id,
-                image_path=capture_result.image_path,
-                quality_data=quality_result,
-                workflow_context=workflow_context,
-            )
-
-            if not image_record:
-                logger.error("Failed to create image record")
+                    # 4. Handle quality evaluation results (queued corruption
+                    # writes are still committed for discarded images)
+                    if quality_result["should_discard"]:
+                        logger.warning(
+                            f"Image discarded due to quality: {quality_result['reason']}",
+                            extra_context={
+                                "camera_id": camera_id,
+                                "timelapse_id": timelapse_id,
+                                "image_path": str(capture_result.image_path),
+                                "discard_reason": quality_result["reason"],
+                                "corruption_score": quality_result.get(
+                                    "corruption_score"
+                                ),
+                                "operation": "image_quality_discard",
+                            },
+                        )
+                        # Clean up the captured file
+                        self._cleanup_discarded_image(capture_result.image_path)
+
+                        # Retry after the transaction commits, keeping its
+                        # corruption writes even if the retry fails
+                        retry_capture = quality_result.get("retry_recommended", False)
+                        if not retry_capture:
+                            return RTSPCaptureResult(
+                                success=False,
+                                error=f"Image quality below threshold: {quality_result['final_score']:.1f}",
+                                message="Image discarded due to quality",
+                            )
+
+                    else:
+                        # 5-7. Queue the image record, background jobs, SSE events
+                        # and camera stats for the capture commit
+                        logger.debug("💾 Queuing capture writes")
+                        image_data = self._build_image_data(
+                            camera_id=camera_id,
+                            timelapse_id=timelapse_id,
+                            image_path=capture_result.image_path,
+                            quality_data=quality_result,
+                            workflow_context=workflow_context,
+                            file_size=capture_result.file_size,
+                            capture_context=capture_context,
+                        )
+                        image_count = self._get_timelapse_image_count(
+                            timelapse_id, capture_context
+                        )
+                        job_results = self._queue_capture_writes(
+                            transaction,
+                            camera_id=camera_id,
+                            timelapse_id=timelapse_id,
+                            image_data=image_data,
+                            image_count=image_count,
+                        )
+
+            except ImageOperationError as e:
+                logger.error("Failed to commit capture writes", exception=e)
                 return RTSPCaptureResult(
                     success=False,
                     error="Database record creation failed",
                     message="Could not save image metadata",
                 )
 
-            # 6. Coordinate background jobs
-            logger.debug("🔄 Coordinating background jobs")
-            job_results = self._coordinate_background_jobs(
-                image_id=image_record.id,
-                timelapse_id=timelapse_id,
-                workflow_context=workflow_context,
-            )
+            if retry_capture:
+                logger.info(
+                    "Retrying capture due to quality issues",
+                    extra_context={
+                        "camera_id": camera_id,
+                        "timelapse_id": timelapse_id,
+                        "operation": "quality_retry",
+                        "original_reason": quality_result["reason"],
+                    },
+                )
+                return self._retry_capture_workflow(
+                    camera_id,
+                    timelapse_id,
+                    workflow_context,
+                    capture_context,
+                )
 
-            # 7. Broadcast SSE events
-            logger.debug("Broadcasting capture events", emoji=LogEmoji.BROADCAST)
-            self._broadcast_capture_events(
-                camera_id=camera_id,
-                timelapse_id=timelapse_id,
-                image_record=image_record,
-                job_results=job_results,
+            image_record = Image.model_validate(transaction.results["image"])
+            thumbnail_job = transaction.results.get("thumbnail_job")
+            if thumbnail_job:
+                job_results["thumbnail_job"] = thumbnail_job["id"]
+            logger.debug(
+                f"Recorded image {image_record.id} with {job_results['total_jobs_queued']} jobs queued",
+                emoji=LogEmoji.BROADCAST,
             )
 
             # 8. Return successful result
@@ -356,7 +423,7 @@ class WorkflowOrchestratorService:
                     "corruption_score": quality_result.get("final_score", 0.0),
                     "quality_verdict": quality_result.get("quality_verdict", "unknown"),
                     "background_jobs": job_results,
-                    "image_count": self._get_timelapse_image_count(timelapse_id),
+                    "image_count": image_count,
                 },
             )
 
@@ -366,34 +433,46 @@ class WorkflowOrchestratorService:
                 camera_id, timelapse_id, e, workflow_context
             )
 
+    def _load_capture_context(self, timelapse_id: int) -> Optional[CaptureContext]:
+        """Load the capture context of a timelapse, or None if unavailable."""
+        try:
+            return load_capture_context(self.db, timelapse_id)
+        except Exception as e:
+            logger.error(
+                f"Error loading capture context for timelapse {timelapse_id}",
+                exception=e,
+            )
+            return None
+
     def _validate_capture_prerequisites(
-        self, camera_id: int, timelapse_id: int
+        self,
+        camera_id: int,
+        timelapse_id: int,
+        capture_context: Optional[CaptureContext],
     ) -> Dict[str, Any]:
         """
         Minimal safety validation for capture workflow.
 
         TRUST MODEL: Assumes comprehensive validation already performed by SchedulerWorker
         using SchedulingService.validate_capture_readiness(). This method only performs
-        basic safety checks as a final safeguard.
+        basic safety checks on the capture context as a final safeguard.
 
         Args:
             camera_id: Camera identifier
             timelapse_id: Timelapse identifier
+            capture_context: Loaded capture context, if any
 
         Returns:
             Validation result with status and details
         """
         try:
             # Basic existence checks only - trust scheduler's comprehensive validation
-            camera = self.camera_service.get_camera_by_id(camera_id)
-            timelapse = self.timelapse_service.get_timelapse_by_id(timelapse_id)
+            if capture_context is None:
+                return {"valid": False, "error": f"Timelapse {timelapse_id} not found"}
 
-            if not camera:
+            if capture_context.camera_id != camera_id:
                 return {"valid": False, "error": f"Camera {camera_id} not found"}
 
-            if not timelapse:
-                return {"valid": False, "error": f"Timelapse {timelapse_id} not found"}
-
             # Trust scheduler validation for status, health, timing, etc.
             # Only basic existence validation here
             return {"valid": True}
@@ -406,16 +485,27 @@ class WorkflowOrchestratorService:
         self,
         camera_id: int,
         image_path: str,
+        captured_frame: Optional[CapturedFrame] = None,
+        capture_context: Optional[CaptureContext] = None,
+        capture_transaction: Optional[CaptureTransaction] = None,
         _workflow_context: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Evaluate captured image quality using CorruptionService.
 
         TEMPORARILY DISABLED: Always return good quality to bypass corruption evaluation issues.
+        When re-enabled, pass captured_frame, capture_context and
+        capture_transaction to corruption_evaluation_service.evaluate_captured_image()
+        so the detectors work on the in-memory frame instead of decoding the
+        file, the corruption settings are not queried again, and the detection
+        log is written with the capture commit.
 
         Args:
             camera_id: Camera identifier
             image_path: Path to captured image
+            captured_frame: Decoded frame from this capture, if available
+            capture_context: Capture context with the corruption settings
+            capture_transaction: Capture transaction to queue detection writes on
             workflow_context: Optional workflow context
 
         Returns:
@@ -437,16 +527,18 @@ class WorkflowOrchestratorService:
             "reason": "Quality evaluation temporarily disabled - all images accepted",
         }
 
-    def _create_image_record(
+    def _build_image_data(
         self,
         camera_id: int,
         timelapse_id: int,
         image_path: str,
         quality_data: Dict[str, Any],
         workflow_context: Optional[Dict[str, Any]] = None,
-    ):
+        file_size: Optional[int] = None,
+        capture_context: Optional[CaptureContext] = None,
+    ) -> Dict[str, Any]:
         """
-        Create image database record using ImageService.
+        Build the image record parameters for a captured image.
 
         Args:
             camera_id: Camera identifier
@@ -454,77 +546,75 @@ class WorkflowOrchestratorService:
             image_path: Path to captured image
             quality_data: Quality evaluation results
             workflow_context: Optional workflow context
+            file_size: Size of the saved image, if already known
+            capture_context: Capture context providing timezone and start date
 
         Returns:
-            Created image record or None if failed
+            Named parameters for ImageQueryBuilder.build_record_image_query()
         """
-        try:
-            # Use existing file_helpers to get proper relative path for database storage
-            file_path = get_relative_path(Path(image_path))
-
-            # Get timezone-aware timestamp using database timezone settings
-            if self.settings_service:
-                captured_time = get_timezone_aware_timestamp_sync(self.settings_service)
-                logger.debug(f"Using timezone-aware timestamp: {captured_time}")
-            else:
-                captured_time = utc_now()
-                logger.warning(
-                    "Using UTC timestamp - settings_service not available for timezone conversion"
-                )
+        # Use existing file_helpers to get proper relative path for database storage
+        file_path = get_relative_path(Path(image_path))
+
+        # Get timezone-aware timestamp using database timezone settings
+        if capture_context is not None:
+            captured_time = capture_context.now()
+        elif self.settings_service:
+            captured_time = get_timezone_aware_timestamp_sync(self.settings_service)
+            logger.debug(f"Using timezone-aware timestamp: {captured_time}")
+        else:
+            captured_time = utc_now()
+            logger.warning(
+                "Using UTC timestamp - settings_service not available for timezone conversion"
+            )
 
-            # Calculate correct day number based on timelapse start date
+        # Calculate correct day number based on timelapse start date
+        if capture_context is not None:
+            day_number = capture_context.day_number(captured_time)
+        else:
             day_number = self._calculate_day_number(timelapse_id, captured_time)
 
-            # Get current weather data
-            weather_data = self._get_current_weather()
-
-            # Extract filename from path for database storage
-            filename = Path(image_path).name
-
-            image_data = {
-                "camera_id": camera_id,
-                "timelapse_id": timelapse_id,
-                "file_path": file_path,
-                "filename": filename,
-                "captured_at": captured_time,
-                "corruption_score": int(quality_data.get("final_score", 0.0)),
-                "is_flagged": quality_data.get("quality_verdict") == "warning",
-                "file_size": (
+        # Get current weather data
+        weather_data = self._get_current_weather()
+
+        # Extract filename from path for database storage
+        filename = Path(image_path).name
+
+        image_data = {
+            "camera_id": camera_id,
+            "timelapse_id": timelapse_id,
+            "file_path": file_path,
+            "filename": filename,
+            "captured_at": captured_time,
+            "corruption_score": int(quality_data.get("final_score", 0.0)),
+            "is_flagged": quality_data.get("quality_verdict") == "warning",
+            "file_size": (
+                file_size
+                if file_size
+                else (
                     Path(image_path).stat().st_size if Path(image_path).exists() else 0
-                ),
-                # Required database fields
-                "corruption_detected": quality_data.get("quality_verdict") == "warning",
-                "day_number": day_number,
-                "thumbnail_path": None,  # Will be set by thumbnail worker
-                # Weather data from current weather_data table
-                "weather_conditions": weather_data.get("current_weather_description"),
-                "weather_fetched_at": weather_data.get("weather_date_fetched"),
-                "weather_icon": weather_data.get("current_weather_icon"),
-                "weather_temperature": weather_data.get("current_temp"),
-            }
-
-            # Add quality metadata
-            if quality_data.get("success", True):
-                image_data["corruption_details"] = {
-                    "fast_score": quality_data.get("fast_score"),
-                    "heavy_score": quality_data.get("heavy_score"),
-                    "quality_verdict": quality_data.get("quality_verdict"),
-                    "workflow_context": workflow_context,
-                }
-
-            # Create record using ImageService
-            image_record = self.image_service.record_captured_image(image_data)
+                )
+            ),
+            # Required database fields
+            "corruption_detected": quality_data.get("quality_verdict") == "warning",
+            "day_number": day_number,
+            "thumbnail_path": None,  # Will be set by thumbnail worker
+            # Weather data from current weather_data table
+            "weather_conditions": weather_data.get("current_weather_description"),
+            "weather_fetched_at": weather_data.get("weather_date_fetched"),
+            "weather_icon": weather_data.get("current_weather_icon"),
+            "weather_temperature": weather_data.get("current_temp"),
+        }
 
-            if image_record:
-                logger.debug(f"Created image record {image_record.id}")
-                return image_record
-            else:
-                logger.error("ImageService failed to create record")
-                return None
+        # Add quality metadata
+        if quality_data.get("success", True):
+            image_data["corruption_details"] = {
+                "fast_score": quality_data.get("fast_score"),
+                "heavy_score": quality_data.get("heavy_score"),
+                "quality_verdict": quality_data.get("quality_verdict"),
+                "workflow_context": workflow_context,
+            }
 
-        except Exception as e:
-            logger.error("Error creating image record", exception=e)
-            return None
+        return image_data
 
     def _calculate_day_number(self, timelapse_id: int, captured_time) -> int:
         """
@@ -607,104 +697,164 @@ class WorkflowOrchestratorService:
             logger.warning(f"Error retrieving weather data: {e}")
             return {}
 
-    def _coordinate_background_jobs(
+    def _queue_capture_writes(
         self,
-        image_id: int,
+        transaction: CaptureTransaction,
+        camera_id: int,
         timelapse_id: int,
-        workflow_context: Optional[Dict[str, Any]] = None,
+        image_data: Dict[str, Any],
+        image_count: int,
     ) -> Dict[str, Any]:
         """
-        Coordinate background jobs using JobCoordinationService.
+        Queue the database writes of a successful capture.
+
+        The image insert (which also bumps the timelapse counters), the
+        thumbnail job with its worker notification, the SSE events and the
+        camera capture stats are committed together. Statements after the
+        image insert reference the new image and job ids through currval(),
+        so none of them waits for an earlier result.
+
+        🎯 SCHEDULER-CENTRIC: Video automation triggers are handled by
+        SchedulerWorker after capture completion; only the thumbnail job is
+        queued here.
 
         Args:
-            image_id: Created image record ID
+            transaction: Capture transaction to queue the writes on
+            camera_id: Camera identifier
             timelapse_id: Timelapse identifier
-            workflow_context: Optional workflow context
+            image_data: Image record parameters
+            image_count: Image count including this capture
 
         Returns:
-            Job coordination results
+            Job results; the thumbnail job id is filled in after the commit
         """
-        try:
-            job_results = {
-                "thumbnail_job": None,
-                "video_jobs": [],
-                "total_jobs_queued": 0,
-            }
+        job_results: Dict[str, Any] = {
+            "thumbnail_job": None,
+            "video_jobs": [],
+            "total_jobs_queued": 0,
+        }
+        image_id_sql = ImageQueryBuilder.build_current_image_id_sql()
+        now = utc_now()
+
+        transaction.add_write(
+            "image",
+            ImageQueryBuilder.build_record_image_query(),
+            image_data,
+            returns_row=True,
+        )
 
-            # Queue thumbnail generation job
-            thumbnail_result = self.job_coordinator.coordinate_thumbnail_job(
-                image_id=image_id,
-                priority=ThumbnailJobPriority.MEDIUM,
-                job_context=workflow_context,
+        if self._thumbnail_generation_enabled():
+            transaction.add_write(
+                "thumbnail_job",
+                ThumbnailJobQueryBuilder.build_insert_job_query(image_id_sql),
+                {
+                    "priority": ThumbnailJobPriority.MEDIUM,
+                    "status": ThumbnailJobStatus.PENDING,
+                    "job_type": ThumbnailJobType.SINGLE,
+                    "created_at": now,
+                },
+                returns_row=True,
             )
-
-            if thumbnail_result.get("success"):
-                job_results["thumbnail_job"] = thumbnail_result["job_id"]
-                job_results["total_jobs_queued"] += 1
-
-            # 🎯 SCHEDULER-CENTRIC: Video automation triggers are now handled by SchedulerWorker
-            # after capture completion. This ensures ALL timing decisions flow through scheduler authority.
-            # The capture pipeline only reports completion - timing decisions happen in SchedulerWorker.
-            logger.debug(
-                f"Video automation evaluation moved to SchedulerWorker for timelapse {timelapse_id}"
+            # Wake idle workers once the insert commits
+            transaction.add_write(
+                "thumbnail_job_notify",
+                JobClaimQueryBuilder.build_notify_query(),
+                JobClaimQueryBuilder.get_notify_params(THUMBNAIL_JOB_TABLE),
             )
+            transaction.add_write(
+                "job_created_event",
+                SSEEventQueryBuilder.build_insert_event_query(
+                    {
+                        "job_id": ThumbnailJobQueryBuilder.build_current_job_id_sql(),
+                        f"{JobTypes.THUMBNAIL.value}_related_id": f"{image_id_sql}::text",
+                    }
+                ),
+                {
+                    "event_type": SSEEvent.JOB_CREATED,
+                    "event_data": json.dumps(
+                        {
+                            "job_type": JobTypes.THUMBNAIL,
+                            "priority": SSEPriority.NORMAL,
+                            "operation": "created",
+                        }
+                    ),
+                    "priority": SSEPriority.NORMAL,
+                    "source": SSEEventSource.SYSTEM,
+                },
+            )
+            job_results["total_jobs_queued"] += 1
+
+        transaction.add_write(
+            "image_captured_event",
+            SSEEventQueryBuilder.build_insert_event_query(
+                {
+                    "image_id": image_id_sql,
+                    "captured_at": ImageQueryBuilder.build_current_image_captured_at_sql(),
+                }
+            ),
+            {
+                "event_type": SSEEvent.IMAGE_CAPTURED,
+                "event_data": json.dumps(
+                    {
+                        "camera_id": camera_id,
+                        "timelapse_id": timelapse_id,
+                        "image_count": image_count,
+                        "day_number": image_data["day_number"],
+                        "file_path": image_data["file_path"],
+                        "file_size": image_data["file_size"],
+                        "corruption_score": image_data["corruption_score"],
+                        "is_flagged": image_data["is_flagged"],
+                    }
+                ),
+                "priority": SSEPriority.NORMAL,
+                "source": SSEEventSource.CAPTURE_PIPELINE,
+            },
+        )
+        # One notification covers both events: brokers read everything after
+        # the last id they have seen
+        transaction.add_write(
+            "sse_notify",
+            SSEEventQueryBuilder.build_notify_last_event_query(),
+            (SSE_NOTIFY_CHANNEL,),
+        )
 
-            # Note: job_results["video_jobs"] and related counting removed since
-            # video jobs are now created by scheduler, not capture pipeline
+        transaction.add_write(
+            "camera_capture_stats",
+            CameraQueryBuilder.build_capture_success_query(),
+            {
+                "now": now,
+                "health_status": self.camera_service.determine_camera_health_status(0),
+                "now_updated": now,
+                "camera_id": camera_id,
+            },
+        )
 
-            return job_results
+        return job_results
 
+    def _thumbnail_generation_enabled(self) -> bool:
+        """Check whether a thumbnail job should be queued for new captures."""
+        try:
+            return self.job_coordinator.check_thumbnail_generation_enabled()
         except Exception as e:
-            logger.error("Error coordinating background jobs", exception=e)
-            return {"error": str(e), "total_jobs_queued": 0}
+            logger.warning(f"Error checking thumbnail generation setting: {e}")
+            return False
 
-    def _broadcast_capture_events(
-        self,
-        camera_id: int,
-        timelapse_id: int,
-        image_record,
-        job_results: Dict[str, Any],
-    ):
+    def _get_timelapse_image_count(
+        self, timelapse_id: int, capture_context: Optional[CaptureContext] = None
+    ) -> int:
         """
-        Broadcast SSE events for capture completion.
+        Get the image count of a timelapse including the capture being recorded.
 
-        Args:
-            camera_id: Camera identifier
-            timelapse_id: Timelapse identifier
-            image_record: Created image record
-            job_results: Background job results
+        With a capture context the count is taken from the snapshot instead of
+        loading the timelapse again.
         """
-        try:
-            # Use SSE operations to broadcast events
-            image_count = self._get_timelapse_image_count(timelapse_id)
-            day_number = image_record.day_number
+        if capture_context is not None:
+            return capture_context.timelapse.image_count + 1
 
-            self.sse_ops.create_event(
-                event_type=SSEEvent.IMAGE_CAPTURED,
-                event_data={
-                    "camera_id": camera_id,
-                    "timelapse_id": timelapse_id,
-                    "image_count": image_count,
-                    "day_number": day_number,
-                    "image_id": image_record.id,
-                },
-                priority=SSEPriority.NORMAL,
-                source=SSEEventSource.CAPTURE_PIPELINE,
-            )
-
-            logger.debug(
-                f"Broadcast capture event for image {image_record.id} with {job_results.get('total_jobs_queued', 0)} jobs queued"
-            )
-
-        except Exception as e:
-            logger.warning(f"Error broadcasting capture events: {e}")
-
-    def _get_timelapse_image_count(self, timelapse_id: int) -> int:
-        """Get current image count for timelapse."""
         try:
             timelapse = self.timelapse_service.get_timelapse_by_id(timelapse_id)
             if timelapse:
-                return timelapse.image_count
+                return timelapse.image_count + 1
             return 0
         except Exception:
             return 0
@@ -712,6 +862,7 @@ class WorkflowOrchestratorService:
     def _cleanup_discarded_image(self, image_path: str) -> None:
         """Clean up discarded image file."""
         try:
+            get_recent_frame_cache().discard(image_path)
             Path(image_path).unlink(missing_ok=True)
             logger.debug(f"Cleaned up discarded image: {image_path}")
         except Exception as e:
@@ -722,6 +873,7 @@ class WorkflowOrchestratorService:
         camera_id: int,
         timelapse_id: int,
         workflow_context: Optional[Dict[str, Any]] = None,
+        capture_context: Optional[CaptureContext] = None,
     ) -> RTSPCaptureResult:
         """
         Retry capture workflow once for quality issues.
@@ -730,6 +882,7 @@ class WorkflowOrchestratorService:
             camera_id: Camera identifier
             timelapse_id: Timelapse identifier
             workflow_context: Optional workflow context
+            capture_context: Capture context of the original attempt
 
         Returns:
             Retry capture result
@@ -744,7 +897,9 @@ class WorkflowOrchestratorService:
             )
 
             # Execute workflow again (this will be the final attempt)
-            return self.execute_capture_workflow(camera_id, timelapse_id, retry_context)
+            return self.execute_capture_workflow(
+                camera_id, timelapse_id, retry_context, capture_context
+            )
 
         except Exception as e:
             logger.error("Error in retry capture workflow", exception=e)
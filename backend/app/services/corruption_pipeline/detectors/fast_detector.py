@@ -69,12 +69,19 @@ class FastCorruptionDetector:
             "max_noise_threshold": 0.8,  # Maximum noise ratio
         }
 
-    def detect(self, image_path: str) -> Dict[str, Any]:
+    def detect(
+        self,
+        image_path: str,
+        image: Optional[np.ndarray] = None,
+        gray: Optional[np.ndarray] = None,
+    ) -> Dict[str, Any]:
         """
         Perform fast corruption detection on an image.
 
         Args:
             image_path: Path to the image file
+            image: Optional already-decoded BGR image (skips reading the file)
+            gray: Optional precomputed grayscale version of ``image``
 
         Returns:
             Dictionary with detection results
@@ -92,8 +99,10 @@ class FastCorruptionDetector:
                 failed_checks.append("file_size")
                 score -= file_size_result["penalty"]
 
-            # Load image
-            image = cv2.imread(image_path)
+            # Load image unless the caller already has it decoded
+            if image is None:
+                image = cv2.imread(image_path)
+                gray = None
             if image is None:
                 failed_checks.append("image_load")
                 return {
@@ -111,15 +120,18 @@ class FastCorruptionDetector:
                 failed_checks.append("dimensions")
                 score -= dimension_result["penalty"]
 
+            if gray is None:
+                gray = self._to_grayscale(image)
+
             # Brightness checks
-            brightness_result = self._check_brightness(image)
+            brightness_result = self._check_brightness(gray)
             details["brightness"] = brightness_result
             if not brightness_result["valid"]:
                 failed_checks.append("brightness")
                 score -= brightness_result["penalty"]
 
             # Uniformity checks
-            uniformity_result = self._check_uniformity(image)
+            uniformity_result = self._check_uniformity(gray)
             details["uniformity"] = uniformity_result
             if not uniformity_result["valid"]:
                 failed_checks.append("uniformity")
@@ -223,15 +235,16 @@ class FastCorruptionDetector:
                 "height": 0,
             }
 
-    def _check_brightness(self, image: np.ndarray) -> Dict[str, Any]:
+    @staticmethod
+    def _to_grayscale(image: np.ndarray) -> np.ndarray:
+        """Convert a BGR image to grayscale (no-op for grayscale input)"""
+        if len(image.shape) == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return image
+
+    def _check_brightness(self, gray: np.ndarray) -> Dict[str, Any]:
         """Check if image brightness is within reasonable bounds"""
         try:
-            # Convert to grayscale for brightness analysis
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-
             mean_brightness = np.mean(gray)
             min_brightness = self.config["min_brightness"]
             max_brightness = self.config["max_brightness"]
@@ -264,15 +277,9 @@ class FastCorruptionDetector:
                 "mean_brightness": 0.0,
             }
 
-    def _check_uniformity(self, image: np.ndarray) -> Dict[str, Any]:
+    def _check_uniformity(self, gray: np.ndarray) -> Dict[str, Any]:
         """Check for excessive uniformity which might indicate corruption"""
         try:
-            # Convert to grayscale for uniformity analysis
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image
-
             # Calculate variance to detect uniform images
             variance = np.var(gray)
             unique_values = len(np.unique(gray))
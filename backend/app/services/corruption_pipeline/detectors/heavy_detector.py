@@ -66,12 +66,19 @@ class HeavyCorruptionDetector:
             "symmetry_threshold": 0.3,  # Maximum allowed symmetry (for solid colors)
         }
 
-    def detect(self, image_path: str) -> Dict[str, Any]:
+    def detect(
+        self,
+        image_path: str,
+        image: Optional[np.ndarray] = None,
+        gray: Optional[np.ndarray] = None,
+    ) -> Dict[str, Any]:
         """
         Perform heavy corruption detection on an image.
 
         Args:
             image_path: Path to the image file
+            image: Optional already-decoded BGR image (skips reading the file)
+            gray: Optional precomputed grayscale version of ``image``
 
         Returns:
             Dictionary with detection results
@@ -82,8 +89,10 @@ class HeavyCorruptionDetector:
         score = 100.0  # Start with perfect score
 
         try:
-            # Load image
-            image = cv2.imread(image_path)
+            # Load image unless the caller already has it decoded
+            if image is None:
+                image = cv2.imread(image_path)
+                gray = None
             if image is None:
                 failed_checks.append("image_load")
                 return {
@@ -94,7 +103,8 @@ class HeavyCorruptionDetector:
                     "details": {"error": "Could not load image"},
                 }
 
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            if gray is None:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
             # Blur detection
             blur_result = self._check_blur(gray)
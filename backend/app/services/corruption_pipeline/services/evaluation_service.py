@@ -15,7 +15,7 @@ Responsibilities:
 - Audit trail management
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ....constants import (  # DEFAULT_CORRUPTION_RETRY_ENABLED,  # Unused; DEFAULT_DEGRADED_MODE_FAILURE_THRESHOLD,  # Unused
     CORRUPTION_CRITICAL_THRESHOLD,
@@ -24,6 +24,7 @@ from ....constants import (  # DEFAULT_CORRUPTION_RETRY_ENABLED,  # Unused; DEFA
 from ....database.core import AsyncDatabase, SyncDatabase
 from ....database.corruption_operations import (
     CorruptionOperations,
+    CorruptionQueryBuilder,
     SyncCorruptionOperations,
 )
 from ....enums import LoggerName, LogSource
@@ -31,6 +32,8 @@ from ....models.corruption_model import (
     CorruptionEvaluationResult,
 )
 from ....services.logger import LogEmoji, get_service_logger
+from ....utils.captured_frame import CapturedFrame
+from ....utils.time_utils import utc_now
 from ..detectors import (
     CorruptionScoreCalculator,
     FastCorruptionDetector,
@@ -48,6 +51,10 @@ from ..models.corruption_responses import (
     RetryDecision,
 )
 
+if TYPE_CHECKING:
+    from ...capture_pipeline.capture_context import CaptureContext
+    from ...capture_pipeline.capture_transaction_manager import CaptureTransaction
+
 logger = get_service_logger(LoggerName.CORRUPTION_PIPELINE, LogSource.PIPELINE)
 
 
@@ -532,6 +539,9 @@ class SyncCorruptionEvaluationService:
         file_path: str,
         timelapse_id: Optional[int] = None,
         capture_attempt: int = 1,
+        captured_frame: Optional[CapturedFrame] = None,
+        capture_context: Optional["CaptureContext"] = None,
+        capture_transaction: Optional["CaptureTransaction"] = None,
     ) -> CorruptionEvaluationResult:
         """
         Evaluate a captured image for corruption (sync version).
@@ -541,13 +551,23 @@ class SyncCorruptionEvaluationService:
             file_path: Path to captured image file
             timelapse_id: Optional timelapse ID
             capture_attempt: Capture attempt number
+            captured_frame: Optional decoded frame from the capture pipeline,
+                so the detectors do not decode the file again
+            capture_context: Optional capture context; its corruption settings
+                and camera replace the settings lookups
+            capture_transaction: Optional capture transaction; the detection
+                log and camera corruption stats are queued on it and written
+                with the capture commit instead of immediately
 
         Returns:
             CorruptionEvaluationResult model instance
         """
         try:
             # Service Layer Boundary Pattern - Process raw dictionary from database
-            settings_dict = self.db_ops.get_corruption_settings()
+            if capture_context is not None:
+                settings_dict = dict(capture_context.corruption_settings)
+            else:
+                settings_dict = self.db_ops.get_corruption_settings()
             is_enabled = settings_dict.get("is_enabled", True)
 
             if not is_enabled:
@@ -559,18 +579,27 @@ class SyncCorruptionEvaluationService:
                 )
 
             # Get camera-specific settings - process raw dictionary
-            camera_settings_dict = self.db_ops.get_camera_corruption_settings(camera_id)
-            heavy_detection_enabled = camera_settings_dict.get(
-                "corruption_detection_heavy", False
-            )
+            if capture_context is not None:
+                heavy_detection_enabled = capture_context.corruption_detection_heavy
+            else:
+                camera_settings_dict = self.db_ops.get_camera_corruption_settings(
+                    camera_id
+                )
+                heavy_detection_enabled = camera_settings_dict.get(
+                    "corruption_detection_heavy", False
+                )
+
+            # Reuse the decoded frame (and its grayscale) for both detectors
+            image = captured_frame.bgr if captured_frame is not None else None
+            gray = captured_frame.gray if captured_frame is not None else None
 
             # Perform fast detection - detector returns dictionary
-            fast_result_dict = self.fast_detector.detect(file_path)
+            fast_result_dict = self.fast_detector.detect(file_path, image, gray)
 
             # Perform heavy detection if enabled
             heavy_result_dict = None
             if heavy_detection_enabled:
-                heavy_result_dict = self.heavy_detector.detect(file_path)
+                heavy_result_dict = self.heavy_detector.detect(file_path, image, gray)
 
             # Calculate final score using raw dictionary data
             heavy_score = (
@@ -586,7 +615,7 @@ class SyncCorruptionEvaluationService:
             action_taken = "saved" if is_valid else "discarded"
 
             # Log the evaluation - database layer expects raw data
-            self.db_ops.log_corruption_detection(
+            detection = dict(
                 camera_id=camera_id,
                 image_id=None,  # Will be set by caller if needed
                 corruption_score=int(score_result.final_score),
@@ -614,12 +643,27 @@ class SyncCorruptionEvaluationService:
                 ),
             )
 
-            # Update camera corruption statistics
-            self.db_ops.update_camera_corruption_stats(
-                camera_id=camera_id,
-                _corruption_score=int(score_result.final_score),
-                is_valid=is_valid,
-            )
+            if capture_transaction is not None:
+                now = utc_now()
+                capture_transaction.add_write(
+                    "corruption_log",
+                    CorruptionQueryBuilder.build_log_detection_query(),
+                    {**detection, "created_at": now},
+                )
+                capture_transaction.add_write(
+                    "corruption_stats",
+                    CorruptionQueryBuilder.build_camera_corruption_stats_query(),
+                    {"is_valid": is_valid, "now": now, "camera_id": camera_id},
+                )
+            else:
+                self.db_ops.log_corruption_detection(**detection)
+
+                # Update camera corruption statistics
+                self.db_ops.update_camera_corruption_stats(
+                    camera_id=camera_id,
+                    _corruption_score=int(score_result.final_score),
+                    is_valid=is_valid,
+                )
 
             # Service Layer Boundary Pattern - Return typed object at boundary
             return CorruptionEvaluationResult(
@@ -7,13 +7,13 @@ for database operations, providing type-safe Pydantic model interfaces.
 
 # Standard library imports
 
-import io
-import zipfile
+import asyncio
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
+from starlette.concurrency import iterate_in_threadpool
 
 from ..config import settings
 
@@ -52,6 +52,7 @@ from ..utils.file_helpers import (
     serve_image_with_metadata,
     validate_file_path,
 )
+from ..utils.pagination_helpers import decode_cursor, encode_cursor
 from ..utils.router_helpers import validate_entity_exists
 from ..utils.time_utils import (
     format_date_string,
@@ -59,6 +60,7 @@ from ..utils.time_utils import (
     get_timezone_aware_timestamp_async,
     get_timezone_aware_timestamp_string_async,
 )
+from ..utils.zip_stream import ZipStreamWriter
 from .logger import get_service_logger
 
 logger = get_service_logger(LoggerName.IMAGE_SERVICE)
@@ -142,25 +144,49 @@ class ImageService:
         page_size: int = DEFAULT_PAGE_SIZE,
         order_by: str = "captured_at",
         order_dir: str = "DESC",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        include_total: bool = False,
     ) -> PaginatedImagesResponse:
         """
         Retrieve images with pagination and filtering.
 
+        Page numbers use OFFSET. For deep scrolling, pass the next_cursor or
+        prev_cursor of a previous page as after/before instead: cursor pages
+        seek on (captured_at, id) and cost the same at any depth.
+
         Args:
             timelapse_id: Optional timelapse ID to filter by
             camera_id: Optional camera ID to filter by
-            page: Page number (1-based)
+            page: Page number (1-based), ignored with a cursor
             page_size: Number of images per page
-            order_by: Column to order by
+            order_by: Column to order by (captured_at with a cursor)
             order_dir: Order direction (ASC/DESC)
+            after: Cursor of the page to continue after
+            before: Cursor of the page to continue before
+            include_total: Also count matching images for cursor pages
 
         Returns:
             Dictionary containing images list (Image models) and pagination metadata
+
+        Raises:
+            ValueError: If a cursor is malformed
         """
         # Light health monitoring for read operations (no performance impact)
         if self.health_service:
             await self._check_database_health("get_images")
 
+        if after is not None or before is not None:
+            return await self._get_images_by_cursor(
+                timelapse_id,
+                camera_id,
+                page_size,
+                order_dir,
+                after,
+                before,
+                include_total,
+            )
+
         # Calculate offset from page
         offset = (page - 1) * page_size
 
@@ -181,6 +207,7 @@ class ImageService:
 
         # Calculate pagination metadata
         total_pages = (total_count + page_size - 1) // page_size
+        has_next = page < total_pages
 
         return PaginatedImagesResponse(
             images=images,
@@ -188,8 +215,78 @@ class ImageService:
             page=page,
             page_size=page_size,
             total_pages=total_pages,
-            has_next=page < total_pages,
+            has_next=has_next,
             has_previous=page > 1,
+            # Lets clients switch to cursor paging from any page
+            next_cursor=(
+                encode_cursor(images[-1].captured_at, images[-1].id)
+                if has_next and images and order_by == "captured_at"
+                else None
+            ),
+        )
+
+    async def _get_images_by_cursor(
+        self,
+        timelapse_id: Optional[int],
+        camera_id: Optional[int],
+        page_size: int,
+        order_dir: str,
+        after: Optional[str],
+        before: Optional[str],
+        include_total: bool,
+    ) -> PaginatedImagesResponse:
+        """Get one keyset page; an extra row tells whether more pages follow."""
+        after_key = decode_cursor(after) if after is not None else None
+        before_key = (
+            decode_cursor(before) if before is not None and after_key is None else None
+        )
+
+        images = await self.image_ops.get_images(
+            limit=page_size + 1,
+            order_dir=order_dir,
+            timelapse_id=timelapse_id,
+            camera_id=camera_id,
+            after=after_key,
+            before=before_key,
+        )
+
+        has_more = len(images) > page_size
+        if after_key is not None:
+            images = images[:page_size]
+            has_next, has_previous = has_more, True
+        else:
+            # The extra row of a backward page is its farthest (first) one
+            images = images[-page_size:] if has_more else images
+            has_next, has_previous = True, has_more
+
+        total_count = None
+        if include_total:
+            total_count = await self.image_ops.get_images_count(
+                timelapse_id=timelapse_id, camera_id=camera_id
+            )
+
+        return PaginatedImagesResponse(
+            images=images,
+            total=total_count,
+            page=None,
+            page_size=page_size,
+            total_pages=(
+                (total_count + page_size - 1) // page_size
+                if total_count is not None
+                else None
+            ),
+            has_next=has_next,
+            has_previous=has_previous,
+            next_cursor=(
+                encode_cursor(images[-1].captured_at, images[-1].id)
+                if has_next and images
+                else None
+            ),
+            prev_cursor=(
+                encode_cursor(images[0].captured_at, images[0].id)
+                if has_previous and images
+                else None
+            ),
         )
 
     async def get_images_for_camera(
@@ -679,115 +776,87 @@ class ImageService:
                 "error": sanitize_error_message(e, "image preparation"),
             }
 
-    async def prepare_bulk_download(
-        self, image_ids: List[int], zip_filename: Optional[str] = None
-    ) -> Dict[str, Any]:
+    async def get_bulk_download_filename(
+        self, zip_filename: Optional[str] = None, prefix: str = "timelapser_images"
+    ) -> str:
         """
-        Prepare bulk download by creating ZIP file with requested images.
+        Get the download filename for a ZIP export.
 
         Args:
-            image_ids: List of image IDs to include
             zip_filename: Optional custom filename
+            prefix: Prefix of the generated filename
 
         Returns:
-            Dictionary with ZIP file data and metadata
+            Clean filename, by default with a timezone-aware timestamp
         """
-        try:
-            data_directory = self._get_data_directory()
+        if zip_filename:
+            return clean_filename(zip_filename)
 
-            if not image_ids:
-                logger.warning("No image IDs provided")
-                # Return an empty ZIP file and metadata if no IDs provided
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED):
-                    pass
-                zip_buffer.seek(0)
-                timestamp_dt = await get_timezone_aware_timestamp_async(
-                    self.settings_service
-                )
-                timestamp = format_filename_timestamp(timestamp_dt)
-                filename = zip_filename or f"timelapser_images_{timestamp}.zip"
-                filename = clean_filename(filename)
-                return {
-                    "zip_data": zip_buffer.getvalue(),
-                    "filename": filename,
-                    "requested_images": 0,
-                    "included_images": 0,
-                    "total_size": 0,
-                }
+        timestamp_dt = await get_timezone_aware_timestamp_async(self.settings_service)
+        timestamp = format_filename_timestamp(timestamp_dt)
+        return clean_filename(f"{prefix}_{timestamp}.zip")
 
-            # Create ZIP file in memory
-            zip_buffer = io.BytesIO()
-            added_files = 0
-            total_size = 0
-
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                for image_id in image_ids:
-                    try:
-                        image_data = await self.get_image_by_id(image_id)
-                        if not image_data:
-                            logger.warning(
-                                f"Image {image_id} not found for bulk download"
-                            )
-                            continue
-
-                        # Use file_helpers to get secure file path with proper camera directory structure
-                        file_path = validate_file_path(
-                            f"cameras/camera-{image_data.camera_id}/images/{image_data.file_path}",
-                            base_directory=data_directory,
-                            must_exist=True,
-                        )
-
-                        # Create clean filename for ZIP
-                        original_name = Path(image_data.file_path).name
-                        clean_name = clean_filename(f"image_{image_id}_{original_name}")
+    async def stream_bulk_download(
+        self,
+        image_ids: Optional[List[int]] = None,
+        timelapse_id: Optional[int] = None,
+        camera_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a ZIP archive of the selected images.
 
-                        # Add file to ZIP
-                        zip_file.write(str(file_path), clean_name)
-                        added_files += 1
-                        total_size += file_path.stat().st_size
+        Images are read from a server-side cursor in capture order and each
+        file is copied into the archive in chunks, so memory use does not
+        grow with the number or size of the images. JPEGs and other
+        compressed media are stored without deflating them again. Images
+        whose file is missing or unreadable are skipped.
 
-                    except Exception as e:
-                        logger.warning(f"Failed to add image {image_id} to ZIP: {e}")
-                        continue
+        Args:
+            image_ids: Specific images to include
+            timelapse_id: Include the images of one timelapse
+            camera_id: Include the images of one camera
+            start_date: First capture date to include
+            end_date: Last capture date to include
+
+        Yields:
+            Consecutive chunks of the ZIP archive
+        """
+        data_directory = self._get_data_directory()
+        writer = ZipStreamWriter()
+        skipped = 0
 
-            if added_files == 0:
-                logger.warning(
-                    "No valid images found for download - returning empty ZIP"
+        async for row in self.async_image_ops.iter_export_images(
+            image_ids=image_ids,
+            timelapse_id=timelapse_id,
+            camera_id=camera_id,
+            start_date=start_date,
+            end_date=end_date,
+        ):
+            image_id = row["id"]
+            try:
+                file_path = validate_file_path(
+                    row["file_path"], base_directory=data_directory, must_exist=True
                 )
-            zip_buffer.seek(0)
-
-            # Generate filename with timezone-aware timestamp
-            timestamp_dt = await get_timezone_aware_timestamp_async(
-                self.settings_service
-            )
-            timestamp = format_filename_timestamp(timestamp_dt)
-            filename = zip_filename or f"timelapser_images_{timestamp}.zip"
-            filename = clean_filename(filename)
-
-            result = {
-                "zip_data": zip_buffer.getvalue(),
-                "filename": filename,
-                "requested_images": len(image_ids),
-                "included_images": added_files,
-                "total_size": total_size,
-            }
+                arcname = clean_filename(
+                    f"image_{image_id}_{Path(row['file_path']).name}"
+                )
+                entry = await asyncio.to_thread(writer.add_file, file_path, arcname)
+            except (HTTPException, OSError) as e:
+                skipped += 1
+                logger.warning(f"Skipping image {image_id} in ZIP export: {e}")
+                continue
 
-            # SSE broadcasting handled by higher-level service layer
+            async for chunk in iterate_in_threadpool(entry):
+                yield chunk
 
-            return result
+        yield writer.close()
 
-        except Exception as e:
-            logger.error(f"Bulk download preparation failed: {e}", exception=e)
-            # Always return a dict even on error
-            return {
-                "zip_data": b"",
-                "filename": "error.zip",
-                "requested_images": len(image_ids) if image_ids else 0,
-                "included_images": 0,
-                "total_size": 0,
-                "error": sanitize_error_message(e, "bulk download"),
-            }
+        logger.debug(
+            f"Streamed ZIP export with {writer.entry_count} images "
+            f"({writer.bytes_added} bytes, {skipped} skipped)"
+        )
 
     async def serve_images_batch(self, image_ids: List[int], size: str = "thumbnail"):
         """
@@ -1090,6 +1159,23 @@ class SyncImageService:
             overlay_updated_at=overlay_updated_at,
         )
 
+    def update_images_overlay_status(
+        self,
+        overlays: List[Tuple[int, str]],
+        overlay_updated_at,
+    ) -> int:
+        """
+        Record rendered overlays for many images in one database write.
+
+        Args:
+            overlays: (image_id, overlay_path) pairs
+            overlay_updated_at: Timestamp when the overlays were generated
+
+        Returns:
+            Number of images updated
+        """
+        return self.image_ops.update_images_overlay_status(overlays, overlay_updated_at)
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get service status information following standardized pattern (sync version).
@@ -0,0 +1,281 @@
+# backend/app/services/latest_image_registry.py
+"""
+Latest Image Registry - In-memory latest frame of every camera.
+
+Role: Answer "what is camera X's latest image" without a database query
+Responsibilities: Keep one entry per camera (image id, paths, captured_at,
+ETag), apply capture and deletion SSE events, seed all cameras from one query
+Interactions: SSEBroker feeds it every published event, camera_routers reads
+it for the latest-image endpoints, AsyncImageOperations loads the seed
+
+Entries are only replaced by newer images (captured_at, then id), so a slow
+database fallback can never overwrite an event that arrived in the meantime.
+Removing an entry is always safe: the next lookup reloads it from the
+database.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..database.core import AsyncDatabase
+from ..database.image_operations import AsyncImageOperations
+from ..enums import LoggerName, SSEEvent
+from ..models.image_model import Image
+from ..services.logger import get_service_logger
+from ..utils.cache_manager import generate_composite_etag
+
+logger = get_service_logger(LoggerName.IMAGE_SERVICE)
+
+
+@dataclass(frozen=True)
+class LatestImageEntry:
+    """Latest image of one camera as kept by the registry."""
+
+    camera_id: int
+    image_id: int
+    captured_at: datetime
+    day_number: int
+    timelapse_id: Optional[int] = None
+    file_path: Optional[str] = None
+    file_size: Optional[int] = None
+    corruption_score: int = 100
+    is_flagged: bool = False
+    thumbnail_path: Optional[str] = None
+    small_path: Optional[str] = None
+    thumbnail_size: Optional[int] = None
+    small_size: Optional[int] = None
+    etag: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "etag", generate_composite_etag(self.image_id, self.captured_at)
+        )
+
+    @classmethod
+    def from_image(cls, image: Image) -> "LatestImageEntry":
+        """Build an entry from an image row."""
+        return cls(
+            camera_id=image.camera_id,
+            image_id=image.id,
+            captured_at=image.captured_at,
+            day_number=image.day_number,
+            timelapse_id=image.timelapse_id,
+            file_path=image.file_path,
+            file_size=image.file_size,
+            corruption_score=image.corruption_score,
+            is_flagged=image.is_flagged,
+            thumbnail_path=image.thumbnail_path,
+            small_path=image.small_path,
+            thumbnail_size=image.thumbnail_size,
+            small_size=image.small_size,
+        )
+
+    @classmethod
+    def from_event(cls, event_data: Dict[str, Any]) -> Optional["LatestImageEntry"]:
+        """
+        Build an entry from IMAGE_CAPTURED event data.
+
+        Args:
+            event_data: Event payload written by the capture commit
+
+        Returns:
+            Entry, or None if the payload lacks the image id or timestamp
+        """
+        try:
+            return cls(
+                camera_id=int(event_data["camera_id"]),
+                image_id=int(event_data["image_id"]),
+                captured_at=datetime.fromisoformat(event_data["captured_at"]),
+                day_number=int(event_data.get("day_number") or 0),
+                timelapse_id=event_data.get("timelapse_id"),
+                file_path=event_data.get("file_path"),
+                file_size=event_data.get("file_size"),
+                corruption_score=event_data.get("corruption_score", 100),
+                is_flagged=bool(event_data.get("is_flagged", False)),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def is_newer_than(self, other: "LatestImageEntry") -> bool:
+        """Check whether this entry describes a later image than other."""
+        return (self.captured_at, self.image_id) > (other.captured_at, other.image_id)
+
+
+class LatestImageRegistry:
+    """
+    Process-wide registry of each camera's latest image.
+
+    All access happens on the event loop, so entries are kept in a plain
+    dict; only seeding is serialized so concurrent first requests share
+    one query.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unseeded registry."""
+        self._entries: Dict[int, LatestImageEntry] = {}
+        self._seeded = False
+        self._seed_lock = asyncio.Lock()
+
+        # Performance tracking
+        self._hits = 0
+        self._misses = 0
+        self._events_applied = 0
+
+    @property
+    def seeded(self) -> bool:
+        """Whether every camera's latest image has been loaded."""
+        return self._seeded
+
+    def get(self, camera_id: int) -> Optional[LatestImageEntry]:
+        """
+        Get the latest image entry of a camera.
+
+        Args:
+            camera_id: Camera identifier
+
+        Returns:
+            Entry, or None if the camera is not in the registry
+        """
+        entry = self._entries.get(camera_id)
+        if entry is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return entry
+
+    def all(self) -> List[LatestImageEntry]:
+        """Get the entries of all cameras ordered by camera id."""
+        return [self._entries[camera_id] for camera_id in sorted(self._entries)]
+
+    def record(self, entry: LatestImageEntry) -> LatestImageEntry:
+        """
+        Store an entry unless the registry already holds a newer image.
+
+        An entry for the same image replaces the stored one, so a database
+        reload fills in variant paths the capture event did not carry.
+
+        Args:
+            entry: Candidate latest image entry
+
+        Returns:
+            The entry kept for the camera
+        """
+        current = self._entries.get(entry.camera_id)
+        if (
+            current is None
+            or current.image_id == entry.image_id
+            or entry.is_newer_than(current)
+        ):
+            self._entries[entry.camera_id] = entry
+            return entry
+        return current
+
+    def record_image(self, image: Image) -> LatestImageEntry:
+        """Store an image row as its camera's latest image if it is newer."""
+        return self.record(LatestImageEntry.from_image(image))
+
+    def discard(self, camera_id: int) -> None:
+        """Drop a camera's entry so the next lookup reloads it."""
+        self._entries.pop(camera_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries and require a new seed."""
+        self._entries.clear()
+        self._seeded = False
+
+    def handle_event(self, event_type: str, event_data: Dict[str, Any]) -> None:
+        """
+        Apply an SSE event to the registry.
+
+        New captures replace the camera's entry. Deleting or updating the
+        registered image, its timelapse or its camera drops the entry.
+
+        Args:
+            event_type: Type of SSE event
+            event_data: Event payload
+        """
+        camera_id = event_data.get("camera_id")
+        if camera_id is None:
+            return
+
+        if event_type == SSEEvent.IMAGE_CAPTURED:
+            entry = LatestImageEntry.from_event(event_data)
+            if entry is not None:
+                self.record(entry)
+                self._events_applied += 1
+            return
+
+        current = self._entries.get(camera_id)
+        if current is not None and self._invalidates(event_type, event_data, current):
+            self.discard(camera_id)
+            self._events_applied += 1
+
+    @staticmethod
+    def _invalidates(
+        event_type: str, event_data: Dict[str, Any], entry: LatestImageEntry
+    ) -> bool:
+        """Check whether an event removes or changes the registered image."""
+        if event_type == SSEEvent.CAMERA_DELETED:
+            return True
+        if event_type in (SSEEvent.IMAGE_DELETED, SSEEvent.IMAGE_UPDATED):
+            return event_data.get("image_id") == entry.image_id
+        if event_type == SSEEvent.TIMELAPSE_DELETED:
+            return event_data.get("timelapse_id") == entry.timelapse_id
+        return False
+
+    async def seed(self, db: AsyncDatabase) -> int:
+        """
+        Load the latest image of every camera with one query.
+
+        Rows are merged with record(), so captures applied while the query
+        ran are kept.
+
+        Args:
+            db: Async database instance
+
+        Returns:
+            Number of cameras in the registry
+        """
+        async with self._seed_lock:
+            await self._load(db)
+        return len(self._entries)
+
+    async def ensure_seeded(self, db: AsyncDatabase) -> None:
+        """Seed the registry unless a previous seed succeeded."""
+        if self._seeded:
+            return
+        async with self._seed_lock:
+            if not self._seeded:
+                await self._load(db)
+
+    async def _load(self, db: AsyncDatabase) -> None:
+        """Merge the latest image rows of all cameras; caller holds the lock."""
+        images = await AsyncImageOperations(db).get_latest_images_by_camera()
+        for image in images:
+            self.record_image(image)
+        self._seeded = True
+        logger.debug(f"Seeded latest image registry with {len(images)} cameras")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics for monitoring."""
+        return {
+            "seeded": self._seeded,
+            "cameras": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "events_applied": self._events_applied,
+        }
+
+
+# Global registry for the API process
+_latest_image_registry: Optional[LatestImageRegistry] = None
+
+
+def get_latest_image_registry() -> LatestImageRegistry:
+    """Get the process-wide latest image registry, creating it on first use."""
+    global _latest_image_registry
+    if _latest_image_registry is None:
+        _latest_image_registry = LatestImageRegistry()
+    return _latest_image_registry
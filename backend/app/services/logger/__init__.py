@@ -29,7 +29,13 @@ Usage:
 # Re-export commonly used enums for convenience
 from ...enums import LogEmoji, LoggerName, LogLevel, LogSource
 from .handlers import ConsoleHandler, EnhancedDatabaseHandler, FileHandler
-from .logger_service import Log, get_service_logger, initialize_global_logger, log
+from .logger_service import (
+    Log,
+    get_service_logger,
+    initialize_console_logger,
+    initialize_global_logger,
+    log,
+)
 from .services import LogCleanupService
 from .utils import ContextExtractor, LogMessageFormatter
 
@@ -38,6 +44,7 @@ __all__ = [
     "log",
     "get_service_logger",
     "initialize_global_logger",
+    "initialize_console_logger",
     "EnhancedDatabaseHandler",
     "ConsoleHandler",
     "FileHandler",
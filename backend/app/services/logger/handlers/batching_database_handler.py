@@ -269,8 +269,8 @@ class BatchingDatabaseHandler:
         # Attempt to write batch with retries
         for attempt in range(self.max_retries):
             try:
-                # Bulk insert logs
-                await self.async_log_ops.bulk_create_logs(batch_to_flush)
+                # COPY the batch; nothing is read back
+                await self.async_log_ops.copy_logs(batch_to_flush)
 
                 # Update statistics
                 self._total_logs_batched += len(batch_to_flush)
@@ -300,8 +300,8 @@ class BatchingDatabaseHandler:
         # Attempt to write batch with retries
         for attempt in range(self.max_retries):
             try:
-                # Bulk insert logs
-                self.sync_log_ops.bulk_create_logs(batch_to_flush)
+                # COPY the batch; nothing is read back
+                self.sync_log_ops.copy_logs(batch_to_flush)
 
                 # Update statistics
                 self._total_logs_batched += len(batch_to_flush)
@@ -1561,6 +1561,9 @@ class LoggerService:
         end_date: Optional[datetime] = None,
         page: int = 1,
         page_size: int = 50,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        include_total: bool = False,
     ) -> Dict[str, Any]:
         """
         Get logs with filtering and pagination.
@@ -1574,11 +1577,18 @@ class LoggerService:
             end_date: End date filter
             page: Page number
             page_size: Items per page
+            after: Cursor of the page to continue after (older logs)
+            before: Cursor of the page to continue before (newer logs)
+            include_total: Count matching logs for cursor pages
 
         Returns:
             Dictionary with logs and pagination info
+
+        Raises:
+            ValueError: If a cursor is malformed
         """
         from ...database.log_operations import LogOperations
+        from ...utils.pagination_helpers import decode_cursor
 
         if not self.async_db:
             raise ValueError("Async database required for log retrieval")
@@ -1595,6 +1605,9 @@ class LoggerService:
             end_date=end_date,
             page=page,
             page_size=page_size,
+            after=decode_cursor(after) if after is not None else None,
+            before=decode_cursor(before) if before is not None else None,
+            include_total=include_total,
         )
 
         # Extract logs from result and convert to dict format
@@ -1607,6 +1620,10 @@ class LoggerService:
             "total_pages": pagination.get("total_pages", 0),
             "page": pagination.get("current_page", page),
             "page_size": pagination.get("page_size", page_size),
+            "has_next": pagination.get("has_next", False),
+            "has_previous": pagination.get("has_prev", False),
+            "next_cursor": pagination.get("next_cursor"),
+            "prev_cursor": pagination.get("prev_cursor"),
         }
 
     async def delete_old_logs(self, days_to_keep: int) -> int:
@@ -1727,6 +1744,26 @@ async def initialize_global_logger(
     return _global_logger_instance
 
 
+def initialize_console_logger() -> LoggerService:
+    """
+    Initialize a console-only global logger.
+
+    For helper processes (such as overlay backfill renderers) that have no
+    database connections; their logs are written to the console only.
+
+    Returns:
+        Initialized LoggerService instance
+    """
+    global _global_logger_instance
+
+    _global_logger_instance = LoggerService(
+        enable_file_logging=False,
+        enable_sse_broadcasting=False,
+        enable_batching=False,
+    )
+    return _global_logger_instance
+
+
 def log() -> LoggerService:
     """
     Get the global logger instance.
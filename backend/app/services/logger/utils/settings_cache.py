@@ -4,12 +4,13 @@ Settings Cache Manager for Logger Service.
 This module provides efficient caching and retrieval of user-configurable logging
 settings from the database, with intelligent fallbacks and performance optimizations.
 
-Now integrates with the global settings cache for TTL-based caching as requested.
+Reads are served from the process settings snapshot when it is loaded; the
+TTL caches below are only used until then (or while its listener is down).
 """
 
 import threading
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ....database.core import AsyncDatabase, SyncDatabase
 from ....enums import LogLevel
@@ -18,6 +19,9 @@ from ....services.settings_cache import (
     get_cached_logger_settings,
     get_settings_cache,
 )
+from ....services.settings_snapshot import get_settings_snapshot_store
+
+_NOT_LOADED = object()
 
 
 class LoggerSettingsCache:
@@ -78,6 +82,32 @@ class LoggerSettingsCache:
         self._batch_cache_timestamp = 0
         self._batch_loaded = False
 
+        # Logger settings parsed from the settings snapshot, keyed by its version
+        self._parsed_snapshot: Tuple[int, Dict[str, Any]] = (0, {})
+
+    def _get_from_snapshot(self, setting_key: str) -> Any:
+        """
+        Get a parsed setting from the settings snapshot.
+
+        Returns:
+            Parsed value, or _NOT_LOADED if there is no snapshot
+        """
+        snapshot = get_settings_snapshot_store().snapshot
+        if snapshot is None:
+            return _NOT_LOADED
+
+        version, parsed = self._parsed_snapshot
+        if version != snapshot.version:
+            parsed = {
+                key: self._parse_setting_value(snapshot.get(key), key)
+                for key in self.DEFAULT_SETTINGS
+            }
+            self._parsed_snapshot = (snapshot.version, parsed)
+
+        if setting_key in parsed:
+            return parsed[setting_key]
+        return self._parse_setting_value(snapshot.get(setting_key), setting_key)
+
     def _is_cache_valid(self, setting_key: str) -> bool:
         """Check if cached value is still valid (thread-safe)."""
         with self._lock:
@@ -166,6 +196,10 @@ class LoggerSettingsCache:
         Returns:
             Setting value with appropriate type
         """
+        value = self._get_from_snapshot(setting_key)
+        if value is not _NOT_LOADED:
+            return value
+
         # Check cache first (thread-safe)
         if self._is_cache_valid(setting_key):
             with self._lock:
@@ -222,6 +256,10 @@ class LoggerSettingsCache:
         Returns:
             Setting value with appropriate type
         """
+        value = self._get_from_snapshot(setting_key)
+        if value is not _NOT_LOADED:
+            return value
+
         # Check cache first (thread-safe)
         if self._is_cache_valid(setting_key):
             with self._lock:
@@ -439,6 +477,9 @@ class LoggerSettingsCache:
         Returns:
             Dictionary with all 8 logger settings
         """
+        if get_settings_snapshot_store().snapshot is not None:
+            return {key: self.get_setting_sync(key) for key in self.DEFAULT_SETTINGS}
+
         # Try to get from global cache first
         cached_settings = get_cached_logger_settings()
         if cached_settings is not None:
@@ -0,0 +1,313 @@
+# backend/app/services/overlay_pipeline/caching/render_plan_cache.py
+"""
+Overlay Render Plan Cache - Compiled per-timelapse overlay render plans.
+
+A render plan is compiled once per (timelapse, config version, frame size). It
+holds the pre-rendered static patches (watermarks, custom text, timelapse name)
+and, for every dynamic item, its resolved font, pixel position and generator.
+Rendering a frame then only generates and draws the dynamic text, and blends
+just the touched regions through the dirty-rectangle compositor.
+
+The config version is built from the update timestamps of the timelapse
+overlay row and its preset, so plans compiled in the worker process are
+replaced as soon as the API process saves a change. Explicit invalidation
+frees memory early in the process that made the change.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from PIL import Image, ImageFont
+
+from ....constants import OVERLAY_RENDER_PLAN_CACHE_MAX_ENTRIES, OVERLAY_TYPE_WATERMARK
+from ....enums import LoggerName, LogSource
+from ....models.overlay_model import OverlayConfiguration, OverlayItem
+from ....services.logger import get_service_logger
+from ..generators import BaseOverlayGenerator, overlay_generator_registry
+from ..utils.dirty_rect_compositor import Box, DirtyRectCompositor
+from ..utils.font_cache import get_font_fast
+from ..utils.overlay_utils import OverlayRenderer
+
+logger = get_service_logger(LoggerName.OVERLAY_PIPELINE, LogSource.PIPELINE)
+
+
+@dataclass(frozen=True)
+class DynamicOverlayBinding:
+    """Per-frame overlay item with everything except its text resolved."""
+
+    position: str
+    item: OverlayItem
+    generator: BaseOverlayGenerator
+    font: ImageFont.FreeTypeFont
+    x: int
+    y: int
+
+
+class OverlayRenderPlan:
+    """
+    Compiled overlay rendering for one configuration and frame size.
+
+    Produces the same output as OverlayRenderer's standard rendering, but the
+    static patches, fonts, positions and generator lookups are computed once.
+    """
+
+    def __init__(
+        self,
+        config: OverlayConfiguration,
+        frame_size: Tuple[int, int],
+        context_data: Dict[str, Any],
+    ):
+        """
+        Compile the plan.
+
+        Args:
+            config: Validated effective overlay configuration
+            frame_size: Frame dimensions (width, height)
+            context_data: Context of the first frame, used for static content
+        """
+        self.config = config
+        self.frame_size = frame_size
+        self._renderer = OverlayRenderer(config)
+
+        self.dynamic_bindings: List[DynamicOverlayBinding] = []
+        self.static_patches: List[Tuple[Box, Image.Image]] = self._compile(context_data)
+
+    def _compile(self, context_data: Dict[str, Any]) -> List[Tuple[Box, Image.Image]]:
+        """Pre-render static items into patches and bind dynamic ones."""
+        static_compositor = DirtyRectCompositor(self.frame_size)
+
+        for position, item in self.config.overlay_positions.items():
+            if not overlay_generator_registry.has_generator(item.type):
+                logger.warning(f"No generator found for overlay type: {item.type}")
+                continue
+
+            generator = overlay_generator_registry.get_generator(item.type)
+            if generator.is_static or item.type == OVERLAY_TYPE_WATERMARK:
+                # Static content is rendered exactly as the standard renderer does
+                self._renderer.add_overlay_element(
+                    static_compositor, position, item, dict(context_data)
+                )
+                continue
+
+            x, y = self._renderer._calculate_position(position, self.frame_size)
+            self.dynamic_bindings.append(
+                DynamicOverlayBinding(
+                    position=position,
+                    item=item,
+                    generator=generator,
+                    font=get_font_fast(self.config.global_options.font, item.text_size),
+                    x=x,
+                    y=y,
+                )
+            )
+
+        return static_compositor.render_patches()
+
+    def render(
+        self, base_image: Image.Image, context_data: Dict[str, Any]
+    ) -> Image.Image:
+        """
+        Render one frame.
+
+        Args:
+            base_image: Base camera image
+            context_data: Dynamic overlay context (timestamps, weather, etc.)
+
+        Returns:
+            Composited RGBA image
+        """
+        if base_image.mode != "RGBA":
+            base_image = base_image.convert("RGBA")
+        else:
+            base_image = base_image.copy()
+
+        compositor = DirtyRectCompositor(self.frame_size)
+        for box, patch in self.static_patches:
+            compositor.add_patch(box[:2], patch)
+
+        if self.dynamic_bindings:
+            generation_context = self._renderer._create_generation_context(context_data)
+            for binding in self.dynamic_bindings:
+                try:
+                    text = binding.generator.generate_content(
+                        binding.item, generation_context
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to generate overlay content for type {binding.item.type}",
+                        exception=e,
+                    )
+                    continue
+
+                if isinstance(text, str) and text:
+                    self._renderer.add_text_element(
+                        compositor,
+                        binding.item,
+                        text,
+                        binding.x,
+                        binding.y,
+                        font=binding.font,
+                    )
+
+        return compositor.composite(base_image, self.config.global_options.opacity)
+
+
+@dataclass
+class _ResolvedConfig:
+    """Effective configuration resolved for one timelapse config version."""
+
+    version: Hashable
+    config: OverlayConfiguration
+    preset_id: Optional[int]
+
+
+class OverlayRenderPlanCache:
+    """
+    Bounded LRU of effective configs and compiled render plans.
+
+    Thread-safe; overlay jobs for the same timelapse share one plan.
+    """
+
+    def __init__(self, max_entries: int = OVERLAY_RENDER_PLAN_CACHE_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of configs and of plans kept
+        """
+        self.max_entries = max_entries
+        self._configs: "OrderedDict[int, _ResolvedConfig]" = OrderedDict()
+        self._plans: (
+            "OrderedDict[Tuple[int, Hashable, Tuple[int, int]], OverlayRenderPlan]"
+        ) = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.compilations = 0
+        self.invalidations = 0
+
+    def get_config(
+        self, timelapse_id: int, version: Hashable
+    ) -> Optional[OverlayConfiguration]:
+        """Get the resolved config for a timelapse if it is still at this version."""
+        with self._lock:
+            entry = self._configs.get(timelapse_id)
+            if entry is None or entry.version != version:
+                return None
+            self._configs.move_to_end(timelapse_id)
+            return entry.config
+
+    def put_config(
+        self,
+        timelapse_id: int,
+        version: Hashable,
+        config: OverlayConfiguration,
+        preset_id: Optional[int] = None,
+    ) -> None:
+        """Store a resolved config, dropping plans compiled for older versions."""
+        with self._lock:
+            self._drop_plans(lambda key: key[0] == timelapse_id and key[1] != version)
+            self._configs[timelapse_id] = _ResolvedConfig(version, config, preset_id)
+            self._configs.move_to_end(timelapse_id)
+            while len(self._configs) > self.max_entries:
+                self._configs.popitem(last=False)
+
+    def get_plan(
+        self,
+        timelapse_id: int,
+        version: Hashable,
+        config: OverlayConfiguration,
+        frame_size: Tuple[int, int],
+        context_data: Dict[str, Any],
+    ) -> OverlayRenderPlan:
+        """
+        Get the plan for a timelapse frame, compiling it on first use.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            version: Config version the plan must match
+            config: Effective configuration for that version
+            frame_size: Frame dimensions (width, height)
+            context_data: Frame context, used for static content when compiling
+
+        Returns:
+            Compiled render plan
+        """
+        key = (timelapse_id, version, tuple(frame_size))
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent duplicate compile is harmless
+        plan = OverlayRenderPlan(config, key[2], context_data)
+
+        with self._lock:
+            self.compilations += 1
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+
+        logger.debug(
+            f"Compiled overlay render plan for timelapse {timelapse_id} at "
+            f"{key[2][0]}x{key[2][1]} ({len(plan.dynamic_bindings)} dynamic items)"
+        )
+        return plan
+
+    def invalidate_timelapse(self, timelapse_id: int) -> int:
+        """Drop the config and plans of a timelapse. Returns plans dropped."""
+        with self._lock:
+            self._configs.pop(timelapse_id, None)
+            return self._drop_plans(lambda key: key[0] == timelapse_id)
+
+    def invalidate_preset(self, preset_id: int) -> int:
+        """Drop configs and plans of every timelapse using a preset. Returns plans dropped."""
+        with self._lock:
+            timelapse_ids = {
+                timelapse_id
+                for timelapse_id, entry in self._configs.items()
+                if entry.preset_id == preset_id
+            }
+            for timelapse_id in timelapse_ids:
+                del self._configs[timelapse_id]
+            return self._drop_plans(lambda key: key[0] in timelapse_ids)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        with self._lock:
+            self.invalidations += len(self._plans)
+            self._configs.clear()
+            self._plans.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "configs": len(self._configs),
+                "plans": len(self._plans),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / total * 100) if total else 0.0,
+                "compilations": self.compilations,
+                "invalidations": self.invalidations,
+            }
+
+    def _drop_plans(self, predicate) -> int:
+        """Remove plans whose key matches; caller holds the lock."""
+        stale = [key for key in self._plans if predicate(key)]
+        for key in stale:
+            del self._plans[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+
+# Global render plan cache shared by overlay jobs in this process
+render_plan_cache = OverlayRenderPlanCache()
@@ -5,6 +5,7 @@ Overlay Services Module
 Contains all overlay service functionality including job management, presets, templates, and integration.
 """
 
+from .backfill_service import OverlayBackfillService
 from .integration_service import (
     OverlayIntegrationService,
     SyncOverlayIntegrationService,
@@ -22,4 +23,5 @@ __all__ = [
     "SyncOverlayTemplateService",
     "OverlayIntegrationService",
     "SyncOverlayIntegrationService",
+    "OverlayBackfillService",
 ]
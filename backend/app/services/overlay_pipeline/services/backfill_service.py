@@ -0,0 +1,460 @@
+# backend/app/services/overlay_pipeline/services/backfill_service.py
+"""
+Overlay Backfill Service - Regenerate existing overlays on a process pool.
+
+Changing a timelapse's overlay preset leaves every existing overlay rendered
+with the old configuration. Overlay jobs regenerate one image at a time on
+threads, and PIL text drawing holds the GIL, so a long timelapse keeps a
+single core busy for hours. The backfill instead shards the stale images
+across a pool of render processes. Each process warms its own font cache
+and compiles its own render plan once; the parent pages through the images,
+writes results back in one UPDATE per page and reports progress over SSE.
+
+Progress is checkpointed after every page to a small JSON file, so a
+restarted worker resumes after the last completed page. A checkpoint written
+for an older config version is discarded.
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ....config import settings
+from ....constants import (
+    OVERLAY_BACKFILL_MAX_PROCESSES,
+    OVERLAY_BACKFILL_PAGE_SIZE,
+    OVERLAY_BACKFILL_PROGRESS_INTERVAL_SECONDS,
+    OVERLAY_BACKFILL_SHARD_SIZE,
+)
+from ....database.core import SyncDatabase
+from ....database.image_operations import SyncImageOperations
+from ....database.sse_events_operations import SyncSSEEventsOperations
+from ....enums import LogEmoji, LoggerName, LogSource, SSEEvent, SSEEventSource
+from ....models.image_model import Image as ImageModel
+from ....models.overlay_model import OverlayConfiguration
+from ....services.logger import get_service_logger, initialize_console_logger
+from ....utils.captured_frame import open_captured_image
+from ....utils.file_helpers import ensure_directory_exists, get_overlay_path_for_image
+from ....utils.time_utils import (
+    get_timezone_aware_timestamp_sync,
+    utc_now,
+    utc_timestamp,
+)
+from ..caching.render_plan_cache import render_plan_cache
+from ..utils.font_cache import get_font_fast, preload_overlay_fonts
+from .integration_service import (
+    SyncOverlayIntegrationService,
+    create_image_overlay_context,
+)
+
+logger = get_service_logger(LoggerName.OVERLAY_PIPELINE, LogSource.PIPELINE)
+
+# (image, overlay output path) pairs rendered by one process task
+RenderTask = Tuple[ImageModel, str]
+# (image_id, overlay path or None, error message or None)
+RenderResult = Tuple[int, Optional[str], Optional[str]]
+
+
+class SettingsSnapshot:
+    """Settings copied from the parent for render processes without a database."""
+
+    def __init__(self, values: Dict[str, Any]):
+        self._values = dict(values)
+
+    def get_setting(self, key: str, default: Any = None) -> Any:
+        """Get a copied setting value."""
+        value = self._values.get(key)
+        return default if value is None else value
+
+
+# Per-process render state, set by the pool initializer
+_render_state: Dict[str, Any] = {}
+
+
+def prepare_render_state(
+    config: OverlayConfiguration,
+    config_version: Hashable,
+    settings_values: Dict[str, Any],
+) -> None:
+    """
+    Store the backfill config in this process and warm its font cache.
+
+    Args:
+        config: Effective overlay configuration being rendered
+        config_version: Version the config was resolved at
+        settings_values: Settings the overlay generators read (timezone)
+    """
+    _render_state.update(
+        config=config,
+        config_version=config_version,
+        settings_service=SettingsSnapshot(settings_values),
+    )
+
+    preload_overlay_fonts()
+    for item in config.overlay_positions.values():
+        get_font_fast(config.global_options.font, item.text_size)
+
+
+def _init_render_process(
+    config: OverlayConfiguration,
+    config_version: Hashable,
+    settings_values: Dict[str, Any],
+) -> None:
+    """Pool initializer: console logging, then the shared render state."""
+    initialize_console_logger()
+    prepare_render_state(config, config_version, settings_values)
+
+
+def render_overlay_shard(
+    timelapse_id: int, tasks: List[RenderTask]
+) -> List[RenderResult]:
+    """
+    Render and save the overlays of one shard in a render process.
+
+    The render plan is compiled on the first image of each frame size and
+    reused by every later shard this process handles.
+
+    Args:
+        timelapse_id: ID of the timelapse the images belong to
+        tasks: Images with their overlay output paths
+
+    Returns:
+        One result per task, in task order
+    """
+    config = _render_state["config"]
+    config_version = _render_state["config_version"]
+    settings_service = _render_state["settings_service"]
+
+    results: List[RenderResult] = []
+    for image, overlay_path in tasks:
+        try:
+            context_data = create_image_overlay_context(image, settings_service)
+            with open_captured_image(image.file_path) as base_image:
+                plan = render_plan_cache.get_plan(
+                    timelapse_id,
+                    config_version,
+                    config,
+                    base_image.size,
+                    context_data,
+                )
+                result_image = plan.render(base_image, context_data)
+
+            ensure_directory_exists(str(Path(overlay_path).parent))
+            result_image.save(overlay_path, "PNG", optimize=True)
+            results.append((image.id, overlay_path, None))
+
+        except Exception as e:
+            results.append((image.id, None, str(e)))
+
+    return results
+
+
+def _create_render_pool(processes: int, initargs: Tuple) -> Executor:
+    """
+    Create the render process pool.
+
+    Processes are spawned rather than forked: the worker process holds
+    database pools and running threads that must not be copied.
+    """
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_render_process,
+        initargs=initargs,
+    )
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Resumable progress of one timelapse backfill."""
+
+    timelapse_id: int
+    config_version: str
+    last_image_id: int = 0
+    rendered: int = 0
+    failed: int = 0
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["BackfillCheckpoint"]:
+        """Load a checkpoint, or None if it is missing or unreadable."""
+        try:
+            return cls(**json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(
+                f"Ignoring unreadable overlay backfill checkpoint {path}: {e}"
+            )
+            return None
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically."""
+        self.updated_at = utc_timestamp()
+        ensure_directory_exists(str(path.parent))
+        temp_path = path.with_name(f"{path.name}.tmp")
+        temp_path.write_text(json.dumps(asdict(self)))
+        temp_path.replace(path)
+
+
+def get_config_updated_at(config_version: Hashable):
+    """When the effective config last changed: the newer of overlay and preset."""
+    overlay_updated_at, _preset_id, preset_updated_at = config_version
+    return max(
+        timestamp
+        for timestamp in (overlay_updated_at, preset_updated_at)
+        if timestamp is not None
+    )
+
+
+class OverlayBackfillService:
+    """
+    Regenerates overlays rendered before a timelapse's config last changed.
+
+    Runs in the worker process; rendering happens in spawned processes.
+    """
+
+    def __init__(
+        self,
+        db: SyncDatabase,
+        integration_service: SyncOverlayIntegrationService,
+        settings_service=None,
+        max_processes: int = OVERLAY_BACKFILL_MAX_PROCESSES,
+        shard_size: int = OVERLAY_BACKFILL_SHARD_SIZE,
+        page_size: int = OVERLAY_BACKFILL_PAGE_SIZE,
+        checkpoint_directory: Optional[str] = None,
+    ):
+        """
+        Initialize the backfill service.
+
+        Args:
+            db: Sync database instance
+            integration_service: Resolves the effective overlay configs
+            settings_service: Settings service for timezone and data directory
+            max_processes: Upper bound on render processes
+            shard_size: Images rendered per process task
+            page_size: Images per checkpointed page and batched DB write
+            checkpoint_directory: Where checkpoints are kept
+        """
+        self.integration_service = integration_service
+        self.settings_service = settings_service
+        self.image_ops = SyncImageOperations(db)
+        self.sse_ops = SyncSSEEventsOperations(db)
+        self.max_processes = max(1, max_processes)
+        self.shard_size = max(1, shard_size)
+        self.page_size = max(self.shard_size, page_size)
+        self.checkpoint_directory = Path(
+            checkpoint_directory or settings.overlay_backfill_directory
+        )
+
+    def backfill_stale_timelapses(
+        self, cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, int]:
+        """
+        Backfill every timelapse whose overlays predate its config.
+
+        Args:
+            cancel_event: Stops the backfill after the current page when set
+
+        Returns:
+            Dictionary with timelapses, rendered and failed counts
+        """
+        overlay_ops = self.integration_service.overlay_ops
+        totals = {"timelapses": 0, "rendered": 0, "failed": 0}
+        for timelapse_id in overlay_ops.get_timelapses_with_stale_overlays():
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            result = self.backfill_timelapse(timelapse_id, cancel_event)
+            if result["rendered"] or result["failed"]:
+                totals["timelapses"] += 1
+            totals["rendered"] += result["rendered"]
+            totals["failed"] += result["failed"]
+        return totals
+
+    def backfill_timelapse(
+        self, timelapse_id: int, cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Regenerate the stale overlays of one timelapse, resuming from its checkpoint.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            cancel_event: Stops the backfill after the current page when set
+
+        Returns:
+            Dictionary with rendered/failed counts for this run and whether
+            the backfill reached the last image
+        """
+        result = {
+            "timelapse_id": timelapse_id,
+            "rendered": 0,
+            "failed": 0,
+            "completed": False,
+        }
+
+        resolved = self.integration_service.get_cached_overlay_config(timelapse_id)
+        if not resolved:
+            return result
+        config_version, config = resolved
+        config_updated_at = get_config_updated_at(config_version)
+
+        checkpoint = self._load_checkpoint(timelapse_id, config_version)
+        remaining = self.image_ops.count_stale_overlay_images(
+            timelapse_id, config_updated_at, checkpoint.last_image_id
+        )
+        if remaining == 0:
+            result["completed"] = True
+            return result
+
+        total = checkpoint.rendered + checkpoint.failed + remaining
+        processes = min(self.max_processes, os.cpu_count() or 1)
+        logger.info(
+            f"Backfilling {remaining} overlays for timelapse {timelapse_id} "
+            f"on {processes} processes"
+            + (
+                f" (resuming after image {checkpoint.last_image_id})"
+                if checkpoint.last_image_id
+                else ""
+            ),
+            emoji=LogEmoji.OVERLAY,
+        )
+
+        pool = _create_render_pool(
+            processes, (config, config_version, self._get_settings_values())
+        )
+        last_progress = 0.0
+        try:
+            while cancel_event is None or not cancel_event.is_set():
+                images = self.image_ops.get_stale_overlay_images(
+                    timelapse_id,
+                    config_updated_at,
+                    after_id=checkpoint.last_image_id,
+                    limit=self.page_size,
+                )
+                if not images:
+                    result["completed"] = True
+                    break
+
+                rendered, failed = self._render_page(pool, timelapse_id, images)
+                self._record_overlays(rendered)
+
+                checkpoint.last_image_id = images[-1].id
+                checkpoint.rendered += len(rendered)
+                checkpoint.failed += failed
+                checkpoint.save(self._checkpoint_path(timelapse_id))
+                result["rendered"] += len(rendered)
+                result["failed"] += failed
+
+                now = time.monotonic()
+                if now - last_progress >= OVERLAY_BACKFILL_PROGRESS_INTERVAL_SECONDS:
+                    last_progress = now
+                    self._broadcast(
+                        SSEEvent.OVERLAY_BACKFILL_PROGRESS, checkpoint, total
+                    )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        if result["completed"]:
+            self._broadcast(SSEEvent.OVERLAY_BACKFILL_COMPLETED, checkpoint, total)
+            logger.info(
+                f"Overlay backfill for timelapse {timelapse_id} finished: "
+                f"{checkpoint.rendered} rendered, {checkpoint.failed} failed",
+                emoji=LogEmoji.SUCCESS,
+            )
+        return result
+
+    def _render_page(
+        self, pool: Executor, timelapse_id: int, images: List[ImageModel]
+    ) -> Tuple[List[Tuple[int, str]], int]:
+        """Render one page across the pool. Returns (rendered pairs, failed count)."""
+        tasks = [(image, self._get_overlay_path(image)) for image in images]
+        futures = [
+            pool.submit(
+                render_overlay_shard,
+                timelapse_id,
+                tasks[start : start + self.shard_size],
+            )
+            for start in range(0, len(tasks), self.shard_size)
+        ]
+
+        rendered: List[Tuple[int, str]] = []
+        failed = 0
+        for future in futures:
+            for image_id, overlay_path, error in future.result():
+                if overlay_path is not None:
+                    rendered.append((image_id, overlay_path))
+                else:
+                    failed += 1
+                    logger.warning(
+                        f"Failed to backfill overlay for image {image_id}: {error}"
+                    )
+        return rendered, failed
+
+    def _record_overlays(self, rendered: List[Tuple[int, str]]) -> None:
+        """Write a page of rendered overlays in one statement."""
+        overlay_updated_at = (
+            get_timezone_aware_timestamp_sync(self.settings_service)
+            if self.settings_service
+            else utc_now()
+        )
+        self.integration_service.sync_image_service.update_images_overlay_status(
+            rendered, overlay_updated_at
+        )
+
+    def _broadcast(
+        self, event_type: SSEEvent, checkpoint: BackfillCheckpoint, total: int
+    ) -> None:
+        """Publish backfill progress; failures only cost the event."""
+        try:
+            self.sse_ops.create_event(
+                event_type=event_type,
+                event_data={
+                    "timelapse_id": checkpoint.timelapse_id,
+                    "rendered": checkpoint.rendered,
+                    "failed": checkpoint.failed,
+                    "total": total,
+                    "timestamp": utc_timestamp(),
+                },
+                source=SSEEventSource.OVERLAY_WORKER,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to broadcast overlay backfill progress: {e}")
+
+    def _load_checkpoint(
+        self, timelapse_id: int, config_version: Hashable
+    ) -> BackfillCheckpoint:
+        """Load the checkpoint for this config version, or start a new one."""
+        version_key = "|".join(str(part) for part in config_version)
+        checkpoint = BackfillCheckpoint.load(self._checkpoint_path(timelapse_id))
+        if checkpoint is None or checkpoint.config_version != version_key:
+            return BackfillCheckpoint(timelapse_id, version_key)
+        return checkpoint
+
+    def _checkpoint_path(self, timelapse_id: int) -> Path:
+        return self.checkpoint_directory / f"timelapse-{timelapse_id}.json"
+
+    def _get_overlay_path(self, image: ImageModel) -> str:
+        base_dir = None
+        if self.settings_service:
+            base_dir = self.settings_service.get_setting("data_directory", None)
+
+        return str(
+            get_overlay_path_for_image(
+                image_path=image.file_path,
+                camera_id=image.camera_id,
+                timelapse_id=image.timelapse_id or 0,
+                base_directory=base_dir,
+            )
+        )
+
+    def _get_settings_values(self) -> Dict[str, Any]:
+        """Settings the overlay generators read, copied for render processes."""
+        if not self.settings_service:
+            return {}
+        return {"timezone": self.settings_service.get_setting("timezone")}
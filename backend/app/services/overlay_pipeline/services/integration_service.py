@@ -7,7 +7,9 @@ instead of custom generators.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from PIL import Image as PILImage
 
 from ....database.core import SyncDatabase
 from ....database.sse_events_operations import SSEEventsOperations
@@ -33,6 +35,7 @@ from ....models.overlay_model import (
 from ....services.capture_pipeline.rtsp_service import AsyncRTSPService, RTSPService
 from ....services.image_service import ImageService
 from ....services.logger import get_service_logger
+from ....utils.captured_frame import open_captured_image
 from ....utils.file_helpers import (
     ensure_directory_exists,
     get_overlay_path_for_image,
@@ -47,6 +50,7 @@ from ....utils.time_utils import (
     utc_now,
     utc_timestamp,
 )
+from ..caching.render_plan_cache import render_plan_cache
 from ..utils.overlay_helpers import OverlaySettingsResolver
 from ..utils.overlay_utils import (
     OverlayRenderer,
@@ -59,6 +63,90 @@ from .preset_service import OverlayPresetService, SyncOverlayPresetService
 logger = get_service_logger(LoggerName.OVERLAY_PIPELINE, LogSource.PIPELINE)
 
 
+def create_image_overlay_context(
+    image: ImageModel, settings_service=None
+) -> Dict[str, Any]:
+    """
+    Create context data for overlay rendering from image metadata.
+
+    Module-level so overlay render processes can build contexts without a
+    database-backed integration service.
+
+    Args:
+        image: Image the overlay is rendered for
+        settings_service: Any object with get_setting(), used for timezones
+
+    Returns:
+        Context dictionary consumed by the overlay generators
+    """
+
+    try:
+        # Create context with actual model objects and complete data
+        context_data = {
+            # Pass actual image model object
+            "image": image,
+            "image_id": image.id,
+            "camera_id": image.camera_id,
+            "timelapse_id": image.timelapse_id,
+            "file_path": image.file_path,
+            "timestamp": image.captured_at,
+            "frame_number": getattr(image, "frame_number", 0),
+            # Timelapse info (will be populated by renderer if timelapse object available)
+            "timelapse_name": f"Timelapse {image.timelapse_id}",
+            "day_number": 1,  # This would be calculated from timelapse start date
+            # Settings service for timezone handling in generators
+            "settings_service": settings_service,
+        }
+
+        # Add weather data if available from image's historical weather
+        if (
+            hasattr(image, "weather_temperature")
+            and image.weather_temperature is not None
+        ):
+            # Use historical weather data stored with the image
+            context_data.update(
+                {
+                    "temperature": image.weather_temperature,
+                    "weather_conditions": image.weather_conditions or "",
+                    "temperature_unit": "F",  # Default, could be from settings
+                }
+            )
+            logger.debug(
+                f"Using historical weather data for image {image.id}: temp={image.weather_temperature}"
+            )
+        # Weather data from image's stored weather fields (captured at image time)
+        if image.weather_temperature is not None or image.weather_conditions:
+            context_data.update(
+                {
+                    "temperature": image.weather_temperature,
+                    "weather_conditions": image.weather_conditions or "",
+                    "weather_icon": image.weather_icon or "",
+                    "temperature_unit": "C",  # Image weather is stored in Celsius
+                    "weather_fetched_at": image.weather_fetched_at,
+                }
+            )
+            logger.debug(
+                f"Using stored weather data for image {image.id} from {image.weather_fetched_at}"
+            )
+
+        return context_data
+
+    except Exception as e:
+        logger.error(f"Failed to create image context for overlay: {e}")
+        # Return minimal context with timezone-aware fallback if possible
+        fallback_timestamp = image.captured_at or (
+            get_timezone_aware_timestamp_sync(settings_service)
+            if settings_service
+            else utc_now()
+        )
+        return {
+            "timestamp": fallback_timestamp,
+            "frame_number": 0,
+            "timelapse_name": "Timelapse",
+            "day_number": 1,
+        }
+
+
 class SyncOverlayIntegrationService:
     """
     Synchronous integration service coordinating overlay generation.
@@ -136,40 +224,21 @@ class SyncOverlayIntegrationService:
                 # Skip SSE event for routine skips to reduce noise
                 return True
 
-            # Get timelapse overlay configuration
-            timelapse_overlay = (
-                self.overlay_ops.get_timelapse_overlay(image.timelapse_id)
+            # Get the effective configuration (resolved once per config version)
+            resolved = (
+                self.get_cached_overlay_config(image.timelapse_id)
                 if image.timelapse_id
                 else None
             )
-            if not timelapse_overlay or not timelapse_overlay.enabled:
-                logger.debug(
-                    f"No overlay configuration found for timelapse {image.timelapse_id}"
-                )
+            if not resolved:
                 # Skip SSE event for configuration issues to reduce noise
                 return False
-
-            # Resolve effective configuration
-            logger.debug(
-                "Resolving effective overlay configuration", emoji=LogEmoji.PROCESSING
-            )
-            effective_config = self._get_effective_overlay_config_for_timelapse(
-                timelapse_overlay
-            )
-
-            # Validate configuration
-            if not effective_config or not validate_overlay_configuration(
-                effective_config
-            ):
-                logger.warning(f"Invalid overlay configuration for image {image_id}")
-                return False
+            config_version, effective_config = resolved
 
             # Generate overlay
             logger.debug("Rendering overlay for image", emoji=LogEmoji.PROCESSING)
-            success = (
-                self._render_overlay_for_image(image, effective_config)
-                if effective_config
-                else False
+            success = self._render_overlay_for_image(
+                image, effective_config, config_version
             )
 
             if success:
@@ -440,10 +509,59 @@ class SyncOverlayIntegrationService:
             )
             return None
 
+    def get_cached_overlay_config(
+        self, timelapse_id: int
+    ) -> Optional[Tuple[Hashable, OverlayConfiguration]]:
+        """
+        Get the validated effective overlay config for a timelapse.
+
+        Only the overlay/preset update timestamps are read per call; the preset
+        merge and validation run again only when one of them changes.
+
+        Returns:
+            Tuple of (config_version, config), or None if overlays are disabled,
+            missing or invalid for this timelapse
+        """
+        version_row = self.overlay_ops.get_timelapse_overlay_version(timelapse_id)
+        if not version_row or not version_row["enabled"]:
+            logger.debug(f"No overlay configuration found for timelapse {timelapse_id}")
+            return None
+
+        version = (
+            version_row["overlay_updated_at"],
+            version_row["preset_id"],
+            version_row["preset_updated_at"],
+        )
+        config = render_plan_cache.get_config(timelapse_id, version)
+        if config is not None:
+            return version, config
+
+        logger.debug(
+            "Resolving effective overlay configuration", emoji=LogEmoji.PROCESSING
+        )
+        timelapse_overlay = self.overlay_ops.get_timelapse_overlay(timelapse_id)
+        if not timelapse_overlay or not timelapse_overlay.enabled:
+            return None
+
+        config = self._get_effective_overlay_config_for_timelapse(timelapse_overlay)
+        if not config or not validate_overlay_configuration(config):
+            logger.warning(
+                f"Invalid overlay configuration for timelapse {timelapse_id}"
+            )
+            return None
+
+        render_plan_cache.put_config(
+            timelapse_id, version, config, timelapse_overlay.preset_id
+        )
+        return version, config
+
     def _render_overlay_for_image(
-        self, image: ImageModel, config: OverlayConfiguration
+        self,
+        image: ImageModel,
+        config: OverlayConfiguration,
+        config_version: Hashable,
     ) -> bool:
-        """Render overlay for a specific image using the provided configuration."""
+        """Render overlay for a specific image using the compiled render plan."""
 
         try:
             # Get image file path
@@ -456,23 +574,52 @@ class SyncOverlayIntegrationService:
             overlay_path = self._get_overlay_path(image)
             ensure_directory_exists(str(overlay_path.parent))
 
-            # Create overlay context
-            context_data = self._create_image_context(image)
-
-            # Render overlay using proven OverlayRenderer
-            renderer = OverlayRenderer(config)
-            success = renderer.render_overlay(
-                base_image_path=str(image_path),
-                output_path=str(overlay_path),
-                context_data=context_data,
-            )
+            result_image = self.render_overlay_frame(image, config, config_version)
 
-            return success
+            # Save as PNG to preserve transparency
+            result_image.save(str(overlay_path), "PNG", optimize=True)
+            return True
 
         except Exception as e:
             logger.error(f"Failed to render overlay for image {image.id}: {e}")
             return False
 
+    def render_overlay_frame(
+        self,
+        image: ImageModel,
+        config: OverlayConfiguration,
+        config_version: Hashable,
+        image_path: Optional[str] = None,
+        frame_number: Optional[int] = None,
+    ) -> PILImage.Image:
+        """
+        Render the overlay onto one image in memory.
+
+        Args:
+            image: Image the frame belongs to (supplies the overlay context)
+            config: Effective overlay configuration
+            config_version: Version returned with the config by
+                get_cached_overlay_config()
+            image_path: File to read instead of image.file_path
+            frame_number: Position of the frame in a video, if known
+
+        Returns:
+            Composited RGBA image
+        """
+        context_data = self._create_image_context(image)
+        if frame_number is not None:
+            context_data["frame_number"] = frame_number
+
+        with open_captured_image(image_path or str(image.file_path)) as base_image:
+            plan = render_plan_cache.get_plan(
+                image.timelapse_id or 0,
+                config_version,
+                config,
+                base_image.size,
+                context_data,
+            )
+            return plan.render(base_image, context_data)
+
     def _generate_preview_overlay(
         self, test_image_path: Path, config: OverlayConfiguration
     ) -> Optional[Path]:
@@ -580,72 +727,7 @@ class SyncOverlayIntegrationService:
 
     def _create_image_context(self, image: ImageModel) -> Dict[str, Any]:
         """Create context data for overlay rendering from image metadata."""
-
-        try:
-            # Create context with actual model objects and complete data
-            context_data = {
-                # Pass actual image model object
-                "image": image,
-                "image_id": image.id,
-                "camera_id": image.camera_id,
-                "timelapse_id": image.timelapse_id,
-                "file_path": image.file_path,
-                "timestamp": image.captured_at,
-                "frame_number": getattr(image, "frame_number", 0),
-                # Timelapse info (will be populated by renderer if timelapse object available)
-                "timelapse_name": f"Timelapse {image.timelapse_id}",
-                "day_number": 1,  # This would be calculated from timelapse start date
-                # Settings service for timezone handling in generators
-                "settings_service": self.settings_service,
-            }
-
-            # Add weather data if available from image's historical weather
-            if (
-                hasattr(image, "weather_temperature")
-                and image.weather_temperature is not None
-            ):
-                # Use historical weather data stored with the image
-                context_data.update(
-                    {
-                        "temperature": image.weather_temperature,
-                        "weather_conditions": image.weather_conditions or "",
-                        "temperature_unit": "F",  # Default, could be from settings
-                    }
-                )
-                logger.debug(
-                    f"Using historical weather data for image {image.id}: temp={image.weather_temperature}"
-                )
-            # Weather data from image's stored weather fields (captured at image time)
-            if image.weather_temperature is not None or image.weather_conditions:
-                context_data.update(
-                    {
-                        "temperature": image.weather_temperature,
-                        "weather_conditions": image.weather_conditions or "",
-                        "weather_icon": image.weather_icon or "",
-                        "temperature_unit": "C",  # Image weather is stored in Celsius
-                        "weather_fetched_at": image.weather_fetched_at,
-                    }
-                )
-                logger.debug(
-                    f"Using stored weather data for image {image.id} from {image.weather_fetched_at}"
-                )
-
-            return context_data
-
-        except Exception as e:
-            logger.error(f"Failed to create image context for overlay: {e}")
-            # Return minimal context with timezone-aware fallback if possible
-            fallback_timestamp = image.captured_at or (
-                get_timezone_aware_timestamp_sync(self.settings_service)
-                if self.settings_service
-                else utc_now()
-            )
-            return {
-                "timestamp": fallback_timestamp,
-                "frame_number": 0,
-                "timelapse_name": "Timelapse",
-                "day_number": 1,
-            }
+        return create_image_overlay_context(image, self.settings_service)
 
     def _get_effective_overlay_config_for_timelapse(
         self, timelapse_overlay: TimelapseOverlay
@@ -1349,19 +1431,26 @@ class OverlayIntegrationService:
         self, config_data
     ) -> Optional[TimelapseOverlay]:
         """Create or update timelapse overlay configuration."""
-        return await self.overlay_ops.create_or_update_timelapse_overlay(config_data)
+        result = await self.overlay_ops.create_or_update_timelapse_overlay(config_data)
+        if result:
+            render_plan_cache.invalidate_timelapse(result.timelapse_id)
+        return result
 
     async def update_timelapse_overlay_config(
         self, timelapse_id: int, config_data
     ) -> Optional[TimelapseOverlay]:
         """Update timelapse overlay configuration."""
-        return await self.overlay_ops.update_timelapse_overlay(
+        result = await self.overlay_ops.update_timelapse_overlay(
             timelapse_id, config_data
         )
+        render_plan_cache.invalidate_timelapse(timelapse_id)
+        return result
 
     async def delete_timelapse_overlay_config(self, timelapse_id: int) -> bool:
         """Delete timelapse overlay configuration."""
-        return await self.overlay_ops.delete_timelapse_overlay(timelapse_id)
+        deleted = await self.overlay_ops.delete_timelapse_overlay(timelapse_id)
+        render_plan_cache.invalidate_timelapse(timelapse_id)
+        return deleted
 
     # ================================================================
     # ASSET MANAGEMENT METHODS (Required by Router)
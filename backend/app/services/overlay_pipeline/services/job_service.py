@@ -121,6 +121,16 @@ class SyncOverlayJobService:
             logger.error("Failed to get pending overlay jobs", exception=e)
             return []
 
+    def claim_jobs(
+        self, batch_size: int = DEFAULT_OVERLAY_JOB_BATCH_SIZE
+    ) -> List[OverlayGenerationJob]:
+        """Atomically claim jobs for processing (already marked as processing)."""
+        try:
+            return self.overlay_job_ops.claim_jobs(batch_size)
+        except Exception as e:
+            logger.error("Failed to claim overlay jobs", exception=e)
+            return []
+
     def mark_job_processing(self, job_id: int) -> bool:
         """Mark a job as processing."""
         try:
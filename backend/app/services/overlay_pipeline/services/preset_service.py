@@ -14,6 +14,7 @@ from ....models.overlay_model import (
     OverlayPresetUpdate,
 )
 from ....services.logger import get_service_logger
+from ..caching.render_plan_cache import render_plan_cache
 
 logger = get_service_logger(LoggerName.OVERLAY_PIPELINE, LogSource.PIPELINE)
 
@@ -74,6 +75,7 @@ class SyncOverlayPresetService:
             # Convert dict to OverlayPresetUpdate model
             preset_update = OverlayPresetUpdate(**updates)
             result = self.overlay_ops.update_preset(preset_id, preset_update)
+            render_plan_cache.invalidate_preset(preset_id)
             return result is not None
         except Exception as e:
             logger.error(f"Failed to update overlay preset {preset_id}", exception=e)
@@ -82,7 +84,9 @@ class SyncOverlayPresetService:
     def delete_preset(self, preset_id: int) -> bool:
         """Delete an overlay preset."""
         try:
-            return self.overlay_ops.delete_preset(preset_id)
+            deleted = self.overlay_ops.delete_preset(preset_id)
+            render_plan_cache.invalidate_preset(preset_id)
+            return deleted
         except Exception as e:
             logger.error(f"Failed to delete overlay preset {preset_id}", exception=e)
             return False
@@ -182,6 +186,7 @@ class OverlayPresetService:
             # Convert dict to OverlayPresetUpdate model
             preset_update = OverlayPresetUpdate(**updates)
             result = await self.overlay_ops.update_preset(preset_id, preset_update)
+            render_plan_cache.invalidate_preset(preset_id)
             return result is not None
         except Exception as e:
             logger.error(f"Failed to update overlay preset {preset_id}", exception=e)
@@ -190,7 +195,9 @@ class OverlayPresetService:
     async def delete_preset(self, preset_id: int) -> bool:
         """Delete an overlay preset (async)."""
         try:
-            return await self.overlay_ops.delete_preset(preset_id)
+            deleted = await self.overlay_ops.delete_preset(preset_id)
+            render_plan_cache.invalidate_preset(preset_id)
+            return deleted
         except Exception as e:
             logger.error(f"Failed to delete overlay preset {preset_id}", exception=e)
             return False
@@ -11,7 +11,7 @@ import asyncio
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
-from PIL import Image, ImageColor, ImageDraw
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from ....constants import OVERLAY_TYPE_WATERMARK
 from ....enums import LoggerName, LogSource, OverlayGridPosition
@@ -19,13 +19,18 @@ from ....models.image_model import Image as ImageModel
 from ....models.overlay_model import OverlayConfiguration, OverlayItem
 from ....models.timelapse_model import Timelapse as TimelapseModel
 from ....services.logger import LogEmoji, get_service_logger
+from ....utils.captured_frame import open_captured_image
 from ....utils.time_utils import utc_now
 from ..generators import OverlayGenerationContext, overlay_generator_registry
+from .dirty_rect_compositor import Box, DirtyRectCompositor, union_box
 from .font_cache import get_font_fast, get_text_size_fast
 from .overlay_template_cache import get_overlay_template
 
 logger = get_service_logger(LoggerName.OVERLAY_PIPELINE, LogSource.PIPELINE)
 
+# Padding around text backgrounds, in pixels
+TEXT_BACKGROUND_PADDING = 4
+
 
 class OverlayRenderer:
     """
@@ -60,8 +65,8 @@ class OverlayRenderer:
             True if overlay was successfully rendered and saved
         """
         try:
-            # Load base image
-            with Image.open(base_image_path) as base_image:
+            # Load base image (in-memory frame if recently captured)
+            with open_captured_image(base_image_path) as base_image:
                 # Convert to RGBA if needed for transparency support
                 if base_image.mode != "RGBA":
                     base_image = base_image.convert("RGBA")
@@ -145,34 +150,22 @@ class OverlayRenderer:
         else:
             base_image = base_image.copy()
 
-        # Create overlay layer
-        overlay_layer = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay_layer)
-
-        # Render each positioned overlay
+        # Collect each positioned overlay with its bounding box
+        compositor = DirtyRectCompositor(base_image.size)
         for position, overlay_item in self.config.overlay_positions.items():
-            self._render_overlay_item(
-                draw, overlay_layer, position, overlay_item, context_data
-            )
-
-        # Apply global opacity
-        if self.config.global_options.opacity < 100:
-            overlay_layer = self._apply_global_opacity(overlay_layer)
+            self.add_overlay_element(compositor, position, overlay_item, context_data)
 
-        # Composite overlay onto base image
-        final_image = Image.alpha_composite(base_image, overlay_layer)
+        # Blend only the regions that were drawn, with global opacity applied
+        return compositor.composite(base_image, self.config.global_options.opacity)
 
-        return final_image
-
-    def _render_overlay_item(
+    def add_overlay_element(
         self,
-        draw: ImageDraw.ImageDraw,
-        overlay_layer: Image.Image,
+        compositor: DirtyRectCompositor,
         position: OverlayGridPosition,
         overlay_item: OverlayItem,
         context_data: Dict[str, Any],
     ) -> None:
-        """Render a single overlay item at the specified position."""
+        """Register a single overlay item at the specified position."""
 
         # Get overlay content text
         content_text = self._get_overlay_content(overlay_item, context_data)
@@ -180,12 +173,12 @@ class OverlayRenderer:
             return  # Skip empty text overlays
 
         # Calculate position coordinates
-        x, y = self._calculate_position(position, overlay_layer.size)
+        x, y = self._calculate_position(position, compositor.frame_size)
 
         if overlay_item.type == OVERLAY_TYPE_WATERMARK:
-            self._render_image_overlay(overlay_layer, overlay_item, x, y)
+            self._add_image_element(compositor, overlay_item, x, y)
         else:
-            self._render_text_overlay(draw, overlay_item, content_text, x, y)
+            self.add_text_element(compositor, overlay_item, content_text, x, y)
 
     def _get_overlay_content(
         self, overlay_item: OverlayItem, context_data: Dict[str, Any]
@@ -281,18 +274,22 @@ class OverlayRenderer:
             ),
         )
 
-    def _render_text_overlay(
+    def add_text_element(
         self,
-        draw: ImageDraw.ImageDraw,
+        compositor: DirtyRectCompositor,
         overlay_item: OverlayItem,
         text: str,
         x: int,
         y: int,
+        font: Optional[ImageFont.FreeTypeFont] = None,
     ) -> None:
-        """Render text overlay with background and styling."""
+        """Register text overlay with background and styling."""
 
-        # Get font using global cache
-        font = get_font_fast(self.config.global_options.font, overlay_item.text_size)
+        # Get font using global cache unless already resolved
+        if font is None:
+            font = get_font_fast(
+                self.config.global_options.font, overlay_item.text_size
+            )
 
         # Calculate text dimensions using cached font
         text_width, text_height = get_text_size_fast(
@@ -303,27 +300,72 @@ class OverlayRenderer:
         adjusted_x, adjusted_y = self._adjust_text_position(
             x, y, text_width, text_height
         )
+        has_background = bool(
+            overlay_item.background_opacity > 0 and overlay_item.background_color
+        )
+        text_color = overlay_item.text_color or "#FFFFFF"
 
-        # Draw background if specified
-        if overlay_item.background_opacity > 0 and overlay_item.background_color:
-            self._draw_text_background(
-                draw,
+        def draw_text(_patch, draw, offset_x, offset_y):
+            origin_x, origin_y = adjusted_x - offset_x, adjusted_y - offset_y
+
+            # Draw background if specified
+            if has_background:
+                self._draw_text_background(
+                    draw,
+                    origin_x,
+                    origin_y,
+                    text_width,
+                    text_height,
+                    overlay_item.background_color,
+                    overlay_item.background_opacity,
+                )
+
+            # Draw text
+            draw.text((origin_x, origin_y), text, font=font, fill=text_color)
+
+        compositor.add(
+            self._text_element_box(
+                font,
+                text,
                 adjusted_x,
                 adjusted_y,
                 text_width,
                 text_height,
-                overlay_item.background_color,
-                overlay_item.background_opacity,
-            )
+                has_background,
+            ),
+            draw_text,
+        )
 
-        # Draw text
-        text_color = overlay_item.text_color or "#FFFFFF"
-        draw.text((adjusted_x, adjusted_y), text, font=font, fill=text_color)
+    @staticmethod
+    def _text_element_box(
+        font,
+        text: str,
+        x: int,
+        y: int,
+        text_width: int,
+        text_height: int,
+        has_background: bool,
+    ) -> Box:
+        """Bounding box of rendered text and its background, with a 1px guard."""
+        left, top, right, bottom = font.getbbox(text)
+        box = (x + left - 1, y + top - 1, x + right + 1, y + bottom + 1)
+        if has_background:
+            padding = TEXT_BACKGROUND_PADDING
+            box = union_box(
+                box,
+                (
+                    x - padding,
+                    y - padding,
+                    x + text_width + padding + 1,
+                    y + text_height + padding + 1,
+                ),
+            )
+        return box
 
-    def _render_image_overlay(
-        self, overlay_layer: Image.Image, overlay_item: OverlayItem, x: int, y: int
+    def _add_image_element(
+        self, compositor: DirtyRectCompositor, overlay_item: OverlayItem, x: int, y: int
     ) -> None:
-        """Render image overlay (watermark) at specified position."""
+        """Register image overlay (watermark) at specified position."""
 
         if not overlay_item.image_url:
             return
@@ -337,8 +379,7 @@ class OverlayRenderer:
 
             with Image.open(overlay_image_path) as img:
                 # Convert to RGBA for transparency
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
+                img = img.convert("RGBA")
 
                 # Scale image if needed
                 if overlay_item.image_scale != 100:
@@ -349,11 +390,21 @@ class OverlayRenderer:
                     )
                     img = img.resize(new_size, Image.Resampling.LANCZOS)
 
-                # Adjust position for image dimensions
-                adjusted_x, adjusted_y = self._adjust_image_position(x, y, img.size)
+            # Adjust position for image dimensions
+            adjusted_x, adjusted_y = self._adjust_image_position(x, y, img.size)
 
-                # Paste image onto overlay layer
-                overlay_layer.paste(img, (adjusted_x, adjusted_y), img)
+            def draw_image(patch, _draw, offset_x, offset_y):
+                patch.paste(img, (adjusted_x - offset_x, adjusted_y - offset_y), img)
+
+            compositor.add(
+                (
+                    adjusted_x,
+                    adjusted_y,
+                    adjusted_x + img.width,
+                    adjusted_y + img.height,
+                ),
+                draw_image,
+            )
 
         except Exception as e:
             logger.error("Failed to render image overlay", exception=e)
@@ -417,7 +468,7 @@ class OverlayRenderer:
             background_rgba = (*color, alpha)
 
             # Add padding
-            padding = 4
+            padding = TEXT_BACKGROUND_PADDING
             draw.rectangle(
                 [x - padding, y - padding, x + width + padding, y + height + padding],
                 fill=background_rgba,
@@ -429,23 +480,6 @@ class OverlayRenderer:
     # Note: Font loading now handled by global font cache (font_cache.py)
     # Previous font loading methods removed in favor of global cache
 
-    def _apply_global_opacity(self, overlay_layer: Image.Image) -> Image.Image:
-        """Apply global opacity to the overlay layer."""
-
-        if self.config.global_options.opacity >= 100:
-            return overlay_layer
-
-        # Create alpha mask
-        alpha = int(255 * (self.config.global_options.opacity / 100.0))
-
-        # Apply opacity
-        overlay_array = overlay_layer.split()
-        if len(overlay_array) == 4:  # RGBA
-            alpha_channel = overlay_array[3].point(lambda p: int(p * alpha / 255))
-            overlay_layer = Image.merge("RGBA", overlay_array[:3] + (alpha_channel,))
-
-        return overlay_layer
-
 
 def create_overlay_context(
     image_data: Dict[str, Any],
@@ -559,8 +593,8 @@ async def render_overlay_with_caching(
         - Template cache has 30-minute TTL for efficient memory usage
     """
     try:
-        # Load base image
-        with Image.open(base_image_path) as base_image:
+        # Load base image (in-memory frame if recently captured)
+        with open_captured_image(base_image_path) as base_image:
             # Convert to RGBA if needed for transparency support
             if base_image.mode != "RGBA":
                 base_image = base_image.convert("RGBA")
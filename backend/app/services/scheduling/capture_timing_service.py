@@ -53,7 +53,7 @@ from ...utils.time_utils import (
 from .time_window_service import SyncTimeWindowService, TimeWindowService
 
 if TYPE_CHECKING:
-    pass
+    from ..capture_pipeline.capture_context import CaptureContext
 
 logger = get_service_logger(LoggerName.SCHEDULING_SERVICE, LogSource.SCHEDULER)
 
@@ -630,6 +630,7 @@ class SyncCaptureTimingService:
         time_window_start: Optional[time] = None,
         time_window_end: Optional[time] = None,
         current_time: Optional[datetime] = None,
+        grace_period_seconds: Optional[int] = None,
     ) -> bool:
         """
         Determine if a capture is due for a camera (sync version).
@@ -640,6 +641,7 @@ class SyncCaptureTimingService:
             time_window_start: Camera's time window start
             time_window_end: Camera's time window end
             current_time: Current time (defaults to now)
+            grace_period_seconds: Capture grace period (defaults to the setting)
 
         Returns:
             True if capture is due
@@ -647,8 +649,9 @@ class SyncCaptureTimingService:
         if current_time is None:
             current_time = get_timezone_aware_timestamp_sync(self.settings_service)
 
-        settings = self._get_timing_settings()
-        grace_period_seconds = settings["grace_period_seconds"]
+        if grace_period_seconds is None:
+            settings = self._get_timing_settings()
+            grace_period_seconds = settings["grace_period_seconds"]
 
         # Check time window first
         if time_window_start and time_window_end:
@@ -693,10 +696,12 @@ class SyncCaptureTimingService:
         Comprehensive validation for capture readiness - implements scheduler trust model.
 
         This method performs ALL validation checks so that workers can trust scheduler
-        decisions and skip redundant validation.
+        decisions and skip redundant validation. The timelapse, its camera and the
+        capture settings are loaded with a single query; on success the resulting
+        CaptureContext is returned so the capture itself needs no further lookups.
 
         Args:
-            camera_id: Camera identifier
+            camera_id: Camera identifier (0 = use the timelapse's camera)
             timelapse_id: Timelapse identifier
 
         Returns:
@@ -704,32 +709,60 @@ class SyncCaptureTimingService:
         """
         try:
             # Import here to avoid circular imports
-            from ...database.camera_operations import SyncCameraOperations
-            from ...database.timelapse_operations import SyncTimelapseOperations
-
-            camera_ops = SyncCameraOperations(self.db, self.async_db)
-            timelapse_ops = SyncTimelapseOperations(self.db)
-
-            # Step 0: Extract camera_id from timelapse if camera_id=0 (scheduler convenience)
-            if camera_id == 0:
-                timelapse = timelapse_ops.get_timelapse_by_id(timelapse_id)
-                if not timelapse:
-                    return CaptureReadinessValidationResult(
-                        valid=False,
-                        error=f"Timelapse {timelapse_id} not found (needed to extract camera_id)",
-                        error_type="timelapse_not_found",
-                    )
-                camera_id = timelapse.camera_id
+            from ..capture_pipeline.capture_context import load_capture_context
 
-            # Step 1: Validate camera exists and is enabled
-            camera = camera_ops.get_camera_by_id(camera_id)
-            if not camera:
+            # Step 0: Load timelapse, camera and settings in one round trip
+            context = load_capture_context(self.db, timelapse_id)
+            if not context:
                 return CaptureReadinessValidationResult(
                     valid=False,
-                    error=f"Camera {camera_id} not found",
-                    error_type="camera_not_found",
+                    error=f"Timelapse {timelapse_id} not found",
+                    error_type="timelapse_not_found",
                 )
 
+            return self.evaluate_capture_readiness(context, camera_id)
+
+        except Exception as e:
+            logger.error(
+                f"Error validating capture readiness for camera {camera_id}: {e}"
+            )
+            return CaptureReadinessValidationResult(
+                valid=False,
+                error=f"Validation error: {str(e)}",
+                error_type="validation_error",
+            )
+
+    def evaluate_capture_readiness(
+        self, context: "CaptureContext", camera_id: int = 0
+    ) -> CaptureReadinessValidationResult:
+        """
+        Run the readiness checks against an already loaded capture context.
+
+        Performs no database access, so it is safe to call from the event loop
+        (see CaptureReadinessEvaluator, which loads contexts in batches).
+
+        Args:
+            context: Capture context of the timelapse
+            camera_id: Expected camera identifier (0 = use the timelapse's camera)
+
+        Returns:
+            CaptureValidationResult with validation status and details
+        """
+        timelapse_id = context.timelapse_id
+        try:
+            # camera_id=0 is a scheduler convenience: use the timelapse's camera
+            if camera_id and camera_id != context.camera_id:
+                return CaptureReadinessValidationResult(
+                    valid=False,
+                    error=f"Timelapse {timelapse_id} does not belong to camera {camera_id}",
+                    error_type="camera_mismatch",
+                )
+
+            camera = context.camera
+            timelapse = context.timelapse
+            camera_id = context.camera_id
+
+            # Step 1: Validate camera is enabled
             if camera.status != "active":
                 return CaptureReadinessValidationResult(
                     valid=False,
@@ -745,15 +778,7 @@ class SyncCaptureTimingService:
                     error_type="camera_offline",
                 )
 
-            # Step 3: Validate timelapse exists and is active
-            timelapse = timelapse_ops.get_timelapse_by_id(timelapse_id)
-            if not timelapse:
-                return CaptureReadinessValidationResult(
-                    valid=False,
-                    error=f"Timelapse {timelapse_id} not found",
-                    error_type="timelapse_not_found",
-                )
-
+            # Step 3: Validate timelapse is active
             if timelapse.status not in ["running", "active"]:
                 return CaptureReadinessValidationResult(
                     valid=False,
@@ -762,7 +787,7 @@ class SyncCaptureTimingService:
                 )
 
             # Step 4: Validate capture timing (is capture due?)
-            current_time = get_timezone_aware_timestamp_sync(self.settings_service)
+            current_time = context.now()
 
             # Get last capture time for this camera
             last_capture_time = camera.last_capture_at
@@ -795,6 +820,7 @@ class SyncCaptureTimingService:
                 time_window_start=time_window_start,
                 time_window_end=time_window_end,
                 current_time=current_time,
+                grace_period_seconds=context.grace_period_seconds,
             ):
                 return CaptureReadinessValidationResult(
                     valid=False,
@@ -822,6 +848,7 @@ class SyncCaptureTimingService:
                 next_capture_time=self.calculate_next_capture_time(
                     current_time=current_time, interval_seconds=capture_interval
                 ),
+                capture_context=context,
             )
 
         except Exception as e:
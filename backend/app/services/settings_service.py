@@ -6,10 +6,9 @@ This service provides a clean interface for settings operations,
 handling business logic and coordinating between database operations
 and external systems.
 """
-import time
 import zoneinfo
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from ..constants import (
     DEFAULT_CORRUPTION_DISCARD_THRESHOLD,
@@ -22,6 +21,7 @@ from ..database.settings_operations import (
     SettingsOperationError,
     SettingsOperations,
     SyncSettingsOperations,
+    _process_corruption_settings_shared,
 )
 from ..database.sse_events_operations import SSEEventsOperations
 from ..enums import LoggerName, LogSource, SSEEvent, SSEEventSource, SSEPriority
@@ -31,11 +31,25 @@ from ..utils.conversion_utils import safe_int
 from ..utils.hashing import mask_api_key
 from ..utils.time_utils import utc_timestamp
 from .logger import get_service_logger
+from .settings_snapshot import get_settings_snapshot_store
 from .weather.api_key_service import APIKeyService, SyncAPIKeyService
 
 logger = get_service_logger(LoggerName.SETTINGS_SERVICE, LogSource.SYSTEM)
 
 
+def _corruption_settings_from_snapshot(
+    values: Mapping[str, Optional[str]],
+) -> CorruptionSettings:
+    """Build corruption settings from snapshot values like the database query does."""
+    return _process_corruption_settings_shared(
+        {
+            key: value
+            for key, value in values.items()
+            if key.startswith("corruption_") and value is not None
+        }
+    )
+
+
 class SettingsService:
     """
     System configuration business logic.
@@ -59,13 +73,14 @@ class SettingsService:
         self.settings_ops = SettingsOperations(db)
         self.sse_ops = SSEEventsOperations(db)
         self.api_key_service = APIKeyService(db)
-
-        # Settings caching (extracted from RTSPService)
-        self._settings_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_timestamps: Dict[str, float] = {}
+        self.snapshot_store = get_settings_snapshot_store()
 
     async def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings as a dictionary."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is not None:
+            return dict(snapshot.values)
+
         try:
             return await self.settings_ops.get_all_settings()
         except SettingsOperationError as e:
@@ -79,6 +94,10 @@ class SettingsService:
         self, key: str, default: Optional[str] = None
     ) -> Optional[str]:
         """Get specific setting by key."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is not None:
+            return snapshot.get(key, default)
+
         try:
             return await self.settings_ops.get_setting(key, default)
         except SettingsOperationError as e:
@@ -97,75 +116,38 @@ class SettingsService:
         return await self.api_key_service.get_api_key_for_display()
 
     async def get_cached_settings_group(
-        self,
-        group_name: str,
-        setting_keys: List[str],
-        cache_ttl_seconds: int = 30,
-        force_refresh: bool = False,
+        self, group_name: str, setting_keys: List[str]
     ) -> Dict[str, Any]:
         """
-        Get a group of related settings with caching support.
-
-        Extracted from RTSPService to provide centralized settings caching.
+        Get a group of related settings from the settings snapshot.
 
         Args:
-            group_name: Name for this settings group (for cache key)
+            group_name: Name for this settings group (used in error logs)
             setting_keys: List of setting keys to fetch
-            cache_ttl_seconds: Cache time-to-live in seconds (default 30)
-            force_refresh: Force refresh of cache
 
         Returns:
             Dictionary of setting_key -> value
         """
-        # Check cache validity
-        current_time = time.time()
-        cache_key = f"{group_name}_{hash(tuple(setting_keys))}"
-
-        if (
-            not force_refresh
-            and cache_key in self._settings_cache
-            and cache_key in self._cache_timestamps
-            and (current_time - self._cache_timestamps[cache_key]) < cache_ttl_seconds
-        ):
-            return self._settings_cache[cache_key]
-
         try:
-            # Fetch settings from database
-            settings = {}
-            for key in setting_keys:
-                value = await self.settings_ops.get_setting(key)
-                settings[key] = value
-
-            # Update cache
-            self._settings_cache[cache_key] = settings
-            self._cache_timestamps[cache_key] = current_time
-
-            return settings
-
+            return {key: await self.get_setting(key) for key in setting_keys}
         except Exception as e:
-            logger.warning(f"Failed to get cached settings group '{group_name}': {e}")
-            # Return cached value if available, otherwise empty dict
-            return self._settings_cache.get(cache_key, {})
+            logger.warning(f"Failed to get settings group '{group_name}': {e}")
+            return {}
 
-    def clear_settings_cache(self, group_name: Optional[str] = None) -> None:
+    async def _refresh_snapshot(self) -> None:
         """
-        Clear settings cache, optionally for a specific group.
+        Reload the settings snapshot after a write made by this process.
 
-        Args:
-            group_name: If provided, only clear cache entries containing this group name
+        Other processes reload on the write's NOTIFY; reloading here as well
+        lets this request read its own write without waiting for it.
         """
-        if group_name is None:
-            # Clear all cache
-            self._settings_cache.clear()
-            self._cache_timestamps.clear()
-        else:
-            # Clear specific group cache entries
-            keys_to_remove = [
-                key for key in self._settings_cache.keys() if group_name in key
-            ]
-            for key in keys_to_remove:
-                self._settings_cache.pop(key, None)
-                self._cache_timestamps.pop(key, None)
+        if self.snapshot_store.snapshot is None:
+            return
+        try:
+            await self.snapshot_store.reload(self.db)
+        except Exception as e:
+            logger.warning(f"Failed to reload settings snapshot: {e}")
+            self.snapshot_store.invalidate()
 
     async def set_setting(self, key: str, value: str) -> bool:
         """Set a setting value with special handling for API keys."""
@@ -175,8 +157,7 @@ class SettingsService:
                 result = await self.api_key_service.store_api_key(value)
 
                 if result:
-                    # Clear settings cache since a setting was updated
-                    self.clear_settings_cache()
+                    await self._refresh_snapshot()
 
                     # Create SSE event (use masked value for security)
                     await self.sse_ops.create_event(
@@ -201,8 +182,7 @@ class SettingsService:
                 result = await self.settings_ops.set_setting(key, value)
 
                 if result:
-                    # Clear settings cache since a setting was updated
-                    self.clear_settings_cache()
+                    await self._refresh_snapshot()
 
                     # Special handling for timezone changes
                     if key == "timezone" and old_value and old_value != value:
@@ -251,6 +231,8 @@ class SettingsService:
             result = await self.settings_ops.set_multiple_settings(processed_settings)
 
             if result:
+                await self._refresh_snapshot()
+
                 # Create SSE event for bulk setting changes
                 await self.sse_ops.create_event(
                     event_type=SSEEvent.SETTINGS_UPDATED,
@@ -277,6 +259,8 @@ class SettingsService:
             result = await self.settings_ops.delete_setting(key)
 
             if result:
+                await self._refresh_snapshot()
+
                 # Create SSE event for setting deletion
                 await self.sse_ops.create_event(
                     event_type=SSEEvent.SETTING_DELETED,
@@ -299,6 +283,10 @@ class SettingsService:
 
     async def get_corruption_settings(self) -> CorruptionSettings:
         """Get corruption detection related settings."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is not None:
+            return _corruption_settings_from_snapshot(snapshot.values)
+
         try:
             return await self.settings_ops.get_corruption_settings()
         except SettingsOperationError as e:
@@ -321,14 +309,7 @@ class SettingsService:
 
     async def get_settings_dict(self) -> Dict[str, Any]:
         """Get all settings as a dictionary (backward compatibility)."""
-        try:
-            return await self.settings_ops.get_all_settings()
-        except SettingsOperationError as e:
-            logger.error(f"Database error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
+        return await self.get_all_settings()
 
     async def validate_setting(self, key: str, value: str) -> Dict[str, Any]:
         """
@@ -398,7 +379,7 @@ class SettingsService:
                 "status": "healthy",
                 "database_connected": True,
                 "settings_count": len(settings_dict),
-                "cache_entries": len(self._settings_cache),
+                "settings_snapshot": self.snapshot_store.get_stats(),
                 "api_key_service_available": self.api_key_service is not None,
                 "last_checked": utc_timestamp(),
             }
@@ -571,9 +552,14 @@ class SyncSettingsService:
         self.db = db
         self.settings_ops = SyncSettingsOperations(db)
         self.api_key_service = SyncAPIKeyService(db)
+        self.snapshot_store = get_settings_snapshot_store()
 
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all settings as a dictionary."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is not None:
+            return dict(snapshot.values)
+
         try:
             return self.settings_ops.get_all_settings()
         except SettingsOperationError as e:
@@ -585,6 +571,10 @@ class SyncSettingsService:
 
     def get_setting(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """Get specific setting by key."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is not None:
+            return snapshot.get(key, default)
+
         try:
             return self.settings_ops.get_setting(key, default)
         except SettingsOperationError as e:
@@ -596,6 +586,10 @@ class SyncSettingsService:
 
     def get_corruption_settings(self) -> CorruptionSettings:
         """Get corruption detection related settings."""
+        snapshot = self.snapshot_store.snapshot
+        if snapshot is not None:
+            return _corruption_settings_from_snapshot(snapshot.values)
+
         try:
             return self.settings_ops.get_corruption_settings()
         except SettingsOperationError as e:
@@ -608,7 +602,7 @@ class SyncSettingsService:
     def set_setting(self, key: str, value: str) -> bool:
         """Set a setting value."""
         try:
-            return self.settings_ops.set_setting(key, value)
+            result = self.settings_ops.set_setting(key, value)
         except SettingsOperationError as e:
             logger.error(f"Database error: {e}")
             raise
@@ -616,6 +610,15 @@ class SyncSettingsService:
             logger.error(f"Unexpected error: {e}")
             raise
 
+        # Read-your-writes in this process; others reload on the NOTIFY
+        if result and self.snapshot_store.snapshot is not None:
+            try:
+                self.snapshot_store.reload_sync(self.db)
+            except Exception as e:
+                logger.warning(f"Failed to reload settings snapshot: {e}")
+                self.snapshot_store.invalidate()
+        return result
+
     def get_openweather_api_key(self) -> Optional[str]:
         """Get the actual OpenWeather API key for use by weather service."""
         return self.api_key_service.get_api_key_for_service()
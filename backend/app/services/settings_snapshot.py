@@ -0,0 +1,216 @@
+# backend/app/services/settings_snapshot.py
+"""
+Settings Snapshot - One immutable copy of the settings table per process.
+
+Role: Serve settings reads from memory in the API and worker processes
+Responsibilities: Load all settings in one query, swap the snapshot
+atomically, reload it when a settings write issues NOTIFY
+Interactions: SettingsService, SyncSettingsService and LoggerSettingsCache
+read it; SettingsOperations notify SETTINGS_NOTIFY_CHANNEL in the same
+transaction as every settings write
+
+Readers take the current snapshot reference and look keys up in its mapping,
+with no locks and no TTL checks. A snapshot is never mutated: a reload builds
+a new one and replaces the reference, so readers see either the old or the
+new settings, never a mix. Loads are numbered when they start and a load
+only replaces an older snapshot, so a slow reload cannot undo a newer one.
+
+While the LISTEN connection is down a write could go unnoticed, so the
+snapshot is dropped and reads fall back to the database until the listener
+reconnects and reloads it.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+import psycopg
+
+from ..config import settings
+from ..constants import SETTINGS_LISTENER_RECONNECT_SECONDS, SETTINGS_NOTIFY_CHANNEL
+from ..database.core import AsyncDatabase, SyncDatabase
+from ..database.settings_operations import SettingsOperations, SyncSettingsOperations
+from ..enums import LoggerName, LogSource
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable settings of one load; version increases with every load."""
+
+    version: int
+    values: Mapping[str, Optional[str]]
+    loaded_at: float
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a setting value, or default if the key does not exist."""
+        return self.values.get(key, default)
+
+
+class SettingsSnapshotStore:
+    """
+    Process-wide settings snapshot kept current by LISTEN/NOTIFY.
+
+    The listener runs on the event loop; sync services in worker threads
+    only read the snapshot reference or reload it with reload_sync().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store; reads fall back until the first load."""
+        self._snapshot: Optional[SettingsSnapshot] = None
+        self._lock = threading.Lock()  # Orders load numbers, never held by readers
+        self._loads_started = 0
+        self._discard_through = 0
+
+        self._db: Optional[AsyncDatabase] = None
+        self._task: Optional[asyncio.Task] = None
+        self._listening = False
+        self._notifications_received = 0
+
+    @property
+    def snapshot(self) -> Optional[SettingsSnapshot]:
+        """Current snapshot, or None while settings must be read from the database."""
+        return self._snapshot
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener task is active."""
+        return self._task is not None and not self._task.done()
+
+    def _begin_load(self) -> int:
+        """Number a load before its query runs."""
+        with self._lock:
+            self._loads_started += 1
+            return self._loads_started
+
+    def _install(
+        self, version: int, values: Dict[str, Any]
+    ) -> Optional[SettingsSnapshot]:
+        """Swap in the result of a load unless a newer load or a drop came after it."""
+        snapshot = SettingsSnapshot(
+            version=version,
+            values=MappingProxyType(dict(values)),
+            loaded_at=time.time(),
+        )
+        with self._lock:
+            current = self._snapshot
+            if version <= self._discard_through or (
+                current is not None and current.version >= version
+            ):
+                return current
+            self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot, including the result of any load in progress."""
+        with self._lock:
+            self._snapshot = None
+            self._discard_through = self._loads_started
+
+    async def reload(self, db: AsyncDatabase) -> Optional[SettingsSnapshot]:
+        """
+        Load all settings in one query and swap in the new snapshot.
+
+        Args:
+            db: Async database instance
+
+        Returns:
+            The current snapshot after the load
+        """
+        version = self._begin_load()
+        values = await SettingsOperations(db).get_all_settings()
+        return self._install(version, values)
+
+    def reload_sync(self, db: SyncDatabase) -> Optional[SettingsSnapshot]:
+        """Load all settings with the sync database (see reload())."""
+        version = self._begin_load()
+        values = SyncSettingsOperations(db).get_all_settings()
+        return self._install(version, values)
+
+    def start(self, db: AsyncDatabase) -> None:
+        """
+        Start listening for settings changes (no-op if already running).
+
+        The snapshot is loaded once the LISTEN connection is up, so no change
+        committed after the load can be missed.
+
+        Args:
+            db: Async database used for reloads
+        """
+        if self.running:
+            return
+        self._db = db
+        self._task = asyncio.create_task(
+            self._listen_loop(), name="settings-snapshot-listener"
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and drop the snapshot."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._listening = False
+        self.invalidate()
+
+    async def _listen_loop(self) -> None:
+        """Keep a LISTEN connection open, reloading on every notification."""
+        # Imported here: the logger reads settings through this module
+        from .logger import get_service_logger
+
+        logger = get_service_logger(LoggerName.SETTINGS_SERVICE, LogSource.SYSTEM)
+        assert self._db is not None, "start() sets the database"
+
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    settings.database_url, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {SETTINGS_NOTIFY_CHANNEL}")
+                    self._listening = True
+                    await self.reload(self._db)
+
+                    async for _notify in conn.notifies():
+                        self._notifications_received += 1
+                        await self.reload(self._db)
+
+            except asyncio.CancelledError:
+                self._listening = False
+                raise
+            except Exception as e:
+                if self._listening:
+                    logger.warning(
+                        "Settings listener lost connection, reading settings from the database",
+                        exception=e,
+                        store_in_db=False,
+                    )
+                self._listening = False
+                self.invalidate()
+
+            await asyncio.sleep(SETTINGS_LISTENER_RECONNECT_SECONDS)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot and listener statistics for status reporting."""
+        snapshot = self._snapshot
+        return {
+            "running": self.running,
+            "listening": self._listening,
+            "version": snapshot.version if snapshot else None,
+            "settings_count": len(snapshot.values) if snapshot else 0,
+            "age_seconds": time.time() - snapshot.loaded_at if snapshot else None,
+            "notifications_received": self._notifications_received,
+        }
+
+
+# Global store for the process (API or worker)
+settings_snapshot_store = SettingsSnapshotStore()
+
+
+def get_settings_snapshot_store() -> SettingsSnapshotStore:
+    """Get the process-wide settings snapshot store."""
+    return settings_snapshot_store
@@ -0,0 +1,372 @@
+# backend/app/services/sse_broker.py
+"""
+SSE Broker - In-process fan-out of database SSE events.
+
+Role: Deliver SSE events to every connected client with one database reader
+Responsibilities: LISTEN for new-event notifications, load new events once,
+fan them out to per-client bounded queues, replay missed events on resume
+Interactions: Uses SSEEventsOperations for reads, sse_routers streams from
+subscriber queues
+
+Every insert into sse_events issues pg_notify(SSE_NOTIFY_CHANNEL, id) in the
+same transaction, so the broker wakes up as soon as the event commits instead
+of each client polling on its own timer. Clients keep their own cursor (the
+last event ID they received) and resume with the Last-Event-ID header.
+
+Event IDs are assigned at INSERT but become visible at COMMIT, so a longer
+transaction can commit an event below IDs that were already published. The
+broker remembers such skipped IDs for SSE_BROKER_GAP_GRACE_SECONDS and reads
+from the lowest one on every fetch, so late commits are still delivered.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+import psycopg
+
+from ..config import settings
+from ..constants import (
+    SSE_BROKER_FETCH_BATCH_SIZE,
+    SSE_BROKER_GAP_GRACE_SECONDS,
+    SSE_BROKER_MAX_PENDING_GAPS,
+    SSE_BROKER_RECONNECT_DELAY_SECONDS,
+    SSE_BROKER_REPLAY_BUFFER_SIZE,
+    SSE_BROKER_REPLAY_MAX_AGE_MINUTES,
+    SSE_BROKER_SUBSCRIBER_QUEUE_SIZE,
+    SSE_NOTIFY_CHANNEL,
+)
+from ..database.core import AsyncDatabase
+from ..database.sse_events_operations import SSEEventsOperations
+from ..enums import LoggerName
+from ..services.latest_image_registry import get_latest_image_registry
+from ..services.logger import get_service_logger
+from ..utils.cache_invalidation import CacheInvalidationService
+
+logger = get_service_logger(LoggerName.SSEBROADCASTER)
+
+
+class SSESubscriber:
+    """
+    A connected SSE client.
+
+    Events are delivered through a bounded queue. A None entry means the
+    stream should end (broker shutdown or the client fell too far behind);
+    the client then reconnects and resumes from its Last-Event-ID.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.closed = False
+
+    def offer(self, event: Optional[Dict[str, Any]]) -> bool:
+        """
+        Queue an event without blocking.
+
+        Returns:
+            False if the queue is full (the subscriber is then closed)
+        """
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.close()
+            return False
+
+    def close(self) -> None:
+        """End the stream, making room for the end-of-stream marker if needed."""
+        if self.closed:
+            return
+        self.closed = True
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class SSEBroker:
+    """
+    Single database reader that fans SSE events out to all subscribers.
+
+    Falls back to polling every SSE_BROKER_RECONNECT_DELAY_SECONDS while the
+    LISTEN connection is unavailable.
+    """
+
+    def __init__(
+        self,
+        db: AsyncDatabase,
+        queue_size: int = SSE_BROKER_SUBSCRIBER_QUEUE_SIZE,
+        replay_buffer_size: int = SSE_BROKER_REPLAY_BUFFER_SIZE,
+    ):
+        """
+        Initialize the SSE broker.
+
+        Args:
+            db: Async database used for event reads
+            queue_size: Maximum queued events per subscriber
+            replay_buffer_size: Number of recent events kept for resume
+        """
+        self.db = db
+        self.sse_ops = SSEEventsOperations(db)
+        self.queue_size = queue_size
+
+        self._subscribers: Set[SSESubscriber] = set()
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=replay_buffer_size)
+        self._last_event_id: Optional[int] = None
+        # Skipped IDs below the cursor that may still commit -> time first missed
+        self._pending_gaps: Dict[int, float] = {}
+        self._fetch_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._listening = False
+
+        self._events_published = 0
+        self._subscribers_dropped = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener task is active."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start listening for new events."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._listen_loop(), name="sse-broker")
+        logger.info("SSE broker started", store_in_db=False)
+
+    async def stop(self) -> None:
+        """Stop listening and end all subscriber streams."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for subscriber in list(self._subscribers):
+            subscriber.close()
+        self._subscribers.clear()
+        logger.info("SSE broker stopped", store_in_db=False)
+
+    async def subscribe(self, last_event_id: Optional[int] = None) -> SSESubscriber:
+        """
+        Register a new client.
+
+        Args:
+            last_event_id: ID of the last event the client received, if resuming
+
+        Returns:
+            Subscriber whose queue already holds any missed events
+        """
+        subscriber = SSESubscriber(self.queue_size)
+
+        backlog: List[Dict[str, Any]] = []
+        cursor = last_event_id
+        if cursor is not None and not self._replay_buffer_covers(cursor):
+            backlog = await self.sse_ops.get_events_after(
+                cursor,
+                limit=self.queue_size,
+                max_age_minutes=SSE_BROKER_REPLAY_MAX_AGE_MINUTES,
+            )
+            if backlog:
+                cursor = backlog[-1]["id"]
+
+        # No awaits from here on: the buffer cannot change before registration,
+        # so the client sees neither gaps nor duplicates
+        if cursor is not None:
+            backlog.extend(event for event in self._recent if event["id"] > cursor)
+
+        for event in backlog[-self.queue_size :]:
+            subscriber.offer(event)
+
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: SSESubscriber) -> None:
+        """Remove a client."""
+        self._subscribers.discard(subscriber)
+
+    def _replay_buffer_covers(self, last_event_id: int) -> bool:
+        """Check whether every event after last_event_id is in the buffer."""
+        if self._last_event_id is not None and last_event_id >= self._last_event_id:
+            return True
+        return bool(self._recent) and self._recent[0]["id"] <= last_event_id + 1
+
+    async def _listen_loop(self) -> None:
+        """Keep a LISTEN connection open, polling while it is unavailable."""
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    settings.database_url, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {SSE_NOTIFY_CHANNEL}")
+                    self._listening = True
+
+                    # Catch up on anything committed while not listening
+                    await self._fetch_new_events()
+
+                    async for notify in conn.notifies():
+                        if self._is_already_seen(notify.payload):
+                            continue
+                        await self._fetch_new_events()
+
+            except asyncio.CancelledError:
+                self._listening = False
+                raise
+            except Exception as e:
+                if self._listening:
+                    logger.warning(
+                        "SSE broker lost LISTEN connection, falling back to polling",
+                        exception=e,
+                        store_in_db=False,
+                    )
+                self._listening = False
+
+            await asyncio.sleep(SSE_BROKER_RECONNECT_DELAY_SECONDS)
+            try:
+                await self._fetch_new_events()
+            except Exception as e:
+                logger.debug(f"SSE broker poll failed: {e}", store_in_db=False)
+
+    def _is_already_seen(self, payload: str) -> bool:
+        """Check whether a notification refers to an event already published."""
+        try:
+            event_id = int(payload)
+        except ValueError:
+            return False
+        return (
+            self._last_event_id is not None
+            and event_id <= self._last_event_id
+            and event_id not in self._pending_gaps
+        )
+
+    async def _fetch_new_events(self) -> None:
+        """Load events newer than the broker cursor or filling a gap and publish them."""
+        async with self._fetch_lock:
+            if self._last_event_id is None:
+                # First start: only stream events created from now on
+                self._last_event_id = await self.sse_ops.get_latest_event_id()
+                return
+
+            self._expire_gaps()
+            read_after = self._last_event_id
+            if self._pending_gaps:
+                read_after = min(read_after, min(self._pending_gaps) - 1)
+
+            while True:
+                events = await self.sse_ops.get_events_after(
+                    read_after,
+                    limit=SSE_BROKER_FETCH_BATCH_SIZE,
+                    max_age_minutes=SSE_BROKER_REPLAY_MAX_AGE_MINUTES,
+                )
+                if not events:
+                    return
+
+                read_after = events[-1]["id"]
+                new_events = self._take_unseen(events)
+                if new_events:
+                    await self._publish(new_events)
+
+                if len(events) < SSE_BROKER_FETCH_BATCH_SIZE:
+                    return
+
+    def _take_unseen(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Advance the cursor over a batch ordered by ID, recording skipped IDs.
+
+        Returns:
+            Events not published before (new events and filled gaps)
+        """
+        unseen: List[Dict[str, Any]] = []
+        now = time.monotonic()
+        for event in events:
+            event_id = event["id"]
+            if event_id in self._pending_gaps:
+                del self._pending_gaps[event_id]
+                unseen.append(event)
+            elif event_id > self._last_event_id:
+                for missing_id in range(self._last_event_id + 1, event_id):
+                    self._pending_gaps[missing_id] = now
+                self._last_event_id = event_id
+                unseen.append(event)
+
+        if len(self._pending_gaps) > SSE_BROKER_MAX_PENDING_GAPS:
+            for gap_id in sorted(self._pending_gaps)[
+                : len(self._pending_gaps) - SSE_BROKER_MAX_PENDING_GAPS
+            ]:
+                del self._pending_gaps[gap_id]
+        return unseen
+
+    def _expire_gaps(self) -> None:
+        """Forget skipped IDs whose transaction most likely rolled back."""
+        cutoff = time.monotonic() - SSE_BROKER_GAP_GRACE_SECONDS
+        for gap_id, missed_at in list(self._pending_gaps.items()):
+            if missed_at < cutoff:
+                del self._pending_gaps[gap_id]
+
+    async def _publish(self, events: List[Dict[str, Any]]) -> None:
+        """Apply each event to caches and the latest image registry, then fan out."""
+        latest_images = get_latest_image_registry()
+        for event in events:
+            latest_images.handle_event(event["type"], event["data"])
+            try:
+                await CacheInvalidationService.handle_sse_event(
+                    event["type"], event["data"]
+                )
+            except Exception as cache_error:
+                logger.warning(
+                    f"Cache invalidation failed for {event['type']}",
+                    exception=cache_error,
+                    store_in_db=False,
+                )
+
+            self._recent.append(event)
+            for subscriber in list(self._subscribers):
+                if not subscriber.offer(event):
+                    self._subscribers.discard(subscriber)
+                    self._subscribers_dropped += 1
+                    logger.warning(
+                        "Dropped slow SSE client (queue full), client will resume",
+                        store_in_db=False,
+                    )
+
+        self._events_published += len(events)
+
+        # Keep processed_at meaningful for stats and cleanup: events are
+        # delivered once by the broker regardless of the number of clients
+        try:
+            await self.sse_ops.mark_events_processed([event["id"] for event in events])
+        except Exception as e:
+            logger.debug(f"Failed to mark SSE events processed: {e}", store_in_db=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get broker statistics for monitoring."""
+        return {
+            "running": self.running,
+            "listening": self._listening,
+            "subscribers": len(self._subscribers),
+            "last_event_id": self._last_event_id,
+            "pending_gaps": len(self._pending_gaps),
+            "replay_buffer_size": len(self._recent),
+            "events_published": self._events_published,
+            "subscribers_dropped": self._subscribers_dropped,
+        }
+
+
+# Global broker for the API process
+_sse_broker: Optional[SSEBroker] = None
+
+
+def get_sse_broker() -> SSEBroker:
+    """Get the process-wide SSE broker, creating it on first use."""
+    global _sse_broker
+    if _sse_broker is None:
+        from ..database import async_db
+
+        _sse_broker = SSEBroker(async_db)
+    return _sse_broker
@@ -7,6 +7,7 @@ Comprehensive thumbnail generation system following the corruption pipeline mode
 
 from .generators import (
     BatchThumbnailGenerator,
+    MultiSizeImageGenerator,
     SmallImageGenerator,
     ThumbnailGenerator,
 )
@@ -60,6 +61,7 @@ __all__ = [
     # Generators
     "ThumbnailGenerator",
     "SmallImageGenerator",
+    "MultiSizeImageGenerator",
     "BatchThumbnailGenerator",
     # Utils
     "generate_thumbnail",
@@ -5,15 +5,18 @@ Thumbnail Generation Components
 Specialized components for different types of thumbnail generation:
 - ThumbnailGenerator: 200x150 dashboard thumbnails
 - SmallImageGenerator: 800x600 medium quality images
+- MultiSizeImageGenerator: Small image and thumbnail from a single decode
 - BatchThumbnailGenerator: Bulk processing operations
 """
 
 from .batch_thumbnail_generator import BatchThumbnailGenerator
+from .multi_size_generator import MultiSizeImageGenerator
 from .small_image_generator import SmallImageGenerator
 from .thumbnail_generator import ThumbnailGenerator
 
 __all__ = [
     "ThumbnailGenerator",
     "SmallImageGenerator",
+    "MultiSizeImageGenerator",
     "BatchThumbnailGenerator",
 ]
@@ -11,6 +11,7 @@ from typing import Any, Callable, Dict, List, Optional
 
 from ....enums import LoggerName, LogSource
 from ....services.logger import get_service_logger
+from .multi_size_generator import MultiSizeImageGenerator
 from .small_image_generator import SmallImageGenerator
 from .thumbnail_generator import ThumbnailGenerator
 
@@ -32,6 +33,7 @@ class BatchThumbnailGenerator:
         self,
         thumbnail_generator: Optional[ThumbnailGenerator] = None,
         small_generator: Optional[SmallImageGenerator] = None,
+        multi_size_generator: Optional[MultiSizeImageGenerator] = None,
         max_workers: int = 6,  # Increased for better CPU utilization
         batch_size: int = 20,  # Larger batches for better throughput
     ):
@@ -41,11 +43,13 @@ class BatchThumbnailGenerator:
         Args:
             thumbnail_generator: Thumbnail generator instance
             small_generator: Small image generator instance
+            multi_size_generator: Generator producing both sizes from one decode
             max_workers: Maximum number of concurrent worker threads
             batch_size: Number of images to process in each batch
         """
         self.thumbnail_generator = thumbnail_generator or ThumbnailGenerator()
         self.small_generator = small_generator or SmallImageGenerator()
+        self.multi_size_generator = multi_size_generator or MultiSizeImageGenerator()
         self.max_workers = max(
             2, min(max_workers, 12)
         )  # Allow more workers for I/O-bound operations
@@ -286,41 +290,24 @@ class BatchThumbnailGenerator:
                 "errors": [],
             }
 
-            # Generate thumbnail
-            if thumbnail_path:
-                thumbnail_result = self.thumbnail_generator.generate_thumbnail(
-                    source_path=source_path,
-                    output_path=thumbnail_path,
-                    force_regenerate=force_regenerate,
-                )
-
-                if thumbnail_result["success"]:
-                    results["thumbnail_generated"] = thumbnail_result.get(
-                        "generated", False
-                    )
-                    results["thumbnail_path"] = thumbnail_result["output_path"]
-                    results["thumbnail_size"] = thumbnail_result.get("file_size")
-                else:
-                    results["errors"].append(
-                        f"Thumbnail: {thumbnail_result.get('error', 'Unknown error')}"
-                    )
-
-            # Generate small image if requested
-            if include_small_images and small_path:
-                small_result = self.small_generator.generate_small_image(
-                    source_path=source_path,
-                    output_path=small_path,
-                    force_regenerate=force_regenerate,
-                )
+            # Generate thumbnail and (if requested) small image from one decode
+            sizes_result = self.multi_size_generator.generate(
+                source_path=source_path,
+                thumbnail_path=thumbnail_path,
+                small_path=small_path if include_small_images else None,
+                force_regenerate=force_regenerate,
+            )
 
-                if small_result["success"]:
-                    results["small_generated"] = small_result.get("generated", False)
-                    results["small_path"] = small_result["output_path"]
-                    results["small_size"] = small_result.get("file_size")
-                else:
-                    results["errors"].append(
-                        f"Small image: {small_result.get('error', 'Unknown error')}"
-                    )
+            if sizes_result["success"]:
+                results["thumbnail_generated"] = sizes_result["thumbnail_generated"]
+                results["thumbnail_path"] = thumbnail_path
+                results["thumbnail_size"] = sizes_result.get("thumbnail_file_size")
+                if include_small_images and small_path:
+                    results["small_generated"] = sizes_result["small_generated"]
+                    results["small_path"] = small_path
+                    results["small_size"] = sizes_result.get("small_file_size")
+            else:
+                results["errors"].append(sizes_result.get("error", "Unknown error"))
 
             # Determine overall success
             if results["errors"]:
@@ -357,10 +344,9 @@ class BatchThumbnailGenerator:
             if not image_tasks:
                 return {"total_time": 0.0, "per_image": 0.0, "parallel_time": 0.0}
 
-            # Estimate time per image (assuming average image size)
-            avg_thumbnail_time = 0.5  # seconds
-            avg_small_time = 1.0  # seconds
-            avg_time_per_image = avg_thumbnail_time + avg_small_time
+            # Estimate time per image (assuming average image size); both
+            # sizes share one reduced-scale decode
+            avg_time_per_image = 0.5  # seconds
 
             total_sequential_time = len(image_tasks) * avg_time_per_image
 
@@ -0,0 +1,252 @@
+# backend/app/services/thumbnail_pipeline/generators/multi_size_generator.py
+"""
+Multi-Size Image Generator Component
+
+Generates the 800×600 small image and the 200×150 thumbnail of a capture from
+a single decode of the source file.
+
+JPEG sources are decoded with DCT draft scaling: libjpeg decodes directly at
+the largest 1/2, 1/4 or 1/8 scale that is still at least as large as the
+biggest requested output, so a 4K capture is never fully decoded just to be
+thrown away by the resize. The small image is resized from that decode and
+the thumbnail is derived from the small image.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from PIL import Image
+
+from ....enums import LoggerName, LogSource
+from ....services.logger import get_service_logger
+from ....utils.captured_frame import get_recent_frame_cache
+from ..utils.constants import (
+    SMALL_IMAGE_QUALITY,
+    SMALL_IMAGE_SIZE,
+    THUMBNAIL_QUALITY,
+    THUMBNAIL_SIZE,
+)
+from ..utils.thumbnail_utils import calculate_thumbnail_dimensions, validate_image_file
+
+logger = get_service_logger(LoggerName.THUMBNAIL_PIPELINE, LogSource.PIPELINE)
+
+
+class MultiSizeImageGenerator:
+    """
+    Component responsible for generating all reduced sizes of a capture at once.
+
+    Optimized for:
+    - One source decode per image instead of one per output size
+    - Reduced-scale JPEG decoding (draft mode) for large captures
+    - Same output format and dimensions as ThumbnailGenerator and
+      SmallImageGenerator
+    """
+
+    def __init__(
+        self,
+        thumbnail_quality: int = THUMBNAIL_QUALITY,
+        small_quality: int = SMALL_IMAGE_QUALITY,
+    ):
+        """
+        Initialize multi-size generator.
+
+        Args:
+            thumbnail_quality: JPEG quality of thumbnails (1-95)
+            small_quality: JPEG quality of small images (1-95)
+        """
+        self.thumbnail_quality = max(1, min(95, thumbnail_quality))
+        self.small_quality = max(1, min(95, small_quality))
+        self.thumbnail_size = THUMBNAIL_SIZE
+        self.small_size = SMALL_IMAGE_SIZE
+
+        logger.debug(
+            f"MultiSizeImageGenerator initialized "
+            f"(thumbnail_quality={self.thumbnail_quality}, "
+            f"small_quality={self.small_quality})"
+        )
+
+    def generate(
+        self,
+        source_path: str,
+        thumbnail_path: Optional[str],
+        small_path: Optional[str] = None,
+        force_regenerate: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Generate the thumbnail and/or small image of a source image.
+
+        Outputs that already exist are skipped unless force_regenerate is set;
+        the source is only decoded if at least one output is needed.
+
+        Args:
+            source_path: Path to source image file
+            thumbnail_path: Path where the thumbnail should be saved (None = skip)
+            small_path: Path where the small image should be saved (None = skip)
+            force_regenerate: Whether to overwrite existing files
+
+        Returns:
+            Dict containing generation result and per-output metadata
+        """
+        result: Dict[str, Any] = {
+            "success": True,
+            "source_path": source_path,
+            "thumbnail_path": thumbnail_path,
+            "small_path": small_path,
+            "thumbnail_generated": False,
+            "small_generated": False,
+        }
+
+        try:
+            source_path_obj = Path(source_path)
+
+            # Validate source image
+            if not validate_image_file(str(source_path_obj)):
+                result["success"] = False
+                result["error"] = (
+                    f"Invalid or unsupported image file: {source_path_obj}"
+                )
+                return result
+
+            thumbnail_output = self._pending_output(
+                thumbnail_path, force_regenerate, result, "thumbnail"
+            )
+            small_output = self._pending_output(
+                small_path, force_regenerate, result, "small"
+            )
+            if thumbnail_output is None and small_output is None:
+                result["message"] = "All outputs already exist"
+                return result
+
+            # Decode only as large as the biggest requested output needs
+            decode_size = self.small_size if small_output else self.thumbnail_size
+
+            with self._open_source(source_path_obj, decode_size) as (
+                img,
+                original_size,
+            ):
+                result["original_size"] = original_size
+
+                # Convert to RGB if necessary (handles RGBA, P, etc.)
+                if img.mode not in ("RGB", "L"):
+                    img = img.convert("RGB")
+
+                # Small image first: the thumbnail is derived from it
+                small = self._resize_to_fit(img, self.small_size)
+
+                if small_output:
+                    self._save_jpeg(small, small_output, self.small_quality)
+                    result["small_generated"] = True
+                    result["small_final_size"] = small.size
+                    result["small_file_size"] = small_output.stat().st_size
+                    result["resized"] = original_size != small.size
+
+                if thumbnail_output:
+                    thumbnail = self._create_thumbnail(small)
+                    self._save_jpeg(thumbnail, thumbnail_output, self.thumbnail_quality)
+                    result["thumbnail_generated"] = True
+                    result["thumbnail_file_size"] = thumbnail_output.stat().st_size
+
+            logger.debug(f"Generated image sizes for {source_path_obj.name}")
+            return result
+
+        except Exception as e:
+            logger.error(
+                f"Failed to generate image sizes for {source_path}",
+                exception=e,
+                extra_context={
+                    "source_path": source_path,
+                    "thumbnail_path": thumbnail_path,
+                    "small_path": small_path,
+                },
+            )
+            result["success"] = False
+            result["error"] = f"Image processing failed: {str(e)}"
+            return result
+
+    def _pending_output(
+        self,
+        output_path: Optional[str],
+        force_regenerate: bool,
+        result: Dict[str, Any],
+        name: str,
+    ) -> Optional[Path]:
+        """
+        Resolve an output that still has to be written.
+
+        Records the size of existing outputs in the result and returns None
+        for outputs that are skipped.
+        """
+        if not output_path:
+            return None
+
+        output_path_obj = Path(output_path)
+        if output_path_obj.exists() and not force_regenerate:
+            result[f"{name}_file_size"] = output_path_obj.stat().st_size
+            return None
+
+        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        return output_path_obj
+
+    @contextmanager
+    def _open_source(
+        self, source_path: Path, decode_size: Tuple[int, int]
+    ) -> Iterator[Tuple[Image.Image, Tuple[int, int]]]:
+        """
+        Decode the source image once, at reduced scale where possible.
+
+        Recently captured frames are served from the in-memory frame cache.
+        JPEG files use draft mode, which scales by a power of two during the
+        DCT so that the result still covers decode_size.
+
+        Yields:
+            Tuple of (decoded image, original (width, height))
+        """
+        captured = get_recent_frame_cache().get(source_path)
+        if captured is not None:
+            yield captured.to_pil_image(downscaled=True), captured.resolution
+            return
+
+        with Image.open(source_path) as img:
+            original_size = img.size
+            if img.format == "JPEG":
+                img.draft("RGB", decode_size)
+            img.load()
+            yield img, original_size
+
+    @staticmethod
+    def _resize_to_fit(img: Image.Image, max_size: Tuple[int, int]) -> Image.Image:
+        """Resize an image to fit within max_size, never upscaling."""
+        if img.width <= max_size[0] and img.height <= max_size[1]:
+            return img
+        return img.resize(
+            calculate_thumbnail_dimensions(img.size, max_size),
+            Image.Resampling.LANCZOS,
+        )
+
+    def _create_thumbnail(self, img: Image.Image) -> Image.Image:
+        """Fit an image into the thumbnail size, centered on a white canvas."""
+        target_width, target_height = self.thumbnail_size
+        fitted = img.copy()
+        fitted.thumbnail(
+            calculate_thumbnail_dimensions(img.size, self.thumbnail_size),
+            Image.Resampling.LANCZOS,
+        )
+
+        thumbnail = Image.new("RGB", (target_width, target_height), (255, 255, 255))
+        thumbnail.paste(
+            fitted,
+            ((target_width - fitted.width) // 2, (target_height - fitted.height) // 2),
+        )
+        return thumbnail
+
+    @staticmethod
+    def _save_jpeg(img: Image.Image, output_path: Path, quality: int) -> None:
+        """Save an image as an optimized progressive JPEG."""
+        img.save(
+            output_path,
+            "JPEG",
+            quality=quality,
+            optimize=True,
+            progressive=True,
+        )
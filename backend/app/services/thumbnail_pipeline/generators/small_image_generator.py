@@ -13,6 +13,7 @@ from PIL import Image
 
 from ....enums import LoggerName, LogSource
 from ....services.logger import get_service_logger
+from ....utils.captured_frame import open_captured_image
 from ..utils.constants import (
     SMALL_IMAGE_QUALITY,
     SMALL_IMAGE_SIZE,
@@ -127,8 +128,8 @@ class SmallImageGenerator:
             Dict containing generation result and metadata
         """
         try:
-            # Open and process image
-            with Image.open(source_path) as img:
+            # Open and process image (in-memory frame if recently captured)
+            with open_captured_image(source_path, downscaled=False) as img:
                 # Store original size
                 original_size = img.size
 
@@ -13,6 +13,7 @@ from PIL import Image
 
 from ....enums import LoggerName, LogSource
 from ....services.logger import get_service_logger
+from ....utils.captured_frame import open_captured_image
 from ..utils.constants import (
     SUPPORTED_IMAGE_FORMATS,
     THUMBNAIL_QUALITY,
@@ -133,8 +134,8 @@ class ThumbnailGenerator:
             Dict containing generation result and metadata
         """
         try:
-            # Open and process image
-            with Image.open(source_path) as img:
+            # Open and process image (in-memory frame if recently captured)
+            with open_captured_image(source_path, downscaled=True) as img:
                 # Convert to RGB if necessary (handles RGBA, P, etc.)
                 if img.mode not in ("RGB", "L"):
                     img = img.convert("RGB")
@@ -61,6 +61,14 @@ class SyncThumbnailJobService:
             logger.error("Failed to get pending jobs", exception=e)
             return []
 
+    def claim_jobs(self, batch_size: int = 5) -> List[ThumbnailGenerationJob]:
+        """Atomically claim jobs for processing (already marked as started)."""
+        try:
+            return self.thumbnail_job_ops.claim_jobs(batch_size=batch_size)
+        except Exception as e:
+            logger.error("Failed to claim thumbnail jobs", exception=e)
+            return []
+
     def mark_job_completed(self, job_id: int, result: Dict[str, Any]) -> bool:
         """Mark job as completed."""
         try:
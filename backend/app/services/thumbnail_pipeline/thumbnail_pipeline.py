@@ -34,6 +34,7 @@ from ...utils.file_helpers import ensure_entity_directory
 from ...utils.time_utils import utc_now
 from .generators import (
     BatchThumbnailGenerator,
+    MultiSizeImageGenerator,
     SmallImageGenerator,
     ThumbnailGenerator,
 )
@@ -224,9 +225,11 @@ class ThumbnailPipeline:
         try:
             self.thumbnail_generator = ThumbnailGenerator()
             self.small_generator = SmallImageGenerator()
+            self.multi_size_generator = MultiSizeImageGenerator()
             self.batch_generator = BatchThumbnailGenerator(
                 thumbnail_generator=self.thumbnail_generator,
                 small_generator=self.small_generator,
+                multi_size_generator=self.multi_size_generator,
             )
             logger.debug("✅ Thumbnail pipeline generators initialized")
         except Exception as e:
@@ -487,9 +490,7 @@ class ThumbnailPipeline:
     def process_image_thumbnails(self, image_id: int) -> Dict[str, Any]:
         """Process thumbnails for a single image (sync interface for workers)."""
 
-        if not hasattr(self, "thumbnail_generator") or not hasattr(
-            self, "small_generator"
-        ):
+        if not hasattr(self, "multi_size_generator"):
             logger.error("Thumbnail generators not available")
             return ThumbnailGenerationResult(
                 success=False, image_id=image_id, error="Generators not initialized"
@@ -555,52 +556,48 @@ class ThumbnailPipeline:
             thumbnail_path = str(thumbnail_dir / thumbnail_filename)
             small_path = str(small_dir / small_filename)
 
-            # Always generate regular thumbnails
-            thumbnail_result = self.thumbnail_generator.generate_thumbnail(
-                source_path=image.file_path, output_path=thumbnail_path
-            )
-
             # Check small generation mode setting
             small_generation_mode = self._get_small_generation_mode()
             should_generate_small = self._should_generate_small_image(
                 image_id, small_generation_mode
             )
-
-            # Generate small image based on settings
-            small_result = {
-                "success": True,
-                "path": None,
-            }  # Default to success for skipped generation
-            if should_generate_small:
-                small_result = self.small_generator.generate_small_image(
-                    source_path=image.file_path, output_path=small_path
-                )
-
-                # If in "latest" mode and small generation was successful, cleanup old small images
-                if small_result.get("success") and small_generation_mode == "latest":
-                    # We already verified timelapse_id is not None above
-                    self._cleanup_old_small_images(image.camera_id, image.timelapse_id, image_id)  # type: ignore
-            else:
+            if not should_generate_small:
                 logger.debug(
                     f"Skipping small image generation for image {image_id} (mode: {small_generation_mode})"
                 )
 
+            # Thumbnail is always generated; small image based on settings.
+            # Both come from a single decode of the source image.
+            sizes_result = self.multi_size_generator.generate(
+                source_path=image.file_path,
+                thumbnail_path=thumbnail_path,
+                small_path=small_path if should_generate_small else None,
+            )
+
+            # If in "latest" mode and small generation was successful, cleanup old small images
+            if (
+                sizes_result.get("small_generated")
+                and small_generation_mode == "latest"
+            ):
+                # We already verified timelapse_id is not None above
+                self._cleanup_old_small_images(image.camera_id, image.timelapse_id, image_id)  # type: ignore
+
             # Determine success - thumbnail is required, small is optional based on settings
-            success = thumbnail_result.get("success", False)
+            success = sizes_result.get("success", False)
 
             result = ThumbnailGenerationResult(
                 success=success,
                 image_id=image_id,
                 timelapse_id=getattr(image, "timelapse_id", None),
                 thumbnail_path=(
-                    thumbnail_result.get("path")
-                    if thumbnail_result.get("success")
-                    else None
+                    thumbnail_path if sizes_result.get("thumbnail_generated") else None
                 ),
-                small_path=(
-                    small_result.get("path") if small_result.get("success") else None
+                small_path=small_path if sizes_result.get("small_generated") else None,
+                error=(
+                    None
+                    if success
+                    else sizes_result.get("error", "Failed to generate thumbnails")
                 ),
-                error=None if success else "Failed to generate thumbnails",
             )
 
             return result.__dict__
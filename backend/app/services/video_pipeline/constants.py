@@ -80,6 +80,29 @@ VIDEO_SSE_EVENTS = [
 # FFmpeg Settings
 FFMPEG_COMMAND_TIMEOUT_SECONDS = 300
 FFMPEG_AVAILABILITY_CHECK_TIMEOUT = 10
+FFMPEG_TIMEOUT_BASE_SECONDS = 120  # Startup and muxing allowance of any render
+FFMPEG_TIMEOUT_PER_FRAME_SECONDS = 0.5  # Slowest expected encode rate (2 fps)
+FFMPEG_TIMEOUT_MAX_SECONDS = 6 * 3600  # Hard ceiling for a single FFmpeg process
+FFMPEG_TERMINATE_GRACE_SECONDS = 5  # Wait after SIGTERM before SIGKILL
+FFMPEG_CANCEL_POLL_SECONDS = 0.5  # How often a running process checks for cancellation
+FFMPEG_STDERR_TAIL_LINES = 40  # stderr lines kept for error messages
+FFMPEG_CANCELLED_MESSAGE = "FFmpeg process cancelled"
+
+# Render Progress Settings
+VIDEO_PROGRESS_SSE_INTERVAL_SECONDS = 2.0  # Minimum gap between progress events per job
+VIDEO_JOB_HEARTBEAT_INTERVAL_SECONDS = 30  # Heartbeat/cancel check while rendering
+
+# Segment Cache Settings
+VIDEO_SEGMENT_FILE_PREFIX = "seg_"
+VIDEO_SEGMENT_KEY_LENGTH = 16  # Hex digits of the segment key kept in file names
+
+# Parallel Chunk Encoding Settings
+VIDEO_CHUNK_MIN_FRAMES = 120  # Smallest chunk worth its own encoder process
+VIDEO_CHUNK_MIN_CORES_PER_ENCODER = 2  # Cores reserved for each concurrent encoder
+
+# Streamed Overlay Render Settings
+VIDEO_OVERLAY_STREAM_MAX_WORKERS = 4  # Threads decoding frames and drawing overlays
+VIDEO_OVERLAY_STREAM_QUEUE_FRAMES = 8  # Rendered frames buffered ahead of FFmpeg
 
 # Health Check Settings
 VIDEO_PIPELINE_HEALTH_CHECK_INTERVAL = 60
@@ -0,0 +1,363 @@
+# backend/app/services/video_pipeline/ffmpeg_runner.py
+"""
+FFmpeg Runner - Supervised FFmpeg processes with live progress and cancellation.
+
+FFmpeg is started with "-progress pipe:1", so it writes key=value progress
+blocks to stdout while encoding. The runner parses those blocks into
+FFmpegProgress updates, keeps only the tail of stderr for error messages,
+and stops the process when its deadline passes or its cancel event is set.
+
+Each FFmpeg process is started in its own session (process group), so
+termination also reaches any helper processes FFmpeg spawned. Termination is
+SIGTERM first, then SIGKILL after FFMPEG_TERMINATE_GRACE_SECONDS.
+
+Commands reading raw frames from "pipe:0" get their input from an iterator
+of byte chunks. The iterator is advanced in an executor thread and every
+chunk is written with backpressure, so a slow encoder throttles the frame
+producer instead of buffering frames in memory.
+
+The runner itself is asyncio-based; run_ffmpeg() drives it on a private
+event loop so the synchronous video pipeline (executor threads of the video
+worker and the chunk encoder pool) can call it directly.
+"""
+
+import asyncio
+import os
+import signal
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
+
+from ...enums import LoggerName, LogSource
+from ...services.logger import get_service_logger
+from .constants import (
+    FFMPEG_CANCEL_POLL_SECONDS,
+    FFMPEG_CANCELLED_MESSAGE,
+    FFMPEG_STDERR_TAIL_LINES,
+    FFMPEG_TERMINATE_GRACE_SECONDS,
+    FFMPEG_TIMEOUT_BASE_SECONDS,
+    FFMPEG_TIMEOUT_MAX_SECONDS,
+    FFMPEG_TIMEOUT_PER_FRAME_SECONDS,
+)
+
+logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
+
+
+@dataclass
+class FFmpegProgress:
+    """One progress block reported by FFmpeg."""
+
+    frame: int = 0
+    fps: float = 0.0
+    out_time_seconds: float = 0.0
+    speed: Optional[float] = None
+    total_frames: Optional[int] = None
+    finished: bool = False
+
+    @property
+    def percent(self) -> Optional[int]:
+        """Completion percentage, if the total frame count is known."""
+        if not self.total_frames:
+            return None
+        return min(100, int(self.frame * 100 / self.total_frames))
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds remaining at the current encode rate."""
+        if not self.total_frames or self.fps <= 0:
+            return None
+        return max(0.0, (self.total_frames - self.frame) / self.fps)
+
+
+FFmpegProgressCallback = Callable[[FFmpegProgress], None]
+
+
+class FFmpegProgressParser:
+    """
+    Incremental parser for FFmpeg "-progress" output.
+
+    Lines are fed one at a time; a complete FFmpegProgress is returned at the
+    "progress=continue" / "progress=end" line that terminates each block.
+    """
+
+    def __init__(self, total_frames: Optional[int] = None):
+        self.total_frames = total_frames
+        self._current = FFmpegProgress(total_frames=total_frames)
+
+    def feed(self, line: str) -> Optional[FFmpegProgress]:
+        """
+        Parse one line of progress output.
+
+        Args:
+            line: A "key=value" line (surrounding whitespace is ignored)
+
+        Returns:
+            The finished progress block, or None while a block is incomplete
+        """
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return None
+        value = value.strip()
+
+        try:
+            if key == "frame":
+                self._current.frame = int(value)
+            elif key == "fps":
+                self._current.fps = float(value)
+            elif key in ("out_time_us", "out_time_ms"):
+                # Both keys are microseconds ("out_time_ms" is a legacy misnomer)
+                self._current.out_time_seconds = int(value) / 1_000_000
+            elif key == "speed":
+                speed = value.rstrip("x")
+                self._current.speed = float(speed) if speed != "N/A" else None
+            elif key == "progress":
+                self._current.finished = value == "end"
+                block = self._current
+                self._current = FFmpegProgress(
+                    frame=block.frame,
+                    fps=block.fps,
+                    out_time_seconds=block.out_time_seconds,
+                    total_frames=self.total_frames,
+                )
+                return block
+        except ValueError:
+            # FFmpeg reports "N/A" for values it does not know yet
+            pass
+
+        return None
+
+
+def calculate_ffmpeg_timeout(frame_count: int) -> int:
+    """
+    Derive the timeout of an FFmpeg encode from the number of frames.
+
+    Args:
+        frame_count: Frames the process encodes
+
+    Returns:
+        Timeout in seconds, between the base allowance and the hard ceiling
+    """
+    timeout = FFMPEG_TIMEOUT_BASE_SECONDS + max(0, frame_count) * (
+        FFMPEG_TIMEOUT_PER_FRAME_SECONDS
+    )
+    return int(min(timeout, FFMPEG_TIMEOUT_MAX_SECONDS))
+
+
+def with_progress_output(cmd: List[str]) -> List[str]:
+    """Add machine-readable progress reporting to an FFmpeg command."""
+    if "-progress" in cmd:
+        return list(cmd)
+    return [cmd[0], "-nostats", "-progress", "pipe:1", *cmd[1:]]
+
+
+def _signal_process_group(process: asyncio.subprocess.Process, sig: int) -> None:
+    """Send a signal to the process group the FFmpeg process leads."""
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+    except OSError:
+        # Not a group leader (or no permission); signal the process itself
+        try:
+            process.send_signal(sig)
+        except ProcessLookupError:
+            pass
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    """Stop an FFmpeg process group, escalating to SIGKILL."""
+    _signal_process_group(process, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(process.wait(), FFMPEG_TERMINATE_GRACE_SECONDS)
+    except asyncio.TimeoutError:
+        _signal_process_group(process, signal.SIGKILL)
+        await process.wait()
+
+
+async def _read_progress(
+    stream: asyncio.StreamReader,
+    parser: FFmpegProgressParser,
+    progress_callback: Optional[FFmpegProgressCallback],
+) -> None:
+    """Parse progress blocks from FFmpeg's stdout as they arrive."""
+    async for raw_line in stream:
+        progress = parser.feed(raw_line.decode(errors="replace"))
+        if progress is not None and progress_callback:
+            try:
+                progress_callback(progress)
+            except Exception as e:
+                logger.debug(f"FFmpeg progress callback failed: {e}")
+
+
+async def _read_stderr_tail(stream: asyncio.StreamReader, tail: Deque[str]) -> None:
+    """Keep the last lines of FFmpeg's stderr without buffering all of it."""
+    async for raw_line in stream:
+        line = raw_line.decode(errors="replace").rstrip()
+        if line:
+            tail.append(line)
+
+
+async def _write_stdin(
+    stream: asyncio.StreamWriter, input_chunks: Iterator[bytes]
+) -> None:
+    """Feed FFmpeg's stdin from a blocking chunk iterator, then close it."""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(None, next, input_chunks, None)
+            if chunk is None:
+                break
+            stream.write(chunk)
+            await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # FFmpeg exited early; its exit code and stderr carry the reason
+        pass
+    finally:
+        close = getattr(input_chunks, "close", None)
+        if close is not None:
+            close()
+        try:
+            stream.close()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+async def _wait_for_cancel(cancel_event: threading.Event) -> None:
+    """Resolve once the cancel event is set."""
+    while not cancel_event.is_set():
+        await asyncio.sleep(FFMPEG_CANCEL_POLL_SECONDS)
+
+
+async def run_ffmpeg_async(
+    cmd: List[str],
+    timeout: float,
+    total_frames: Optional[int] = None,
+    progress_callback: Optional[FFmpegProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+    input_chunks: Optional[Iterator[bytes]] = None,
+) -> Tuple[bool, str]:
+    """
+    Run an FFmpeg command with progress reporting, a deadline and cancellation.
+
+    Args:
+        cmd: FFmpeg command as list of strings
+        timeout: Seconds before the process is terminated
+        total_frames: Frames the command produces (enables percent and ETA)
+        progress_callback: Called with each parsed progress block
+        cancel_event: Terminates the process when set
+        input_chunks: Data written to FFmpeg's stdin (for "-i pipe:0")
+
+    Returns:
+        Tuple of (success, output_or_error_message)
+    """
+    if cancel_event is not None and cancel_event.is_set():
+        return False, FFMPEG_CANCELLED_MESSAGE
+
+    process = await asyncio.create_subprocess_exec(
+        *with_progress_output(cmd),
+        stdin=(
+            asyncio.subprocess.PIPE
+            if input_chunks is not None
+            else asyncio.subprocess.DEVNULL
+        ),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+
+    stderr_tail: Deque[str] = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+    readers = [
+        asyncio.ensure_future(
+            _read_progress(
+                process.stdout,  # type: ignore[arg-type]
+                FFmpegProgressParser(total_frames),
+                progress_callback,
+            )
+        ),
+        asyncio.ensure_future(
+            _read_stderr_tail(process.stderr, stderr_tail)  # type: ignore[arg-type]
+        ),
+    ]
+    writer = None
+    if input_chunks is not None:
+        writer = asyncio.ensure_future(
+            _write_stdin(process.stdin, input_chunks)  # type: ignore[arg-type]
+        )
+        readers.append(writer)
+    exit_waiter = asyncio.ensure_future(process.wait())
+    waiters = {exit_waiter}
+    cancel_waiter = None
+    if cancel_event is not None:
+        cancel_waiter = asyncio.ensure_future(_wait_for_cancel(cancel_event))
+        waiters.add(cancel_waiter)
+
+    try:
+        done, _ = await asyncio.wait(
+            waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        if exit_waiter not in done:
+            await _terminate(process)
+            if cancel_waiter is not None and cancel_waiter in done:
+                logger.info(f"FFmpeg process {process.pid} cancelled")
+                return False, FFMPEG_CANCELLED_MESSAGE
+            error_msg = f"FFmpeg command timed out after {int(timeout)} seconds"
+            logger.error(error_msg)
+            return False, error_msg
+
+        await asyncio.gather(*readers, return_exceptions=True)
+
+        if writer is not None and writer.exception() is not None:
+            # FFmpeg saw a short input; the video must not be treated as done
+            error_msg = f"FFmpeg input failed: {writer.exception()}"
+            logger.error(error_msg)
+            return False, error_msg
+
+        if process.returncode == 0:
+            return True, "Success"
+
+        error_msg = f"FFmpeg failed with code {process.returncode}"
+        if stderr_tail:
+            error_msg += ": " + "\n".join(stderr_tail)
+        return False, error_msg
+
+    finally:
+        for task in [
+            *readers,
+            exit_waiter,
+            *([cancel_waiter] if cancel_waiter else []),
+        ]:
+            if not task.done():
+                task.cancel()
+        if process.returncode is None:
+            await _terminate(process)
+
+
+def run_ffmpeg(
+    cmd: List[str],
+    timeout: float,
+    total_frames: Optional[int] = None,
+    progress_callback: Optional[FFmpegProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+    input_chunks: Optional[Iterator[bytes]] = None,
+) -> Tuple[bool, str]:
+    """
+    Synchronous entry point for run_ffmpeg_async().
+
+    Must not be called from a thread that is already running an event loop;
+    the video pipeline calls it from executor and chunk-encoder threads.
+
+    Returns:
+        Tuple of (success, output_or_error_message)
+    """
+    return asyncio.run(
+        run_ffmpeg_async(
+            cmd,
+            timeout,
+            total_frames=total_frames,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+            input_chunks=input_chunks,
+        )
+    )
@@ -10,12 +10,17 @@ import glob
 import re
 import subprocess
 import tempfile
+import threading
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ...enums import LoggerName, LogSource, VideoQuality
 from ...services.logger import get_service_logger
 from ...utils import file_helpers
+from . import ffmpeg_runner
+from .constants import FFMPEG_CANCELLED_MESSAGE
+from .ffmpeg_runner import FFmpegProgressCallback
 
 logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
 
@@ -276,8 +281,6 @@ def build_ffmpeg_command(
     Returns:
         FFmpeg command as list of strings
     """
-    quality_opts = get_quality_settings(quality)
-
     cmd = [
         "ffmpeg",
         "-y",  # Overwrite output files
@@ -287,6 +290,37 @@ def build_ffmpeg_command(
         "0",
         "-i",
         image_list_file,
+    ]
+    cmd.extend(build_encoder_args(framerate, quality, rotation))
+
+    # Add subtitle overlay if provided (deprecated - use overlay images instead)
+    # if subtitle_file and overlay_settings and overlay_settings.get("enabled", True):
+    #     # Override the video filter to add subtitles (deprecated path)
+    #     cmd[-1] = f"fps={framerate},subtitles={subtitle_file}"
+    #     logger.warning("Using deprecated subtitle overlay system in FFmpeg command")
+
+    cmd.append(output_path)
+
+    return cmd
+
+
+def build_encoder_args(
+    framerate: float, quality: VideoQuality, rotation: int = 0
+) -> List[str]:
+    """
+    Build the encoder, filter and pixel format arguments shared by all renders.
+
+    Args:
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+
+    Returns:
+        FFmpeg arguments placed between the input and the output path
+    """
+    quality_opts = get_quality_settings(quality)
+
+    cmd = [
         "-c:v",
         "libx264",
         "-crf",
@@ -313,27 +347,144 @@ def build_ffmpeg_command(
     if quality_opts.get("scale"):
         cmd.extend(["-s", quality_opts["scale"]])
 
-    # Add subtitle overlay if provided (deprecated - use overlay images instead)
-    # if subtitle_file and overlay_settings and overlay_settings.get("enabled", True):
-    #     # Override the video filter to add subtitles (deprecated path)
-    #     cmd[-1] = f"fps={framerate},subtitles={subtitle_file}"
-    #     logger.warning("Using deprecated subtitle overlay system in FFmpeg command")
-
-    cmd.extend(["-pix_fmt", "yuv420p", output_path])  # Ensure compatibility
+    cmd.extend(["-pix_fmt", "yuv420p"])  # Ensure compatibility
 
     return cmd
 
 
+def build_rawvideo_command(
+    frame_size: Tuple[int, int],
+    output_path: str,
+    framerate: float,
+    quality: VideoQuality,
+    rotation: int = 0,
+) -> List[str]:
+    """
+    Build FFmpeg command that encodes raw RGB frames read from stdin.
+
+    Encoder settings match build_ffmpeg_command, so a streamed render and a
+    render from image files produce the same kind of video.
+
+    Args:
+        frame_size: Frame dimensions (width, height) of every piped frame
+        output_path: Output video file path
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+
+    Returns:
+        FFmpeg command as list of strings
+    """
+    width, height = frame_size
+    return [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{width}x{height}",
+        "-framerate",
+        str(framerate),
+        "-i",
+        "pipe:0",
+        *build_encoder_args(framerate, quality, rotation),
+        "-f",
+        "mp4",
+        output_path,
+    ]
+
+
+def build_segment_command(
+    image_list_file: str,
+    output_path: str,
+    framerate: float,
+    quality: VideoQuality,
+    rotation: int,
+    frame_count: int,
+    threads: Optional[int] = None,
+) -> List[str]:
+    """
+    Build FFmpeg command for encoding one video segment or chunk.
+
+    Uses the same encoder settings as build_ffmpeg_command so segments can be
+    joined with stream copy. Each segment is encoded on its own and therefore
+    starts with a keyframe; the frame count is capped so every segment holds
+    exactly its frame range.
+
+    Args:
+        image_list_file: Concat list with the segment's frames
+        output_path: Segment file path (may use a temporary suffix)
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+        frame_count: Number of frames in the segment
+        threads: Encoder threads (None lets libx264 use all cores)
+
+    Returns:
+        FFmpeg command as list of strings
+    """
+    cmd = build_ffmpeg_command(
+        image_list_file, output_path, framerate, quality, rotation
+    )
+    extra_args = ["-frames:v", str(frame_count), "-f", "mp4"]
+    if threads:
+        extra_args.extend(["-threads", str(threads)])
+    return cmd[:-1] + extra_args + [output_path]
+
+
+def build_concat_copy_command(segment_list_file: str, output_path: str) -> List[str]:
+    """
+    Build FFmpeg command that joins encoded segments without re-encoding.
+
+    Args:
+        segment_list_file: Concat list with segment file paths
+        output_path: Output video file path
+
+    Returns:
+        FFmpeg command as list of strings
+    """
+    return [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        segment_list_file,
+        "-c",
+        "copy",
+        "-movflags",
+        "+faststart",
+        output_path,
+    ]
+
+
 def execute_ffmpeg_command(
-    cmd: List[str], timeout: int = 300, capture_output: bool = True
+    cmd: List[str],
+    timeout: float = 300,
+    capture_output: bool = True,
+    total_frames: Optional[int] = None,
+    progress_callback: Optional[FFmpegProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+    input_chunks: Optional[Iterator[bytes]] = None,
 ) -> Tuple[bool, str]:
     """
     Execute FFmpeg command with proper error handling.
 
+    Runs under ffmpeg_runner, which streams progress instead of buffering
+    all output and terminates the process group on timeout or cancellation.
+
     Args:
         cmd: FFmpeg command as list of strings
         timeout: Command timeout in seconds
-        capture_output: Whether to capture stdout/stderr
+        capture_output: Kept for compatibility; the stderr tail is always kept
+        total_frames: Frames the command produces (for progress percent/ETA)
+        progress_callback: Called with each FFmpeg progress update
+        cancel_event: Terminates the process when set
+        input_chunks: Data piped to FFmpeg's stdin (raw frame input)
 
     Returns:
         Tuple of (success, output_or_error_message)
@@ -341,57 +492,58 @@ def execute_ffmpeg_command(
     try:
         logger.info(f"Executing FFmpeg command: {' '.join(cmd)}")
 
-        result = subprocess.run(
-            cmd, capture_output=capture_output, text=True, timeout=timeout, check=False
+        success, output = ffmpeg_runner.run_ffmpeg(
+            cmd,
+            timeout,
+            total_frames=total_frames,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+            input_chunks=input_chunks,
         )
 
-        if result.returncode == 0:
+        if success:
             logger.info("FFmpeg command completed successfully")
-            return True, result.stdout if capture_output else "Success"
-        else:
-            error_msg = f"FFmpeg failed with code {result.returncode}"
-            if capture_output and result.stderr:
-                error_msg += f": {result.stderr}"
-            logger.error(error_msg)
-            return False, error_msg
+        elif output != FFMPEG_CANCELLED_MESSAGE:
+            logger.error(output)
+        return success, output
 
-    except subprocess.TimeoutExpired:
-        error_msg = f"FFmpeg command timed out after {timeout} seconds"
-        logger.error(error_msg)
-        return False, error_msg
     except Exception as e:
         error_msg = f"Error executing FFmpeg command: {str(e)}"
         logger.error(error_msg)
         return False, error_msg
 
 
-def create_image_list_file(image_files: List[str]) -> str:
+def create_image_list_file(
+    image_files: List[str], frame_duration: float = 1, validate_paths: bool = True
+) -> str:
     """
     Create temporary file with list of images for FFmpeg concat demuxer.
 
     Args:
         image_files: List of image file paths
+        frame_duration: Duration of each image in seconds
+        validate_paths: Validate and stat every path; frames from a database
+            manifest are already absolute and skip this for a single-pass write
 
     Returns:
         Path to temporary file containing image list
     """
     temp_file = tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False)
 
+    def list_path(image_file: str) -> str:
+        if not validate_paths:
+            return image_file
+        # Use validated paths and resolve properly
+        return str(file_helpers.validate_file_path(image_file, must_exist=True))
+
     try:
         for image_file in image_files:
-            # Use validated paths and resolve properly
-            validated_path = file_helpers.validate_file_path(
-                image_file, must_exist=True
-            )
-            temp_file.write(f"file '{validated_path}'\n")
-            temp_file.write("duration 1\n")  # 1 frame duration
+            temp_file.write(f"file '{list_path(image_file)}'\n")
+            temp_file.write(f"duration {frame_duration}\n")
 
         # Add final frame to maintain last image duration
         if image_files:
-            validated_path = file_helpers.validate_file_path(
-                image_files[-1], must_exist=True
-            )
-            temp_file.write(f"file '{validated_path}'\n")
+            temp_file.write(f"file '{list_path(image_files[-1])}'\n")
 
         temp_file.flush()
         logger.debug(f"Created image list file: {temp_file.name}")
@@ -401,6 +553,123 @@ def create_image_list_file(image_files: List[str]) -> str:
         temp_file.close()
 
 
+def select_video_frames(
+    images_directory: Path, use_overlay_images: bool = False
+) -> List[str]:
+    """
+    Select the ordered frame files a video is rendered from.
+
+    Args:
+        images_directory: Directory containing source images
+        use_overlay_images: Whether to prefer pre-rendered overlay images
+
+    Returns:
+        List of sorted frame file paths (empty if none found)
+    """
+    # Determine which images to use
+    if use_overlay_images:
+        # Extract camera ID from directory path
+        camera_id = None
+        if "camera-" in str(images_directory):
+            camera_match = re.search(r"camera-(\d+)", str(images_directory))
+            if camera_match:
+                camera_id = int(camera_match.group(1))
+
+        # Try to find overlay images
+        overlay_images = []
+        if camera_id:
+            # images_directory is like: data/cameras/camera-1/images
+            # We need base_directory as: data/
+            base_directory = images_directory.parent.parent
+            overlay_images = find_overlay_images(camera_id, base_directory)
+
+        if overlay_images:
+            logger.info(
+                f"Using {len(overlay_images)} overlay images for video generation"
+            )
+            return overlay_images
+
+        logger.info("No overlay images found, falling back to regular images")
+
+    # Use regular images
+    return find_image_files(images_directory)
+
+
+def encode_frame_chunk(
+    image_files: List[str],
+    output_path: str,
+    framerate: float,
+    quality: VideoQuality,
+    rotation: int = 0,
+    threads: Optional[int] = None,
+    timeout: Optional[float] = None,
+    validate_paths: bool = True,
+    progress_callback: Optional[FFmpegProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[bool, str]:
+    """
+    Encode a contiguous run of frames into a standalone MP4 chunk.
+
+    The chunk is written under a temporary name and only renamed to
+    output_path once FFmpeg succeeds, so a cached chunk is never partial.
+
+    Args:
+        image_files: Ordered frame file paths
+        output_path: Chunk file path
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+        threads: Encoder threads (None lets libx264 use all cores)
+        timeout: Command timeout in seconds (None = scaled to the frame count)
+        validate_paths: Validate and stat every frame path
+        progress_callback: Called with each FFmpeg progress update
+        cancel_event: Terminates the encode when set
+
+    Returns:
+        Tuple of (success, output_or_error_message)
+    """
+    image_list_file = create_image_list_file(
+        image_files, frame_duration=1 / framerate, validate_paths=validate_paths
+    )
+    output_path_obj = Path(output_path)
+    # Unique temp name so concurrent encodes of one chunk never share a file
+    temp_path = output_path_obj.with_name(
+        f"{output_path_obj.name}.{uuid.uuid4().hex[:8]}.partial"
+    )
+
+    try:
+        cmd = build_segment_command(
+            image_list_file,
+            str(temp_path),
+            framerate,
+            quality,
+            rotation,
+            len(image_files),
+            threads=threads,
+        )
+        success, output = execute_ffmpeg_command(
+            cmd,
+            timeout=(
+                timeout
+                if timeout is not None
+                else ffmpeg_runner.calculate_ffmpeg_timeout(len(image_files))
+            ),
+            total_frames=len(image_files),
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+        )
+        if success:
+            temp_path.replace(output_path_obj)
+        return success, output
+
+    finally:
+        for leftover in (Path(image_list_file), temp_path):
+            try:
+                leftover.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to clean up temp file {leftover}: {e}")
+
+
 def generate_video(
     images_directory: Path,
     output_path: str,
@@ -408,6 +677,9 @@ def generate_video(
     quality: VideoQuality = VideoQuality.MEDIUM,
     rotation: int = 0,
     use_overlay_images: bool = False,
+    image_files: Optional[List[str]] = None,
+    progress_callback: Optional[FFmpegProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
     # overlay_settings: Optional[Dict[str, Any]] = None,
     # day_numbers: Optional[List[int]] = None,
 ) -> Tuple[bool, str, Dict[str, Any]]:
@@ -421,6 +693,10 @@ def generate_video(
         quality: Quality level (low/medium/high)
         rotation: Video rotation in degrees (0, 90, 180, 270)
         use_overlay_images: Whether to use pre-rendered overlay images
+        image_files: Ordered absolute frame paths from a frame manifest
+            (skips directory scanning and per-file validation)
+        progress_callback: Called with each FFmpeg progress update
+        cancel_event: Terminates the encode when set
         # overlay_settings: Optional overlay configuration (deprecated - use overlay images)
         # day_numbers: Optional list of day numbers for overlays (deprecated)
 
@@ -428,36 +704,11 @@ def generate_video(
         Tuple of (success, message, metadata_dict)
     """
     temp_files = []
+    from_manifest = image_files is not None
 
     try:
-        # Determine which images to use
-        if use_overlay_images:
-            # Extract camera ID from directory path
-            camera_id = None
-            if "camera-" in str(images_directory):
-                camera_match = re.search(r"camera-(\d+)", str(images_directory))
-                if camera_match:
-                    camera_id = int(camera_match.group(1))
-
-            # Try to find overlay images
-            overlay_images = []
-            if camera_id:
-                # images_directory is like: data/cameras/camera-1/images
-                # We need base_directory as: data/
-                base_directory = images_directory.parent.parent
-                overlay_images = find_overlay_images(camera_id, base_directory)
-
-            if overlay_images:
-                logger.info(
-                    f"Using {len(overlay_images)} overlay images for video generation"
-                )
-                image_files = overlay_images
-            else:
-                logger.info("No overlay images found, falling back to regular images")
-                image_files = find_image_files(images_directory)
-        else:
-            # Use regular images
-            image_files = find_image_files(images_directory)
+        if not from_manifest:
+            image_files = select_video_frames(images_directory, use_overlay_images)
 
         if not image_files:
             return False, "No image files found in directory", {}
@@ -465,7 +716,11 @@ def generate_video(
         logger.info(f"Generating video from {len(image_files)} images")
 
         # Create image list file
-        image_list_file = create_image_list_file(image_files)
+        image_list_file = create_image_list_file(
+            image_files,
+            frame_duration=1 / framerate,
+            validate_paths=not from_manifest,
+        )
         temp_files.append(image_list_file)
 
         # Calculate video duration
@@ -503,8 +758,14 @@ def generate_video(
             # overlay_settings,
         )
 
-        # Execute FFmpeg
-        success, output = execute_ffmpeg_command(cmd)
+        # Execute FFmpeg (timeout scales with the number of frames)
+        success, output = execute_ffmpeg_command(
+            cmd,
+            timeout=ffmpeg_runner.calculate_ffmpeg_timeout(len(image_files)),
+            total_frames=len(image_files),
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+        )
 
         if success:
             # Get output file info
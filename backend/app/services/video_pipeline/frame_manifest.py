@@ -0,0 +1,131 @@
+# backend/app/services/video_pipeline/frame_manifest.py
+"""
+Frame Manifest - Database-driven frame selection for video generation.
+
+The frames of a video are the images rows of its timelapse, in capture order,
+optionally limited to a date or day range. Each frame uses its overlay image
+when overlays are requested and the row has a valid overlay, and the original
+capture otherwise. For streamed overlay renders every frame is the original
+capture and its row is kept, so the overlay can be drawn while encoding.
+
+Rows are streamed with a server-side cursor and turned into absolute paths
+without touching the filesystem, so building a manifest is O(frames) with no
+directory scans and no per-file stat. Directory globbing
+(ffmpeg_utils.select_video_frames) mixed frames of every timelapse that
+shared a camera.
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ...database.image_operations import SyncImageOperations
+from ...enums import LoggerName, LogSource
+from ...services.logger import get_service_logger
+
+logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
+
+
+@dataclass
+class FrameManifest:
+    """Ordered frames of one video, with per-frame version tokens."""
+
+    timelapse_id: int
+    frames: List[str] = field(default_factory=list)
+    # Identify frame content without a stat: image ID, path and overlay version
+    fingerprints: List[str] = field(default_factory=list)
+    overlay_frames: int = 0
+    # Image rows of the frames, kept only for streamed overlay renders
+    frame_rows: List[Dict[str, Any]] = field(default_factory=list)
+    first_captured_at: Optional[datetime] = None
+    last_captured_at: Optional[datetime] = None
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames in the manifest."""
+        return len(self.frames)
+
+
+class FrameManifestBuilder:
+    """
+    Builds frame manifests from the images table.
+    """
+
+    def __init__(self, image_ops: SyncImageOperations, data_directory: str):
+        """
+        Initialize the manifest builder.
+
+        Args:
+            image_ops: Sync image operations used to stream frame rows
+            data_directory: Base directory that stored image paths are relative to
+        """
+        self.image_ops = image_ops
+        self.data_directory = str(Path(data_directory).resolve())
+
+    def _resolve(self, stored_path: str) -> str:
+        """Turn a stored (usually data-relative) path into an absolute path."""
+        if os.path.isabs(stored_path):
+            return stored_path
+        return os.path.join(self.data_directory, stored_path)
+
+    def build(
+        self,
+        timelapse_id: int,
+        use_overlay_images: bool = False,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+        keep_rows: bool = False,
+    ) -> FrameManifest:
+        """
+        Build the ordered frame manifest for a timelapse.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            use_overlay_images: Whether to use overlay images where valid
+            start_date: First capture date to include
+            end_date: Last capture date to include
+            start_day: First day number to include
+            end_day: Last day number to include
+            keep_rows: Keep each frame's image row (for streamed overlays)
+
+        Returns:
+            FrameManifest (empty if the timelapse has no matching images)
+        """
+        manifest = FrameManifest(timelapse_id=timelapse_id)
+
+        for row in self.image_ops.iter_video_frames(
+            timelapse_id,
+            start_date=start_date,
+            end_date=end_date,
+            start_day=start_day,
+            end_day=end_day,
+        ):
+            if use_overlay_images and row["has_valid_overlay"] and row["overlay_path"]:
+                stored_path = row["overlay_path"]
+                overlay_version = row["overlay_updated_at"]
+                manifest.overlay_frames += 1
+            else:
+                stored_path = row["file_path"]
+                overlay_version = None
+
+            manifest.frames.append(self._resolve(stored_path))
+            if keep_rows:
+                manifest.frame_rows.append(row)
+            manifest.fingerprints.append(
+                f"{row['id']}:{stored_path}:"
+                f"{overlay_version.isoformat() if overlay_version else ''}"
+            )
+
+            if manifest.first_captured_at is None:
+                manifest.first_captured_at = row["captured_at"]
+            manifest.last_captured_at = row["captured_at"]
+
+        logger.debug(
+            f"Frame manifest for timelapse {timelapse_id}: "
+            f"{manifest.frame_count} frames ({manifest.overlay_frames} with overlay)"
+        )
+        return manifest
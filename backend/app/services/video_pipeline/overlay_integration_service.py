@@ -4,16 +4,23 @@ Overlay Integration Service - Simplified Overlay Coordination
 
 Handles overlay availability checking and fallback coordination.
 Simplified version of OverlayManagementService focused on integration only.
+
+When overlay streaming is enabled, videos of timelapses with an overlay
+configuration draw the overlay while encoding ("stream" mode) and do not
+need pre-rendered overlay images at all.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from ...config import settings
 from ...database.core import SyncDatabase
 from ...database.timelapse_operations import SyncTimelapseOperations
 from ...enums import LoggerName, LogSource
+from ...models.image_model import Image as ImageModel
 from ...services.logger import get_service_logger
+from .frame_manifest import FrameManifest
+from .overlay_stream_renderer import FrameRenderer
 
 logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
 
@@ -37,6 +44,7 @@ class OverlayIntegrationService:
         """
         self.db = db
         self.timelapse_ops = SyncTimelapseOperations(db)
+        self._overlay_renderer = None
 
         logger.debug("OverlayIntegrationService initialized")
 
@@ -177,6 +185,50 @@ class OverlayIntegrationService:
             logger.error(f"Error checking overlay images for camera {camera_id}: {e}")
             return False
 
+    def _get_overlay_renderer(self):
+        """Get the overlay pipeline service that renders overlays in memory."""
+        if self._overlay_renderer is None:
+            from ...services.image_service import SyncImageService
+            from ..overlay_pipeline.services.integration_service import (
+                SyncOverlayIntegrationService,
+            )
+
+            self._overlay_renderer = SyncOverlayIntegrationService(
+                self.db, SyncImageService(self.db)
+            )
+        return self._overlay_renderer
+
+    def create_frame_renderer(
+        self, timelapse_id: int, manifest: FrameManifest
+    ) -> Optional[FrameRenderer]:
+        """
+        Build a renderer that draws the timelapse overlay onto manifest frames.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            manifest: Frame manifest built with keep_rows=True
+
+        Returns:
+            Callable rendering the frame at an index, or None if the timelapse
+            has no usable overlay configuration
+        """
+        renderer = self._get_overlay_renderer()
+        resolved = renderer.get_cached_overlay_config(timelapse_id)
+        if not resolved:
+            return None
+        config_version, config = resolved
+
+        def render_frame(index: int):
+            return renderer.render_overlay_frame(
+                ImageModel(**manifest.frame_rows[index]),
+                config,
+                config_version,
+                image_path=manifest.frames[index],
+                frame_number=index + 1,
+            )
+
+        return render_frame
+
     def get_overlay_mode_for_video(self, timelapse_id: int) -> str:
         """
         Determine which overlay mode to use for video generation.
@@ -185,9 +237,17 @@ class OverlayIntegrationService:
             timelapse_id: ID of the timelapse
 
         Returns:
-            'overlay' if overlays should be used, 'regular' for regular images
+            'stream' to draw overlays while encoding, 'overlay' if overlay
+            images should be used, 'regular' for regular images
         """
         try:
+            if (
+                settings.video_overlay_streaming_enabled
+                and self._get_overlay_renderer().get_cached_overlay_config(timelapse_id)
+            ):
+                logger.debug(f"Using stream overlay mode for timelapse {timelapse_id}")
+                return "stream"
+
             overlay_status = self.check_overlays_available(timelapse_id)
 
             if overlay_status.get("overlays_enabled") and overlay_status.get(
@@ -0,0 +1,263 @@
+# backend/app/services/video_pipeline/overlay_stream_renderer.py
+"""
+Overlay Stream Renderer - Draw overlays while encoding, without overlay files.
+
+The overlay image path renders a full-resolution overlay file per frame,
+which FFmpeg then decodes again: twice the storage, a lossy re-encode, and
+videos that depend on the overlay job backlog. Here the source captures are
+decoded, the compiled overlay is drawn in memory by a pool of worker
+threads, and the raw RGB frames are piped to FFmpeg's stdin.
+
+Frames are rendered ahead into a bounded window (VIDEO_OVERLAY_STREAM_QUEUE_FRAMES)
+and handed to FFmpeg strictly in order. FFmpeg's stdin applies backpressure,
+so memory stays at a few frames no matter how long the video is.
+"""
+
+import os
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from PIL import Image
+
+from ...enums import LoggerName, LogSource, VideoQuality
+from ...services.logger import get_service_logger
+from . import ffmpeg_runner, ffmpeg_utils
+from .constants import (
+    FFMPEG_CANCELLED_MESSAGE,
+    VIDEO_OVERLAY_STREAM_MAX_WORKERS,
+    VIDEO_OVERLAY_STREAM_QUEUE_FRAMES,
+)
+from .ffmpeg_runner import FFmpegProgress
+from .parallel_encoder import ChunkProgress, ProgressCallback
+
+logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
+
+# Renders the frame at an index as an image with the overlay applied
+FrameRenderer = Callable[[int], Image.Image]
+
+
+def frame_to_rgb_bytes(image: Image.Image, frame_size: Tuple[int, int]) -> bytes:
+    """
+    Convert a rendered frame to the raw rgb24 layout FFmpeg reads.
+
+    Args:
+        image: Rendered frame (any mode)
+        frame_size: Size every frame of the stream must have
+
+    Returns:
+        Raw RGB bytes of the frame
+    """
+    if image.size != frame_size:
+        # FFmpeg's rawvideo input has one fixed size; odd captures are scaled
+        image = image.resize(frame_size)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image.tobytes()
+
+
+class RenderedFrameStream:
+    """
+    Ordered iterator of raw frames rendered ahead by worker threads.
+
+    At most queue_frames frames are rendered or waiting at any time; the next
+    frame is submitted only when the oldest one has been handed out.
+    """
+
+    def __init__(
+        self,
+        frame_count: int,
+        render_frame: FrameRenderer,
+        frame_size: Tuple[int, int],
+        max_workers: int = VIDEO_OVERLAY_STREAM_MAX_WORKERS,
+        queue_frames: int = VIDEO_OVERLAY_STREAM_QUEUE_FRAMES,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            frame_count: Number of frames in the video
+            render_frame: Renders the frame at an index
+            frame_size: Size of every emitted frame (width, height)
+            max_workers: Rendering threads
+            queue_frames: Frames rendered ahead of the consumer
+            cancel_event: Stops the stream when set
+        """
+        self.frame_count = frame_count
+        self.frame_size = frame_size
+        self.frames_emitted = 0
+        self._render_frame = render_frame
+        self._queue_frames = max(1, queue_frames)
+        self._cancel_event = cancel_event
+        self._next_index = 0
+        self._pending: Deque[Future] = deque()
+        self._lock = threading.RLock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="overlay-stream"
+        )
+
+    def _render(self, index: int) -> bytes:
+        return frame_to_rgb_bytes(self._render_frame(index), self.frame_size)
+
+    def _fill(self) -> None:
+        """Submit frames until the render-ahead window is full."""
+        while (
+            len(self._pending) < self._queue_frames
+            and self._next_index < self.frame_count
+        ):
+            self._pending.append(self._executor.submit(self._render, self._next_index))
+            self._next_index += 1
+
+    def __iter__(self) -> "RenderedFrameStream":
+        return self
+
+    def __next__(self) -> bytes:
+        with self._lock:
+            if self._closed:
+                raise StopIteration
+            if self._cancel_event is not None and self._cancel_event.is_set():
+                self.close()
+                raise RuntimeError(FFMPEG_CANCELLED_MESSAGE)
+
+            self._fill()
+            if not self._pending:
+                self.close()
+                raise StopIteration
+            future = self._pending.popleft()
+
+        try:
+            frame = future.result()
+        except Exception:
+            self.close()
+            raise
+        self.frames_emitted += 1
+        return frame
+
+    def close(self) -> None:
+        """Drop frames not yet rendered and release the worker threads."""
+        with self._lock:
+            self._closed = True
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._executor.shutdown(wait=False)
+
+
+def generate_video_with_streamed_overlays(
+    frame_count: int,
+    render_frame: FrameRenderer,
+    output_path: str,
+    framerate: float = 24.0,
+    quality: VideoQuality = VideoQuality.MEDIUM,
+    rotation: int = 0,
+    max_workers: int = VIDEO_OVERLAY_STREAM_MAX_WORKERS,
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[bool, str, Dict[str, Any]]:
+    """
+    Render a video with overlays drawn in-process and piped to FFmpeg.
+
+    The first frame is rendered up front to fix the stream's frame size. The
+    video is written under a temporary name and only renamed to output_path
+    once FFmpeg succeeds.
+
+    Args:
+        frame_count: Number of frames in the video
+        render_frame: Renders the frame at an index with its overlay
+        output_path: Output video file path
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+        max_workers: Upper bound on rendering threads
+        progress_callback: Called with encoding progress
+        cancel_event: Terminates the render when set
+
+    Returns:
+        Tuple of (success, message, metadata_dict)
+    """
+    if frame_count == 0:
+        return False, "No frames to render", {}
+
+    output_path_obj = Path(output_path)
+    temp_path = output_path_obj.with_name(
+        f"{output_path_obj.name}.{uuid.uuid4().hex[:8]}.partial"
+    )
+
+    try:
+        frame_size = render_frame(0).size
+        workers = max(1, min(max_workers, os.cpu_count() or 1))
+        stream = RenderedFrameStream(
+            frame_count,
+            render_frame,
+            frame_size,
+            max_workers=workers,
+            cancel_event=cancel_event,
+        )
+
+        def on_progress(update: FFmpegProgress) -> None:
+            if progress_callback:
+                progress_callback(
+                    ChunkProgress(
+                        chunks_completed=1 if update.finished else 0,
+                        chunks_total=1,
+                        frames_completed=update.frame,
+                        frames_total=frame_count,
+                        fps=update.fps,
+                    )
+                )
+
+        logger.info(
+            f"Streaming {frame_count} overlay frames at "
+            f"{frame_size[0]}x{frame_size[1]} to FFmpeg ({workers} render threads)"
+        )
+
+        cmd = ffmpeg_utils.build_rawvideo_command(
+            frame_size, str(temp_path), framerate, quality, rotation
+        )
+        success, output = ffmpeg_utils.execute_ffmpeg_command(
+            cmd,
+            timeout=ffmpeg_runner.calculate_ffmpeg_timeout(frame_count),
+            total_frames=frame_count,
+            progress_callback=on_progress,
+            cancel_event=cancel_event,
+            input_chunks=stream,
+        )
+        if not success:
+            return False, f"Video generation failed: {output}", {}
+        if stream.frames_emitted != frame_count:
+            return (
+                False,
+                f"Video generation failed: streamed {stream.frames_emitted} "
+                f"of {frame_count} frames",
+                {},
+            )
+
+        temp_path.replace(output_path_obj)
+        metadata = {
+            "image_count": frame_count,
+            "duration_seconds": frame_count / framerate,
+            "framerate": framerate,
+            "quality": quality,
+            "rotation": rotation,
+            "file_size_bytes": output_path_obj.stat().st_size,
+            "overlay_enabled": True,
+            "overlay_images_used": False,
+            "overlay_streamed": True,
+        }
+        return True, f"Video generated successfully: {output_path}", metadata
+
+    except Exception as e:
+        error_msg = f"Error during streamed overlay video generation: {str(e)}"
+        logger.error(error_msg, exception=e)
+        return False, error_msg, {}
+
+    finally:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to clean up temp file {temp_path}: {e}")
@@ -0,0 +1,410 @@
+# backend/app/services/video_pipeline/parallel_encoder.py
+"""
+Parallel Encoder - Encode contiguous frame chunks concurrently.
+
+A single libx264 process over a whole timelapse leaves most cores idle with
+the slower presets. Splitting the frame list into contiguous chunks, encoding
+each chunk in its own FFmpeg process and joining the chunks with stream copy
+keeps every core busy and produces the same video losslessly.
+
+Used for full renders (generate_video_chunked) and for encoding the missing
+segments of the segment cache (SegmentedVideoRenderer). Live FFmpeg progress
+of the running chunks is aggregated into one ChunkProgress per update.
+"""
+
+import os
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ...enums import LoggerName, LogSource, VideoQuality
+from ...services.logger import get_service_logger
+from . import ffmpeg_utils
+from .constants import (
+    FFMPEG_CANCEL_POLL_SECONDS,
+    FFMPEG_CANCELLED_MESSAGE,
+    FFMPEG_COMMAND_TIMEOUT_SECONDS,
+    VIDEO_CHUNK_MIN_CORES_PER_ENCODER,
+    VIDEO_CHUNK_MIN_FRAMES,
+)
+from .ffmpeg_runner import FFmpegProgress
+
+logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
+
+
+@dataclass
+class ChunkProgress:
+    """Progress of a chunked encode, including frames of running chunks."""
+
+    chunks_completed: int
+    chunks_total: int
+    frames_completed: int
+    frames_total: int
+    fps: float = 0.0  # Combined encode rate of the running chunks
+
+    @property
+    def percent(self) -> int:
+        """Completion percentage by encoded frames."""
+        if not self.frames_total:
+            return 100
+        return min(100, int(self.frames_completed * 100 / self.frames_total))
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds remaining at the current combined encode rate."""
+        if self.fps <= 0:
+            return None
+        return max(0.0, (self.frames_total - self.frames_completed) / self.fps)
+
+
+ProgressCallback = Callable[[ChunkProgress], None]
+
+
+@dataclass
+class FrameChunk:
+    """A contiguous run of frames encoded into one file."""
+
+    frames: List[str]
+    output_path: str
+
+
+def calculate_chunk_count(
+    frame_count: int,
+    cpu_count: Optional[int] = None,
+    max_chunks: int = 0,
+) -> int:
+    """
+    Derive how many chunks to encode concurrently.
+
+    Each encoder gets at least VIDEO_CHUNK_MIN_CORES_PER_ENCODER cores and
+    each chunk at least VIDEO_CHUNK_MIN_FRAMES frames, so small videos and
+    small machines keep using a single encoder.
+
+    Args:
+        frame_count: Total number of frames
+        cpu_count: Available cores (defaults to os.cpu_count())
+        max_chunks: Upper bound (0 = no bound)
+
+    Returns:
+        Number of chunks (at least 1)
+    """
+    cores = cpu_count or os.cpu_count() or 1
+    chunks = min(
+        cores // VIDEO_CHUNK_MIN_CORES_PER_ENCODER,
+        frame_count // VIDEO_CHUNK_MIN_FRAMES,
+    )
+    if max_chunks > 0:
+        chunks = min(chunks, max_chunks)
+    return max(1, chunks)
+
+
+def split_frame_ranges(frame_count: int, chunk_count: int) -> List[Tuple[int, int]]:
+    """
+    Split frame indexes into contiguous, near-equal ranges.
+
+    Args:
+        frame_count: Total number of frames
+        chunk_count: Number of ranges
+
+    Returns:
+        List of (start, end) index pairs, end exclusive
+    """
+    chunk_count = max(1, min(chunk_count, frame_count))
+    base, remainder = divmod(frame_count, chunk_count)
+    ranges = []
+    start = 0
+    for index in range(chunk_count):
+        end = start + base + (1 if index < remainder else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def encode_chunks(
+    chunks: List[FrameChunk],
+    framerate: float,
+    quality: VideoQuality,
+    rotation: int,
+    max_workers: int,
+    progress_callback: Optional[ProgressCallback] = None,
+    validate_paths: bool = True,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[bool, str]:
+    """
+    Encode frame chunks concurrently, one FFmpeg process per chunk.
+
+    The pool threads only wait on FFmpeg; encoding runs in the FFmpeg child
+    processes. Each encoder is limited to its share of the cores and gets a
+    timeout scaled to its frame count. The first failure (or cancellation)
+    terminates the encoders that are still running.
+
+    Args:
+        chunks: Chunks to encode
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+        max_workers: Maximum concurrent FFmpeg processes
+        progress_callback: Called with aggregated progress while encoding
+            and after each finished chunk
+        validate_paths: Validate and stat every frame path
+        cancel_event: Terminates all encoders when set
+
+    Returns:
+        Tuple of (success, error_message); stops at the first failed chunk
+    """
+    if not chunks:
+        return True, ""
+
+    workers = max(1, min(max_workers, len(chunks)))
+    threads = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else None
+    progress = ChunkProgress(
+        chunks_completed=0,
+        chunks_total=len(chunks),
+        frames_completed=0,
+        frames_total=sum(len(chunk.frames) for chunk in chunks),
+    )
+    progress_lock = threading.Lock()
+    running: Dict[int, FFmpegProgress] = {}
+    finished_frames = [0]
+    # Set on cancellation or the first failure to stop every running encoder
+    stop_event = threading.Event()
+
+    def report() -> None:
+        # Caller holds progress_lock, so reports are serialized across chunks
+        progress.frames_completed = finished_frames[0] + sum(
+            update.frame for update in running.values()
+        )
+        progress.fps = sum(update.fps for update in running.values())
+        if progress_callback:
+            try:
+                progress_callback(progress)
+            except Exception as e:
+                logger.debug(f"Chunk progress callback failed: {e}")
+
+    def chunk_progress_callback(index: int):
+        def on_progress(update: FFmpegProgress) -> None:
+            with progress_lock:
+                running[index] = update
+                report()
+
+        return on_progress
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="video-chunk"
+    ) as executor:
+        futures = {
+            executor.submit(
+                ffmpeg_utils.encode_frame_chunk,
+                chunk.frames,
+                chunk.output_path,
+                framerate,
+                quality,
+                rotation,
+                threads,
+                None,
+                validate_paths,
+                chunk_progress_callback(index),
+                stop_event,
+            ): (index, chunk)
+            for index, chunk in enumerate(chunks)
+        }
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending, timeout=FFMPEG_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED
+            )
+
+            if cancel_event is not None and cancel_event.is_set():
+                stop_event.set()
+                for future in pending:
+                    future.cancel()
+                return False, FFMPEG_CANCELLED_MESSAGE
+
+            for future in done:
+                index, chunk = futures[future]
+                try:
+                    success, output = future.result()
+                except Exception as e:
+                    success, output = False, str(e)
+
+                if not success:
+                    stop_event.set()
+                    for other in pending:
+                        other.cancel()
+                    return (
+                        False,
+                        f"Encoding {Path(chunk.output_path).name} failed: {output}",
+                    )
+
+                with progress_lock:
+                    running.pop(index, None)
+                    finished_frames[0] += len(chunk.frames)
+                    progress.chunks_completed += 1
+                    report()
+
+    return True, ""
+
+
+def concat_chunks(
+    chunk_paths: List[str],
+    output_path: str,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[bool, str]:
+    """
+    Join encoded chunks into the output file with stream copy.
+
+    Args:
+        chunk_paths: Chunk files in playback order
+        output_path: Output video file path
+        cancel_event: Terminates the concat when set
+
+    Returns:
+        Tuple of (success, output_or_error_message)
+    """
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".txt", dir=Path(chunk_paths[0]).parent, delete=False
+    ) as f:
+        for chunk_path in chunk_paths:
+            f.write(f"file '{Path(chunk_path).resolve()}'\n")
+    list_file = Path(f.name)
+
+    try:
+        cmd = ffmpeg_utils.build_concat_copy_command(str(list_file), output_path)
+        return ffmpeg_utils.execute_ffmpeg_command(
+            cmd, timeout=FFMPEG_COMMAND_TIMEOUT_SECONDS, cancel_event=cancel_event
+        )
+    finally:
+        list_file.unlink(missing_ok=True)
+
+
+def generate_video_chunked(
+    images_directory: Path,
+    output_path: str,
+    framerate: float = 24.0,
+    quality: VideoQuality = VideoQuality.MEDIUM,
+    rotation: int = 0,
+    use_overlay_images: bool = False,
+    max_chunks: int = 0,
+    progress_callback: Optional[ProgressCallback] = None,
+    image_files: Optional[List[str]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[bool, str, Dict[str, Any]]:
+    """
+    Fully render a timelapse video with chunks encoded in parallel.
+
+    Falls back to ffmpeg_utils.generate_video() when the video is too small
+    (or the machine too small) to benefit from more than one chunk.
+
+    Args:
+        images_directory: Directory containing source images
+        output_path: Output video file path
+        framerate: Video framerate
+        quality: Quality level (low/medium/high)
+        rotation: Video rotation in degrees (0, 90, 180, 270)
+        use_overlay_images: Whether to use pre-rendered overlay images
+        max_chunks: Upper bound on concurrent chunks (0 = derive from cores)
+        progress_callback: Called with encoding progress
+        image_files: Ordered absolute frame paths from a frame manifest
+        cancel_event: Terminates the render when set
+
+    Returns:
+        Tuple of (success, message, metadata_dict)
+    """
+    try:
+        from_manifest = image_files is not None
+        frames = (
+            image_files
+            if from_manifest
+            else ffmpeg_utils.select_video_frames(images_directory, use_overlay_images)
+        )
+        if not frames:
+            return False, "No image files found in directory", {}
+
+        chunk_count = calculate_chunk_count(len(frames), max_chunks=max_chunks)
+        if chunk_count == 1:
+
+            def on_progress(update: FFmpegProgress) -> None:
+                if progress_callback:
+                    progress_callback(
+                        ChunkProgress(
+                            chunks_completed=1 if update.finished else 0,
+                            chunks_total=1,
+                            frames_completed=update.frame,
+                            frames_total=len(frames),
+                            fps=update.fps,
+                        )
+                    )
+
+            return ffmpeg_utils.generate_video(
+                images_directory=images_directory,
+                output_path=output_path,
+                framerate=framerate,
+                quality=quality,
+                rotation=rotation,
+                use_overlay_images=use_overlay_images,
+                image_files=image_files,
+                progress_callback=on_progress,
+                cancel_event=cancel_event,
+            )
+
+        logger.info(f"Encoding {len(frames)} frames in {chunk_count} parallel chunks")
+
+        with tempfile.TemporaryDirectory(
+            prefix=".chunks_", dir=Path(output_path).parent
+        ) as chunk_dir:
+            chunks = [
+                FrameChunk(
+                    frames=frames[start:end],
+                    output_path=str(Path(chunk_dir) / f"chunk_{index:04d}.mp4"),
+                )
+                for index, (start, end) in enumerate(
+                    split_frame_ranges(len(frames), chunk_count)
+                )
+            ]
+
+            success, error = encode_chunks(
+                chunks,
+                framerate,
+                quality,
+                rotation,
+                max_workers=chunk_count,
+                progress_callback=progress_callback,
+                validate_paths=not from_manifest,
+                cancel_event=cancel_event,
+            )
+            if not success:
+                return False, f"Video generation failed: {error}", {}
+
+            success, output = concat_chunks(
+                [chunk.output_path for chunk in chunks],
+                output_path,
+                cancel_event=cancel_event,
+            )
+            if not success:
+                return False, f"Chunk concatenation failed: {output}", {}
+
+        output_path_obj = Path(output_path)
+        metadata = {
+            "image_count": len(frames),
+            "duration_seconds": len(frames) / framerate,
+            "framerate": framerate,
+            "quality": quality,
+            "rotation": rotation,
+            "file_size_bytes": (
+                output_path_obj.stat().st_size if output_path_obj.exists() else 0
+            ),
+            "overlay_enabled": bool(use_overlay_images),
+            "overlay_images_used": use_overlay_images,
+            "chunks_total": chunk_count,
+        }
+
+        return True, f"Video generated successfully: {output_path}", metadata
+
+    except Exception as e:
+        error_msg = f"Error during chunked video generation: {str(e)}"
+        logger.error(error_msg, exception=e)
+        return False, error_msg, {}
@@ -0,0 +1,319 @@
+# backend/app/services/video_pipeline/segment_renderer.py
+"""
+Segmented Video Renderer - Incremental video rendering for growing timelapses.
+
+Frames are encoded into fixed-size segments that are cached on disk, keyed by
+(timelapse, frame range, fps, quality, rotation, overlay mode) plus a
+fingerprint of the frame files. Each render only encodes segments whose key
+is not cached yet - normally just the newest, still-growing segment - and the
+final MP4 is assembled with the concat demuxer using stream copy.
+
+Segments are encoded independently, so each one starts with a keyframe and
+can be joined without re-encoding. Any change to a frame (replaced, deleted,
+re-rendered overlay) changes the fingerprint of its segment only.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...enums import LoggerName, LogSource, VideoQuality
+from ...services.logger import get_service_logger
+from . import ffmpeg_utils
+from .constants import VIDEO_SEGMENT_FILE_PREFIX, VIDEO_SEGMENT_KEY_LENGTH
+from .parallel_encoder import (
+    FrameChunk,
+    ProgressCallback,
+    calculate_chunk_count,
+    concat_chunks,
+    encode_chunks,
+)
+
+logger = get_service_logger(LoggerName.VIDEO_PIPELINE, LogSource.PIPELINE)
+
+
+@dataclass(frozen=True)
+class VideoSegment:
+    """A fixed frame range of a video, cached as its own encoded file."""
+
+    index: int
+    start_frame: int
+    end_frame: int  # Exclusive
+    key: str
+    path: Path
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames in the segment."""
+        return self.end_frame - self.start_frame
+
+
+class SegmentedVideoRenderer:
+    """
+    Renders timelapse videos from cached, independently encoded segments.
+
+    Drop-in alternative to ffmpeg_utils.generate_video() with the same return
+    shape, used by VideoWorkflowService when the segment cache is enabled.
+    """
+
+    def __init__(
+        self,
+        cache_directory: str,
+        segment_frame_count: int,
+        max_parallel_encoders: int = 0,
+    ):
+        """
+        Initialize the segmented renderer.
+
+        Args:
+            cache_directory: Root directory of the segment cache
+            segment_frame_count: Frames per segment
+            max_parallel_encoders: Upper bound on concurrent segment encodes
+                (0 = derive from cores)
+        """
+        self.cache_directory = Path(cache_directory)
+        self.segment_frame_count = max(1, segment_frame_count)
+        self.max_parallel_encoders = max_parallel_encoders
+
+    def get_timelapse_cache_directory(self, timelapse_id: int) -> Path:
+        """Get the segment cache directory for a timelapse."""
+        return self.cache_directory / f"timelapse-{timelapse_id}"
+
+    @staticmethod
+    def _frame_fingerprint(frame_path: str) -> List[Any]:
+        """Identify a frame file by path, size and modification time."""
+        stat = os.stat(frame_path)
+        return [frame_path, stat.st_size, stat.st_mtime_ns]
+
+    def plan_segments(
+        self,
+        timelapse_id: int,
+        frames: List[str],
+        framerate: float,
+        quality: VideoQuality,
+        rotation: int,
+        overlay_mode: str,
+        fingerprints: Optional[List[str]] = None,
+    ) -> List[VideoSegment]:
+        """
+        Split frames into segments and compute each segment's cache key.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            frames: Ordered frame file paths
+            framerate: Video framerate
+            quality: Quality level
+            rotation: Video rotation in degrees
+            overlay_mode: Overlay mode the frames were selected with
+            fingerprints: Per-frame version tokens from a frame manifest
+                (defaults to a size/mtime stat of each frame file)
+
+        Returns:
+            Segments in playback order
+        """
+        cache_dir = self.get_timelapse_cache_directory(timelapse_id)
+        render_settings = {
+            "timelapse_id": timelapse_id,
+            "fps": float(framerate),
+            "quality": getattr(quality, "value", quality),
+            "rotation": rotation,
+            "overlay_mode": overlay_mode,
+        }
+
+        segments = []
+        for index, start in enumerate(range(0, len(frames), self.segment_frame_count)):
+            end = min(start + self.segment_frame_count, len(frames))
+            key_source = json.dumps(
+                {
+                    **render_settings,
+                    "frames": [start, end],
+                    "fingerprints": (
+                        fingerprints[start:end]
+                        if fingerprints is not None
+                        else [
+                            self._frame_fingerprint(frame)
+                            for frame in frames[start:end]
+                        ]
+                    ),
+                },
+                sort_keys=True,
+            )
+            key = hashlib.sha256(key_source.encode()).hexdigest()[
+                :VIDEO_SEGMENT_KEY_LENGTH
+            ]
+            segments.append(
+                VideoSegment(
+                    index=index,
+                    start_frame=start,
+                    end_frame=end,
+                    key=key,
+                    path=cache_dir
+                    / f"{VIDEO_SEGMENT_FILE_PREFIX}{start:08d}-{end:08d}_{key}.mp4",
+                )
+            )
+
+        return segments
+
+    def render(
+        self,
+        timelapse_id: int,
+        images_directory: Path,
+        output_path: str,
+        framerate: float = 24.0,
+        quality: VideoQuality = VideoQuality.MEDIUM,
+        rotation: int = 0,
+        use_overlay_images: bool = False,
+        progress_callback: Optional[ProgressCallback] = None,
+        image_files: Optional[List[str]] = None,
+        fingerprints: Optional[List[str]] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Render a timelapse video, re-encoding only uncached segments.
+
+        Missing segments (all of them on a first render or after a settings
+        change) are encoded in parallel.
+
+        Args:
+            timelapse_id: ID of the timelapse (segment cache namespace)
+            images_directory: Directory containing source images
+            output_path: Output video file path
+            framerate: Video framerate
+            quality: Quality level (low/medium/high)
+            rotation: Video rotation in degrees (0, 90, 180, 270)
+            use_overlay_images: Whether to use pre-rendered overlay images
+            progress_callback: Called with encoding progress of new segments
+            image_files: Ordered absolute frame paths from a frame manifest
+            fingerprints: Per-frame version tokens matching image_files
+            cancel_event: Terminates the render when set
+
+        Returns:
+            Tuple of (success, message, metadata_dict)
+        """
+        try:
+            from_manifest = image_files is not None
+            frames = (
+                image_files
+                if from_manifest
+                else ffmpeg_utils.select_video_frames(
+                    images_directory, use_overlay_images
+                )
+            )
+            if not frames:
+                return False, "No image files found in directory", {}
+
+            overlay_mode = "overlay" if use_overlay_images else "none"
+            segments = self.plan_segments(
+                timelapse_id,
+                frames,
+                framerate,
+                quality,
+                rotation,
+                overlay_mode,
+                fingerprints=fingerprints,
+            )
+
+            cache_dir = self.get_timelapse_cache_directory(timelapse_id)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            missing = [
+                FrameChunk(
+                    frames=frames[segment.start_frame : segment.end_frame],
+                    output_path=str(segment.path),
+                )
+                for segment in segments
+                if not segment.path.exists()
+            ]
+            segments_encoded = len(missing)
+
+            success, error = encode_chunks(
+                missing,
+                framerate,
+                quality,
+                rotation,
+                max_workers=calculate_chunk_count(
+                    sum(len(chunk.frames) for chunk in missing),
+                    max_chunks=self.max_parallel_encoders,
+                ),
+                progress_callback=progress_callback,
+                validate_paths=not from_manifest,
+                cancel_event=cancel_event,
+            )
+            if not success:
+                return False, f"Segment encoding failed: {error}", {}
+
+            logger.info(
+                f"Rendering timelapse {timelapse_id} from {len(segments)} segments "
+                f"({segments_encoded} encoded, "
+                f"{len(segments) - segments_encoded} reused)"
+            )
+
+            success, output = concat_chunks(
+                [str(segment.path) for segment in segments],
+                output_path,
+                cancel_event=cancel_event,
+            )
+            if not success:
+                return False, f"Segment concatenation failed: {output}", {}
+
+            self.prune_stale_segments(timelapse_id, segments)
+
+            output_path_obj = Path(output_path)
+            metadata = {
+                "image_count": len(frames),
+                "duration_seconds": len(frames) / framerate,
+                "framerate": framerate,
+                "quality": quality,
+                "rotation": rotation,
+                "file_size_bytes": (
+                    output_path_obj.stat().st_size if output_path_obj.exists() else 0
+                ),
+                "overlay_enabled": bool(use_overlay_images),
+                "overlay_images_used": use_overlay_images,
+                "segments_total": len(segments),
+                "segments_encoded": segments_encoded,
+                "segments_reused": len(segments) - segments_encoded,
+            }
+
+            return True, f"Video generated successfully: {output_path}", metadata
+
+        except Exception as e:
+            error_msg = f"Error during segmented video generation: {str(e)}"
+            logger.error(error_msg, exception=e)
+            return False, error_msg, {}
+
+    def prune_stale_segments(
+        self, timelapse_id: int, current_segments: List[VideoSegment]
+    ) -> int:
+        """
+        Delete cached segments that are no longer part of the timelapse video.
+
+        Args:
+            timelapse_id: ID of the timelapse
+            current_segments: Segments of the latest render
+
+        Returns:
+            Number of segment files deleted
+        """
+        cache_dir = self.get_timelapse_cache_directory(timelapse_id)
+        keep = {segment.path.name for segment in current_segments}
+        removed = 0
+
+        for segment_file in cache_dir.glob(f"{VIDEO_SEGMENT_FILE_PREFIX}*.mp4"):
+            if segment_file.name in keep:
+                continue
+            try:
+                segment_file.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove stale segment {segment_file}: {e}")
+
+        if removed:
+            logger.debug(
+                f"Pruned {removed} stale segments for timelapse {timelapse_id}"
+            )
+        return removed
@@ -8,6 +8,8 @@ Replaces separate JobCoordinationService with integrated functionality.
 import json
 from typing import Any, Dict, List, Optional
 
+from ...config import settings as app_settings
+from ...constants import VIDEO_JOB_VISIBILITY_GRACE_SECONDS
 from ...database.core import AsyncDatabase, SyncDatabase
 from ...database.sse_events_operations import SyncSSEEventsOperations
 from ...database.timelapse_operations import SyncTimelapseOperations
@@ -151,6 +153,36 @@ class VideoJobService:
             logger.error(f"Failed to create video job: {e}")
             return None
 
+    def claim_next_job(self) -> Optional[VideoGenerationJobWithDetails]:
+        """
+        Atomically claim the next job from the queue (same priority order as
+        get_next_pending_job), so several worker processes never pick the same job.
+
+        Jobs without a heartbeat (see heartbeat_job) for longer than the
+        generation timeout plus a grace period are assumed orphaned by a
+        crashed worker and claimed again.
+
+        Returns:
+            Claimed job (already marked processing) or None if queue is empty
+        """
+        try:
+            visibility_timeout = (
+                app_settings.video_generation_timeout_minutes * 60
+                + VIDEO_JOB_VISIBILITY_GRACE_SECONDS
+            )
+            job = self.video_ops.claim_next_video_generation_job(visibility_timeout)
+            if job:
+                logger.debug(
+                    f"Claimed video job {job.id} "
+                    f"(priority: {job.priority}, "
+                    f"trigger: {getattr(job, 'trigger_type', 'unknown')})"
+                )
+            return job
+
+        except Exception as e:
+            logger.error(f"Failed to claim next pending job: {e}")
+            return None
+
     def get_next_pending_job(self) -> Optional[VideoGenerationJobWithDetails]:
         """
         Get the next pending job from the queue using priority-based algorithm.
@@ -250,6 +282,22 @@ class VideoJobService:
             logger.error(f"Failed to start video job {job_id}: {e}")
             return False
 
+    def heartbeat_job(self, job_id: int) -> Optional[str]:
+        """
+        Keep a processing video job claimed and read back its status.
+
+        Args:
+            job_id: ID of the job being rendered
+
+        Returns:
+            Current job status, or None if the job is gone or the update failed
+        """
+        try:
+            return self.video_ops.heartbeat_video_generation_job(job_id)
+        except Exception as e:
+            logger.warning(f"Failed to record heartbeat for video job {job_id}: {e}")
+            return None
+
     def complete_job(
         self,
         job_id: int,
@@ -30,10 +30,14 @@ Separation of Concerns:
 - No direct router compatibility layer
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...config import settings
 from ...database.core import SyncDatabase
+from ...database.image_operations import SyncImageOperations
 from ...database.sse_events_operations import SyncSSEEventsOperations
 from ...enums import (
     JobPriority,
@@ -62,8 +66,15 @@ from ...workers.models.video_responses import (
     QueueStatus,
     VideoGenerationResult,
 )
-from . import ffmpeg_utils
+from . import ffmpeg_utils, overlay_stream_renderer, parallel_encoder
+from .constants import (
+    VIDEO_JOB_HEARTBEAT_INTERVAL_SECONDS,
+    VIDEO_PROGRESS_SSE_INTERVAL_SECONDS,
+)
+from .frame_manifest import FrameManifest, FrameManifestBuilder
 from .overlay_integration_service import OverlayIntegrationService
+from .parallel_encoder import ChunkProgress
+from .segment_renderer import SegmentedVideoRenderer
 
 # from ..log_service import SyncLogService  # Removed: file does not exist
 from .video_job_service import VideoJobService
@@ -141,6 +152,28 @@ class VideoWorkflowService:
         # SSE operations (keep for now until we have a dedicated SSE service)
         self.sse_ops = SyncSSEEventsOperations(db)
 
+        # Frame selection from the images table (per timelapse, in capture order)
+        self.frame_manifest_builder = FrameManifestBuilder(
+            SyncImageOperations(db), settings.data_directory
+        )
+
+        # Incremental renderer (re-encodes only new or changed frame segments)
+        self.segment_renderer = SegmentedVideoRenderer(
+            cache_directory=settings.video_segments_directory,
+            segment_frame_count=settings.video_segment_frame_count,
+            max_parallel_encoders=settings.video_encode_max_parallel_chunks,
+        )
+
+        # Encoding progress of jobs currently rendering, keyed by job ID
+        self.job_progress: Dict[int, Dict[str, Any]] = {}
+
+        # Cancel events of jobs currently rendering; setting one terminates
+        # the job's FFmpeg processes
+        self._cancel_events: Dict[int, threading.Event] = {}
+        # Monotonic times of the last progress event and heartbeat per job
+        self._last_progress_broadcast: Dict[int, float] = {}
+        self._last_heartbeat: Dict[int, float] = {}
+
         # Processing limits
         self.max_concurrent_jobs = max_concurrent_jobs
         self.currently_processing = 0
@@ -222,8 +255,8 @@ class VideoWorkflowService:
                 logger.debug(f"Max concurrent jobs reached: {self.max_concurrent_jobs}")
                 return None
 
-            # Get next job from queue
-            next_job = self.job_service.get_next_pending_job()
+            # Atomically claim next job from queue
+            next_job = self.job_service.claim_next_job()
             if not next_job:
                 logger.debug("No pending jobs in queue")
                 return None
@@ -333,6 +366,15 @@ class VideoWorkflowService:
                 )
 
                 return True
+            elif video_result.get("cancelled"):
+                # Job status is already 'cancelled'; don't overwrite it with 'failed'
+                self._log_job_event(
+                    job,
+                    LogLevel.INFO,
+                    f"Video generation job {job_id} cancelled during rendering",
+                    "job_cancelled",
+                )
+                return False
             else:
                 # Complete job with failure
                 self.job_service.complete_job(
@@ -393,6 +435,9 @@ class VideoWorkflowService:
         Returns:
             Generation result dictionary
         """
+        cancel_event = threading.Event()
+        self._cancel_events[job.id] = cancel_event
+
         try:
             logger.info(
                 f"Starting video generation for job {job.id}, timelapse {job.timelapse_id}"
@@ -413,7 +458,7 @@ class VideoWorkflowService:
             images_dir = validate_file_path(
                 f"cameras/camera-{timelapse.camera_id}/images",
                 base_directory=settings.data_directory,
-                must_exist=True,
+                must_exist=False,
             )
 
             # Generate output filename with timezone-aware timestamp
@@ -432,9 +477,25 @@ class VideoWorkflowService:
                 job.timelapse_id
             )
             use_overlay_images = overlay_mode == "overlay"
+            stream_overlays = overlay_mode == "stream"
 
             logger.info(f"Generating video with overlay mode: {overlay_mode}")
 
+            # Frames come from the images table rather than a scan of the camera
+            # directory, which would mix in frames of other timelapses
+            frame_range = self._get_frame_range(job_settings)
+            manifest = self.frame_manifest_builder.build(
+                job.timelapse_id,
+                use_overlay_images,
+                keep_rows=stream_overlays,
+                **frame_range,
+            )
+            if manifest.frame_count == 0:
+                return {
+                    "success": False,
+                    "error": f"No images found for timelapse {job.timelapse_id}",
+                }
+
             # Get video settings with defaults
             video_settings = {
                 "fps": job_settings.get("fps", 24.0),
@@ -442,15 +503,66 @@ class VideoWorkflowService:
                 "rotation": job_settings.get("rotation", 0),
             }
 
-            # Generate video using FFmpeg
-            success, message, metadata = ffmpeg_utils.generate_video(
-                images_directory=images_dir,
-                output_path=str(output_path),
-                framerate=float(video_settings["fps"]),
-                quality=video_settings["quality"],
-                rotation=video_settings["rotation"],
-                use_overlay_images=use_overlay_images,
-            )
+            # Draw overlays while encoding; overlay images are not needed
+            success = False
+            if stream_overlays:
+                success, message, metadata = self._render_with_streamed_overlays(
+                    job, manifest, video_settings, str(output_path), cancel_event
+                )
+                if not success and not cancel_event.is_set():
+                    logger.warning(
+                        f"Streamed overlay render failed for job {job.id}, "
+                        f"falling back to overlay images: {message}"
+                    )
+                    use_overlay_images = True
+                    manifest = self.frame_manifest_builder.build(
+                        job.timelapse_id, use_overlay_images, **frame_range
+                    )
+
+            render_kwargs = {
+                "images_directory": images_dir,
+                "output_path": str(output_path),
+                "framerate": float(video_settings["fps"]),
+                "quality": video_settings["quality"],
+                "rotation": video_settings["rotation"],
+                "use_overlay_images": use_overlay_images,
+                "image_files": manifest.frames,
+                "progress_callback": lambda progress: self._report_encode_progress(
+                    job, progress
+                ),
+                "cancel_event": cancel_event,
+            }
+
+            # Generate video from cached segments, falling back to a full render
+            if (
+                not success
+                and not cancel_event.is_set()
+                and settings.video_segment_cache_enabled
+            ):
+                success, message, metadata = self.segment_renderer.render(
+                    timelapse_id=job.timelapse_id,
+                    fingerprints=manifest.fingerprints,
+                    **render_kwargs,
+                )
+                if not success and not cancel_event.is_set():
+                    logger.warning(
+                        f"Segmented render failed for job {job.id}, "
+                        f"falling back to full render: {message}"
+                    )
+
+            if not success and not cancel_event.is_set():
+                success, message, metadata = parallel_encoder.generate_video_chunked(
+                    max_chunks=settings.video_encode_max_parallel_chunks,
+                    **render_kwargs,
+                )
+
+            if cancel_event.is_set():
+                logger.info(f"Video generation for job {job.id} was cancelled")
+                return {
+                    "success": False,
+                    "cancelled": True,
+                    "error": "Video generation cancelled",
+                }
 
             if success:
                 # Create video record
@@ -528,6 +640,128 @@ class VideoWorkflowService:
 
             return {"success": False, "error": str(e)}
 
+        finally:
+            self.job_progress.pop(job.id, None)
+            self._cancel_events.pop(job.id, None)
+            self._last_progress_broadcast.pop(job.id, None)
+            self._last_heartbeat.pop(job.id, None)
+
+    def _render_with_streamed_overlays(
+        self,
+        job: VideoGenerationJobWithDetails,
+        manifest: FrameManifest,
+        video_settings: Dict[str, Any],
+        output_path: str,
+        cancel_event: threading.Event,
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Render a job's video with overlays drawn in-process while encoding.
+
+        Returns:
+            Tuple of (success, message, metadata_dict)
+        """
+        render_frame = self.overlay_service.create_frame_renderer(
+            job.timelapse_id, manifest
+        )
+        if render_frame is None:
+            return False, "Overlay configuration is not available", {}
+
+        return overlay_stream_renderer.generate_video_with_streamed_overlays(
+            frame_count=manifest.frame_count,
+            render_frame=render_frame,
+            output_path=output_path,
+            framerate=float(video_settings["fps"]),
+            quality=video_settings["quality"],
+            rotation=video_settings["rotation"],
+            progress_callback=lambda progress: self._report_encode_progress(
+                job, progress
+            ),
+            cancel_event=cancel_event,
+        )
+
+    @staticmethod
+    def _get_frame_range(job_settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the optional frame range of a job from its settings.
+
+        Args:
+            job_settings: Job settings (dates may be ISO strings from JSON)
+
+        Returns:
+            Keyword arguments for FrameManifestBuilder.build()
+        """
+        frame_range: Dict[str, Any] = {}
+        for key in ("start_date", "end_date"):
+            value = job_settings.get(key)
+            if value:
+                frame_range[key] = (
+                    value if isinstance(value, date) else date.fromisoformat(value)
+                )
+        for key in ("start_day", "end_day"):
+            value = job_settings.get(key)
+            if value is not None:
+                frame_range[key] = int(value)
+        return frame_range
+
+    def _report_encode_progress(
+        self, job: VideoGenerationJobWithDetails, progress: ChunkProgress
+    ) -> None:
+        """
+        Record encoding progress for a job and publish it, throttled.
+
+        FFmpeg reports progress about twice a second per running chunk, so
+        SSE events are limited to one per VIDEO_PROGRESS_SSE_INTERVAL_SECONDS
+        (plus the final one). Every VIDEO_JOB_HEARTBEAT_INTERVAL_SECONDS the
+        job is heartbeated, which also picks up cancellations made by other
+        processes (e.g. the API) and stops the render.
+        """
+        eta_seconds = progress.eta_seconds
+        progress_data = {
+            "job_id": job.id,
+            "timelapse_id": job.timelapse_id,
+            "chunks_completed": progress.chunks_completed,
+            "chunks_total": progress.chunks_total,
+            "frames_completed": progress.frames_completed,
+            "frames_total": progress.frames_total,
+            "fps": round(progress.fps, 1),
+            "eta_seconds": round(eta_seconds) if eta_seconds is not None else None,
+            "progress_percent": progress.percent,
+        }
+        self.job_progress[job.id] = progress_data
+
+        now = time.monotonic()
+
+        last_heartbeat = self._last_heartbeat.setdefault(job.id, now)
+        if now - last_heartbeat >= VIDEO_JOB_HEARTBEAT_INTERVAL_SECONDS:
+            self._last_heartbeat[job.id] = now
+            status = self.job_service.heartbeat_job(job.id)
+            cancel_event = self._cancel_events.get(job.id)
+            if status == JobStatus.CANCELLED and cancel_event is not None:
+                logger.info(f"Video job {job.id} was cancelled, stopping FFmpeg")
+                cancel_event.set()
+                return
+
+        finished = progress.chunks_completed == progress.chunks_total
+        last_broadcast = self._last_progress_broadcast.get(job.id)
+        if (
+            not finished
+            and last_broadcast is not None
+            and now - last_broadcast < VIDEO_PROGRESS_SSE_INTERVAL_SECONDS
+        ):
+            return
+        self._last_progress_broadcast[job.id] = now
+
+        logger.debug(
+            f"Video job {job.id}: {progress.frames_completed}/{progress.frames_total} "
+            f"frames ({progress.percent}%), chunk {progress.chunks_completed}"
+            f"/{progress.chunks_total}"
+        )
+        self._broadcast_job_event(
+            SSEEvent.VIDEO_GENERATION_PROGRESS,
+            progress_data,
+            priority=SSEPriority.LOW,
+        )
+
     def get_processing_status(self) -> ProcessingStatus:
         """
         Get current video processing status.
@@ -756,6 +990,12 @@ class VideoWorkflowService:
             # Use the job service to cancel the job
             success = self.job_service.cancel_job(job_id)
 
+            # Stop the render right away if this process is running it; other
+            # processes notice the cancelled status at their next heartbeat
+            cancel_event = self._cancel_events.get(job_id)
+            if success and cancel_event is not None:
+                cancel_event.set()
+
             if success:
                 # Log successful cancellation
                 logger.info(
@@ -906,6 +1146,7 @@ class VideoWorkflowService:
                 ),
                 "can_process_more": self.currently_processing
                 < self.max_concurrent_jobs,
+                "job_progress": dict(self.job_progress),
                 "data_directory": settings.data_directory,
                 "videos_directory": settings.videos_directory,
                 "service_healthy": all(
@@ -717,11 +717,10 @@ def cached_response_with_etag(
     return decorator
 
 
-# Settings-specific caching utilities
-@cached_response(ttl_seconds=300, key_prefix="setting")
+# Settings-specific utilities (settings services serve the process settings snapshot)
 async def get_timezone_async(settings_service) -> str:
     """
-    Get timezone using SettingsService and unified cache infrastructure.
+    Get timezone using SettingsService.
 
     Args:
         settings_service: SettingsService instance for data access (async or sync)
@@ -750,12 +749,14 @@ async def get_timezone_async(settings_service) -> str:
         return DEFAULT_TIMEZONE
 
 
-@cached_response(ttl_seconds=300, key_prefix="setting")
 async def get_setting_cached(
     settings_service, key: str, default: Optional[str] = None
 ) -> Optional[str]:
     """
-    Get any setting with unified caching infrastructure using decorator pattern.
+    Get any setting through a settings service.
+
+    Not TTL-cached: settings services read the process settings snapshot,
+    which is reloaded on every settings change instead of expiring.
 
     Args:
         settings_service: SettingsService instance for data access
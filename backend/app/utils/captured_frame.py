@@ -0,0 +1,237 @@
+# backend/app/utils/captured_frame.py
+"""
+Captured Frame Context
+
+Carries a decoded capture frame through the processing steps that follow the
+capture (quality evaluation, thumbnail generation, overlay rendering) so the
+JPEG written to disk does not have to be decoded again by each consumer.
+
+The capture pipeline registers each saved frame in the process-wide
+RecentFrameCache keyed by its file path. Downstream generators look the path
+up first and only fall back to decoding the file when the frame is no longer
+cached (e.g. regeneration jobs or jobs handled by another process).
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from ..constants import (
+    CAPTURED_FRAME_CACHE_MAX_ENTRIES,
+    CAPTURED_FRAME_CACHE_TTL_SECONDS,
+    CAPTURED_FRAME_DOWNSCALED_SIZE,
+)
+
+
+class CapturedFrame:
+    """
+    A decoded capture frame with lazily derived representations.
+
+    The grayscale and downscaled versions are computed on first access and
+    reused by every consumer. All arrays are treated as read-only.
+    """
+
+    def __init__(
+        self,
+        bgr: np.ndarray,
+        image_path: Optional[Union[str, Path]] = None,
+        file_size: int = 0,
+    ):
+        """
+        Initialize captured frame context.
+
+        Args:
+            bgr: Processed frame in OpenCV BGR layout (as written to disk)
+            image_path: Path of the saved JPEG, if already written
+            file_size: Size of the saved JPEG in bytes
+        """
+        self.bgr = bgr
+        self.image_path = str(image_path) if image_path else None
+        self.file_size = file_size
+        self.created_at = time.monotonic()
+        self._gray: Optional[np.ndarray] = None
+        self._downscaled: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+        self._downscaled_rgb: Optional[np.ndarray] = None
+
+    @property
+    def resolution(self) -> Tuple[int, int]:
+        """Frame resolution as (width, height)."""
+        height, width = self.bgr.shape[:2]
+        return width, height
+
+    @property
+    def gray(self) -> np.ndarray:
+        """Grayscale version of the frame (computed once)."""
+        if self._gray is None:
+            if self.bgr.ndim == 2:
+                self._gray = self.bgr
+            else:
+                self._gray = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    @property
+    def downscaled(self) -> np.ndarray:
+        """
+        Frame scaled to fit CAPTURED_FRAME_DOWNSCALED_SIZE (computed once).
+
+        Frames that already fit are returned unchanged.
+        """
+        if self._downscaled is None:
+            max_width, max_height = CAPTURED_FRAME_DOWNSCALED_SIZE
+            width, height = self.resolution
+            scale = min(max_width / width, max_height / height)
+            if scale >= 1.0:
+                self._downscaled = self.bgr
+            else:
+                target = (max(1, round(width * scale)), max(1, round(height * scale)))
+                self._downscaled = cv2.resize(
+                    self.bgr, target, interpolation=cv2.INTER_AREA
+                )
+        return self._downscaled
+
+    def to_pil_image(self, downscaled: bool = False) -> Image.Image:
+        """
+        Get the frame as an RGB (or L) PIL image.
+
+        Args:
+            downscaled: Whether to use the downscaled version of the frame
+
+        Returns:
+            New PIL image backed by the cached RGB conversion
+        """
+        if downscaled:
+            if self._downscaled_rgb is None:
+                self._downscaled_rgb = self._to_rgb(self.downscaled)
+            rgb = self._downscaled_rgb
+        else:
+            if self._rgb is None:
+                self._rgb = self._to_rgb(self.bgr)
+            rgb = self._rgb
+        return Image.fromarray(rgb)
+
+    @staticmethod
+    def _to_rgb(frame: np.ndarray) -> np.ndarray:
+        """Convert a BGR (or grayscale) frame to a PIL-compatible array."""
+        if frame.ndim == 2:
+            return frame
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+class RecentFrameCache:
+    """
+    Bounded, thread-safe cache of recently captured frames keyed by file path.
+
+    Entries expire after CAPTURED_FRAME_CACHE_TTL_SECONDS and the least
+    recently inserted entry is dropped once the cache is full.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CAPTURED_FRAME_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = CAPTURED_FRAME_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._frames: "OrderedDict[str, CapturedFrame]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(image_path: Union[str, Path]) -> str:
+        """Normalize a path so absolute and relative spellings match."""
+        return str(Path(image_path).resolve())
+
+    def put(self, image_path: Union[str, Path], frame: CapturedFrame) -> None:
+        """Register a decoded frame for the given file path."""
+        if self.max_entries <= 0:
+            return
+
+        key = self._key(image_path)
+        with self._lock:
+            self._frames.pop(key, None)
+            self._frames[key] = frame
+            while len(self._frames) > self.max_entries:
+                self._frames.popitem(last=False)
+
+    def get(self, image_path: Union[str, Path]) -> Optional[CapturedFrame]:
+        """Get the decoded frame for a file path, if still cached."""
+        key = self._key(image_path)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None and (
+                time.monotonic() - frame.created_at > self.ttl_seconds
+            ):
+                del self._frames[key]
+                frame = None
+
+            if frame is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return frame
+
+    def discard(self, image_path: Union[str, Path]) -> None:
+        """Remove the frame for a file path (e.g. when the file is deleted)."""
+        with self._lock:
+            self._frames.pop(self._key(image_path), None)
+
+    def clear(self) -> None:
+        """Remove all cached frames."""
+        with self._lock:
+            self._frames.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._frames),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Global cache shared by the capture pipeline and downstream generators
+recent_frame_cache = RecentFrameCache()
+
+
+def get_recent_frame_cache() -> RecentFrameCache:
+    """Get the process-wide recent frame cache."""
+    return recent_frame_cache
+
+
+@contextmanager
+def open_captured_image(
+    image_path: Union[str, Path], downscaled: bool = False
+) -> Iterator[Image.Image]:
+    """
+    Open an image, preferring the in-memory frame from a recent capture.
+
+    Drop-in replacement for ``with Image.open(path) as img`` in generators
+    that run shortly after a capture.
+
+    Args:
+        image_path: Path of the image file
+        downscaled: Use the downscaled frame when served from the cache
+            (for consumers that only need a reduced-size image)
+
+    Yields:
+        PIL image for the file
+    """
+    captured = recent_frame_cache.get(image_path)
+    if captured is not None:
+        yield captured.to_pil_image(downscaled=downscaled)
+        return
+
+    with Image.open(image_path) as img:
+        yield img
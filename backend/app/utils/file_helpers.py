@@ -8,10 +8,10 @@ Provides standardized file serving, path resolution, and security validation.
 
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import HTTPException
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from ..config import settings
 from ..constants import ALLOWED_IMAGE_EXTENSIONS, ASSET_TYPE_MAP
@@ -140,6 +140,32 @@ def create_file_response(
     )
 
 
+def create_download_stream_response(
+    chunks: AsyncIterator[bytes],
+    filename: str,
+    media_type: str = "application/zip",
+) -> StreamingResponse:
+    """
+    Create a StreamingResponse that downloads generated content as a file.
+
+    Args:
+        chunks: Async iterator producing the file content
+        filename: Filename for download (already cleaned)
+        media_type: MIME type for the response
+
+    Returns:
+        StreamingResponse object ready to return
+    """
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
 def create_image_response(
     file_path: Path,
     image_data: Optional[Dict[str, Any]] = None,
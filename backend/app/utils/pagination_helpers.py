@@ -3,10 +3,18 @@
 Pagination helper utilities for API responses.
 
 Provides standardized pagination metadata creation to ensure
-consistent pagination structure across all API endpoints.
+consistent pagination structure across all API endpoints, and the opaque
+cursor tokens used for keyset pagination.
 """
 
-from typing import Any, Dict
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+# Keyset position: (sort timestamp, row id)
+CursorKey = Tuple[datetime, int]
 
 
 def create_pagination_metadata(
@@ -60,3 +68,39 @@ def calculate_pagination_params(
         "has_next": page < total_pages,
         "has_previous": page > 1,
     }
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """
+    Encode a keyset position as an opaque, URL-safe cursor token.
+
+    Args:
+        sort_value: Timestamp the listing is ordered by
+        row_id: Row ID breaking ties between equal timestamps
+
+    Returns:
+        Cursor token
+    """
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> CursorKey:
+    """
+    Decode a cursor token produced by encode_cursor().
+
+    Args:
+        token: Cursor token from a previous page
+
+    Returns:
+        Tuple of (sort timestamp, row id)
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {token}") from e
@@ -0,0 +1,117 @@
+# backend/app/utils/zip_stream.py
+"""
+Streaming ZIP writer.
+
+Builds a ZIP archive as a sequence of byte chunks instead of in a buffer, so
+an export of any size is sent with constant memory. zipfile writes to a sink
+that cannot seek, which makes it emit a data descriptor after each entry
+rather than seeking back to patch the local header. Files are read in chunks
+and already-compressed media (ZIP_STORED_EXTENSIONS) is stored as-is instead
+of being deflated again.
+
+Only the central directory (one small record per entry) is kept until the
+archive is closed.
+"""
+
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from ..constants import ZIP_STORED_EXTENSIONS, ZIP_STREAM_CHUNK_SIZE
+
+
+class _ZipSink:
+    """Write-only, non-seekable target collecting zipfile output until drained."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last drain."""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class ZipStreamWriter:
+    """
+    Produce a ZIP archive incrementally.
+
+    Usage:
+        writer = ZipStreamWriter()
+        for chunk in writer.add_file(path, "frame_0001.jpg"):
+            send(chunk)
+        send(writer.close())
+    """
+
+    def __init__(self, chunk_size: int = ZIP_STREAM_CHUNK_SIZE) -> None:
+        """
+        Initialize an empty archive.
+
+        Args:
+            chunk_size: File bytes read per write
+        """
+        self.chunk_size = chunk_size
+        self.entry_count = 0
+        self.bytes_added = 0
+        self._sink = _ZipSink()
+        self._zip = zipfile.ZipFile(self._sink, "w", allowZip64=True)
+
+    @staticmethod
+    def get_compress_type(path: Path) -> int:
+        """Store already-compressed media, deflate everything else."""
+        if path.suffix.lower() in ZIP_STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def add_file(self, path: Path, arcname: str) -> Iterator[bytes]:
+        """
+        Open a file and return the chunks of its archive entry.
+
+        The file is opened before anything is written, so a missing or
+        unreadable file raises OSError here and the archive is unaffected.
+
+        Args:
+            path: File to add
+            arcname: Name of the entry in the archive
+
+        Returns:
+            Iterator over the entry's bytes (header, data, data descriptor)
+        """
+        source = path.open("rb")
+        try:
+            info = zipfile.ZipInfo.from_file(path, arcname)
+        except OSError:
+            source.close()
+            raise
+        info.compress_type = self.get_compress_type(path)
+        return self._write_entry(source, info)
+
+    def _write_entry(self, source: BinaryIO, info: zipfile.ZipInfo) -> Iterator[bytes]:
+        """Copy source into the archive chunk by chunk, yielding output as produced."""
+        with source, self._zip.open(info, "w") as entry:
+            yield self._sink.drain()
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                entry.write(chunk)
+                data = self._sink.drain()
+                if data:
+                    yield data
+
+        self.entry_count += 1
+        self.bytes_added += info.file_size
+        yield self._sink.drain()
+
+    def close(self) -> bytes:
+        """Finish the archive and return its central directory."""
+        self._zip.close()
+        return self._sink.drain()
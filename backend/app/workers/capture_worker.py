@@ -7,6 +7,7 @@ Handles image capture from RTSP cameras.
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from ..config import settings
 from ..constants import UNKNOWN_ERROR_MESSAGE
 from ..enums import LogEmoji, LoggerName, LogSource, WorkerType
 from ..models.camera_model import Camera
@@ -22,9 +23,11 @@ from .exceptions import (
     WorkerInitializationError,
 )
 from .models.capture_responses import CaptureWorkerStatus
+from .utils.capture_executor import CaptureExecutor
 from .utils.worker_status_builder import WorkerStatusBuilder
 
 if TYPE_CHECKING:
+    from ..services.capture_pipeline.capture_context import CaptureContext
     from ..services.timelapse_service import TimelapseService
     from ..services.camera_service import CameraService
 
@@ -59,6 +62,7 @@ class CaptureWorker(BaseWorker):
             Any
         ] = None,  # Optional for thumbnail job queuing
         overlay_job_service: Optional[Any] = None,  # Optional for overlay job queuing
+        capture_executor: Optional[CaptureExecutor] = None,
     ):
         """
         Initialize capture worker with dependency injection.
@@ -70,6 +74,7 @@ class CaptureWorker(BaseWorker):
             weather_manager: Optional weather manager
             thumbnail_job_service: Optional thumbnail job service for queuing jobs
             overlay_job_service: Optional overlay job service for queuing overlay jobs
+            capture_executor: Optional capture executor (created from settings if omitted)
         """
         super().__init__("CaptureWorker")
 
@@ -92,6 +97,13 @@ class CaptureWorker(BaseWorker):
         # Initialize workflow service for Service Layer Boundary Pattern
         self.capture_service = CaptureWorkflowService()
 
+        # Dedicated executor bounds capture parallelism globally and per camera host
+        self.capture_executor = capture_executor or CaptureExecutor(
+            max_concurrent=settings.max_concurrent_captures,
+            max_concurrent_per_host=settings.max_concurrent_captures_per_host,
+            max_jitter_seconds=settings.capture_start_jitter_seconds,
+        )
+
     async def initialize(self) -> None:
         """Initialize capture worker resources."""
         try:
@@ -118,6 +130,7 @@ class CaptureWorker(BaseWorker):
 
     async def cleanup(self) -> None:
         """Cleanup capture worker resources."""
+        self.capture_executor.shutdown()
         capture_logger.info("Cleaned up capture worker", store_in_db=False)
 
     async def capture_from_camera(self, camera_info: Camera) -> None:
@@ -162,23 +175,22 @@ class CaptureWorker(BaseWorker):
 
             workflow_orchestrator = self.workflow_orchestrator
 
-            # Execute the complete 12-step capture workflow
-            result: RTSPCaptureResult = await self.run_in_executor(
+            # Execute the complete 12-step capture workflow on the capture executor
+            result: RTSPCaptureResult = await self.capture_executor.run(
+                CaptureExecutor.get_host_key(camera_info.rtsp_url),
                 workflow_orchestrator.execute_capture_workflow,
                 camera_id,
                 timelapse.id,
                 {"source": "capture_worker", "camera_name": camera_name},
+                label=f"camera {camera_id}",
+                apply_jitter=False,
             )
 
             if result.success:
+                # Camera health was set to online by the capture commit
                 capture_logger.info(
                     "Capture workflow completed successfully", emoji=LogEmoji.SUCCESS
                 )
-
-                # Update camera connectivity status to online
-                await self.async_camera_service.update_camera_connectivity(
-                    camera_id, True, None
-                )
             else:
                 capture_logger.error(
                     f"Capture workflow failed: {result.error or UNKNOWN_ERROR_MESSAGE}"
@@ -226,7 +238,11 @@ class CaptureWorker(BaseWorker):
                     camera_id, False, str(e)
                 )
 
-    async def capture_single_timelapse(self, timelapse_id: int) -> None:
+    async def capture_single_timelapse(
+        self,
+        timelapse_id: int,
+        capture_context: Optional["CaptureContext"] = None,
+    ) -> None:
         """
         Capture image for a specific timelapse by ID using the injected workflow.
 
@@ -236,31 +252,37 @@ class CaptureWorker(BaseWorker):
 
         Args:
             timelapse_id: ID of the timelapse to capture for
+            capture_context: Capture context validated by the scheduler; when
+                given, camera and timelapse are not looked up again
         """
         try:
-            # Trust scheduler validation - minimal existence checks only
-            # Get the timelapse info (basic existence check)
-            timelapse = await self.async_timelapse_service.get_timelapse_by_id(
-                timelapse_id
-            )
-
-            if not timelapse:
-                capture_logger.warning(
-                    f"Timelapse {timelapse_id} not found for capture", store_in_db=False
+            if capture_context is not None:
+                camera = capture_context.camera
+            else:
+                # Trust scheduler validation - minimal existence checks only
+                # Get the timelapse info (basic existence check)
+                timelapse = await self.async_timelapse_service.get_timelapse_by_id(
+                    timelapse_id
                 )
-                return
 
-            # Get the camera for this timelapse (basic existence check)
-            camera = await self.async_camera_service.get_camera_by_id(
-                timelapse.camera_id
-            )
+                if not timelapse:
+                    capture_logger.warning(
+                        f"Timelapse {timelapse_id} not found for capture",
+                        store_in_db=False,
+                    )
+                    return
 
-            if not camera:
-                capture_logger.error(
-                    f"Camera {timelapse.camera_id} not found for timelapse {timelapse_id}",
-                    store_in_db=False,
+                # Get the camera for this timelapse (basic existence check)
+                camera = await self.async_camera_service.get_camera_by_id(
+                    timelapse.camera_id
                 )
-                return
+
+                if not camera:
+                    capture_logger.error(
+                        f"Camera {timelapse.camera_id} not found for timelapse {timelapse_id}",
+                        store_in_db=False,
+                    )
+                    return
 
             capture_logger.info(
                 f"Starting timelapse-specific capture for timelapse {timelapse_id} on camera {camera.name}",
@@ -275,12 +297,16 @@ class CaptureWorker(BaseWorker):
 
             workflow_orchestrator = self.workflow_orchestrator
 
-            # Execute the complete 12-step capture workflow
-            result: RTSPCaptureResult = await self.run_in_executor(
+            # Execute the complete 12-step capture workflow on the capture executor
+            # (jittered so timelapses sharing an interval boundary are spread out)
+            result: RTSPCaptureResult = await self.capture_executor.run(
+                CaptureExecutor.get_host_key(camera.rtsp_url),
                 workflow_orchestrator.execute_capture_workflow,
                 camera.id,
                 timelapse_id,
                 {"source": "scheduler", "timelapse_id": timelapse_id},
+                capture_context,
+                label=f"timelapse {timelapse_id}",
             )
 
             if result.success:
@@ -358,6 +384,7 @@ class CaptureWorker(BaseWorker):
                     "is_healthy": status.is_healthy,
                     "core_services_count": status.core_services_count,
                     "optional_services_count": status.optional_services_count,
+                    "capture_executor": self.capture_executor.get_stats(),
                 }
             )
 
@@ -47,3 +47,22 @@ WEATHER_CATCHUP_INTERVAL_MINUTES = 15  # Weather catchup job interval
 AUTOMATION_TRIGGER_INTERVAL_MINUTES = 5  # Automation trigger evaluation interval
 TIMELAPSE_SYNC_INTERVAL_MINUTES = 5  # Timelapse sync interval
 SSE_CLEANUP_INTERVAL_HOURS = 6  # SSE cleanup interval
+TIMELAPSE_COUNTER_RECONCILE_INTERVAL_HOURS = 24  # Image counter drift repair interval
+OVERLAY_BACKFILL_INTERVAL_MINUTES = 10  # Stale overlay backfill check interval
+
+# Capture Executor Constants
+CAPTURE_EXECUTOR_THREAD_PREFIX = "capture"
+CAPTURE_EXECUTOR_RECENT_TIMINGS = 100  # Per-capture timings kept for status reporting
+CAPTURE_QUEUE_WAIT_WARNING_SECONDS = 10.0  # Warn when a capture waits this long
+
+# Capture Readiness Constants
+CAPTURE_READINESS_BATCH_WINDOW_SECONDS = 0.05  # Batch readiness checks due together
+
+# Capture Dispatcher Constants
+CAPTURE_DISPATCHER_JOB_ID = "capture_dispatcher"  # Single job driving all captures
+CAPTURE_DISPATCH_TICK_SECONDS = 1  # How often due timelapses are popped from the heap
+CAPTURE_DISPATCH_MAX_BATCH = 500  # Captures dispatched per tick; the rest go next tick
+
+# Health Sweep Constants
+HEALTH_SWEEP_THREAD_PREFIX = "health"
+HEALTH_PROBE_BACKOFF_MAX_SWEEPS = 8  # Offline cameras probed at least every 8th sweep
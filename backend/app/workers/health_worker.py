@@ -5,8 +5,10 @@ Health monitoring worker for Timelapser v4.
 Handles camera health monitoring and connectivity testing.
 """
 
+import asyncio
 from typing import Any, Dict, Optional
 
+from ..config import settings
 from ..enums import LogEmoji, LoggerName, LogSource, WorkerType
 from ..models.health_model import HealthStatus
 from ..services.camera_service import SyncCameraService
@@ -21,6 +23,7 @@ from .exceptions import (
     WorkerInitializationError,
 )
 from .models.health_responses import HealthWorkerStatus
+from .utils.health_sweep import HealthSweep
 from .utils.worker_status_builder import WorkerStatusBuilder
 
 # Initialize health worker logger
@@ -61,6 +64,13 @@ class HealthWorker(BaseWorker):
         # Initialize health workflow service for Service Layer Boundary Pattern
         self.health_service = HealthWorkflowService()
 
+        # Concurrent connectivity probes; one sweep at a time
+        self.sweep = HealthSweep(
+            probe=self.rtsp_service.check_connection_liveness,
+            max_concurrent=settings.health_check_max_concurrent,
+        )
+        self._sweep_lock = asyncio.Lock()
+
     async def initialize(self) -> None:
         """Initialize health worker resources."""
         try:
@@ -81,19 +91,44 @@ class HealthWorker(BaseWorker):
 
     async def cleanup(self) -> None:
         """Cleanup health worker resources."""
+        self.sweep.shutdown()
         health_logger.info("Cleaned up health monitoring worker", store_in_db=False)
 
     async def check_camera_health(self) -> None:
         """
         Check and update camera health status based on RTSP connectivity.
 
-        Performs comprehensive health monitoring for all active cameras:
+        Performs one health sweep over all active cameras:
         1. Retrieves all active cameras from database
-        2. Tests RTSP connectivity without full image capture
-        3. Updates database connectivity status for each camera
+        2. Tests RTSP connectivity concurrently (bounded by
+           health_check_max_concurrent), using a cheap liveness check when the
+           camera has an open capture session; cameras that keep failing are
+           probed on fewer sweeps
+        3. Updates database connectivity status for all probed cameras at once
         4. Logs connectivity issues for monitoring and debugging
+
+        A sweep that starts while the previous one is still running is skipped.
         """
+        if self._sweep_lock.locked():
+            health_logger.warning(
+                "Previous health sweep still running, skipping this one",
+                store_in_db=False,
+            )
+            return
+
+        async with self._sweep_lock:
+            await self._run_health_sweep()
+
+    async def _run_health_sweep(self) -> None:
+        """Run one health sweep (see check_camera_health())."""
         try:
+            # Release RTSP sessions for cameras that are no longer capturing
+            evicted = await self.run_in_executor(self.rtsp_service.evict_idle_sessions)
+            if evicted:
+                health_logger.debug(
+                    f"Evicted {evicted} idle RTSP sessions", store_in_db=False
+                )
+
             # Get all active cameras using async service
             if not self.async_camera_service:
                 raise ServiceUnavailableError(
@@ -108,64 +143,45 @@ class HealthWorker(BaseWorker):
                 )
                 return
 
-            health_logger.info(
-                f"Checking health for {len(cameras)} cameras", store_in_db=False
-            )
-
-            # Test connectivity for each camera
+            valid_cameras = []
             for camera in cameras:
-                camera_id = camera.id
-                camera_name = camera.name
-
                 try:
                     # Validate camera using validation helpers
-                    validate_camera_exists(camera, camera_id)
-                    camera_id = validate_camera_id(camera_id)
-
-                    # Test RTSP connectivity using unified RTSP service
-                    health_logger.info(
-                        f"Health check - testing camera {camera_name} (ID: {camera_id})",
-                        emoji=LogEmoji.CAMERA,
+                    validate_camera_exists(camera, camera.id)
+                    validate_camera_id(camera.id)
+                    valid_cameras.append(camera)
+                except ValueError as e:
+                    health_logger.error(
+                        f"Invalid camera data for {camera.name}: {e}",
                         store_in_db=False,
                     )
+
+            results = await self.sweep.run(valid_cameras)
+
+            health_logger.info(
+                f"Health check - probed {len(results)} of {len(valid_cameras)} cameras",
+                emoji=LogEmoji.CAMERA,
+                store_in_db=False,
+            )
+            for result in results:
+                if result.success:
                     health_logger.debug(
-                        f"Health check - RTSP URL: {camera.rtsp_url}", store_in_db=False
+                        f"Camera {result.camera_name} is online", store_in_db=False
                     )
-                    connectivity_result = await self.run_in_executor(
-                        self.rtsp_service.test_connection, camera_id, camera.rtsp_url
+                else:
+                    health_logger.warning(
+                        f"Camera {result.camera_name} is offline: {result.error}",
+                        store_in_db=False,
                     )
-                    success = connectivity_result.success
-                    message = connectivity_result.error or "Connection test completed"
-
-                    if success:
-                        await self.async_camera_service.update_camera_connectivity(
-                            camera_id, True, None
-                        )
-                        health_logger.debug(
-                            f"Camera {camera_name} is online: {message}",
-                            store_in_db=False,
-                        )
-                    else:
-                        await self.async_camera_service.update_camera_connectivity(
-                            camera_id, False, message
-                        )
-                        health_logger.warning(
-                            f"Camera {camera_name} is offline: {message}",
-                            store_in_db=False,
-                        )
 
-                except ValueError as e:
-                    health_logger.error(
-                        f"Invalid camera data for {camera_name}: {e}", store_in_db=False
-                    )
-                except Exception as e:
-                    if camera_id is not None:
-                        await self.async_camera_service.update_camera_connectivity(
-                            camera_id, False, str(e)
-                        )
-                    raise HealthCheckError(
-                        f"Health check failed for camera {camera_name}: {e}"
-                    )
+            try:
+                await self.async_camera_service.update_cameras_connectivity(
+                    [result.as_connectivity_update() for result in results]
+                )
+            except Exception as e:
+                raise HealthCheckError(
+                    f"Failed to store connectivity for {len(results)} cameras: {e}"
+                )
 
         except HealthCheckError as e:
             health_logger.error(f"Health check error: {e}")
@@ -228,6 +244,8 @@ class HealthWorker(BaseWorker):
                     "is_healthy": status.is_healthy,
                     "services_online_count": status.services_online_count,
                     "has_cameras_to_monitor": status.has_cameras_to_monitor,
+                    "rtsp_session_pool": self.rtsp_service.get_session_pool_stats(),
+                    "health_sweep": self.sweep.get_stats(),
                 }
             )
 
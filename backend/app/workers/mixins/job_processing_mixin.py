@@ -15,6 +15,7 @@ from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar
 from ...enums import SSEEventSource
 from ...utils.time_utils import utc_now
 from ..base_worker import BaseWorker
+from ..utils.job_queue_listener import get_job_queue_listener
 from .job_batch_processor import JobBatchProcessor, ProcessableJob
 from .retry_manager import RetryManager
 from .sse_broadcaster import SSEBroadcaster
@@ -44,6 +45,10 @@ class JobProcessingMixin(BaseWorker, Generic[JobType]):
     PROVIDES: Consistent, tested, optimized job processing patterns
     """
 
+    # Job table this worker consumes. When set, idle waits end early on a
+    # job queue NOTIFY instead of always sleeping for worker_interval.
+    job_table_name: Optional[str] = None
+
     def __init__(
         self,
         name: str,
@@ -370,8 +375,8 @@ class JobProcessingMixin(BaseWorker, Generic[JobType]):
                 if processed_count > 0 or self._should_broadcast_stats():
                     await self._broadcast_worker_statistics()
 
-                # Wait before next cycle
-                await asyncio.sleep(self.worker_interval)
+                # Wait before next cycle (or until a new job is enqueued)
+                await self._wait_for_next_cycle()
 
             except asyncio.CancelledError:
                 self.log_info(f"{self.name} worker loop cancelled")
@@ -396,6 +401,16 @@ class JobProcessingMixin(BaseWorker, Generic[JobType]):
 
         self.log_info(f"{self.name} worker main loop stopped")
 
+    async def _wait_for_next_cycle(self) -> None:
+        """Sleep for worker_interval, waking early when a job is enqueued."""
+        if self.job_table_name is None:
+            await asyncio.sleep(self.worker_interval)
+            return
+
+        await get_job_queue_listener().wait_for_jobs(
+            self.job_table_name, timeout=self.worker_interval
+        )
+
     async def _broadcast_worker_statistics(self) -> None:
         """Broadcast current worker statistics via SSE."""
         try:
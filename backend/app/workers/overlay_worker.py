@@ -27,6 +27,7 @@ from ..constants import (
     OVERLAY_JOB_RETRY_DELAYS,
 )
 from ..database.core import SyncDatabase
+from ..database.overlay_job_operations import OVERLAY_JOB_TABLE
 from ..database.sse_events_operations import SyncSSEEventsOperations
 from ..enums import (
     JobTypes,
@@ -89,6 +90,8 @@ class OverlayWorker(
     - Overlay-specific job validation
     """
 
+    job_table_name = OVERLAY_JOB_TABLE
+
     def __init__(
         self,
         db: SyncDatabase,
@@ -217,15 +220,18 @@ class OverlayWorker(
 
     def get_pending_jobs(self, batch_size: int) -> List[OverlayGenerationJob]:
         """
-        Get pending overlay jobs from the queue.
+        Claim pending overlay jobs from the queue.
+
+        Jobs are claimed atomically (FOR UPDATE SKIP LOCKED) and already marked
+        as processing, so several worker processes can share the queue.
 
         Args:
             batch_size: Maximum number of jobs to retrieve
 
         Returns:
-            List of pending overlay jobs to process
+            List of claimed overlay jobs to process
         """
-        return self.overlay_job_service.get_pending_jobs(batch_size)
+        return self.overlay_job_service.claim_jobs(batch_size)
 
     def process_single_job_impl(self, job: OverlayGenerationJob) -> bool:
         """
@@ -244,13 +250,7 @@ class OverlayWorker(
         try:
             job_start_time = time.time()
 
-            # Mark job as processing
-            if not self.overlay_job_service.mark_job_processing(job.id):
-                overlay_logger.warning(
-                    f"Failed to mark overlay job {job.id} as processing",
-                    store_in_db=False
-                )
-                return False
+            # Job was marked as processing when it was claimed in get_pending_jobs()
 
             overlay_logger.debug(
                 f"Processing overlay job {job.id} for image {job.image_id}",
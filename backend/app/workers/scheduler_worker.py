@@ -10,7 +10,7 @@ This is the MAIN COORDINATOR that orchestrates all scheduler operations:
 ┌─ CORE SCHEDULER (this file) ─────────────────────────────────────────────────────────┐
 │ • APScheduler lifecycle management                                                   │
 │ • Job registry and coordination                                                      │
-│ • Timelapse capture job scheduling                                                   │
+│ • Timelapse capture dispatching (one heap-driven CaptureDispatcher job)              │
 │ • Integration point for all specialized managers                                     │
 └──────────────────────────────────────────────────────────────────────────────────────┘
                                             │
@@ -35,7 +35,10 @@ REFACTORING IMPACT:
 • Refactored: 427 lines with proper separation of concerns
 • 83% size reduction while maintaining full functionality
 """
-from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import inspect
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from apscheduler.job import Job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -47,18 +50,27 @@ from ..database.core import SyncDatabase
 from ..database.scheduled_job_operations import SyncScheduledJobOperations
 from ..database.sse_events_operations import SyncSSEEventsOperations
 from ..database.timelapse_operations import SyncTimelapseOperations
+from ..database.weather_operations import SyncWeatherOperations
 from ..enums import JobPriority, LogEmoji, LoggerName, LogSource, WorkerType
 from ..models.scheduled_job_model import ScheduledJobCreate
+from ..services.image_service import SyncImageService
 from ..services.logger import get_service_logger
+from ..services.overlay_pipeline.services import (
+    OverlayBackfillService,
+    SyncOverlayIntegrationService,
+)
 from ..services.scheduler_workflow_service import SchedulerWorkflowService
 from ..services.scheduling.capture_timing_service import SyncCaptureTimingService
 from ..services.settings_service import SyncSettingsService
 from ..utils.time_utils import utc_now
 from .automation_evaluator import AutomationEvaluator
 from .base_worker import BaseWorker
+from .constants import CAPTURE_DISPATCH_TICK_SECONDS, CAPTURE_DISPATCHER_JOB_ID
 from .immediate_job_manager import ImmediateJobManager
 from .standard_job_manager import StandardJobManager
 from .utils import JobIdGenerator, SchedulerJobTemplate, SchedulerTimeUtils
+from .utils.capture_dispatcher import CaptureDispatcher, build_capture_window
+from .utils.capture_readiness_evaluator import CaptureReadinessEvaluator
 from .utils.worker_status_builder import WorkerStatusBuilder
 
 # Initialize scheduler worker logger
@@ -100,6 +112,7 @@ class SchedulerWorker(BaseWorker):
         self.timelapse_ops = SyncTimelapseOperations(db)
         self.sse_ops = SyncSSEEventsOperations(db)
         self.scheduled_job_ops = SyncScheduledJobOperations(db)
+        self.weather_ops = SyncWeatherOperations(db)
 
         # APScheduler setup
         self.scheduler = AsyncIOScheduler()
@@ -108,12 +121,26 @@ class SchedulerWorker(BaseWorker):
         # External function references
         self.timelapse_capture_func: Optional[Callable] = None
 
+        # Async, batched readiness checks for capture jobs (keeps blocking
+        # queries off the event loop)
+        self.readiness_evaluator = CaptureReadinessEvaluator(
+            scheduling_service, scheduling_service.async_db
+        )
+
         # Initialize workflow service for Service Layer Boundary Pattern
         self.scheduler_service = SchedulerWorkflowService()
 
         # Utility and manager initialization
         self._initialize_managers()
 
+        # Single heap-driven dispatcher for all timelapse captures (replaces
+        # one APScheduler job per timelapse)
+        self.capture_dispatcher = CaptureDispatcher(
+            self.scheduled_job_ops, self._run_timelapse_capture, self.time_utils
+        )
+        self._sun_times: Optional[Tuple[datetime, datetime]] = None
+        self._overlay_backfill_service: Optional[OverlayBackfillService] = None
+
     def _initialize_managers(self) -> None:
         """Initialize specialized managers and utilities."""
         # Time utilities with caching
@@ -173,6 +200,9 @@ class SchedulerWorker(BaseWorker):
         # Start scheduler first
         self.start_scheduler()
 
+        # One tick job drives every timelapse capture
+        self._add_capture_dispatcher_job()
+
         # Rebuild APScheduler jobs from database
         await self._rebuild_jobs_from_database()
 
@@ -189,6 +219,9 @@ class SchedulerWorker(BaseWorker):
         except Exception as e:
             scheduler_logger.error(f"Error shutting down scheduler: {e}", store_in_db=False)
 
+        # Persist timings collected since the last dispatcher tick
+        self.capture_dispatcher.flush_timings()
+
     # APScheduler Management
 
     def start_scheduler(self) -> None:
@@ -214,6 +247,24 @@ class SchedulerWorker(BaseWorker):
         except Exception as e:
             scheduler_logger.error(f"Error stopping scheduler: {e}", store_in_db=False)
 
+    def _add_capture_dispatcher_job(self) -> None:
+        """Add the capture dispatcher tick to APScheduler (not persisted)."""
+        try:
+            self.scheduler.add_job(
+                func=self.capture_dispatcher.tick,
+                trigger="interval",
+                seconds=CAPTURE_DISPATCH_TICK_SECONDS,
+                id=CAPTURE_DISPATCHER_JOB_ID,
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True,
+            )
+            scheduler_logger.debug("Added capture dispatcher job", store_in_db=False)
+        except Exception as e:
+            scheduler_logger.error(
+                f"Failed to add capture dispatcher job: {e}", store_in_db=False
+            )
+
     async def _rebuild_jobs_from_database(self) -> None:
         """Rebuild APScheduler jobs from database on startup."""
         try:
@@ -229,13 +280,21 @@ class SchedulerWorker(BaseWorker):
             jobs_rebuilt = 0
             skipped_standard_jobs = 0
 
+            # Window columns of all running timelapses in one query
+            timelapse_data = self._get_active_timelapse_data()
+
             for job_record in active_jobs:
                 try:
                     # Determine job type and rebuild accordingly
                     if job_record.job_type == "timelapse_capture":
                         if job_record.entity_id and job_record.interval_seconds:
-                            success = self.add_timelapse_job(
-                                job_record.entity_id, job_record.interval_seconds
+                            # Resume on the persisted cadence; the row exists
+                            success = self._schedule_timelapse(
+                                job_record.entity_id,
+                                job_record.interval_seconds,
+                                timelapse_data.get(job_record.entity_id),
+                                first_run=job_record.next_run_time,
+                                persist=False,
                             )
                             if success:
                                 jobs_rebuilt += 1
@@ -420,6 +479,13 @@ class SchedulerWorker(BaseWorker):
 
     def remove_job(self, job_id: str) -> None:
         """Remove job from scheduler, registry, and database."""
+        if job_id not in self.job_registry and job_id.startswith(
+            "timelapse_capture_"
+        ):
+            # Timelapse captures are scheduled by the capture dispatcher
+            self.remove_timelapse_job(int(job_id.replace("timelapse_capture_", "")))
+            return
+
         try:
             if job_id in self.job_registry:
                 self.scheduler.remove_job(job_id)
@@ -498,8 +564,11 @@ class SchedulerWorker(BaseWorker):
                     store_in_db=False
                 )
 
-                # Execute the original function
-                result = await original_func(*args, **kwargs)
+                # Execute the original function (internal jobs such as the
+                # timelapse sync are plain functions)
+                result = original_func(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
 
                 # Track successful execution
                 self._track_job_execution(job_id, success=True)
@@ -532,98 +601,186 @@ class SchedulerWorker(BaseWorker):
 
     # Timelapse Job Management
 
-    def add_timelapse_job(self, timelapse_id: int, interval_seconds: int) -> bool:
+    def add_timelapse_job(
+        self,
+        timelapse_id: int,
+        interval_seconds: int,
+        timelapse_data: Optional[Dict[str, Any]] = None,
+    ) -> bool:
         """
-        Add timelapse capture job to scheduler.
+        Add timelapse captures to the capture dispatcher.
 
         Args:
             timelapse_id: ID of timelapse to schedule
             interval_seconds: Capture interval in seconds
+            timelapse_data: Timelapse row with its time window columns
+                (loaded when not given)
 
         Returns:
-            True if job was added successfully
+            True if the timelapse was scheduled successfully
         """
-        try:
-            if not self.timelapse_capture_func:
-                scheduler_logger.error("No timelapse capture function configured")
-                return False
+        return self._schedule_timelapse(timelapse_id, interval_seconds, timelapse_data)
 
-            job_id = JobIdGenerator.timelapse_capture(timelapse_id)
+    def _schedule_timelapse(
+        self,
+        timelapse_id: int,
+        interval_seconds: int,
+        timelapse_data: Optional[Dict[str, Any]] = None,
+        first_run: Optional[datetime] = None,
+        persist: bool = True,
+    ) -> bool:
+        """
+        Schedule a timelapse on the dispatcher with its precomputed capture window.
 
-            # Create capture wrapper with validation
-            async def capture_wrapper():
-                scheduler_logger.info(
-                    f"Capture wrapper called for timelapse {timelapse_id}",
-                    store_in_db=False,
-                    emoji=LogEmoji.CAMERA
-                )
-                try:
-                    # Validate capture readiness
-                    validation_result = self.scheduling_service.validate_capture_readiness(
-                        camera_id=0,  # Will be extracted from timelapse in validation
-                        timelapse_id=timelapse_id,
-                    )
+        Args:
+            timelapse_id: ID of timelapse to schedule
+            interval_seconds: Capture interval in seconds
+            timelapse_data: Timelapse row with its time window columns
+            first_run: First due time (persisted next_run_time on rebuild)
+            persist: Whether to upsert the scheduled_jobs row
 
-                    if not validation_result.valid:
-                        scheduler_logger.info(
-                            f"❌ Capture blocked for timelapse {timelapse_id}: "
-                            f"{validation_result.error or 'Unknown reason'}"
-                        )
-                        return
+        Returns:
+            True if the timelapse was scheduled successfully
+        """
+        try:
+            if timelapse_data is None:
+                timelapse = self.timelapse_ops.get_timelapse_by_id(timelapse_id)
+                timelapse_data = timelapse.model_dump() if timelapse else {}
+
+            window = build_capture_window(
+                timelapse_data,
+                self._get_sun_times(timelapse_data),
+                self.time_utils.get_timezone(),
+            )
+            next_run_time = self.capture_dispatcher.schedule(
+                timelapse_id, interval_seconds, window, first_run
+            )
 
-                    # Execute capture
-                    if self.timelapse_capture_func is not None:
-                        scheduler_logger.info(
-                            f"🚀 Executing capture for timelapse {timelapse_id}"
-                        )
-                        await self.timelapse_capture_func(timelapse_id)
-                    else:
-                        scheduler_logger.error(
-                            f"Timelapse capture function not configured for timelapse {timelapse_id}"
-                        )
+            if persist:
+                self._persist_timelapse_job_to_database(
+                    timelapse_id, interval_seconds, next_run_time
+                )
 
-                except Exception as e:
-                    scheduler_logger.error(
-                        f"Error in capture job for timelapse {timelapse_id}: {e}",
-                        store_in_db=False,
-                    )
+            scheduler_logger.info(
+                f"Scheduled captures for timelapse {timelapse_id} "
+                f"(interval: {interval_seconds}s, next: {next_run_time.isoformat()})"
+            )
+            return True
 
-            # Create tracked wrapper for execution monitoring
-            tracked_capture_wrapper = self._create_tracked_job_wrapper(
-                job_id, capture_wrapper
+        except Exception as e:
+            scheduler_logger.error(
+                f"Error adding timelapse job for {timelapse_id}: {e}", store_in_db=False
             )
+            return False
 
-            # Add the job
-            success = self.add_job(
-                job_id=job_id,
-                func=tracked_capture_wrapper,
-                trigger="interval",
-                seconds=interval_seconds,
+    def _persist_timelapse_job_to_database(
+        self, timelapse_id: int, interval_seconds: int, next_run_time: datetime
+    ) -> None:
+        """Persist a dispatcher-driven timelapse job for visibility and recovery."""
+        job_id = JobIdGenerator.timelapse_capture(timelapse_id)
+        try:
+            self.scheduled_job_ops.create_or_update_job(
+                ScheduledJobCreate(
+                    job_id=job_id,
+                    job_type="timelapse_capture",
+                    interval_seconds=interval_seconds,
+                    next_run_time=next_run_time,
+                    entity_id=timelapse_id,
+                    entity_type="timelapse",
+                    config={"dispatcher": CAPTURE_DISPATCHER_JOB_ID},
+                    status="active",
+                )
             )
+            scheduler_logger.debug(f"Persisted job to database: {job_id}")
+        except Exception as e:
+            scheduler_logger.warning(f"Failed to persist job {job_id} to database: {e}")
 
-            if success:
+    async def _run_timelapse_capture(self, timelapse_id: int) -> None:
+        """Validate and run one scheduled capture (called by the dispatcher)."""
+        scheduler_logger.info(
+            f"Capture dispatched for timelapse {timelapse_id}",
+            store_in_db=False,
+            emoji=LogEmoji.CAMERA
+        )
+        try:
+            # Validate capture readiness (batched with other timelapses
+            # due in the same tick, without blocking the event loop)
+            validation_result = await self.readiness_evaluator.validate(timelapse_id)
+
+            if not validation_result.valid:
+                scheduler_logger.info(
+                    f"❌ Capture blocked for timelapse {timelapse_id}: "
+                    f"{validation_result.error or 'Unknown reason'}"
+                )
+                return
+
+            # Execute capture, handing over the validated capture context
+            # so the worker does not look up camera/timelapse again
+            if self.timelapse_capture_func is not None:
                 scheduler_logger.info(
-                    f"Added timelapse job for timelapse {timelapse_id} (interval: {interval_seconds}s)"
+                    f"🚀 Executing capture for timelapse {timelapse_id}"
                 )
+                if validation_result.capture_context is not None:
+                    await self.timelapse_capture_func(
+                        timelapse_id,
+                        capture_context=validation_result.capture_context,
+                    )
+                else:
+                    await self.timelapse_capture_func(timelapse_id)
             else:
                 scheduler_logger.error(
-                    f"Failed to add timelapse job for timelapse {timelapse_id}"
+                    f"Timelapse capture function not configured for timelapse {timelapse_id}"
                 )
 
-            return success
-
         except Exception as e:
             scheduler_logger.error(
-                f"Error adding timelapse job for {timelapse_id}: {e}", store_in_db=False
+                f"Error in capture job for timelapse {timelapse_id}: {e}",
+                store_in_db=False,
             )
-            return False
 
     def remove_timelapse_job(self, timelapse_id: int) -> None:
-        """Remove timelapse capture job."""
-        job_id = JobIdGenerator.timelapse_capture(timelapse_id)
-        self.remove_job(job_id)
+        """Remove timelapse captures from the dispatcher and database."""
+        if self.capture_dispatcher.unschedule(timelapse_id):
+            self._remove_job_from_database(
+                JobIdGenerator.timelapse_capture(timelapse_id)
+            )
         scheduler_logger.info(f"Removed timelapse job for timelapse {timelapse_id}")
 
+    def _get_active_timelapse_data(self) -> Dict[int, Dict[str, Any]]:
+        """Get running/paused timelapses (with time window columns) by ID."""
+        try:
+            return {
+                timelapse["id"]: timelapse
+                for timelapse in self.timelapse_ops.get_running_and_paused_timelapses()
+            }
+        except Exception as e:
+            scheduler_logger.warning(f"Failed to load active timelapses: {e}")
+            return {}
+
+    def _load_sun_times(self) -> Optional[Tuple[datetime, datetime]]:
+        """Get sunrise and sunset from the latest weather data."""
+        try:
+            weather = self.weather_ops.get_latest_weather()
+        except Exception as e:
+            scheduler_logger.warning(f"Failed to load sunrise/sunset times: {e}")
+            return None
+
+        if weather and weather.get("sunrise_timestamp") and weather.get(
+            "sunset_timestamp"
+        ):
+            return weather["sunrise_timestamp"], weather["sunset_timestamp"]
+        return None
+
+    def _get_sun_times(
+        self, timelapse_data: Dict[str, Any]
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Get (cached) sun times when the timelapse uses a sunrise/sunset window."""
+        if timelapse_data.get("time_window_type") != "sunrise_sunset":
+            return None
+        if self._sun_times is None:
+            self._sun_times = self._load_sun_times()
+        return self._sun_times
+
     # Standard Jobs Management
 
     def add_standard_jobs(
@@ -680,6 +837,12 @@ class SchedulerWorker(BaseWorker):
         tracked_sync_timelapses_func = self._create_tracked_job_wrapper(
             "timelapse_sync_job", self.sync_running_timelapses
         )
+        tracked_counter_reconcile_func = self._create_tracked_job_wrapper(
+            "counter_reconcile_job", self.reconcile_timelapse_counters
+        )
+        tracked_overlay_backfill_func = self._create_tracked_job_wrapper(
+            "overlay_backfill_job", self.backfill_stale_overlays
+        )
 
         # Inject tracked functions into standard job manager
         self.standard_job_manager.health_check_func = tracked_health_func
@@ -690,6 +853,10 @@ class SchedulerWorker(BaseWorker):
         )
         self.standard_job_manager.sync_timelapses_func = tracked_sync_timelapses_func
         self.standard_job_manager.sse_cleanup_func = tracked_sse_cleanup_func
+        self.standard_job_manager.counter_reconcile_func = (
+            tracked_counter_reconcile_func
+        )
+        self.standard_job_manager.overlay_backfill_func = tracked_overlay_backfill_func
 
         jobs_added = self.standard_job_manager.add_all_standard_jobs()
 
@@ -700,46 +867,102 @@ class SchedulerWorker(BaseWorker):
 
     # Synchronization
 
+    async def reconcile_timelapse_counters(self) -> int:
+        """
+        Repair drifted timelapse image counters off the event loop.
+
+        Returns:
+            Number of timelapses whose counters were corrected
+        """
+        loop = asyncio.get_running_loop()
+        corrected = await loop.run_in_executor(
+            None, self.timelapse_ops.reconcile_image_counters
+        )
+        if corrected:
+            scheduler_logger.warning(
+                f"Reconciled image counters for {corrected} timelapses"
+            )
+        else:
+            scheduler_logger.debug("Timelapse image counters are consistent")
+        return corrected
+
+    async def backfill_stale_overlays(self) -> Dict[str, int]:
+        """
+        Regenerate overlays rendered before their timelapse's config changed.
+
+        The backfill blocks on its render process pool, so it runs off the
+        event loop.
+
+        Returns:
+            Dictionary with timelapses, rendered and failed counts
+        """
+        if self._overlay_backfill_service is None:
+            self._overlay_backfill_service = OverlayBackfillService(
+                self.db,
+                SyncOverlayIntegrationService(
+                    self.db, SyncImageService(self.db), self.settings_service
+                ),
+                self.settings_service,
+            )
+
+        loop = asyncio.get_running_loop()
+        totals = await loop.run_in_executor(
+            None, self._overlay_backfill_service.backfill_stale_timelapses
+        )
+        if totals["rendered"] or totals["failed"]:
+            scheduler_logger.info(
+                f"Overlay backfill regenerated {totals['rendered']} overlays "
+                f"across {totals['timelapses']} timelapses "
+                f"({totals['failed']} failed)"
+            )
+        return totals
+
     def sync_running_timelapses(self) -> None:
-        """Synchronize running timelapses with scheduler jobs and database."""
+        """Synchronize running timelapses with the capture dispatcher and database."""
         try:
             scheduler_logger.debug("Starting timelapse synchronization")
 
             # Get running and paused timelapses
             active_timelapses = self.timelapse_ops.get_running_and_paused_timelapses()
 
-            # Track which timelapses should have jobs
-            expected_jobs = set()
+            # Sunrise/sunset shift daily; re-resolve sun windows once per sync
+            self._sun_times = self._load_sun_times()
+            timezone = self.time_utils.get_timezone()
+
+            # Track which timelapses should be scheduled
+            expected_ids = set()
             jobs_added = 0
 
             for timelapse in active_timelapses:
                 timelapse_id = timelapse["id"]
                 interval_seconds = timelapse["capture_interval_seconds"]
-                job_id = JobIdGenerator.timelapse_capture(timelapse_id)
 
-                expected_jobs.add(job_id)
+                expected_ids.add(timelapse_id)
 
-                # Add job if missing
-                if job_id not in self.job_registry:
-                    if self.add_timelapse_job(timelapse_id, interval_seconds):
+                if not self.capture_dispatcher.is_scheduled(timelapse_id):
+                    if self._schedule_timelapse(
+                        timelapse_id, interval_seconds, timelapse
+                    ):
                         jobs_added += 1
                 else:
-                    # Update next_run_time in database for existing jobs
-                    self._sync_job_timing_to_database(job_id)
+                    # Pick up interval and window changes in memory; the
+                    # resulting next-run times are written in bulk below
+                    self.capture_dispatcher.schedule(
+                        timelapse_id,
+                        interval_seconds,
+                        build_capture_window(timelapse, self._sun_times, timezone),
+                    )
 
-            # Remove jobs for timelapses that are no longer active
+            # Remove timelapses that are no longer active
             jobs_removed = 0
-            timelapse_jobs = [
-                job_id
-                for job_id in self.job_registry.keys()
-                if job_id.startswith("timelapse_capture_")
-            ]
-
-            for job_id in timelapse_jobs:
-                if job_id not in expected_jobs:
-                    self.remove_job(job_id)
+            for timelapse_id in self.capture_dispatcher.get_scheduled_ids():
+                if timelapse_id not in expected_ids:
+                    self.remove_timelapse_job(timelapse_id)
                     jobs_removed += 1
 
+            # Next-run times of all timelapses in one statement
+            self.capture_dispatcher.flush_timings()
+
             if jobs_added > 0 or jobs_removed > 0:
                 scheduler_logger.info(
                     f"Timelapse sync: +{jobs_added} jobs added, -{jobs_removed} jobs removed"
@@ -798,14 +1021,20 @@ class SchedulerWorker(BaseWorker):
     # Utility Methods
 
     def get_job_count(self) -> int:
-        """Get total number of active jobs."""
-        return len(self.job_registry)
+        """Get total number of active jobs (including dispatched timelapse captures)."""
+        return len(self.job_registry) + len(self.capture_dispatcher.get_scheduled_ids())
 
     def get_job_info(self) -> Dict[str, Any]:
         """Get information about active jobs."""
+        timelapse_job_ids = [
+            JobIdGenerator.timelapse_capture(timelapse_id)
+            for timelapse_id in self.capture_dispatcher.get_scheduled_ids()
+        ]
+        job_ids = list(self.job_registry.keys()) + timelapse_job_ids
         return {
-            "total_jobs": len(self.job_registry),
-            "job_ids": list(self.job_registry.keys()),
+            "total_jobs": len(job_ids),
+            "job_ids": job_ids,
+            "timelapse_jobs": len(timelapse_job_ids),
             "scheduler_running": self.scheduler.running,
         }
 
@@ -865,6 +1094,8 @@ class SchedulerWorker(BaseWorker):
                     "scheduling_service_status": scheduler_status.scheduling_service_status,
                     "capture_timing_enabled": scheduler_status.capture_timing_enabled,
                     "automation_enabled": scheduler_status.automation_enabled,
+                    "capture_readiness": self.readiness_evaluator.get_stats(),
+                    "capture_dispatcher": self.capture_dispatcher.get_stats(),
                     # Job information (clean property access)
                     "total_jobs": (
                         scheduler_status.job_info.total_jobs
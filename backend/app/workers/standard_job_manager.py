@@ -70,9 +70,11 @@ from ..services.logger import get_service_logger
 from .constants import (  # TIMELAPSE_SYNC_INTERVAL_MINUTES,
     AUTOMATION_TRIGGER_INTERVAL_MINUTES,
     CLEANUP_INTERVAL_HOURS_DEFAULT,
+    OVERLAY_BACKFILL_INTERVAL_MINUTES,
     SECONDS_PER_HOUR,
     SECONDS_PER_MINUTE,
     SSE_CLEANUP_INTERVAL_HOURS,
+    TIMELAPSE_COUNTER_RECONCILE_INTERVAL_HOURS,
     WEATHER_CATCHUP_INTERVAL_MINUTES,
     WEATHER_STARTUP_DELAY_SECONDS,
 )
@@ -108,6 +110,8 @@ class StandardJobManager:
         self.sync_timelapses_func: Optional[Callable] = None
         self.sse_cleanup_func: Optional[Callable] = None
         self.database_cleanup_func: Optional[Callable] = None
+        self.counter_reconcile_func: Optional[Callable] = None
+        self.overlay_backfill_func: Optional[Callable] = None
 
     def log_info(self, message: str) -> None:
         """Log info message with prefix."""
@@ -165,6 +169,14 @@ class StandardJobManager:
         if self._add_database_cleanup_job():
             success_count += 1
 
+        # Add timelapse image counter reconcile job
+        if self._add_counter_reconcile_job():
+            success_count += 1
+
+        # Add stale overlay backfill job
+        if self._add_overlay_backfill_job():
+            success_count += 1
+
         total_jobs = len(
             [
                 "health_job",
@@ -176,6 +188,8 @@ class StandardJobManager:
                 "timelapse_sync_job",
                 "sse_cleanup_job",
                 "database_cleanup_job",
+                "counter_reconcile_job",
+                "overlay_backfill_job",
             ]
         )
         self.log_info(f"Added {success_count}/{total_jobs} standard jobs")
@@ -343,6 +357,35 @@ class StandardJobManager:
             * SECONDS_PER_HOUR,  # 6 hours
         )
 
+    def _add_counter_reconcile_job(self) -> bool:
+        """Add job that repairs drifted timelapse image counters."""
+        if not self.counter_reconcile_func:
+            self.log_debug(
+                "Counter reconcile function not configured, skipping counter reconcile job"
+            )
+            return False
+
+        return self.job_template.schedule_interval_job(
+            job_id="counter_reconcile_job",
+            func=self.counter_reconcile_func,
+            interval_seconds=TIMELAPSE_COUNTER_RECONCILE_INTERVAL_HOURS
+            * SECONDS_PER_HOUR,
+        )
+
+    def _add_overlay_backfill_job(self) -> bool:
+        """Add job that regenerates overlays after an overlay config change."""
+        if not self.overlay_backfill_func:
+            self.log_debug(
+                "Overlay backfill function not configured, skipping overlay backfill job"
+            )
+            return False
+
+        return self.job_template.schedule_interval_job(
+            job_id="overlay_backfill_job",
+            func=self.overlay_backfill_func,
+            interval_seconds=OVERLAY_BACKFILL_INTERVAL_MINUTES * SECONDS_PER_MINUTE,
+        )
+
     def remove_all_standard_jobs(self) -> None:
         """Remove all standard jobs from the scheduler."""
         standard_job_ids = [
@@ -355,6 +398,8 @@ class StandardJobManager:
             "timelapse_sync_job",
             "sse_cleanup_job",
             "database_cleanup_job",
+            "counter_reconcile_job",
+            "overlay_backfill_job",
         ]
 
         for job_id in standard_job_ids:
@@ -25,6 +25,7 @@ from ..constants import (
     THUMBNAIL_QUEUE_SIZE_LOW_THRESHOLD,
 )
 from ..database.sse_events_operations import SyncSSEEventsOperations
+from ..database.thumbnail_job_operations import THUMBNAIL_JOB_TABLE
 from ..database.timelapse_operations import SyncTimelapseOperations
 from ..enums import (
     JobTypes,
@@ -82,6 +83,8 @@ class ThumbnailWorker(
     - Performance warning thresholds
     """
 
+    job_table_name = THUMBNAIL_JOB_TABLE
+
     def __init__(
         self,
         thumbnail_job_service: SyncThumbnailJobService,
@@ -178,15 +181,18 @@ class ThumbnailWorker(
 
     def get_pending_jobs(self, batch_size: int) -> List[ThumbnailGenerationJob]:
         """
-        Get pending thumbnail jobs from the queue.
+        Claim pending thumbnail jobs from the queue.
+
+        Jobs are claimed atomically (FOR UPDATE SKIP LOCKED) and already marked
+        as started, so several worker processes can share the queue.
 
         Args:
             batch_size: Maximum number of jobs to retrieve
 
         Returns:
-            List of pending thumbnail jobs to process
+            List of claimed thumbnail jobs to process
         """
-        return self.thumbnail_job_service.get_pending_jobs(batch_size)
+        return self.thumbnail_job_service.claim_jobs(batch_size)
 
     def process_single_job_impl(self, job: ThumbnailGenerationJob) -> bool:
         """
@@ -217,18 +223,7 @@ class ThumbnailWorker(
                 },
             )
 
-            # Mark job as started in database
-            if not self.thumbnail_job_service.mark_job_started(job.id):
-                logger.warning(
-                    f"Failed to mark job {job.id} as started",
-                    store_in_db=False,
-                    extra_context={
-                        "job_id": job.id,
-                        "image_id": job.image_id,
-                        "operation": "mark_job_started",
-                    },
-                )
-                return False
+            # Job was marked as started when it was claimed in get_pending_jobs()
 
             # Generate thumbnails using thumbnail pipeline (thumbnail-specific logic)
             result_dict: Dict[str, Any] = (
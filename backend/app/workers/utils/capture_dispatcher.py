@@ -0,0 +1,459 @@
+# backend/app/workers/utils/capture_dispatcher.py
+"""
+CaptureDispatcher - One heap-driven dispatcher for all timelapse captures.
+
+Every running timelapse used to get its own APScheduler interval job, which
+was persisted to scheduled_jobs when added and re-synced one row at a time.
+With many timelapses that meant one trigger per timelapse, several UPDATEs per
+tick and per-job timers drifting apart. The dispatcher replaces them with a
+single scheduler job (a short tick):
+
+- Next-due times live in a min-heap; each tick pops every due timelapse in one
+  batch and starts its capture
+- Time windows and sunrise/sunset windows are resolved to a CaptureWindow when
+  a timelapse is scheduled, so a due time outside the window jumps straight to
+  the next window opening instead of waking up every interval all night
+- Due times advance on the original cadence (due + n × interval) rather than
+  from when the tick ran, so schedules do not drift
+- Next-run times and execution results are collected and written to
+  scheduled_jobs with one bulk UPDATE per tick
+
+Readiness validation is unchanged: every dispatched capture still goes
+through the scheduler's readiness checks (batched by CaptureReadinessEvaluator).
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from ...constants import SCHEDULER_MAX_INSTANCES
+from ...database.scheduled_job_operations import SyncScheduledJobOperations
+from ...enums import LoggerName, LogSource
+from ...services.logger import get_service_logger
+from ...utils.time_utils import parse_time_string, utc_now
+from ..constants import CAPTURE_DISPATCH_MAX_BATCH
+from .job_id_generator import JobIdGenerator
+from .scheduler_time_utils import SchedulerTimeUtils
+
+logger = get_service_logger(LoggerName.SCHEDULER_WORKER, LogSource.WORKER)
+
+
+@dataclass(frozen=True)
+class CaptureWindow:
+    """Daily window (local time) in which a timelapse may capture."""
+
+    start: time
+    end: time
+
+    def contains(self, moment: time) -> bool:
+        """Whether a local time of day falls inside the window."""
+        if self.start <= self.end:
+            # Normal window (e.g., 06:00 - 18:00)
+            return self.start <= moment <= self.end
+        # Overnight window (e.g., 22:00 - 06:00)
+        return moment >= self.start or moment <= self.end
+
+    def next_open(self, moment: datetime) -> datetime:
+        """
+        Earliest time at or after moment that lies inside the window.
+
+        Args:
+            moment: Timezone-aware datetime in the window's local timezone
+        """
+        if self.contains(moment.time()):
+            return moment
+        opening = datetime.combine(moment.date(), self.start, tzinfo=moment.tzinfo)
+        if opening <= moment:
+            opening += timedelta(days=1)
+        return opening
+
+
+def _parse_window_time(value: Any) -> Optional[time]:
+    """Parse a time window bound from a row (time) or model (HH:MM[:SS] string)."""
+    if isinstance(value, time):
+        return value
+    if isinstance(value, str):
+        parsed = parse_time_string(value)
+        return parsed.time() if parsed else None
+    return None
+
+
+def build_capture_window(
+    timelapse: Mapping[str, Any],
+    sun_times: Optional[Tuple[datetime, datetime]],
+    timezone: Any,
+) -> Optional[CaptureWindow]:
+    """
+    Resolve a timelapse's capture window.
+
+    Args:
+        timelapse: Timelapse row or model dump with the time window columns
+        sun_times: (sunrise, sunset) from the latest weather data, if any
+        timezone: Configured timezone (ZoneInfo)
+
+    Returns:
+        CaptureWindow, or None when the timelapse may capture at any time (or
+        its sun window cannot be resolved yet)
+    """
+    if timelapse.get("time_window_type") == "sunrise_sunset":
+        if not sun_times:
+            return None
+        sunrise, sunset = sun_times
+        start = sunrise.astimezone(timezone) + timedelta(
+            minutes=timelapse.get("sunrise_offset_minutes") or 0
+        )
+        end = sunset.astimezone(timezone) + timedelta(
+            minutes=timelapse.get("sunset_offset_minutes") or 0
+        )
+        return CaptureWindow(start=start.time(), end=end.time())
+
+    # Same bounds the readiness check enforces
+    start_time = _parse_window_time(timelapse.get("time_window_start"))
+    end_time = _parse_window_time(timelapse.get("time_window_end"))
+    if start_time is None or end_time is None:
+        return None
+    return CaptureWindow(start=start_time, end=end_time)
+
+
+@dataclass
+class _ScheduleEntry:
+    """Schedule state of one timelapse; heap items pointing at an older version are stale."""
+
+    timelapse_id: int
+    interval_seconds: int
+    window: Optional[CaptureWindow]
+    next_due: datetime
+    version: int
+
+
+class CaptureDispatcher:
+    """
+    Min-heap of next-due capture times driven by a single scheduler tick.
+
+    schedule()/unschedule() may be called from executor threads (the scheduler
+    authority service does), so heap and bookkeeping are guarded by a lock;
+    tick() runs on the event loop.
+    """
+
+    def __init__(
+        self,
+        scheduled_job_ops: SyncScheduledJobOperations,
+        capture_func: Callable[[int], Awaitable[None]],
+        time_utils: SchedulerTimeUtils,
+        max_batch: int = CAPTURE_DISPATCH_MAX_BATCH,
+        max_instances: int = SCHEDULER_MAX_INSTANCES,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            scheduled_job_ops: Operations used to persist job timings in bulk
+            capture_func: Coroutine function running one timelapse capture
+            time_utils: Scheduler time utilities (configured timezone)
+            max_batch: Most captures dispatched per tick
+            max_instances: Most concurrent captures per timelapse
+        """
+        self.scheduled_job_ops = scheduled_job_ops
+        self.capture_func = capture_func
+        self.time_utils = time_utils
+        self.max_batch = max(1, max_batch)
+        self.max_instances = max(1, max_instances)
+
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, int]] = []
+        self._entries: Dict[int, _ScheduleEntry] = {}
+        self._versions = itertools.count()
+        self._pending_timings: Dict[int, Dict[str, Any]] = {}
+
+        self._in_flight: Dict[int, int] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._ticks = 0
+        self._dispatched = 0
+        self._skipped = 0
+        self._largest_batch = 0
+        self._timing_writes = 0
+
+    # Scheduling
+
+    def schedule(
+        self,
+        timelapse_id: int,
+        interval_seconds: int,
+        window: Optional[CaptureWindow] = None,
+        first_run: Optional[datetime] = None,
+    ) -> datetime:
+        """
+        Add a timelapse or update its interval/window.
+
+        A timelapse that is already scheduled with the same interval keeps its
+        cadence; only its next-due time is re-gated against the (possibly
+        shifted) window.
+
+        Args:
+            timelapse_id: Timelapse to capture for
+            interval_seconds: Capture interval in seconds
+            window: Capture window, None to capture at any time
+            first_run: First due time (e.g. a persisted next_run_time);
+                defaults to one interval from now
+
+        Returns:
+            The timelapse's next due time
+        """
+        interval_seconds = max(1, int(interval_seconds))
+        now = utc_now()
+
+        with self._lock:
+            existing = self._entries.get(timelapse_id)
+            if existing and existing.interval_seconds == interval_seconds:
+                next_due = existing.next_due
+            elif first_run is not None:
+                next_due = max(first_run, now)
+            else:
+                next_due = now + timedelta(seconds=interval_seconds)
+
+            next_due = self._gate(window, next_due)
+            if (
+                existing
+                and existing.interval_seconds == interval_seconds
+                and existing.window == window
+                and existing.next_due == next_due
+            ):
+                return next_due
+
+            self._push(
+                _ScheduleEntry(
+                    timelapse_id=timelapse_id,
+                    interval_seconds=interval_seconds,
+                    window=window,
+                    next_due=next_due,
+                    version=0,
+                )
+            )
+            self._record_timing(timelapse_id, next_run_time=next_due)
+            return next_due
+
+    def unschedule(self, timelapse_id: int) -> bool:
+        """
+        Stop dispatching captures for a timelapse.
+
+        Returns:
+            True if the timelapse was scheduled
+        """
+        with self._lock:
+            # Its heap item becomes stale and is dropped when popped
+            self._pending_timings.pop(timelapse_id, None)
+            return self._entries.pop(timelapse_id, None) is not None
+
+    def is_scheduled(self, timelapse_id: int) -> bool:
+        """Whether captures are dispatched for a timelapse."""
+        return timelapse_id in self._entries
+
+    def get_scheduled_ids(self) -> List[int]:
+        """IDs of all scheduled timelapses."""
+        with self._lock:
+            return sorted(self._entries)
+
+    def get_next_run_time(self, timelapse_id: int) -> Optional[datetime]:
+        """Next due time of a timelapse, if scheduled."""
+        entry = self._entries.get(timelapse_id)
+        return entry.next_due if entry else None
+
+    def _push(self, entry: _ScheduleEntry) -> None:
+        """Store an entry and push its heap item (lock held)."""
+        entry.version = next(self._versions)
+        self._entries[entry.timelapse_id] = entry
+        heapq.heappush(
+            self._heap,
+            (entry.next_due.timestamp(), entry.version, entry.timelapse_id),
+        )
+
+    def _gate(self, window: Optional[CaptureWindow], due: datetime) -> datetime:
+        """Move a due time that falls outside the window to the window opening."""
+        if window is None:
+            return due
+        timezone = self.time_utils.get_timezone()
+        local_due = due.astimezone(timezone)
+        opening = window.next_open(local_due)
+        return due if opening == local_due else opening.astimezone(due.tzinfo)
+
+    def _advance(self, entry: _ScheduleEntry, now: datetime) -> datetime:
+        """Next due time on the entry's cadence after now, gated by its window."""
+        interval = timedelta(seconds=entry.interval_seconds)
+        # Coalesce missed runs but stay on the original cadence
+        missed = max(0, (now - entry.next_due) // interval)
+        return self._gate(entry.window, entry.next_due + interval * (missed + 1))
+
+    # Dispatching
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[int]:
+        """
+        Pop the timelapses due at now and schedule their next run.
+
+        Args:
+            now: Current time (defaults to utc_now())
+
+        Returns:
+            IDs of the due timelapses, at most max_batch
+        """
+        now = now or utc_now()
+        cutoff = now.timestamp()
+        due: List[int] = []
+
+        with self._lock:
+            while self._heap and len(due) < self.max_batch:
+                due_at, version, timelapse_id = self._heap[0]
+                if due_at > cutoff:
+                    break
+                heapq.heappop(self._heap)
+
+                entry = self._entries.get(timelapse_id)
+                if entry is None or entry.version != version:
+                    continue  # Unscheduled or rescheduled since
+
+                in_window = entry.window is None or entry.window.contains(
+                    now.astimezone(self.time_utils.get_timezone()).time()
+                )
+                entry.next_due = self._advance(entry, now)
+                self._push(entry)
+                self._record_timing(timelapse_id, next_run_time=entry.next_due)
+
+                # The window can shift after gating (daily sunrise/sunset changes)
+                if in_window:
+                    due.append(timelapse_id)
+
+        return due
+
+    async def tick(self) -> int:
+        """
+        Dispatch all due captures and persist timings (the scheduler job).
+
+        Returns:
+            Number of captures started
+        """
+        now = utc_now()
+        due = self.pop_due(now)
+        dispatched = 0
+
+        for timelapse_id in due:
+            if self._in_flight.get(timelapse_id, 0) >= self.max_instances:
+                self._skipped += 1
+                logger.warning(
+                    f"Skipping capture for timelapse {timelapse_id}: "
+                    f"{self.max_instances} captures still running",
+                    store_in_db=False,
+                )
+                continue
+
+            with self._lock:
+                self._record_timing(timelapse_id, last_run_time=now)
+            task = asyncio.create_task(self._run_capture(timelapse_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            dispatched += 1
+
+        self._ticks += 1
+        self._dispatched += dispatched
+        self._largest_batch = max(self._largest_batch, dispatched)
+
+        if self._pending_timings:
+            # One statement for every timing change since the last tick
+            await asyncio.get_running_loop().run_in_executor(None, self.flush_timings)
+
+        return dispatched
+
+    async def _run_capture(self, timelapse_id: int) -> None:
+        """Run one capture and record its outcome for the next bulk write."""
+        self._in_flight[timelapse_id] = self._in_flight.get(timelapse_id, 0) + 1
+        try:
+            await self.capture_func(timelapse_id)
+            self.record_result(timelapse_id, success=True)
+        except Exception as e:
+            logger.error(
+                f"Capture job for timelapse {timelapse_id} failed: {e}",
+                store_in_db=False,
+            )
+            self.record_result(timelapse_id, success=False, error_message=str(e))
+        finally:
+            self._in_flight[timelapse_id] -= 1
+            if not self._in_flight[timelapse_id]:
+                del self._in_flight[timelapse_id]
+
+    # Persistence
+
+    def record_result(
+        self, timelapse_id: int, success: bool, error_message: Optional[str] = None
+    ) -> None:
+        """Queue a capture outcome for the next bulk timing write."""
+        finished_at = utc_now()
+        with self._lock:
+            if timelapse_id not in self._entries:
+                return
+            if success:
+                self._record_timing(timelapse_id, last_success_time=finished_at)
+            else:
+                self._record_timing(
+                    timelapse_id,
+                    last_failure_time=finished_at,
+                    error_message=error_message,
+                )
+
+    def _record_timing(self, timelapse_id: int, **fields: Any) -> None:
+        """Merge timing fields into the pending write (lock held)."""
+        self._pending_timings.setdefault(timelapse_id, {}).update(fields)
+
+    def flush_timings(self) -> int:
+        """
+        Write all pending timing changes with one statement.
+
+        Returns:
+            Number of job rows updated
+        """
+        with self._lock:
+            pending, self._pending_timings = self._pending_timings, {}
+        if not pending:
+            return 0
+
+        timings = [
+            {"job_id": JobIdGenerator.timelapse_capture(timelapse_id), **fields}
+            for timelapse_id, fields in pending.items()
+        ]
+        try:
+            updated = self.scheduled_job_ops.bulk_update_job_timings(timings)
+            self._timing_writes += 1
+            return updated
+        except Exception as e:
+            logger.warning(
+                f"Failed to persist timings for {len(timings)} capture jobs: {e}"
+            )
+            # Keep them for the next tick unless newer values arrived
+            with self._lock:
+                for timelapse_id, fields in pending.items():
+                    if timelapse_id in self._entries:
+                        merged = dict(fields)
+                        merged.update(self._pending_timings.get(timelapse_id, {}))
+                        self._pending_timings[timelapse_id] = merged
+            return 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatcher statistics for status reporting."""
+        with self._lock:
+            next_due = min(
+                (entry.next_due for entry in self._entries.values()), default=None
+            )
+            return {
+                "scheduled_timelapses": len(self._entries),
+                "heap_size": len(self._heap),
+                "next_due": next_due.isoformat() if next_due else None,
+                "ticks": self._ticks,
+                "dispatched": self._dispatched,
+                "skipped_overlapping": self._skipped,
+                "largest_batch": self._largest_batch,
+                "running_captures": sum(self._in_flight.values()),
+                "timing_writes": self._timing_writes,
+                "pending_timings": len(self._pending_timings),
+            }
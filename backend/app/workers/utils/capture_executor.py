@@ -0,0 +1,245 @@
+# backend/app/workers/utils/capture_executor.py
+"""
+CaptureExecutor - Dedicated, bounded executor for capture workflows.
+
+Capture workflows are synchronous (RTSP read, JPEG encode, DB writes) and used
+to run on the event loop's default executor, where they competed with every
+other blocking call in the worker process. This executor gives captures their
+own thread pool with:
+
+- A global concurrency limit (size of the pool)
+- A per-camera-host concurrency limit, so several cameras behind the same
+  NVR/host are not hit all at once
+- A random start offset (jitter) so timelapses that share an interval
+  boundary are spread out instead of firing in the same instant
+- Queue-wait vs execution timing for every capture
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+from ...enums import LoggerName, LogSource
+from ...services.logger import get_service_logger
+from ..constants import (
+    CAPTURE_EXECUTOR_RECENT_TIMINGS,
+    CAPTURE_EXECUTOR_THREAD_PREFIX,
+    CAPTURE_QUEUE_WAIT_WARNING_SECONDS,
+)
+
+logger = get_service_logger(LoggerName.CAPTURE_WORKER, LogSource.WORKER)
+
+
+@dataclass
+class CaptureTiming:
+    """Timing breakdown for a single capture run through the executor."""
+
+    host: str
+    label: str
+    jitter_seconds: float
+    queue_wait_seconds: float
+    execution_seconds: float
+    success: bool
+
+
+class CaptureExecutor:
+    """
+    Runs capture workflows on a dedicated thread pool with bounded parallelism.
+
+    Slots are acquired per host first and globally second, so a capture that
+    is blocked by its host limit never holds a global slot.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_concurrent_per_host: int,
+        max_jitter_seconds: float = 0.0,
+    ):
+        """
+        Initialize the capture executor.
+
+        Args:
+            max_concurrent: Maximum captures running at once across all cameras
+            max_concurrent_per_host: Maximum captures running at once per camera host
+            max_jitter_seconds: Upper bound of the random start offset per capture
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_concurrent_per_host = max(1, max_concurrent_per_host)
+        self.max_jitter_seconds = max(0.0, max_jitter_seconds)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent,
+            thread_name_prefix=CAPTURE_EXECUTOR_THREAD_PREFIX,
+        )
+        self._global_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+        self._active_by_host: Dict[str, int] = {}
+        self._queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+        self._total_execution = 0.0
+        self._recent: Deque[CaptureTiming] = deque(
+            maxlen=CAPTURE_EXECUTOR_RECENT_TIMINGS
+        )
+
+    @staticmethod
+    def get_host_key(rtsp_url: Optional[str]) -> str:
+        """
+        Get the concurrency key for a camera stream URL.
+
+        Args:
+            rtsp_url: Camera stream URL
+
+        Returns:
+            Lower-cased host name, or the raw URL if it cannot be parsed
+        """
+        if not rtsp_url:
+            return "unknown"
+        try:
+            hostname = urlparse(rtsp_url).hostname
+        except ValueError:
+            hostname = None
+        return (hostname or rtsp_url).lower()
+
+    def _get_host_slots(self, host: str) -> asyncio.Semaphore:
+        """Get (or create) the semaphore limiting captures for a host."""
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_concurrent_per_host)
+            self._host_slots[host] = slots
+        return slots
+
+    def _get_global_slots(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting captures across all hosts."""
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(self.max_concurrent)
+        return self._global_slots
+
+    async def run(
+        self,
+        host: str,
+        func: Callable[..., Any],
+        *args: Any,
+        label: str = "",
+        apply_jitter: bool = True,
+    ) -> Any:
+        """
+        Run a synchronous capture function on the capture pool.
+
+        Args:
+            host: Concurrency key, usually from get_host_key()
+            func: Synchronous function to execute
+            *args: Positional arguments for func
+            label: Short description used in timing logs (e.g. "timelapse 12")
+            apply_jitter: Whether to delay the start by a random offset
+
+        Returns:
+            Return value of func
+        """
+        jitter = 0.0
+        if apply_jitter and self.max_jitter_seconds > 0:
+            jitter = random.uniform(0, self.max_jitter_seconds)
+            await asyncio.sleep(jitter)
+
+        self._submitted += 1
+        self._queued += 1
+        queued_at = time.monotonic()
+        started_at: Optional[float] = None
+        success = False
+
+        try:
+            async with self._get_host_slots(host):
+                async with self._get_global_slots():
+                    self._queued -= 1
+                    started_at = time.monotonic()
+                    self._active_by_host[host] = self._active_by_host.get(host, 0) + 1
+                    try:
+                        loop = asyncio.get_running_loop()
+                        result = await loop.run_in_executor(self._executor, func, *args)
+                        success = True
+                        return result
+                    finally:
+                        self._active_by_host[host] -= 1
+                        if self._active_by_host[host] <= 0:
+                            del self._active_by_host[host]
+        finally:
+            finished_at = time.monotonic()
+            if started_at is None:
+                # Cancelled before a slot was acquired
+                self._queued -= 1
+                started_at = finished_at
+            self._record_timing(
+                CaptureTiming(
+                    host=host,
+                    label=label,
+                    jitter_seconds=round(jitter, 3),
+                    queue_wait_seconds=round(started_at - queued_at, 3),
+                    execution_seconds=round(finished_at - started_at, 3),
+                    success=success,
+                )
+            )
+
+    def _record_timing(self, timing: CaptureTiming) -> None:
+        """Record timing for a finished capture and log slow queueing."""
+        if timing.success:
+            self._completed += 1
+        else:
+            self._failed += 1
+
+        self._total_queue_wait += timing.queue_wait_seconds
+        self._max_queue_wait = max(self._max_queue_wait, timing.queue_wait_seconds)
+        self._total_execution += timing.execution_seconds
+        self._recent.append(timing)
+
+        message = (
+            f"Capture {timing.label or timing.host}: "
+            f"jitter {timing.jitter_seconds:.2f}s, "
+            f"queue wait {timing.queue_wait_seconds:.2f}s, "
+            f"execution {timing.execution_seconds:.2f}s"
+        )
+        if timing.queue_wait_seconds >= CAPTURE_QUEUE_WAIT_WARNING_SECONDS:
+            logger.warning(message, store_in_db=False)
+        else:
+            logger.debug(message, store_in_db=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics for status reporting.
+
+        Returns:
+            Dictionary with limits, counters and queue-wait/execution timings
+        """
+        finished = self._completed + self._failed
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_concurrent_per_host": self.max_concurrent_per_host,
+            "max_jitter_seconds": self.max_jitter_seconds,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "queued": self._queued,
+            "active": sum(self._active_by_host.values()),
+            "active_by_host": dict(self._active_by_host),
+            "avg_queue_wait_seconds": (
+                round(self._total_queue_wait / finished, 3) if finished else 0.0
+            ),
+            "max_queue_wait_seconds": round(self._max_queue_wait, 3),
+            "avg_execution_seconds": (
+                round(self._total_execution / finished, 3) if finished else 0.0
+            ),
+            "recent": [asdict(timing) for timing in list(self._recent)[-10:]],
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting captures and release the thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
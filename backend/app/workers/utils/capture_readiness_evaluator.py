@@ -0,0 +1,183 @@
+# backend/app/workers/utils/capture_readiness_evaluator.py
+"""
+CaptureReadinessEvaluator - Async, batched capture readiness checks.
+
+Scheduler capture jobs run on the worker's event loop, but
+SyncCaptureTimingService.validate_capture_readiness() runs blocking psycopg
+queries, which stalled every other coroutine while many timelapses fired
+together. This evaluator keeps readiness checks on the event loop without
+blocking it:
+
+- Capture contexts are loaded through the async database pool
+- Checks requested within a short batch window (timelapses sharing an
+  interval boundary fire in the same scheduler tick) are loaded together with
+  one query (timelapses JOIN cameras WHERE id = ANY(...))
+- The readiness rules themselves are the scheduling service's, evaluated
+  per timelapse against the loaded context, so each caller gets its own verdict
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+from ...database.core import AsyncDatabase
+from ...enums import LoggerName, LogSource
+from ...models.shared_models import CaptureReadinessValidationResult
+from ...services.capture_pipeline.capture_context import load_capture_contexts
+from ...services.logger import get_service_logger
+from ...services.scheduling.capture_timing_service import SyncCaptureTimingService
+from ..constants import CAPTURE_READINESS_BATCH_WINDOW_SECONDS
+
+logger = get_service_logger(LoggerName.SCHEDULER_WORKER, LogSource.WORKER)
+
+
+class CaptureReadinessEvaluator:
+    """
+    Coalesces per-timelapse readiness checks into batched async lookups.
+
+    Each capture job awaits validate(); the first request of a batch starts a
+    flush after the batch window, and every request that arrives before then
+    is answered from the same query.
+    """
+
+    def __init__(
+        self,
+        scheduling_service: SyncCaptureTimingService,
+        async_db: AsyncDatabase,
+        batch_window_seconds: float = CAPTURE_READINESS_BATCH_WINDOW_SECONDS,
+    ):
+        """
+        Initialize the readiness evaluator.
+
+        Args:
+            scheduling_service: Service providing the readiness rules
+            async_db: Async database used to load capture contexts
+            batch_window_seconds: How long to collect requests before querying
+        """
+        self.scheduling_service = scheduling_service
+        self.async_db = async_db
+        self.batch_window_seconds = max(0.0, batch_window_seconds)
+
+        self._pending: Dict[int, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self._batches = 0
+        self._evaluated = 0
+        self._largest_batch = 0
+
+    async def validate(self, timelapse_id: int) -> CaptureReadinessValidationResult:
+        """
+        Check whether a timelapse is ready to capture.
+
+        Args:
+            timelapse_id: Timelapse identifier
+
+        Returns:
+            CaptureReadinessValidationResult, with the capture context when valid
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.setdefault(timelapse_id, []).append(future)
+
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the batch window, then answer all collected requests."""
+        pending: Dict[int, List[asyncio.Future]] = {}
+        try:
+            await asyncio.sleep(self.batch_window_seconds)
+            pending = self._take_pending()
+            results = await self.evaluate_batch(list(pending))
+        except BaseException as e:
+            # Never leave a capture job waiting (e.g. on shutdown)
+            for futures in (pending or self._take_pending()).values():
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(e, Exception):
+                        future.set_exception(e)
+                    else:
+                        future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            # Exceptions reach the waiting capture jobs instead
+            return
+
+        for timelapse_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results[timelapse_id])
+
+    def _take_pending(self) -> Dict[int, List[asyncio.Future]]:
+        """Detach the collected requests; later requests start the next batch."""
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        return pending
+
+    async def evaluate_batch(
+        self, timelapse_ids: List[int]
+    ) -> Dict[int, CaptureReadinessValidationResult]:
+        """
+        Validate several timelapses with a single context query.
+
+        Args:
+            timelapse_ids: Timelapse identifiers
+
+        Returns:
+            Dict mapping every requested timelapse ID to its verdict
+        """
+        if not timelapse_ids:
+            return {}
+
+        self._batches += 1
+        self._evaluated += len(timelapse_ids)
+        self._largest_batch = max(self._largest_batch, len(timelapse_ids))
+
+        try:
+            contexts = await load_capture_contexts(self.async_db, timelapse_ids)
+        except Exception as e:
+            logger.error(
+                f"Error loading capture contexts for timelapses {timelapse_ids}",
+                exception=e,
+                store_in_db=False,
+            )
+            return {
+                timelapse_id: CaptureReadinessValidationResult(
+                    valid=False,
+                    error=f"Validation error: {str(e)}",
+                    error_type="validation_error",
+                )
+                for timelapse_id in timelapse_ids
+            }
+
+        results: Dict[int, CaptureReadinessValidationResult] = {}
+        for timelapse_id in timelapse_ids:
+            context = contexts.get(timelapse_id)
+            if context is None:
+                results[timelapse_id] = CaptureReadinessValidationResult(
+                    valid=False,
+                    error=f"Timelapse {timelapse_id} not found",
+                    error_type="timelapse_not_found",
+                )
+            else:
+                results[timelapse_id] = (
+                    self.scheduling_service.evaluate_capture_readiness(context)
+                )
+
+        if len(timelapse_ids) > 1:
+            logger.debug(
+                f"Evaluated capture readiness for {len(timelapse_ids)} timelapses "
+                "with one query"
+            )
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get batching statistics for status reporting."""
+        return {
+            "batches": self._batches,
+            "evaluated": self._evaluated,
+            "largest_batch": self._largest_batch,
+            "pending": sum(len(futures) for futures in self._pending.values()),
+        }
@@ -0,0 +1,193 @@
+# backend/app/workers/utils/health_sweep.py
+"""
+HealthSweep - Concurrent camera connectivity sweeps with adaptive backoff.
+
+A connectivity probe can block for the full RTSP timeout when a camera is
+offline. Probing cameras one after another made a sweep take N × timeout, so
+sweeps ran into the next scheduled sweep. This engine:
+
+- Probes cameras concurrently on its own thread pool, bounded by a
+  configurable cap, so a sweep takes about one timeout per cap-sized batch
+- Backs off per camera: after each consecutive failed probe the camera sits
+  out twice as many sweeps (1, 2, 4, ... up to a maximum), and one successful
+  probe resets it, so offline cameras stop eating the probe budget
+- Returns all results together so they can be written in one batched UPDATE
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ...enums import LoggerName, LogSource
+from ...models.camera_model import Camera
+from ...services.logger import get_service_logger
+from ..constants import HEALTH_PROBE_BACKOFF_MAX_SWEEPS, HEALTH_SWEEP_THREAD_PREFIX
+
+logger = get_service_logger(LoggerName.HEALTH_WORKER, LogSource.WORKER)
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of probing one camera during a sweep."""
+
+    camera_id: int
+    camera_name: str
+    success: bool
+    error: Optional[str] = None
+
+    def as_connectivity_update(self) -> Tuple[int, bool, Optional[str]]:
+        """Row for the batched connectivity update."""
+        return (self.camera_id, self.success, None if self.success else self.error)
+
+
+@dataclass
+class ProbeBackoff:
+    """Backoff state of one camera across sweeps."""
+
+    consecutive_failures: int = 0
+    sweeps_to_skip: int = 0
+
+
+class HealthSweep:
+    """
+    Probes camera connectivity concurrently with a bounded number of probes.
+
+    The probe is a blocking callable (camera_id, rtsp_url) returning an object
+    with success and error attributes, such as RTSPService.check_connection_liveness.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[int, str], Any],
+        max_concurrent: int,
+        max_backoff_sweeps: int = HEALTH_PROBE_BACKOFF_MAX_SWEEPS,
+    ):
+        """
+        Initialize the sweep engine.
+
+        Args:
+            probe: Blocking connectivity check run on the sweep thread pool
+            max_concurrent: Maximum probes running at once
+            max_backoff_sweeps: Most sweeps an offline camera sits out in a row
+        """
+        self.probe = probe
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_backoff_sweeps = max(0, max_backoff_sweeps)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent,
+            thread_name_prefix=HEALTH_SWEEP_THREAD_PREFIX,
+        )
+        self._backoff: Dict[int, ProbeBackoff] = {}
+
+        self._sweeps = 0
+        self._probes = 0
+        self._skipped = 0
+        self._last_sweep_seconds: Optional[float] = None
+        self._last_sweep_probed = 0
+
+    def select_due(self, cameras: Iterable[Camera]) -> List[Camera]:
+        """
+        Pick the cameras to probe this sweep and count down the others' backoff.
+
+        Backoff state of cameras that are no longer active is dropped.
+
+        Args:
+            cameras: All active cameras
+
+        Returns:
+            Cameras that are due for a probe
+        """
+        cameras = list(cameras)
+        active_ids = {camera.id for camera in cameras}
+        for camera_id in list(self._backoff):
+            if camera_id not in active_ids:
+                del self._backoff[camera_id]
+
+        due = []
+        for camera in cameras:
+            state = self._backoff.get(camera.id)
+            if state is not None and state.sweeps_to_skip > 0:
+                state.sweeps_to_skip -= 1
+                self._skipped += 1
+                continue
+            due.append(camera)
+        return due
+
+    def record(self, camera_id: int, success: bool) -> None:
+        """
+        Update a camera's backoff after a probe.
+
+        Args:
+            camera_id: Probed camera
+            success: Whether the camera was reachable
+        """
+        if success:
+            self._backoff.pop(camera_id, None)
+            return
+
+        state = self._backoff.setdefault(camera_id, ProbeBackoff())
+        state.consecutive_failures += 1
+        state.sweeps_to_skip = min(
+            2 ** (state.consecutive_failures - 1), self.max_backoff_sweeps
+        )
+
+    async def _probe_one(self, camera: Camera, slots: asyncio.Semaphore) -> ProbeResult:
+        """Probe one camera once a slot is free; probe errors count as offline."""
+        async with slots:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(
+                    self._executor, self.probe, camera.id, camera.rtsp_url
+                )
+                success = bool(result.success)
+                error = None if success else (result.error or "Connection test failed")
+            except Exception as e:
+                success, error = False, str(e)
+
+        self._probes += 1
+        self.record(camera.id, success)
+        return ProbeResult(
+            camera_id=camera.id, camera_name=camera.name, success=success, error=error
+        )
+
+    async def run(self, cameras: Sequence[Camera]) -> List[ProbeResult]:
+        """
+        Probe every due camera, at most max_concurrent at a time.
+
+        Args:
+            cameras: All active cameras
+
+        Returns:
+            One result per probed camera; backed-off cameras are not included
+        """
+        started = time.perf_counter()
+        due = self.select_due(cameras)
+        slots = asyncio.Semaphore(self.max_concurrent)
+
+        results = list(
+            await asyncio.gather(*(self._probe_one(camera, slots) for camera in due))
+        )
+
+        self._sweeps += 1
+        self._last_sweep_probed = len(due)
+        self._last_sweep_seconds = time.perf_counter() - started
+        return results
+
+    def shutdown(self) -> None:
+        """Release the sweep thread pool without waiting for running probes."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sweep statistics for status reporting."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "sweeps": self._sweeps,
+            "probes": self._probes,
+            "skipped_by_backoff": self._skipped,
+            "cameras_backing_off": len(self._backoff),
+            "last_sweep_probed": self._last_sweep_probed,
+            "last_sweep_seconds": self._last_sweep_seconds,
+        }
@@ -0,0 +1,137 @@
+# backend/app/workers/utils/job_queue_listener.py
+"""
+JobQueueListener - Wake idle job workers as soon as a job is enqueued.
+
+Every job insert issues pg_notify(JOB_QUEUE_NOTIFY_CHANNEL, <table name>) in
+the same transaction. This listener holds one LISTEN connection per worker
+process and sets a per-table event, so job workers wait on that event instead
+of sleeping for their full polling interval. While the LISTEN connection is
+unavailable, waits simply time out and workers fall back to polling.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import psycopg
+
+from ...config import settings
+from ...constants import (
+    JOB_QUEUE_LISTENER_RECONNECT_SECONDS,
+    JOB_QUEUE_NOTIFY_CHANNEL,
+)
+from ...enums import LoggerName, LogSource
+from ...services.logger import get_service_logger
+
+logger = get_service_logger(LoggerName.SYSTEM, LogSource.WORKER)
+
+
+class JobQueueListener:
+    """
+    Process-wide LISTEN connection for the job queue channel.
+
+    Notifications that arrive while a worker is busy leave its event set, so
+    the next wait returns immediately and no wake-up is lost.
+    """
+
+    def __init__(self):
+        self._events: Dict[str, asyncio.Event] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._listening = False
+        self._notifications_received = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener task is active."""
+        return self._task is not None and not self._task.done()
+
+    def _get_event(self, table_name: str) -> asyncio.Event:
+        """Get (or create) the wake-up event for a job table."""
+        event = self._events.get(table_name)
+        if event is None:
+            event = asyncio.Event()
+            self._events[table_name] = event
+        return event
+
+    def start(self) -> None:
+        """Start listening (no-op if already running)."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._listen_loop(), name="job-queue-listener")
+
+    async def stop(self) -> None:
+        """Stop listening and release the connection."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._listening = False
+
+    async def wait_for_jobs(self, table_name: str, timeout: float) -> bool:
+        """
+        Wait until a job is enqueued in table_name or the timeout expires.
+
+        Args:
+            table_name: Job table the caller consumes
+            timeout: Maximum seconds to wait (the regular polling interval)
+
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        self.start()
+        event = self._get_event(table_name)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
+
+    async def _listen_loop(self) -> None:
+        """Keep a LISTEN connection open, reconnecting after failures."""
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    settings.database_url, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {JOB_QUEUE_NOTIFY_CHANNEL}")
+                    self._listening = True
+                    logger.debug("Job queue listener connected", store_in_db=False)
+
+                    async for notify in conn.notifies():
+                        self._notifications_received += 1
+                        self._get_event(notify.payload).set()
+
+            except asyncio.CancelledError:
+                self._listening = False
+                raise
+            except Exception as e:
+                if self._listening:
+                    logger.warning(
+                        "Job queue listener lost connection, workers fall back to polling",
+                        exception=e,
+                        store_in_db=False,
+                    )
+                self._listening = False
+
+            await asyncio.sleep(JOB_QUEUE_LISTENER_RECONNECT_SECONDS)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get listener statistics for status reporting."""
+        return {
+            "running": self.running,
+            "listening": self._listening,
+            "notifications_received": self._notifications_received,
+        }
+
+
+# Global listener for the worker process
+job_queue_listener = JobQueueListener()
+
+
+def get_job_queue_listener() -> JobQueueListener:
+    """Get the process-wide job queue listener."""
+    return job_queue_listener
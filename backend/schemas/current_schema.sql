@@ -788,6 +788,9 @@ CREATE TABLE public.timelapses (
     small_count integer DEFAULT 0 NOT NULL,
     starred boolean,
     capture_interval_seconds integer DEFAULT 300 NOT NULL,
+    flagged_image_count integer DEFAULT 0 NOT NULL,
+    total_image_bytes bigint DEFAULT 0 NOT NULL,
+    first_capture_at timestamp without time zone,
     CONSTRAINT ck_timelapses_capture_interval_range CHECK (((capture_interval_seconds >= 30) AND (capture_interval_seconds <= 86400))),
     CONSTRAINT ck_timelapses_time_window_type CHECK (((time_window_type)::text = ANY ((ARRAY['none'::character varying, 'time'::character varying, 'sunrise_sunset'::character varying])::text[]))),
     CONSTRAINT timelapses_status_check CHECK (((status)::text = ANY ((ARRAY['running'::character varying, 'paused'::character varying, 'completed'::character varying])::text[])))
@@ -830,7 +833,9 @@ CREATE TABLE public.video_generation_jobs (
     error_message text,
     video_path character varying(500),
     video_id integer,
-    settings jsonb
+    settings jsonb,
+    retry_count integer DEFAULT 0 NOT NULL,
+    updated_at timestamp with time zone DEFAULT now() NOT NULL
 );
 
 
@@ -1272,6 +1277,13 @@ CREATE INDEX idx_corruption_logs_created_at ON public.corruption_logs USING btre
 CREATE INDEX idx_corruption_logs_score ON public.corruption_logs USING btree (corruption_score);
 
 
+--
+-- Name: idx_images_camera_captured_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_images_camera_captured_id ON public.images USING btree (camera_id, captured_at DESC, id DESC);
+
+
 --
 -- Name: idx_images_camera_day; Type: INDEX; Schema: public; Owner: -
 --
@@ -1293,6 +1305,13 @@ CREATE INDEX idx_images_has_valid_overlay ON public.images USING btree (has_vali
 CREATE INDEX idx_images_overlay_updated_at ON public.images USING btree (overlay_updated_at);
 
 
+--
+-- Name: idx_images_timelapse_captured_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_images_timelapse_captured_id ON public.images USING btree (timelapse_id, captured_at DESC, id DESC);
+
+
 --
 -- Name: idx_images_timelapse; Type: INDEX; Schema: public; Owner: -
 --
@@ -1300,6 +1319,13 @@ CREATE INDEX idx_images_overlay_updated_at ON public.images USING btree (overlay
 CREATE INDEX idx_images_timelapse ON public.images USING btree (timelapse_id, day_number);
 
 
+--
+-- Name: idx_logs_timestamp_id; Type: INDEX; Schema: public; Owner: -
+--
+
+CREATE INDEX idx_logs_timestamp_id ON public.logs USING btree ("timestamp" DESC, id DESC);
+
+
 --
 -- Name: idx_one_active_timelapse_per_camera; Type: INDEX; Schema: public; Owner: -
 --
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Bulk Log Ingestion Benchmark Script
+
+Compare the multi-row INSERT ... RETURNING * path (bulk_create_logs) against
+binary COPY (copy_logs) for 1k and 10k log batches and report rows/sec.
+
+Requires DATABASE_URL to point at a migrated database. Rows written by the
+benchmark are deleted afterwards.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database.core import SyncDatabase  # noqa: E402
+from app.database.log_operations import SyncLogOperations  # noqa: E402
+from app.enums import LoggerName, LogLevel, LogSource  # noqa: E402
+from app.models.log_model import LogCreate  # noqa: E402
+
+BATCH_SIZES = [1_000, 10_000]
+ROUNDS = 3
+MESSAGE_PREFIX = "bulk-copy-benchmark"
+
+
+def build_batch(size):
+    """Log entries shaped like real worker logs."""
+    return [
+        LogCreate(
+            level=LogLevel.INFO,
+            message=f"{MESSAGE_PREFIX} entry {index}",
+            logger_name=LoggerName.SYSTEM,
+            source=LogSource.WORKER,
+            camera_id=None,
+            extra_data={"index": index, "stage": "capture", "duration_ms": 42.5},
+        )
+        for index in range(size)
+    ]
+
+
+def measure(write, batch):
+    """Best rows/sec of write(batch) over ROUNDS runs, or the error message."""
+    best = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        try:
+            write(batch)
+        except Exception as e:
+            return f"failed ({type(e).__name__}: {e})"
+        best = max(best, len(batch) / (time.perf_counter() - start))
+    return best
+
+
+def cleanup(db):
+    """Remove rows written by the benchmark."""
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "DELETE FROM logs WHERE message LIKE %s", (f"{MESSAGE_PREFIX} %",)
+            )
+            return cur.rowcount
+
+
+def main():
+    """Run the bulk ingestion benchmark."""
+    print("=" * 80)
+    print("BULK LOG INGESTION BENCHMARK")
+    print("=" * 80)
+
+    db = SyncDatabase()
+    db.initialize()
+    log_ops = SyncLogOperations(db)
+
+    try:
+        for size in BATCH_SIZES:
+            batch = build_batch(size)
+            insert_rate = measure(log_ops.bulk_create_logs, batch)
+            copy_rate = measure(log_ops.copy_logs, batch)
+
+            print(f"\n📦 Batch of {size:,} logs (best of {ROUNDS})")
+            for label, rate in (
+                ("INSERT ... RETURNING *", insert_rate),
+                ("COPY (binary)", copy_rate),
+            ):
+                if isinstance(rate, float):
+                    print(f"   {label:<24} {rate:12,.0f} rows/s")
+                else:
+                    print(f"   {label:<24} {rate}")
+            if isinstance(insert_rate, float) and isinstance(copy_rate, float):
+                print(f"   Speedup: {copy_rate / insert_rate:.1f}x")
+    finally:
+        print(f"\n🧹 Removed {cleanup(db):,} benchmark rows")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Overlay Compositor Benchmark Script
+
+Compare dirty-rectangle overlay compositing against the full-frame
+alpha_composite path on a typical overlay layout and report throughput.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageChops  # noqa: E402
+
+from app.services.overlay_pipeline.utils.dirty_rect_compositor import (  # noqa: E402
+    DirtyRectCompositor,
+)
+
+RESOLUTIONS = {"1080p": (1920, 1080), "4K": (3840, 2160)}
+ITERATIONS = 20
+OPACITY = 80
+
+
+def build_compositor(frame_size):
+    """Four corner text-sized boxes plus a watermark, like a common preset."""
+    width, height = frame_size
+    compositor = DirtyRectCompositor(frame_size)
+    boxes = [
+        (20, 20, 520, 80),
+        (width - 420, 20, width - 20, 80),
+        (20, height - 80, 380, height - 20),
+        (width - 340, height - 80, width - 20, height - 20),
+        (width // 2 - 128, height // 2 - 128, width // 2 + 128, height // 2 + 128),
+    ]
+    for box in boxes:
+
+        def draw_element(_target, draw, offset_x, offset_y, box=box):
+            draw.rectangle(
+                (
+                    box[0] - offset_x,
+                    box[1] - offset_y,
+                    box[2] - 1 - offset_x,
+                    box[3] - 1 - offset_y,
+                ),
+                fill=(255, 255, 255, 200),
+            )
+
+        compositor.add(box, draw_element)
+    return compositor
+
+
+def measure(render, iterations):
+    """Frames per second of render() over iterations runs."""
+    render()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return iterations / (time.perf_counter() - start)
+
+
+def main():
+    """Run the compositor benchmark."""
+    print("=" * 80)
+    print("OVERLAY COMPOSITOR BENCHMARK")
+    print("=" * 80)
+
+    for label, frame_size in RESOLUTIONS.items():
+        base = Image.new("RGBA", frame_size, (40, 90, 140, 255))
+        compositor = build_compositor(frame_size)
+
+        expected = compositor.composite_full_frame(base, OPACITY)
+        actual = compositor.composite(base.copy(), OPACITY)
+        identical = ImageChops.difference(expected, actual).getbbox() is None
+
+        full_fps = measure(
+            lambda: compositor.composite_full_frame(base, OPACITY), ITERATIONS
+        )
+        dirty_fps = measure(
+            lambda: compositor.composite(base.copy(), OPACITY), ITERATIONS
+        )
+
+        print(f"\n📐 {label} ({frame_size[0]}x{frame_size[1]})")
+        print(f"   Full-frame alpha_composite: {full_fps:8.1f} frames/s")
+        print(f"   Dirty-rectangle compositor: {dirty_fps:8.1f} frames/s")
+        print(f"   Speedup: {dirty_fps / full_fps:.1f}x")
+        print(f"   Pixel-identical: {'✅' if identical else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,13 @@ Pytest configuration and shared fixtures for Timelapser v4 tests.
 """
 
 import asyncio
+import importlib
+import re
 import time
+from contextlib import ExitStack
 from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -15,6 +20,25 @@ from app.utils.cache_manager import MemoryCache
 from backend.app.enums import ThumbnailJobPriority
 
 
+@pytest.fixture(autouse=True)
+def quiet_loggers(request):
+    """
+    Replace the database-backed loggers listed in a test module's QUIET_LOGGERS.
+
+    Entries are modules (or dotted module paths) whose ``logger`` is patched,
+    or (module, attribute) pairs for loggers with another name.
+    """
+    with ExitStack() as stack:
+        for target in getattr(request.module, "QUIET_LOGGERS", ()):
+            module, attribute = (
+                target if isinstance(target, tuple) else (target, "logger")
+            )
+            if isinstance(module, str):
+                module = importlib.import_module(module)
+            stack.enter_context(patch.object(module, attribute, MagicMock()))
+        yield
+
+
 @pytest.fixture
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -1248,3 +1272,28 @@ def assert_overlay_configuration_valid(config):
         color = config["text_color"]
         assert isinstance(color, str)
         assert color.startswith("#") and len(color) == 7  # Basic hex color validation
+
+
+# ====================================================================
+# DATABASE SCHEMA TEST FIXTURES
+# ====================================================================
+
+SCHEMA_FILE = Path(__file__).parents[1] / "schemas" / "current_schema.sql"
+
+
+@pytest.fixture(scope="session")
+def schema_columns():
+    """Provide a lookup of table name -> column names from the schema dump."""
+    schema = SCHEMA_FILE.read_text()
+
+    def columns(table_name: str) -> set:
+        body = re.search(
+            rf"CREATE TABLE public\.{table_name} \((.*?)\n\);", schema, re.S
+        ).group(1)
+        return {
+            line.split()[0]
+            for line in body.splitlines()
+            if line.strip() and not line.strip().startswith("CONSTRAINT")
+        }
+
+    return columns
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Unit tests for binary COPY bulk ingestion.
+
+A recording stand-in for psycopg's Copy object captures the declared types
+and the rows written, so the tests check row layout and timestamp handling
+without a server.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg import adapters
+
+from app.database.bulk_copy import (
+    CORRUPTION_LOGS_COPY_TABLE,
+    LOGS_COPY_TABLE,
+    SSE_EVENTS_COPY_TABLE,
+    CopyTable,
+    build_copy_query,
+    copy_rows_sync,
+)
+from app.database.corruption_operations import SyncCorruptionOperations
+from app.database.log_operations import SyncLogOperations
+from app.enums import LoggerName, LogLevel, LogSource
+from app.models.log_model import LogCreate
+
+SESSION_TIMEZONE = timezone(timedelta(hours=-5))
+
+
+class RecordingCopy:
+    """Collects what would be streamed to the server."""
+
+    def __init__(self):
+        self.types = None
+        self.rows = []
+
+    def set_types(self, types):
+        self.types = types
+
+    def write_row(self, row):
+        self.rows.append(tuple(row))
+
+
+@pytest.fixture
+def recording_db():
+    """Mock sync database whose cursor records COPY statements and rows."""
+    db = MagicMock()
+    cur = (
+        db.get_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cur.connection.info.timezone = SESSION_TIMEZONE
+    db.copies = []
+
+    @contextmanager
+    def copy(statement):
+        recorder = RecordingCopy()
+        db.copies.append((statement, recorder))
+        yield recorder
+
+    cur.copy.side_effect = copy
+    return db
+
+
+@pytest.mark.unit
+class TestCopyTables:
+    """Test table descriptions and the COPY statement."""
+
+    @pytest.mark.parametrize(
+        "target", [LOGS_COPY_TABLE, SSE_EVENTS_COPY_TABLE, CORRUPTION_LOGS_COPY_TABLE]
+    )
+    def test_types_are_known_to_psycopg(self, target):
+        """Every declared type resolves without a server round trip."""
+        assert all(adapters.types.get(type_name) for type_name in target.types)
+
+    def test_copy_query_is_binary_with_quoted_columns(self):
+        """Reserved column names such as timestamp are quoted."""
+        query = build_copy_query(LOGS_COPY_TABLE)
+
+        assert query.startswith('COPY logs ("level", "message"')
+        assert '"timestamp")' in query
+        assert query.endswith("FROM STDIN (FORMAT BINARY)")
+
+    def test_mismatched_description_is_rejected(self):
+        """Columns and types must pair up."""
+        with pytest.raises(ValueError, match="2 columns but 1 types"):
+            CopyTable("logs", ("level", "message"), ("text",))
+
+
+@pytest.mark.unit
+class TestCopyRows:
+    """Test rows written through COPY."""
+
+    def test_aware_timestamps_use_session_time_zone(self, recording_db):
+        """timestamp columns get the wall-clock time an INSERT would store."""
+        cur = recording_db.get_connection().__enter__().cursor().__enter__()
+        aware = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+        count = copy_rows_sync(
+            cur,
+            LOGS_COPY_TABLE,
+            [("INFO", "hello", "system", "system", None, None, aware)],
+        )
+
+        _, recorder = recording_db.copies[0]
+        assert count == 1
+        assert recorder.types == list(LOGS_COPY_TABLE.types)
+        assert recorder.rows[0][6] == datetime(2025, 6, 1, 7, 0)
+
+    def test_copy_logs_skips_returning(self, recording_db):
+        """The batching path streams rows and reads nothing back."""
+        entries = [
+            LogCreate(
+                level=LogLevel.WARNING,
+                message=f"entry {index}",
+                logger_name=LoggerName.SYSTEM,
+                source=LogSource.SYSTEM,
+                extra_data={"index": index} if index else {},
+            )
+            for index in range(3)
+        ]
+
+        written = SyncLogOperations(recording_db).copy_logs(entries)
+
+        statement, recorder = recording_db.copies[0]
+        assert written == 3
+        assert statement.startswith("COPY logs")
+        assert [row[0] for row in recorder.rows] == ["WARNING"] * 3
+        assert [row[5] for row in recorder.rows] == [None, {"index": 1}, {"index": 2}]
+        assert all(row[6].tzinfo is None for row in recorder.rows)
+        cur = recording_db.get_connection().__enter__().cursor().__enter__()
+        cur.execute.assert_not_called()
+        cur.fetchall.assert_not_called()
+
+    def test_corruption_detections_are_copied(self, recording_db):
+        """Detections keep their details as jsonb and share one created_at."""
+        detections = [
+            {
+                "camera_id": 1,
+                "corruption_score": score,
+                "fast_score": score,
+                "detection_details": {"score": score},
+                "action_taken": "saved",
+                "processing_time_ms": 12,
+            }
+            for score in (10, 90)
+        ]
+
+        written = SyncCorruptionOperations(recording_db).log_corruption_detections(
+            detections
+        )
+
+        _, recorder = recording_db.copies[0]
+        assert written == 2
+        assert [row[2] for row in recorder.rows] == [10, 90]
+        assert recorder.rows[0][5] == {"score": 10}
+        assert recorder.rows[0][8] == recorder.rows[1][8]
+        assert recorder.rows[0][8].tzinfo is not None
+
+    def test_empty_batches_do_not_connect(self, recording_db):
+        """Nothing to write means no connection is taken."""
+        assert SyncLogOperations(recording_db).copy_logs([]) == 0
+        assert SyncCorruptionOperations(recording_db).log_corruption_detections([]) == 0
+        recording_db.get_connection.assert_not_called()
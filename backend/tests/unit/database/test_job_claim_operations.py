@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for JobClaimQueryBuilder.
+
+Tests the atomic claim query shared by all job queue tables: SKIP LOCKED
+claiming, visibility-timeout reclaim, table whitelisting and NOTIFY params.
+"""
+
+import re
+from datetime import timedelta
+
+import pytest
+
+from app.constants import DEFAULT_OVERLAY_MAX_RETRIES, JOB_QUEUE_NOTIFY_CHANNEL
+from app.database.job_claim_operations import JobClaimQueryBuilder
+from app.enums import JobStatus
+
+
+def query_identifiers(query: str) -> set:
+    """Lowercase identifiers in a query (keywords are uppercase)."""
+    query = re.sub(r"%\(\w+\)s|'[^']*'", "", query)
+    return set(re.findall(r"\b[a-z_]+\b", query))
+
+
+@pytest.mark.unit
+class TestJobClaimQueryBuilder:
+    """Test suite for JobClaimQueryBuilder."""
+
+    def test_claim_query_skips_locked_rows(self):
+        """Claim query locks candidate rows without blocking other workers."""
+        query = JobClaimQueryBuilder.build_claim_jobs_query("thumbnail_generation_jobs")
+
+        assert "FOR UPDATE SKIP LOCKED" in query
+        assert "UPDATE thumbnail_generation_jobs" in query
+        assert "RETURNING *" in query
+
+    def test_claim_query_reclaims_expired_processing_jobs(self):
+        """Processing jobs past the visibility timeout are claimable again."""
+        query = JobClaimQueryBuilder.build_claim_jobs_query("overlay_generation_jobs")
+
+        assert "started_at < %(visibility_cutoff)s" in query
+        assert "created_at <= %(now)s" in query
+
+    def test_updated_at_only_for_tables_that_have_it(self):
+        """Only video jobs carry an updated_at column."""
+        video_query = JobClaimQueryBuilder.build_claim_jobs_query(
+            "video_generation_jobs"
+        )
+        thumbnail_query = JobClaimQueryBuilder.build_claim_jobs_query(
+            "thumbnail_generation_jobs"
+        )
+
+        assert "updated_at = %(now)s" in video_query
+        assert "updated_at" not in thumbnail_query
+
+    @pytest.mark.parametrize("table_name", JobClaimQueryBuilder.CLAIMABLE_JOB_TABLES)
+    def test_claim_query_columns_exist(self, table_name, schema_columns):
+        """Every column the claim query touches exists in the schema."""
+        query = JobClaimQueryBuilder.build_claim_jobs_query(table_name)
+        columns = query_identifiers(query) - {table_name, "claimed"}
+
+        assert columns <= schema_columns(table_name)
+
+    def test_rejects_unknown_tables(self):
+        """Table names outside the whitelist are rejected."""
+        with pytest.raises(ValueError):
+            JobClaimQueryBuilder.build_claim_jobs_query("images; DROP TABLE images")
+
+        with pytest.raises(ValueError):
+            JobClaimQueryBuilder.get_notify_params("cameras")
+
+    def test_claim_params(self):
+        """Visibility cutoff is the visibility timeout before now."""
+        params = JobClaimQueryBuilder.build_claim_params(
+            "overlay_generation_jobs", batch_size=3, visibility_timeout_seconds=600
+        )
+
+        assert params["limit"] == 3
+        assert params["pending"] == JobStatus.PENDING
+        assert params["processing"] == JobStatus.PROCESSING
+        assert params["failed"] == JobStatus.FAILED
+        assert params["max_retries"] == DEFAULT_OVERLAY_MAX_RETRIES
+        assert params["now"] - params["visibility_cutoff"] == timedelta(seconds=600)
+
+    def test_reclaim_counts_as_retry(self):
+        """Reclaiming an expired job increments retry_count."""
+        query = JobClaimQueryBuilder.build_claim_jobs_query("video_generation_jobs")
+
+        assert "THEN retry_count + 1 ELSE retry_count END" in query
+
+    def test_exhausted_reclaims_are_failed_not_returned(self):
+        """Expired jobs at the retry limit are failed and filtered from the claim."""
+        query = JobClaimQueryBuilder.build_claim_jobs_query("thumbnail_generation_jobs")
+
+        assert "retry_count >= %(max_retries)s" in query
+        assert "THEN %(failed)s ELSE %(processing)s END" in query
+        assert "WHERE status = %(processing)s\n            ORDER BY" in query
+
+    def test_notify_params(self):
+        """NOTIFY payload is the job table name."""
+        assert JobClaimQueryBuilder.get_notify_params("video_generation_jobs") == (
+            JOB_QUEUE_NOTIFY_CHANNEL,
+            "video_generation_jobs",
+        )
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit tests for keyset (cursor) pagination of images and logs.
+
+Cursor pages seek on (timestamp, id) instead of skipping rows with OFFSET,
+so the queries must carry the row-value predicate, the id tiebreak and no
+OFFSET clause.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Importing image_operations first hits the app.services circular import;
+# loading the workers package first initializes app.services in a working order
+import app.workers  # noqa: F401
+from app.database.image_operations import ImageQueryBuilder, SyncImageOperations
+from app.database.log_operations import LogOperations, LogQueryBuilder
+from app.utils.pagination_helpers import decode_cursor, encode_cursor
+
+CURSOR = (datetime(2025, 6, 1, 12, 0, 5), 42)
+
+
+def image_row(image_id, captured_at):
+    """Minimal images row as returned by dict_row."""
+    return {
+        "id": image_id,
+        "camera_id": 2,
+        "timelapse_id": 3,
+        "file_path": f"{image_id}.jpg",
+        "captured_at": captured_at,
+        "day_number": 1,
+        "created_at": captured_at,
+    }
+
+
+def log_row(log_id, timestamp):
+    """Minimal logs row as returned by dict_row."""
+    return {
+        "id": log_id,
+        "level": "INFO",
+        "message": f"log {log_id}",
+        "timestamp": timestamp,
+        "camera_id": None,
+        "camera_name": None,
+        "logger_name": "system",
+        "source": "system",
+        "extra_data": None,
+    }
+
+
+@pytest.mark.unit
+class TestCursorTokens:
+    """Test the opaque cursor encoding."""
+
+    def test_round_trip(self):
+        """A token decodes to the position it was made from."""
+        token = encode_cursor(*CURSOR)
+
+        assert "=" not in token
+        assert decode_cursor(token) == CURSOR
+
+    @pytest.mark.parametrize(
+        "token", ["", "not-a-cursor", encode_cursor(CURSOR[0], 1)[:-3]]
+    )
+    def test_invalid_tokens_raise_value_error(self, token):
+        """Malformed tokens are rejected rather than silently restarting."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(token)
+
+
+@pytest.mark.unit
+class TestImageKeysetQueries:
+    """Test cursor handling in the image query builder and operations."""
+
+    def test_offset_query_orders_with_id_tiebreak(self):
+        """Offset pages order by captured_at with id to stay stable."""
+        query, params = ImageQueryBuilder.build_images_query(
+            timelapse_id=3, limit=50, offset=100
+        )
+
+        assert "ORDER BY i.captured_at DESC, i.id DESC" in query
+        assert params["offset"] == 100
+
+    def test_after_cursor_seeks_without_offset(self):
+        """Pages after a cursor use a row-value predicate instead of OFFSET."""
+        query, params = ImageQueryBuilder.build_images_query(
+            timelapse_id=3, limit=51, offset=500, after=CURSOR
+        )
+
+        assert (
+            "(i.captured_at, i.id) < (%(cursor_captured_at)s, %(cursor_id)s)" in query
+        )
+        assert "ORDER BY i.captured_at DESC, i.id DESC" in query
+        assert "OFFSET" not in query and "offset" not in params
+        assert (params["cursor_captured_at"], params["cursor_id"]) == CURSOR
+
+    def test_before_cursor_walks_backwards(self):
+        """Pages before a cursor flip both the comparison and the order."""
+        query, _ = ImageQueryBuilder.build_images_query(
+            camera_id=2, limit=51, before=CURSOR
+        )
+
+        assert (
+            "(i.captured_at, i.id) > (%(cursor_captured_at)s, %(cursor_id)s)" in query
+        )
+        assert "ORDER BY i.captured_at ASC, i.id ASC" in query
+
+    def test_before_page_is_returned_in_listing_order(self):
+        """Rows fetched backwards are flipped to newest first."""
+        db = MagicMock()
+        cursor = (
+            db.get_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        )
+        base = CURSOR[0]
+        cursor.fetchall.return_value = [
+            image_row(43, base + timedelta(seconds=1)),
+            image_row(44, base + timedelta(seconds=2)),
+        ]
+
+        images = SyncImageOperations(db).get_images(
+            limit=2, timelapse_id=3, before=CURSOR
+        )
+
+        assert [image.id for image in images] == [44, 43]
+
+
+@pytest.mark.unit
+class TestLogKeysetQueries:
+    """Test cursor handling for the logs listing."""
+
+    def test_keyset_query_has_no_offset_or_window(self):
+        """Cursor pages skip OFFSET and the count CTE."""
+        query = LogQueryBuilder.build_filtered_logs_query(
+            ["l.level = %(level)s"], use_offset=False
+        )
+
+        assert "OFFSET" not in query
+        assert "COUNT(*)" not in query and "ROW_NUMBER" not in query
+        assert "ORDER BY l.timestamp DESC, l.id DESC" in query
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_reports_next_cursor(self):
+        """An extra row signals another page; the cursor is the last log shown."""
+        db, connection, cursor = MagicMock(), MagicMock(), AsyncMock()
+        db.get_connection.return_value.__aenter__.return_value = connection
+        connection.cursor.return_value.__aenter__.return_value = cursor
+        base = CURSOR[0]
+        cursor.fetchall.return_value = [
+            log_row(41 - offset, base - timedelta(seconds=offset + 1))
+            for offset in range(3)
+        ]
+
+        result = await LogOperations(db)._get_logs_by_cursor(
+            [], {}, 2, CURSOR, None, include_total=False
+        )
+
+        query, params = cursor.execute.call_args[0]
+        assert "(l.timestamp, l.id) < (%(cursor_timestamp)s, %(cursor_id)s)" in query
+        assert params["limit"] == 3
+        assert cursor.execute.await_count == 1
+        assert [log.id for log in result["logs"]] == [41, 40]
+        pagination = result["pagination"]
+        assert pagination["has_next"] and pagination["has_prev"]
+        assert pagination["total_count"] is None
+        assert decode_cursor(pagination["next_cursor"]) == (
+            base - timedelta(seconds=2),
+            40,
+        )
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-timelapse image counters.
+
+Image inserts and deletes keep timelapses.image_count and friends current in
+the same statement, count reads use the counters, and drift is repaired by a
+single reconcile UPDATE.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.database.image_operations import ImageQueryBuilder, SyncImageOperations
+from app.database.timelapse_operations import SyncTimelapseOperations
+
+
+@pytest.fixture
+def sync_db():
+    """Mock sync database whose cursor is exposed as db.cursor."""
+    db = MagicMock()
+    db.cursor = (
+        db.get_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    return db
+
+
+@pytest.mark.unit
+class TestImageCounterQueries:
+    """Counters are maintained by the image insert/delete statements."""
+
+    def test_record_query_bumps_counters(self):
+        """Insert and counter update run as one data-modifying CTE."""
+        query = ImageQueryBuilder.build_record_image_query()
+
+        assert "INSERT INTO images" in query
+        assert "UPDATE timelapses t" in query
+        assert "image_count = t.image_count + 1" in query
+        assert "total_image_bytes = t.total_image_bytes + COALESCE" in query
+        assert query.strip().endswith("SELECT * FROM new_image")
+
+    def test_delete_query_decrements_and_recomputes_bounds(self):
+        """Deletes decrement counters and exclude deleted rows from bounds."""
+        query = ImageQueryBuilder.build_delete_images_query("id = %(image_id)s")
+
+        assert "DELETE FROM images" in query
+        assert "WHERE id = %(image_id)s" in query
+        assert "GREATEST(t.image_count - r.image_count, 0)" in query
+        assert "NOT EXISTS (SELECT 1 FROM deleted d WHERE d.id = i.id)" in query
+        assert "AS deleted_count" in query
+
+    def test_record_is_single_execute(self, sync_db):
+        """Recording an image costs one round trip."""
+        sync_db.cursor.fetchone.return_value = {
+            "id": 1,
+            "camera_id": 2,
+            "timelapse_id": 3,
+            "file_path": "a.jpg",
+            "captured_at": datetime(2025, 6, 1, 12, 0),
+            "day_number": 1,
+            "created_at": datetime(2025, 6, 1, 12, 0),
+        }
+
+        image = SyncImageOperations(sync_db).record_captured_image({"timelapse_id": 3})
+
+        assert image.id == 1
+        sync_db.cursor.execute.assert_called_once()
+        assert "UPDATE timelapses t" in sync_db.cursor.execute.call_args[0][0]
+
+    def test_cleanup_returns_deleted_count(self, sync_db):
+        """Cleanup reads the count from the statement result."""
+        sync_db.cursor.fetchone.return_value = {"deleted_count": 4}
+
+        assert SyncImageOperations(sync_db).cleanup_old_images(30) == 4
+        sync_db.cursor.execute.assert_called_once()
+
+
+@pytest.mark.unit
+class TestCounterReads:
+    """Hot-path counts read the timelapse row instead of scanning images."""
+
+    def test_image_count_reads_counter(self, sync_db):
+        """Both count helpers hit timelapses, not images."""
+        sync_db.cursor.fetchone.return_value = {"image_count": 7, "count": 7}
+
+        assert SyncImageOperations(sync_db).get_image_count_by_timelapse(3) == 7
+        assert SyncTimelapseOperations(sync_db).get_timelapse_image_count(3) == 7
+
+        for call in sync_db.cursor.execute.call_args_list:
+            assert "FROM timelapses" in call[0][0]
+            assert "images" not in call[0][0]
+
+    def test_reconcile_is_one_statement(self, sync_db):
+        """Reconcile repairs all drifted rows with a single UPDATE."""
+        sync_db.cursor.fetchall.return_value = [{"id": 3}, {"id": 5}]
+
+        corrected = SyncTimelapseOperations(sync_db).reconcile_image_counters([3, 5])
+
+        assert corrected == 2
+        sync_db.cursor.execute.assert_called_once()
+        query, params = sync_db.cursor.execute.call_args[0]
+        assert "IS DISTINCT FROM" in query
+        assert "t.id = ANY(%(timelapse_ids)s)" in query
+        assert params == {"timelapse_ids": [3, 5]}
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit tests for video generation job heartbeats.
+
+Rendering workers touch updated_at so the claim query does not reclaim long
+renders, and read back the status to pick up cancellations.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+# Importing video_operations first hits the app.services circular import;
+# loading the workers package first initializes app.services in a working order
+import app.workers  # noqa: F401
+from app.database.video_operations import SyncVideoOperations
+
+
+@pytest.fixture
+def sync_db():
+    """Mock sync database whose cursor is exposed as db.cursor."""
+    db = MagicMock()
+    db.cursor = (
+        db.get_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    return db
+
+
+@pytest.mark.unit
+class TestVideoJobHeartbeat:
+    """Test heartbeat and status writes on video_generation_jobs."""
+
+    def test_heartbeat_returns_current_status(self, sync_db):
+        """The heartbeat reports the job status so cancellations are seen."""
+        sync_db.cursor.fetchone.return_value = {"status": "cancelled"}
+
+        status = SyncVideoOperations(sync_db).heartbeat_video_generation_job(5)
+
+        query, params = sync_db.cursor.execute.call_args.args
+        assert status == "cancelled"
+        assert "SET updated_at = %s" in query
+        assert "RETURNING status" in query
+        assert params[1] == 5
+
+    def test_heartbeat_of_missing_job(self, sync_db):
+        """A deleted job has no status."""
+        sync_db.cursor.fetchone.return_value = None
+
+        assert SyncVideoOperations(sync_db).heartbeat_video_generation_job(5) is None
+
+    def test_video_jobs_have_heartbeat_columns(self, schema_columns):
+        """Heartbeats and status updates write columns that exist."""
+        assert {"updated_at", "status"} <= schema_columns("video_generation_jobs")
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_capture_commit.py
+"""
+Unit tests for the pipelined capture commit.
+
+The database mock records the statements sent on the pipeline connection,
+so the tests check that a capture issues its writes on one connection, in
+order, with later statements referencing new ids through currval().
+"""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import psycopg
+import pytest
+
+# Importing app.services.capture_pipeline first hits the app.services circular
+# import; loading the workers package first initializes it in a working order
+import app.workers  # noqa: F401
+from app.constants import SSE_NOTIFY_CHANNEL
+from app.database.exceptions import ImageOperationError
+from app.database.sse_events_operations import SSEEventQueryBuilder
+from app.services.capture_pipeline import capture_transaction_manager as tx_module
+from app.services.capture_pipeline import (
+    workflow_orchestrator_service as orchestrator_module,
+)
+from app.services.capture_pipeline.capture_context import build_capture_context
+from app.services.capture_pipeline.capture_transaction_manager import (
+    CaptureTransactionManager,
+)
+from app.services.capture_pipeline.workflow_orchestrator_service import (
+    WorkflowOrchestratorService,
+)
+
+IMAGE_ROW = {
+    "id": 99,
+    "camera_id": 3,
+    "timelapse_id": 7,
+    "file_path": "frames/x.jpg",
+    "day_number": 10,
+    "captured_at": datetime(2025, 6, 10, 12, 0),
+    "created_at": datetime(2025, 6, 10, 12, 0),
+}
+
+
+QUIET_LOGGERS = [orchestrator_module, tx_module]
+
+
+@pytest.fixture
+def pipeline_db():
+    """Mock sync database recording statements sent in pipeline mode."""
+    db = MagicMock()
+    conn = db.get_pipeline_connection.return_value.__enter__.return_value
+    db.statements = []
+
+    def execute(query, params):
+        db.statements.append((query, params))
+        cur = MagicMock()
+        if "INSERT INTO thumbnail_generation_jobs" in query:
+            cur.fetchone.return_value = {"id": 501}
+        else:
+            cur.fetchone.return_value = dict(IMAGE_ROW)
+        return cur
+
+    conn.execute.side_effect = execute
+    return db
+
+
+def capture_context():
+    """Capture context for timelapse 7 on camera 3 with 41 images."""
+    return build_capture_context(
+        {
+            "id": 7,
+            "camera_id": 3,
+            "name": "Garden",
+            "status": "running",
+            "start_date": date(2025, 6, 1),
+            "image_count": 41,
+            "created_at": datetime(2025, 6, 1, 8, 0),
+            "updated_at": datetime(2025, 6, 1, 8, 0),
+            "camera": {
+                "id": 3,
+                "name": "Garden cam",
+                "rtsp_url": "rtsp://192.168.1.10/stream",
+                "status": "active",
+                "created_at": "2025-05-01T08:00:00",
+                "updated_at": "2025-05-01T08:00:00",
+            },
+            "settings": {"timezone": "UTC"},
+        }
+    )
+
+
+def run_capture(db, tmp_path, thumbnails_enabled=True):
+    """Run the workflow with a successful grab written to tmp_path."""
+    services = {
+        name: MagicMock()
+        for name in (
+            "image_service",
+            "corruption_evaluation_service",
+            "camera_service",
+            "timelapse_service",
+            "rtsp_service",
+            "job_coordinator",
+            "sse_ops",
+            "settings_service",
+        )
+    }
+    captured_file = tmp_path / "capture.jpg"
+    captured_file.write_bytes(b"jpeg")
+    services["rtsp_service"].capture_and_process_frame.return_value = {
+        "success": True,
+        "file_size": 1024,
+    }
+    services["job_coordinator"].check_thumbnail_generation_enabled.return_value = (
+        thumbnails_enabled
+    )
+    services["camera_service"].determine_camera_health_status.return_value = "online"
+    orchestrator = WorkflowOrchestratorService(db=db, **services)
+
+    with patch.object(
+        orchestrator_module, "ensure_entity_directory", return_value=tmp_path
+    ), patch.object(
+        orchestrator_module, "generate_capture_filename", return_value="capture.jpg"
+    ), patch.object(
+        orchestrator_module, "get_relative_path", return_value="frames/x.jpg"
+    ):
+        result = orchestrator.execute_capture_workflow(
+            3, 7, {"source": "scheduler"}, capture_context()
+        )
+    return result, services, captured_file
+
+
+@pytest.mark.unit
+class TestCommitWrites:
+    """Test the transaction manager's pipelined commit."""
+
+    def test_writes_share_one_pipeline_connection(self, pipeline_db):
+        """Queued writes run in order; only returns_row writes are kept."""
+        manager = CaptureTransactionManager(pipeline_db)
+
+        with manager.capture_transaction(camera_id=3) as transaction:
+            transaction.add_write("first", "INSERT 1", {"a": 1}, returns_row=True)
+            transaction.add_write("second", "UPDATE 2", ("b",))
+
+        assert pipeline_db.get_pipeline_connection.call_count == 1
+        pipeline_db.get_connection.assert_not_called()
+        assert pipeline_db.statements == [("INSERT 1", {"a": 1}), ("UPDATE 2", ("b",))]
+        assert transaction.results == {"first": IMAGE_ROW}
+        assert transaction.committed and transaction.writes == []
+
+    def test_failed_commit_removes_captured_file(self, pipeline_db, tmp_path):
+        """A database error rolls back the files of the capture."""
+        captured_file = tmp_path / "capture.jpg"
+        captured_file.write_bytes(b"jpeg")
+        rollback = MagicMock()
+        conn = pipeline_db.get_pipeline_connection.return_value.__enter__.return_value
+        conn.execute.side_effect = psycopg.OperationalError("connection lost")
+        manager = CaptureTransactionManager(pipeline_db)
+
+        with pytest.raises(ImageOperationError, match="commit_capture_writes"):
+            with manager.capture_transaction(camera_id=3) as transaction:
+                transaction.file_path = captured_file
+                transaction.add_rollback_action(rollback)
+                transaction.add_write("image", "INSERT", {}, returns_row=True)
+
+        assert not captured_file.exists()
+        rollback.assert_called()
+        assert not transaction.committed
+
+
+@pytest.mark.unit
+class TestCaptureCommit:
+    """Test the orchestrator's single capture commit."""
+
+    def test_capture_writes_are_committed_together(self, pipeline_db, tmp_path):
+        """Image, thumbnail job, events and camera stats go out in one commit."""
+        result, services, captured_file = run_capture(pipeline_db, tmp_path)
+
+        assert result.success and result.image_id == 99
+        assert result.metadata["image_count"] == 42
+        assert result.metadata["background_jobs"]["thumbnail_job"] == 501
+        assert captured_file.exists()
+        assert pipeline_db.get_pipeline_connection.call_count == 1
+        pipeline_db.get_connection.assert_not_called()
+        services["image_service"].record_captured_image.assert_not_called()
+        services["job_coordinator"].coordinate_thumbnail_job.assert_not_called()
+        services["sse_ops"].create_event.assert_not_called()
+
+        queries = [query for query, _ in pipeline_db.statements]
+        assert "INSERT INTO images" in queries[0]
+        assert "VALUES (currval(pg_get_serial_sequence('images', 'id'))" in queries[1]
+        job_event, image_event = (q for q in queries if "INSERT INTO sse_events" in q)
+        assert (
+            "'job_id', currval(pg_get_serial_sequence('thumbnail_generation_jobs'"
+            in (job_event)
+        )
+        assert "'image_id', currval(pg_get_serial_sequence('images', 'id'))" in (
+            image_event
+        )
+        assert "'captured_at', (SELECT captured_at FROM images WHERE id = currval(" in (
+            image_event
+        )
+        notifies = [
+            params for query, params in pipeline_db.statements if "pg_notify" in query
+        ]
+        assert notifies[-1] == (SSE_NOTIFY_CHANNEL,)
+        assert len(notifies) == 2
+        assert "last_capture_success = true" in queries[-1]
+        assert pipeline_db.statements[-1][1]["health_status"] == "online"
+
+    def test_disabled_thumbnails_queue_no_job(self, pipeline_db, tmp_path):
+        """Without thumbnail generation only the image, event and stats are written."""
+        result, _, _ = run_capture(pipeline_db, tmp_path, thumbnails_enabled=False)
+
+        queries = [query for query, _ in pipeline_db.statements]
+        assert result.success
+        assert result.metadata["background_jobs"]["total_jobs_queued"] == 0
+        assert not any("thumbnail_generation_jobs" in query for query in queries)
+        assert sum("INSERT INTO sse_events" in query for query in queries) == 1
+
+    def test_failed_commit_fails_capture_and_removes_file(self, pipeline_db, tmp_path):
+        """A failed commit leaves neither an image row nor the captured file."""
+        conn = pipeline_db.get_pipeline_connection.return_value.__enter__.return_value
+        conn.execute.side_effect = psycopg.OperationalError("connection lost")
+
+        result, _, captured_file = run_capture(pipeline_db, tmp_path)
+
+        assert not result.success
+        assert result.error == "Database record creation failed"
+        assert not captured_file.exists()
+
+    def test_quality_retry_runs_after_discarded_capture_commits(
+        self, pipeline_db, tmp_path
+    ):
+        """A retry starts only once the discarded capture's writes are committed."""
+
+        def evaluate(capture_transaction=None, **kwargs):
+            capture_transaction.add_write("corruption_log", "INSERT corruption", {})
+            return {
+                "should_discard": True,
+                "retry_recommended": True,
+                "reason": "corrupted",
+                "final_score": 10.0,
+            }
+
+        committed_before_retry = []
+
+        def retry(*args):
+            committed_before_retry.append(list(pipeline_db.statements))
+            raise RuntimeError("retry failed")
+
+        with patch.object(
+            WorkflowOrchestratorService, "_evaluate_image_quality", side_effect=evaluate
+        ), patch.object(
+            WorkflowOrchestratorService, "_retry_capture_workflow", side_effect=retry
+        ), patch.object(
+            WorkflowOrchestratorService, "_cleanup_discarded_image"
+        ):
+            result, _, _ = run_capture(pipeline_db, tmp_path)
+
+        assert not result.success
+        assert committed_before_retry == [[("INSERT corruption", {})]]
+        assert pipeline_db.statements == [("INSERT corruption", {})]
+
+    def test_event_query_merges_computed_fields(self):
+        """Computed event fields are merged into the JSON payload in SQL."""
+        query = SSEEventQueryBuilder.build_insert_event_query({"image_id": "42"})
+
+        assert "%(event_data)s::jsonb || jsonb_build_object('image_id', 42)" in query
+        assert "RETURNING" not in query
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_capture_context.py
+"""
+Unit tests for the capture context snapshot.
+"""
+
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.constants import DEFAULT_CAPTURE_GRACE_PERIOD_SECONDS
+from app.database.timelapse_operations import SyncTimelapseOperations
+from app.services.capture_pipeline import capture_context as context_module
+from app.services.capture_pipeline import capture_transaction_manager as tx_module
+from app.services.capture_pipeline import rtsp_service as rtsp_module
+from app.services.capture_pipeline import (
+    workflow_orchestrator_service as orchestrator_module,
+)
+from app.services.capture_pipeline.capture_context import build_capture_context
+from app.services.capture_pipeline.workflow_orchestrator_service import (
+    WorkflowOrchestratorService,
+)
+from app.services.scheduling import capture_timing_service as timing_module
+from app.services.scheduling.capture_timing_service import SyncCaptureTimingService
+
+
+def _row(settings=None, **timelapse):
+    """A row as returned by SyncTimelapseOperations.get_capture_context_row()."""
+    row = {
+        "id": 7,
+        "camera_id": 3,
+        "name": "Garden",
+        "status": "running",
+        "start_date": date(2025, 6, 1),
+        "image_count": 41,
+        "capture_interval_seconds": 300,
+        "time_window_start": None,
+        "time_window_end": None,
+        "created_at": datetime(2025, 6, 1, 8, 0),
+        "updated_at": datetime(2025, 6, 1, 8, 0),
+        "camera": {
+            "id": 3,
+            "name": "Garden cam",
+            "rtsp_url": "rtsp://192.168.1.10/stream",
+            "status": "active",
+            "health_status": "online",
+            "corruption_detection_heavy": True,
+            "last_capture_at": None,
+            "created_at": "2025-05-01T08:00:00",
+            "updated_at": "2025-05-01T08:00:00",
+        },
+        "settings": (
+            {
+                "timezone": "Europe/Berlin",
+                "image_quality": "75",
+                "rtsp_timeout_seconds": "15",
+                "capture_grace_period_seconds": "20",
+                "corruption_heavy_detection_enabled": "true",
+                "corruption_score_threshold": "70",
+            }
+            if settings is None
+            else settings
+        ),
+    }
+    row.update(timelapse)
+    return row
+
+
+QUIET_LOGGERS = [orchestrator_module, timing_module, rtsp_module, tx_module]
+
+
+@pytest.mark.unit
+class TestBuildCaptureContext:
+    """Test building the snapshot from a single query row."""
+
+    def test_models_and_settings_are_parsed(self):
+        """Camera, timelapse and all capture settings come from one row."""
+        context = build_capture_context(_row())
+
+        assert context.timelapse_id == 7 and context.camera_id == 3
+        assert context.camera.created_at.tzinfo.key == "Europe/Berlin"
+        assert context.camera.active_timelapse_id == 7
+        assert context.timezone == "Europe/Berlin"
+        assert context.capture_settings["quality"] == 75
+        assert context.capture_settings["timeout"] == 15
+        assert context.grace_period_seconds == 20
+        assert context.corruption_settings == {
+            "corruption_heavy_detection_enabled": True,
+            "corruption_score_threshold": 70,
+        }
+        assert context.corruption_detection_heavy
+
+    def test_missing_settings_use_defaults(self):
+        """Unset or invalid settings fall back to the usual defaults."""
+        context = build_capture_context(
+            _row(settings={"timezone": "Not/AZone", "image_quality": "high"})
+        )
+
+        assert context.timezone == "UTC"
+        assert context.grace_period_seconds == DEFAULT_CAPTURE_GRACE_PERIOD_SECONDS
+        assert context.capture_settings["quality"] > 0
+
+    def test_context_is_immutable(self):
+        """The snapshot and its settings cannot be changed downstream."""
+        context = build_capture_context(_row())
+
+        with pytest.raises(Exception):
+            context.timezone = "UTC"
+        with pytest.raises(TypeError):
+            context.capture_settings["quality"] = 10
+
+    def test_day_number_uses_start_date(self):
+        """Day numbers count from the timelapse start date."""
+        context = build_capture_context(_row())
+
+        assert context.day_number(datetime(2025, 6, 1, 23, 0)) == 1
+        assert context.day_number(datetime(2025, 6, 10, 8, 0)) == 10
+
+
+@pytest.mark.unit
+class TestCaptureContextQuery:
+    """Test the single-round-trip load."""
+
+    def test_one_query_per_context(self):
+        """Timelapse, camera and settings are fetched with one execute."""
+        db = MagicMock()
+        cursor = (
+            db.get_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        )
+        cursor.fetchone.return_value = _row()
+
+        context = context_module.load_capture_context(db, 7)
+
+        assert context.timelapse_id == 7
+        cursor.execute.assert_called_once()
+        query, params = cursor.execute.call_args[0]
+        assert "JOIN cameras" in query and "FROM settings" in query
+        assert params["timelapse_ids"] == [7]
+        assert "timezone" in params["setting_keys"]
+
+    def test_missing_timelapse_returns_none(self):
+        """No row means no context."""
+        ops = MagicMock(spec=SyncTimelapseOperations)
+        ops.get_capture_context_row.return_value = None
+
+        with patch.object(context_module, "SyncTimelapseOperations", return_value=ops):
+            assert context_module.load_capture_context(MagicMock(), 7) is None
+
+
+@pytest.mark.unit
+class TestCaptureContextFlow:
+    """Test that the snapshot replaces per-capture lookups."""
+
+    def test_readiness_validation_returns_context(self):
+        """Validation reads no settings and hands the context to the worker."""
+        settings_service = MagicMock()
+        service = SyncCaptureTimingService(
+            MagicMock(), MagicMock(), MagicMock(), settings_service
+        )
+        service.time_window_service.is_within_time_window.return_value = True
+        context = build_capture_context(_row())
+
+        with patch.object(
+            context_module, "load_capture_context", return_value=context
+        ) as load:
+            result = service.validate_capture_readiness(0, 7)
+
+        assert result.valid
+        assert result.capture_context is context
+        load.assert_called_once_with(service.db, 7)
+        settings_service.get_setting.assert_not_called()
+
+    def test_orchestrator_uses_context_instead_of_lookups(self, tmp_path):
+        """With a context, the workflow loads no camera, timelapse or settings."""
+        services = {
+            name: MagicMock()
+            for name in (
+                "image_service",
+                "corruption_evaluation_service",
+                "camera_service",
+                "timelapse_service",
+                "rtsp_service",
+                "job_coordinator",
+                "sse_ops",
+                "settings_service",
+            )
+        }
+        services["rtsp_service"].capture_and_process_frame.return_value = {
+            "success": True,
+            "file_size": 1024,
+        }
+        db = MagicMock()
+        pipeline = db.get_pipeline_connection.return_value.__enter__.return_value
+        pipeline.execute.return_value.fetchone.return_value = {
+            "id": 99,
+            "camera_id": 3,
+            "timelapse_id": 7,
+            "file_path": "frames/x.jpg",
+            "day_number": 10,
+            "captured_at": datetime(2025, 6, 10, 12, 0),
+            "created_at": datetime(2025, 6, 10, 12, 0),
+        }
+        orchestrator = WorkflowOrchestratorService(db=db, **services)
+        context = build_capture_context(_row())
+
+        with patch.object(
+            orchestrator_module, "ensure_entity_directory", return_value=tmp_path
+        ), patch.object(
+            orchestrator_module, "get_relative_path", return_value="frames/x.jpg"
+        ), patch.object(
+            orchestrator_module, "load_capture_context"
+        ) as load:
+            result = orchestrator.execute_capture_workflow(
+                3, 7, {"source": "scheduler"}, context
+            )
+
+        assert result.success
+        assert result.metadata["image_count"] == 42
+        load.assert_not_called()
+        services["camera_service"].get_camera_by_id.assert_not_called()
+        services["timelapse_service"].get_timelapse_by_id.assert_not_called()
+        services["settings_service"].get_setting.assert_not_called()
+        services["rtsp_service"]._get_capture_settings.assert_not_called()
+
+        capture_kwargs = services["rtsp_service"].capture_and_process_frame.call_args
+        assert capture_kwargs.kwargs["camera"] is context.camera
+        assert capture_kwargs.kwargs["capture_settings"]["timeout"] == 15
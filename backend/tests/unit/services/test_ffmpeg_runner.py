@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_ffmpeg_runner.py
+"""
+Unit tests for the supervised FFmpeg runner.
+
+Small shell scripts stand in for FFmpeg, so the tests exercise progress
+parsing, stderr capture, timeouts and cancellation of real processes.
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.services.video_pipeline import ffmpeg_runner as runner_module
+from app.services.video_pipeline.constants import (
+    FFMPEG_CANCELLED_MESSAGE,
+    FFMPEG_TIMEOUT_BASE_SECONDS,
+    FFMPEG_TIMEOUT_MAX_SECONDS,
+)
+from app.services.video_pipeline.ffmpeg_runner import (
+    FFmpegProgressParser,
+    calculate_ffmpeg_timeout,
+    run_ffmpeg,
+    with_progress_output,
+)
+
+QUIET_LOGGERS = [runner_module]
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path):
+    """Write an executable script that ignores its FFmpeg arguments."""
+
+    def make(body: str) -> str:
+        script = tmp_path / "ffmpeg"
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+        return str(script)
+
+    return make
+
+
+@pytest.mark.unit
+class TestProgressParsing:
+    """Test parsing of FFmpeg -progress output."""
+
+    def test_blocks_are_emitted_at_progress_lines(self):
+        """Values accumulate until the progress= line ends the block."""
+        parser = FFmpegProgressParser(total_frames=200)
+
+        assert parser.feed("frame=50") is None
+        assert parser.feed("fps=25.0") is None
+        assert parser.feed("out_time_us=2000000") is None
+        assert parser.feed("speed=1.5x") is None
+        progress = parser.feed("progress=continue")
+
+        assert progress.frame == 50
+        assert progress.out_time_seconds == 2.0
+        assert progress.speed == 1.5
+        assert progress.percent == 25
+        assert progress.eta_seconds == 6.0
+        assert not progress.finished
+
+    def test_unknown_values_are_ignored(self):
+        """N/A values keep the previous reading."""
+        parser = FFmpegProgressParser()
+        parser.feed("frame=10")
+        parser.feed("progress=continue")
+        parser.feed("fps=N/A")
+        parser.feed("speed=N/A")
+        progress = parser.feed("progress=end")
+
+        assert progress.frame == 10
+        assert progress.speed is None
+        assert progress.percent is None
+        assert progress.finished
+
+    def test_progress_flags_are_added_once(self):
+        """Progress output goes to stdout right after the executable."""
+        cmd = with_progress_output(["ffmpeg", "-y", "out.mp4"])
+
+        assert cmd[:4] == ["ffmpeg", "-nostats", "-progress", "pipe:1"]
+        assert with_progress_output(cmd) == cmd
+
+
+@pytest.mark.unit
+class TestTimeoutScaling:
+    """Test frame-count based timeouts."""
+
+    def test_timeout_grows_with_frames(self):
+        """More frames allow more time, starting from the base allowance."""
+        assert calculate_ffmpeg_timeout(0) == FFMPEG_TIMEOUT_BASE_SECONDS
+        assert calculate_ffmpeg_timeout(10_000) > calculate_ffmpeg_timeout(1_000)
+
+    def test_timeout_is_capped(self):
+        """Huge renders still have a hard ceiling."""
+        assert calculate_ffmpeg_timeout(10**9) == FFMPEG_TIMEOUT_MAX_SECONDS
+
+
+@pytest.mark.unit
+class TestRunFFmpeg:
+    """Test supervising real child processes."""
+
+    def test_progress_is_streamed(self, fake_ffmpeg):
+        """Each progress block reaches the callback while the process runs."""
+        script = fake_ffmpeg(
+            "echo frame=5; echo fps=10.0; echo progress=continue; "
+            "echo frame=10; echo progress=end"
+        )
+        updates = []
+
+        success, _ = run_ffmpeg(
+            [script], timeout=10, total_frames=10, progress_callback=updates.append
+        )
+
+        assert success
+        assert [(u.frame, u.percent) for u in updates] == [(5, 50), (10, 100)]
+        assert updates[-1].finished
+
+    def test_failure_reports_stderr_tail(self, fake_ffmpeg):
+        """A non-zero exit includes the last stderr lines."""
+        script = fake_ffmpeg("echo 'Invalid data found' >&2; exit 3")
+
+        success, error = run_ffmpeg([script], timeout=10)
+
+        assert not success
+        assert "code 3" in error
+        assert "Invalid data found" in error
+
+    def test_timeout_terminates_process(self, fake_ffmpeg):
+        """A process past its deadline is stopped."""
+        script = fake_ffmpeg("exec sleep 30")
+
+        started = time.monotonic()
+        success, error = run_ffmpeg([script], timeout=0.3)
+
+        assert not success
+        assert "timed out" in error
+        assert time.monotonic() - started < 10
+
+    def test_cancel_event_terminates_process(self, fake_ffmpeg):
+        """Setting the cancel event stops a running process."""
+        script = fake_ffmpeg("exec sleep 30")
+        cancel_event = threading.Event()
+        threading.Timer(0.2, cancel_event.set).start()
+
+        started = time.monotonic()
+        success, error = run_ffmpeg([script], timeout=60, cancel_event=cancel_event)
+
+        assert not success
+        assert error == FFMPEG_CANCELLED_MESSAGE
+        assert time.monotonic() - started < 10
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_frame_manifest.py
+"""
+Unit tests for database-driven frame manifests.
+"""
+
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.database.image_operations import ImageQueryBuilder
+from app.services.video_pipeline import frame_manifest as manifest_module
+from app.services.video_pipeline.frame_manifest import FrameManifestBuilder
+
+CAPTURED = datetime(2025, 1, 1, 12, 0)
+OVERLAY_AT = datetime(2025, 1, 2, 8, 0)
+
+
+def _row(image_id, overlay=False):
+    return {
+        "id": image_id,
+        "file_path": f"cameras/camera-1/images/2025-01-01/{image_id}.jpg",
+        "overlay_path": (
+            f"cameras/camera-1/overlays/2025-01-01/{image_id}.png" if overlay else None
+        ),
+        "has_valid_overlay": overlay,
+        "overlay_updated_at": OVERLAY_AT if overlay else None,
+        "captured_at": CAPTURED + timedelta(minutes=image_id),
+    }
+
+
+QUIET_LOGGERS = [manifest_module]
+
+
+@pytest.fixture
+def builder(tmp_path):
+    """Manifest builder over mocked image operations."""
+    image_ops = MagicMock()
+    image_ops.iter_video_frames.return_value = iter(
+        [_row(1), _row(2, overlay=True), _row(3)]
+    )
+    return FrameManifestBuilder(image_ops, str(tmp_path))
+
+
+@pytest.mark.unit
+class TestFrameManifestBuilder:
+    """Test frame selection from image rows."""
+
+    def test_frames_resolve_against_data_directory(self, builder, tmp_path):
+        """Stored relative paths become absolute paths without a stat."""
+        manifest = builder.build(7)
+
+        assert manifest.frame_count == 3
+        assert manifest.frames[0] == str(
+            tmp_path.resolve() / "cameras/camera-1/images/2025-01-01/1.jpg"
+        )
+        assert manifest.first_captured_at == CAPTURED + timedelta(minutes=1)
+        assert manifest.last_captured_at == CAPTURED + timedelta(minutes=3)
+
+    def test_overlay_used_only_where_valid(self, builder):
+        """Frames without a valid overlay fall back to the original capture."""
+        manifest = builder.build(7, use_overlay_images=True)
+
+        assert manifest.overlay_frames == 1
+        assert manifest.frames[1].endswith("overlays/2025-01-01/2.png")
+        assert manifest.frames[0].endswith("images/2025-01-01/1.jpg")
+        assert OVERLAY_AT.isoformat() in manifest.fingerprints[1]
+
+    def test_rows_kept_for_streamed_overlays(self, builder):
+        """Streamed renders keep original captures and their image rows."""
+        manifest = builder.build(7, keep_rows=True)
+
+        assert [row["id"] for row in manifest.frame_rows] == [1, 2, 3]
+        assert manifest.frames[1].endswith("images/2025-01-01/2.jpg")
+        assert builder.build(7).frame_rows == []
+
+    def test_range_is_passed_to_query(self, builder):
+        """Date and day ranges are forwarded to the streaming query."""
+        builder.build(7, start_day=2, end_day=5)
+
+        builder.image_ops.iter_video_frames.assert_called_once_with(
+            7, start_date=None, end_date=None, start_day=2, end_day=5
+        )
+
+
+@pytest.mark.unit
+class TestVideoFramesQuery:
+    """Test the frame manifest query builder."""
+
+    def test_query_is_scoped_to_timelapse_in_capture_order(self):
+        """Only the timelapse's rows are selected, oldest first."""
+        query, params = ImageQueryBuilder.build_video_frames_query(7)
+
+        assert "timelapse_id = %(timelapse_id)s" in query
+        assert "ORDER BY captured_at ASC, id ASC" in query
+        assert params == {"timelapse_id": 7}
+
+    def test_end_date_is_inclusive(self):
+        """The end date includes the whole day via an exclusive upper bound."""
+        query, params = ImageQueryBuilder.build_video_frames_query(
+            7, start_date=date(2025, 1, 1), end_date=date(2025, 1, 31)
+        )
+
+        assert "captured_at < %(end_date_exclusive)s" in query
+        assert params["end_date_exclusive"] == date(2025, 2, 1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_latest_image_registry.py
+"""
+Unit tests for the in-memory latest image registry.
+
+The seed query is mocked, so the tests check which events and rows replace
+or drop a camera's entry and that entries from events and rows agree on
+their ETag.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.enums import SSEEvent
+from app.models.image_model import Image
+from app.services import latest_image_registry as registry_module
+from app.services.latest_image_registry import LatestImageEntry, LatestImageRegistry
+from app.utils.cache_manager import generate_composite_etag
+
+
+def _image(image_id: int, camera_id: int = 3, minute: int = 0, **extra) -> Image:
+    return Image(
+        id=image_id,
+        camera_id=camera_id,
+        timelapse_id=7,
+        file_path=f"frames/{image_id}.jpg",
+        day_number=10,
+        captured_at=datetime(2025, 6, 10, 12, minute),
+        created_at=datetime(2025, 6, 10, 12, minute),
+        **extra,
+    )
+
+
+def _captured_event(image_id: int, camera_id: int = 3, minute: int = 0) -> dict:
+    return {
+        "camera_id": camera_id,
+        "timelapse_id": 7,
+        "image_id": image_id,
+        "captured_at": f"2025-06-10T12:{minute:02d}:00",
+        "day_number": 10,
+        "file_path": f"frames/{image_id}.jpg",
+        "file_size": 1024,
+        "corruption_score": 95,
+        "is_flagged": False,
+    }
+
+
+QUIET_LOGGERS = [registry_module]
+
+
+@pytest.fixture
+def registry():
+    """Provide an empty registry."""
+    return LatestImageRegistry()
+
+
+@pytest.mark.unit
+class TestLatestImageRegistry:
+    """Test registry updates from rows and SSE events."""
+
+    def test_event_and_row_share_etag(self, registry):
+        """An entry built from the capture event matches the row's ETag."""
+        registry.handle_event(SSEEvent.IMAGE_CAPTURED, _captured_event(42))
+
+        entry = registry.get(3)
+        assert entry.image_id == 42 and entry.file_size == 1024
+        assert entry.etag == LatestImageEntry.from_image(_image(42)).etag
+        assert entry.etag == generate_composite_etag(42, datetime(2025, 6, 10, 12, 0))
+
+    def test_older_rows_do_not_replace_newer_images(self, registry):
+        """A slow database fallback cannot overwrite a newer capture."""
+        registry.handle_event(SSEEvent.IMAGE_CAPTURED, _captured_event(42, minute=5))
+
+        kept = registry.record_image(_image(41, minute=0))
+
+        assert kept.image_id == 42
+        assert registry.get(3).image_id == 42
+
+    def test_row_for_same_image_fills_in_variants(self, registry):
+        """Reloading the registered image adds the paths the event lacked."""
+        registry.handle_event(SSEEvent.IMAGE_CAPTURED, _captured_event(42))
+
+        registry.record_image(_image(42, thumbnail_path="thumbnails/42.jpg"))
+
+        assert registry.get(3).thumbnail_path == "thumbnails/42.jpg"
+
+    def test_deleting_registered_image_drops_entry(self, registry):
+        """Only deletions of the registered image or its camera drop the entry."""
+        registry.record_image(_image(42))
+        registry.record_image(_image(50, camera_id=4))
+
+        registry.handle_event(SSEEvent.IMAGE_DELETED, {"image_id": 41, "camera_id": 3})
+        assert registry.get(3) is not None
+
+        registry.handle_event(SSEEvent.IMAGE_DELETED, {"image_id": 42, "camera_id": 3})
+        registry.handle_event(SSEEvent.CAMERA_DELETED, {"camera_id": 4})
+        assert registry.get(3) is None
+        assert registry.get(4) is None
+
+    def test_malformed_events_are_ignored(self, registry):
+        """Events without the image fields leave the registry untouched."""
+        registry.handle_event(SSEEvent.IMAGE_CAPTURED, {"n": 1})
+        registry.handle_event(SSEEvent.IMAGE_CAPTURED, {"camera_id": 3})
+
+        assert registry.all() == []
+
+    def test_seed_runs_one_query(self, registry):
+        """Concurrent first requests share a single seed query."""
+        ops = MagicMock()
+        ops.get_latest_images_by_camera = AsyncMock(
+            return_value=[_image(42), _image(50, camera_id=4)]
+        )
+
+        async def scenario():
+            await asyncio.gather(
+                registry.ensure_seeded(MagicMock()),
+                registry.ensure_seeded(MagicMock()),
+            )
+
+        with patch.object(registry_module, "AsyncImageOperations", return_value=ops):
+            asyncio.run(scenario())
+
+        ops.get_latest_images_by_camera.assert_awaited_once()
+        assert registry.seeded
+        assert [entry.camera_id for entry in registry.all()] == [3, 4]
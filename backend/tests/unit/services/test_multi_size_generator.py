@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_multi_size_generator.py
+"""
+Unit tests for single-decode small image and thumbnail generation.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from app.services.thumbnail_pipeline.generators import (
+    multi_size_generator as generator_module,
+)
+from app.services.thumbnail_pipeline.generators.multi_size_generator import (
+    MultiSizeImageGenerator,
+)
+from app.services.thumbnail_pipeline.utils.constants import (
+    SMALL_IMAGE_SIZE,
+    THUMBNAIL_SIZE,
+)
+
+QUIET_LOGGERS = [generator_module]
+
+
+@pytest.fixture
+def generator():
+    """Provide a multi-size generator."""
+    return MultiSizeImageGenerator()
+
+
+@pytest.fixture
+def capture(tmp_path) -> Path:
+    """A 4000×3000 JPEG capture."""
+    source = tmp_path / "capture.jpg"
+    Image.new("RGB", (4000, 3000), (30, 120, 200)).save(source, "JPEG")
+    return source
+
+
+@pytest.mark.unit
+class TestMultiSizeImageGenerator:
+    """Test generating both reduced sizes from one decode."""
+
+    def test_generates_both_sizes(self, generator, capture, tmp_path):
+        """Small image fits its bounds and the thumbnail has the fixed size."""
+        result = generator.generate(
+            str(capture),
+            str(tmp_path / "thumbs" / "thumb.jpg"),
+            str(tmp_path / "smalls" / "small.jpg"),
+        )
+
+        assert result["success"]
+        assert result["thumbnail_generated"] and result["small_generated"]
+        assert result["original_size"] == (4000, 3000)
+        with Image.open(tmp_path / "smalls" / "small.jpg") as small:
+            assert small.size == SMALL_IMAGE_SIZE
+        with Image.open(tmp_path / "thumbs" / "thumb.jpg") as thumbnail:
+            assert thumbnail.size == THUMBNAIL_SIZE
+
+    def test_jpeg_is_decoded_at_reduced_scale(self, generator, capture):
+        """Draft mode decodes at a power-of-two scale that still covers the output."""
+        with generator._open_source(capture, SMALL_IMAGE_SIZE) as (img, original):
+            assert original == (4000, 3000)
+            assert img.size == (1000, 750)
+
+        with generator._open_source(capture, THUMBNAIL_SIZE) as (img, _):
+            assert img.size == (500, 375)
+
+    def test_source_decoded_once_for_both_outputs(self, generator, capture, tmp_path):
+        """Both outputs come from a single open of the source."""
+        with patch.object(
+            generator_module.Image, "open", wraps=Image.open
+        ) as image_open, patch.object(
+            generator_module, "validate_image_file", return_value=True
+        ):
+            generator.generate(
+                str(capture), str(tmp_path / "thumb.jpg"), str(tmp_path / "small.jpg")
+            )
+
+        assert image_open.call_count == 1
+
+    def test_existing_outputs_are_skipped(self, generator, capture, tmp_path):
+        """Outputs that exist are kept unless regeneration is forced."""
+        thumbnail_path = tmp_path / "thumb.jpg"
+        small_path = tmp_path / "small.jpg"
+        generator.generate(str(capture), str(thumbnail_path), str(small_path))
+
+        result = generator.generate(str(capture), str(thumbnail_path), str(small_path))
+        assert result["success"]
+        assert not result["thumbnail_generated"] and not result["small_generated"]
+
+        result = generator.generate(
+            str(capture), str(thumbnail_path), None, force_regenerate=True
+        )
+        assert result["thumbnail_generated"] and not result["small_generated"]
+
+    def test_invalid_source_fails(self, generator, tmp_path):
+        """Unreadable sources are reported as failures."""
+        broken = tmp_path / "broken.jpg"
+        broken.write_bytes(b"not a jpeg")
+
+        result = generator.generate(str(broken), str(tmp_path / "thumb.jpg"))
+
+        assert not result["success"]
+        assert "Invalid" in result["error"]
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_overlay_backfill.py
+"""
+Unit tests for the process-pool overlay backfill.
+
+Render processes are replaced by a thread pool running the same initializer
+and shard function, so the tests exercise sharding, batched writes and
+checkpoint resume without spawning interpreters.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from app.database.image_operations import ImageQueryBuilder
+from app.models.image_model import Image as ImageModel
+from app.models.overlay_model import (
+    GlobalOverlayOptions,
+    OverlayConfiguration,
+    OverlayItem,
+)
+from app.services.overlay_pipeline.services import backfill_service
+from app.services.overlay_pipeline.services.backfill_service import (
+    OverlayBackfillService,
+    prepare_render_state,
+    render_overlay_shard,
+)
+
+CONFIG_UPDATED_AT = datetime(2025, 6, 1, 12, 0)
+CONFIG_VERSION = (CONFIG_UPDATED_AT, 4, CONFIG_UPDATED_AT - timedelta(days=1))
+QUIET_LOGGERS = [
+    "app.services.overlay_pipeline.services.backfill_service",
+    "app.services.overlay_pipeline.services.integration_service",
+    "app.services.overlay_pipeline.caching.render_plan_cache",
+    "app.services.overlay_pipeline.utils.overlay_utils",
+    "app.services.overlay_pipeline.utils.font_cache",
+    "app.services.overlay_pipeline.generators.text_generator",
+    "app.services.overlay_pipeline.generators.sequence_generator",
+]
+
+
+@pytest.fixture
+def config():
+    """Config with one static and one dynamic item."""
+    return OverlayConfiguration(
+        overlay_positions={
+            "topLeft": OverlayItem(type="custom_text", custom_text="Garden"),
+            "bottomRight": OverlayItem(type="frame_number", text_size=16),
+        },
+        global_options=GlobalOverlayOptions(opacity=80),
+    )
+
+
+def make_images(tmp_path, ids):
+    """Image models backed by small JPEG files."""
+    images = []
+    for image_id in ids:
+        path = tmp_path / f"capture_{image_id}.jpg"
+        Image.new("RGB", (160, 120), (image_id * 10 % 256, 90, 140)).save(path)
+        images.append(
+            ImageModel(
+                id=image_id,
+                camera_id=2,
+                timelapse_id=9,
+                file_path=str(path),
+                day_number=1,
+                captured_at=CONFIG_UPDATED_AT - timedelta(days=2),
+                created_at=CONFIG_UPDATED_AT - timedelta(days=2),
+            )
+        )
+    return images
+
+
+def thread_pool(processes, initargs):
+    """Stand-in for the spawned pool using the same per-worker initializer."""
+    return ThreadPoolExecutor(
+        max_workers=processes, initializer=prepare_render_state, initargs=initargs
+    )
+
+
+@pytest.fixture
+def service_factory(tmp_path, config):
+    """Build backfill services over a fake database holding stale images."""
+
+    def build(stale_images, fail_ids=(), page_size=4):
+        integration = MagicMock()
+        integration.get_cached_overlay_config.return_value = (CONFIG_VERSION, config)
+
+        service = OverlayBackfillService(
+            MagicMock(),
+            integration,
+            max_processes=2,
+            shard_size=2,
+            page_size=page_size,
+            checkpoint_directory=str(tmp_path / "checkpoints"),
+        )
+        service.sse_ops = MagicMock()
+        service.image_ops = MagicMock()
+        service._get_overlay_path = lambda image: str(
+            tmp_path / "overlays" / f"{image.id}.png"
+        )
+
+        def stale_after(after_id):
+            # Rendered images are no longer stale; failed ones stay stale
+            writes = integration.sync_image_service.update_images_overlay_status
+            rendered = {
+                image_id
+                for call in writes.call_args_list
+                for image_id, _ in call.args[0]
+            }
+            return [
+                image
+                for image in stale_images
+                if image.id > after_id and image.id not in rendered
+            ]
+
+        service.image_ops.count_stale_overlay_images.side_effect = (
+            lambda _tid, _at, after_id: len(stale_after(after_id))
+        )
+        service.image_ops.get_stale_overlay_images.side_effect = (
+            lambda _tid, _at, after_id, limit: stale_after(after_id)[:limit]
+        )
+        for image in stale_images:
+            if image.id in fail_ids:
+                image.file_path = str(tmp_path / "missing.jpg")
+        return service, integration
+
+    return build
+
+
+@pytest.mark.unit
+@pytest.mark.overlay
+class TestRenderOverlayShard:
+    """Test rendering inside a render process."""
+
+    def test_shard_writes_overlays_and_reports_failures(self, tmp_path, config):
+        """Each task yields a result; a broken image does not stop the shard."""
+        prepare_render_state(config, CONFIG_VERSION, {"timezone": "UTC"})
+        first, second = make_images(tmp_path, [1, 2])
+        second.file_path = str(tmp_path / "missing.jpg")
+
+        results = render_overlay_shard(
+            9,
+            [
+                (first, str(tmp_path / "out" / "1.png")),
+                (second, str(tmp_path / "out" / "2.png")),
+            ],
+        )
+
+        assert results[0] == (1, str(tmp_path / "out" / "1.png"), None)
+        assert results[1][0] == 2 and results[1][1] is None and results[1][2]
+        with Image.open(tmp_path / "out" / "1.png") as rendered:
+            assert rendered.size == (160, 120) and rendered.mode == "RGBA"
+
+
+@pytest.mark.unit
+@pytest.mark.overlay
+class TestOverlayBackfillService:
+    """Test paging, batched writes and checkpoint resume."""
+
+    def test_backfill_writes_one_batch_per_page(self, tmp_path, service_factory):
+        """Every page is rendered across shards and recorded in one UPDATE."""
+        images = make_images(tmp_path, range(1, 11))
+        service, integration = service_factory(images, fail_ids={5})
+
+        with patch.object(backfill_service, "_create_render_pool", thread_pool):
+            result = service.backfill_timelapse(9)
+
+        writes = integration.sync_image_service.update_images_overlay_status
+        assert [len(call.args[0]) for call in writes.call_args_list] == [4, 3, 2]
+        assert result == {
+            "timelapse_id": 9,
+            "rendered": 9,
+            "failed": 1,
+            "completed": True,
+        }
+        assert len(list((tmp_path / "overlays").iterdir())) == 9
+
+        checkpoint = json.loads(
+            (tmp_path / "checkpoints" / "timelapse-9.json").read_text()
+        )
+        assert checkpoint["last_image_id"] == 10
+        assert (checkpoint["rendered"], checkpoint["failed"]) == (9, 1)
+        completed = service.sse_ops.create_event.call_args_list[-1].kwargs
+        assert completed["event_data"]["total"] == 10
+
+    def test_backfill_resumes_after_checkpoint(self, tmp_path, service_factory):
+        """A restart skips pages already done, including failed images."""
+        images = make_images(tmp_path, range(1, 11))
+        service, integration = service_factory(images, fail_ids={2})
+        cancel_event = MagicMock()
+        cancel_event.is_set.side_effect = [False, True]
+
+        with patch.object(backfill_service, "_create_render_pool", thread_pool):
+            first_run = service.backfill_timelapse(9, cancel_event)
+            resumed = service.backfill_timelapse(9)
+
+        assert not first_run["completed"]
+        assert (first_run["rendered"], first_run["failed"]) == (3, 1)
+        assert resumed["completed"] and resumed["rendered"] == 6
+        after_ids = [
+            call.kwargs["after_id"]
+            for call in service.image_ops.get_stale_overlay_images.call_args_list
+        ]
+        assert after_ids == [0, 4, 8, 10]
+
+    def test_config_change_discards_checkpoint(self, tmp_path, service_factory):
+        """A checkpoint from an older config version is not resumed."""
+        service, _ = service_factory(make_images(tmp_path, [1, 2]))
+        checkpoint_path = tmp_path / "checkpoints" / "timelapse-9.json"
+        checkpoint_path.parent.mkdir()
+        checkpoint_path.write_text(
+            json.dumps({"timelapse_id": 9, "config_version": "old", "last_image_id": 2})
+        )
+
+        with patch.object(backfill_service, "_create_render_pool", thread_pool):
+            result = service.backfill_timelapse(9)
+
+        assert result["rendered"] == 2
+
+    def test_batch_update_query_joins_arrays(self):
+        """Overlay results are written with a single unnest() join."""
+        query = ImageQueryBuilder.build_overlay_status_batch_query()
+
+        assert "unnest(%(image_ids)s::int[], %(overlay_paths)s::text[])" in query
+        assert "WHERE i.id = v.id" in query
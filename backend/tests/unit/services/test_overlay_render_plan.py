@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit tests for compiled overlay render plans and their per-timelapse cache.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image, ImageChops
+
+from app.models.overlay_model import (
+    GlobalOverlayOptions,
+    OverlayConfiguration,
+    OverlayItem,
+    TimelapseOverlay,
+)
+from app.services.overlay_pipeline.caching.render_plan_cache import (
+    OverlayRenderPlanCache,
+)
+from app.services.overlay_pipeline.services import integration_service
+from app.services.overlay_pipeline.services.integration_service import (
+    SyncOverlayIntegrationService,
+)
+from app.services.overlay_pipeline.utils.overlay_utils import OverlayRenderer
+
+FRAME_SIZE = (320, 240)
+UPDATED_AT = datetime(2025, 6, 1, 12, 0)
+QUIET_LOGGERS = [
+    "app.services.overlay_pipeline.caching.render_plan_cache",
+    "app.services.overlay_pipeline.services.integration_service",
+    "app.services.overlay_pipeline.utils.overlay_utils",
+    "app.services.overlay_pipeline.utils.font_cache",
+    "app.services.overlay_pipeline.generators.text_generator",
+    "app.services.overlay_pipeline.generators.sequence_generator",
+]
+
+
+@pytest.fixture
+def config():
+    """Config mixing a static and a dynamic item with global opacity."""
+    return OverlayConfiguration(
+        overlay_positions={
+            "topLeft": OverlayItem(
+                type="custom_text",
+                custom_text="Garden",
+                text_size=20,
+                background_color="#000000",
+                background_opacity=50,
+            ),
+            "bottomRight": OverlayItem(type="frame_number", text_size=16),
+        },
+        global_options=GlobalOverlayOptions(opacity=80, x_margin=10, y_margin=10),
+    )
+
+
+def frame_context(frame_number):
+    """Minimal per-frame overlay context."""
+    return {
+        "timestamp": UPDATED_AT,
+        "frame_number": frame_number,
+        "timelapse_id": 7,
+        "timelapse_name": "Timelapse 7",
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.overlay
+class TestOverlayRenderPlan:
+    """Test plan compilation, rendering parity and cache lifecycle."""
+
+    def test_plan_matches_standard_renderer(self, config):
+        """Compiled rendering is pixel-identical to the uncompiled fallback."""
+        base = Image.new("RGBA", FRAME_SIZE, (40, 90, 140, 255))
+        plan = OverlayRenderPlanCache().get_plan(
+            7, "v1", config, FRAME_SIZE, frame_context(1)
+        )
+
+        assert plan.static_patches
+        assert [b.item.type for b in plan.dynamic_bindings] == ["frame_number"]
+        for frame_number in (1, 42):
+            expected = OverlayRenderer(config)._render_overlay_fallback(
+                base, frame_context(frame_number)
+            )
+            actual = plan.render(base, frame_context(frame_number))
+            assert ImageChops.difference(expected, actual).getbbox() is None
+
+    def test_plans_are_reused_and_replaced_on_new_version(self, config):
+        """One compile per (timelapse, version, size); new versions evict old plans."""
+        cache = OverlayRenderPlanCache(max_entries=2)
+        cache.put_config(7, "v1", config, preset_id=3)
+        first = cache.get_plan(7, "v1", config, FRAME_SIZE, frame_context(1))
+
+        assert cache.get_plan(7, "v1", config, FRAME_SIZE, frame_context(2)) is first
+        assert cache.get_config(7, "v1") is config
+        assert cache.get_config(7, "v2") is None
+
+        cache.put_config(7, "v2", config, preset_id=3)
+        assert cache.get_stats()["plans"] == 0
+
+        cache.get_plan(7, "v2", config, FRAME_SIZE, frame_context(1))
+        assert cache.invalidate_preset(3) == 1
+        assert cache.get_config(7, "v2") is None
+        assert cache.get_stats()["compilations"] == 2
+
+    def test_lru_is_bounded(self, config):
+        """Least recently used plans are evicted past max_entries."""
+        cache = OverlayRenderPlanCache(max_entries=2)
+        for timelapse_id in (1, 2, 3):
+            cache.get_plan(timelapse_id, "v1", config, FRAME_SIZE, frame_context(1))
+
+        assert cache.get_stats()["plans"] == 2
+        assert cache.invalidate_timelapse(1) == 0
+
+    def test_effective_config_resolved_once_per_version(self, config):
+        """Only the version probe runs per frame until the config changes."""
+        overlay_ops = MagicMock()
+        overlay_ops.get_timelapse_overlay_version.return_value = {
+            "enabled": True,
+            "preset_id": None,
+            "overlay_updated_at": UPDATED_AT,
+            "preset_updated_at": None,
+        }
+        overlay_ops.get_timelapse_overlay.return_value = TimelapseOverlay(
+            id=1,
+            timelapse_id=7,
+            overlay_config=config,
+            enabled=True,
+            created_at=UPDATED_AT,
+            updated_at=UPDATED_AT,
+        )
+        service = SyncOverlayIntegrationService.__new__(SyncOverlayIntegrationService)
+        service.overlay_ops = overlay_ops
+
+        with patch.object(
+            integration_service, "render_plan_cache", OverlayRenderPlanCache()
+        ):
+            first = service.get_cached_overlay_config(7)
+            second = service.get_cached_overlay_config(7)
+            overlay_ops.get_timelapse_overlay_version.return_value = {
+                **overlay_ops.get_timelapse_overlay_version.return_value,
+                "overlay_updated_at": datetime(2025, 6, 2),
+            }
+            third = service.get_cached_overlay_config(7)
+
+        assert first == second and first[1] == config
+        assert third[0] != first[0]
+        assert overlay_ops.get_timelapse_overlay.call_count == 2
+        assert overlay_ops.get_timelapse_overlay_version.call_count == 3
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_overlay_stream_renderer.py
+"""
+Unit tests for streaming overlay frames into FFmpeg's stdin.
+
+A small shell script stands in for FFmpeg and counts the bytes it is piped,
+so the tests exercise the real stdin writer and backpressure.
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from app.enums import VideoQuality
+from app.services.video_pipeline import ffmpeg_runner as runner_module
+from app.services.video_pipeline import ffmpeg_utils as ffmpeg_utils_module
+from app.services.video_pipeline import overlay_stream_renderer as stream_module
+from app.services.video_pipeline.ffmpeg_runner import run_ffmpeg
+from app.services.video_pipeline.ffmpeg_utils import build_rawvideo_command
+from app.services.video_pipeline.overlay_stream_renderer import (
+    RenderedFrameStream,
+    generate_video_with_streamed_overlays,
+)
+
+FRAME_SIZE = (8, 6)
+FRAME_BYTES = FRAME_SIZE[0] * FRAME_SIZE[1] * 3
+
+
+QUIET_LOGGERS = [runner_module, ffmpeg_utils_module, stream_module]
+
+
+def solid_frame(index: int, size=FRAME_SIZE) -> Image.Image:
+    """RGBA frame whose red channel encodes its index."""
+    return Image.new("RGBA", size, (index % 256, 0, 0, 255))
+
+
+@pytest.mark.unit
+class TestRenderedFrameStream:
+    """Test ordering, the render-ahead bound and error propagation."""
+
+    def test_frames_are_ordered_and_bounded(self):
+        """Out-of-order completion still yields frames in index order."""
+        in_flight = []
+        lock = threading.Lock()
+        active = [0]
+
+        def render(index):
+            with lock:
+                active[0] += 1
+                in_flight.append(active[0])
+            time.sleep(0.01 if index % 2 == 0 else 0)
+            with lock:
+                active[0] -= 1
+            return solid_frame(index)
+
+        stream = RenderedFrameStream(
+            12, render, FRAME_SIZE, max_workers=4, queue_frames=3
+        )
+        frames = list(stream)
+
+        assert [frame[0] for frame in frames] == list(range(12))
+        assert all(len(frame) == FRAME_BYTES for frame in frames)
+        assert max(in_flight) <= 3
+        assert stream.frames_emitted == 12
+
+    def test_mismatched_frames_are_resized(self):
+        """Every emitted frame has the stream's fixed size."""
+        stream = RenderedFrameStream(
+            2, lambda index: solid_frame(index, (16, 12)), FRAME_SIZE
+        )
+
+        assert [len(frame) for frame in stream] == [FRAME_BYTES, FRAME_BYTES]
+
+    def test_render_errors_propagate(self):
+        """A failed frame stops the stream with the render error."""
+
+        def render(index):
+            if index == 1:
+                raise OSError("truncated capture")
+            return solid_frame(index)
+
+        stream = RenderedFrameStream(3, render, FRAME_SIZE)
+        next(stream)
+
+        with pytest.raises(OSError, match="truncated capture"):
+            next(stream)
+        with pytest.raises(StopIteration):
+            next(stream)
+
+
+@pytest.mark.unit
+class TestStdinPipe:
+    """Test piping frames through the FFmpeg runner."""
+
+    @pytest.fixture
+    def fake_ffmpeg(self, tmp_path):
+        """Script that writes the number of stdin bytes to its last argument."""
+        script = tmp_path / "ffmpeg"
+        script.write_text('#!/bin/sh\nfor last; do :; done\nwc -c > "$last"\n')
+        script.chmod(0o755)
+        return str(script)
+
+    def test_all_frames_reach_stdin(self, fake_ffmpeg, tmp_path):
+        """The runner writes every chunk before closing stdin."""
+        count_file = tmp_path / "count"
+        stream = RenderedFrameStream(20, solid_frame, FRAME_SIZE)
+
+        success, _ = run_ffmpeg(
+            [fake_ffmpeg, str(count_file)], timeout=10, input_chunks=stream
+        )
+
+        assert success
+        assert int(count_file.read_text()) == 20 * FRAME_BYTES
+
+    def test_short_input_fails_the_encode(self, fake_ffmpeg, tmp_path):
+        """A producer error is reported even though FFmpeg exits cleanly."""
+
+        def chunks():
+            yield b"\0" * FRAME_BYTES
+            raise OSError("unreadable frame")
+
+        success, output = run_ffmpeg(
+            [fake_ffmpeg, str(tmp_path / "count")], timeout=10, input_chunks=chunks()
+        )
+
+        assert not success
+        assert "unreadable frame" in output
+
+
+@pytest.mark.unit
+class TestStreamedVideoGeneration:
+    """Test the streamed render entry point."""
+
+    def test_rawvideo_command_reads_stdin(self):
+        """Raw RGB frames of the given size are read from pipe:0."""
+        cmd = build_rawvideo_command(
+            (1920, 1080), "out.mp4", 30.0, VideoQuality.HIGH, 90
+        )
+
+        assert cmd[cmd.index("-i") + 1] == "pipe:0"
+        assert cmd[cmd.index("-s") + 1] == "1920x1080"
+        assert "rgb24" in cmd and "transpose=1" in cmd[cmd.index("-vf") + 1]
+        assert cmd[-1] == "out.mp4"
+
+    def test_output_is_published_after_success(self, tmp_path):
+        """Frames are streamed to a temp file that is renamed on success."""
+        output_path = tmp_path / "video.mp4"
+        received = []
+
+        def fake_execute(cmd, input_chunks=None, **kwargs):
+            received.extend(input_chunks)
+            Path(cmd[-1]).write_bytes(b"mp4")
+            return True, "Success"
+
+        with patch.object(
+            ffmpeg_utils_module, "execute_ffmpeg_command", side_effect=fake_execute
+        ):
+            success, _, metadata = generate_video_with_streamed_overlays(
+                5, solid_frame, str(output_path), framerate=10.0
+            )
+
+        assert success
+        assert len(received) == 5
+        assert output_path.read_bytes() == b"mp4"
+        assert metadata["overlay_streamed"] and not metadata["overlay_images_used"]
+        assert metadata["duration_seconds"] == 0.5
+        assert list(tmp_path.iterdir()) == [output_path]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_parallel_encoder.py
+"""
+Unit tests for parallel chunked video encoding.
+
+FFmpeg execution is replaced with a fake that writes the requested output
+file, so the tests exercise chunk sizing, concurrency and progress.
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.enums import VideoQuality
+from app.services.video_pipeline import parallel_encoder as encoder_module
+from app.services.video_pipeline.parallel_encoder import (
+    FrameChunk,
+    calculate_chunk_count,
+    encode_chunks,
+    split_frame_ranges,
+)
+
+QUIET_LOGGERS = [encoder_module]
+
+
+@pytest.mark.unit
+class TestChunkSizing:
+    """Test chunk count and range derivation."""
+
+    def test_chunk_count_limited_by_cores(self):
+        """Each encoder gets at least two cores."""
+        assert calculate_chunk_count(100_000, cpu_count=16) == 8
+
+    def test_chunk_count_limited_by_frames(self):
+        """Short videos are not split into tiny chunks."""
+        assert calculate_chunk_count(300, cpu_count=64) == 2
+        assert calculate_chunk_count(50, cpu_count=64) == 1
+
+    def test_chunk_count_respects_configured_maximum(self):
+        """A configured maximum caps the chunk count."""
+        assert calculate_chunk_count(100_000, cpu_count=64, max_chunks=4) == 4
+
+    def test_ranges_are_contiguous_and_balanced(self):
+        """Ranges cover every frame once, in order, differing by at most one."""
+        ranges = split_frame_ranges(10, 3)
+
+        assert ranges == [(0, 4), (4, 7), (7, 10)]
+        assert split_frame_ranges(2, 5) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.unit
+class TestEncodeChunks:
+    """Test concurrent chunk encoding."""
+
+    def test_chunks_encode_concurrently_and_report_progress(self, tmp_path):
+        """Chunks run in parallel and progress is reported per chunk."""
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def fake_encode(frames, output_path, *args):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            Path(output_path).write_bytes(b"video")
+            with lock:
+                active["now"] -= 1
+            return True, ""
+
+        chunks = [
+            FrameChunk(frames=["f"] * 5, output_path=str(tmp_path / f"c{i}.mp4"))
+            for i in range(4)
+        ]
+        reports = []
+
+        with patch.object(
+            encoder_module.ffmpeg_utils, "encode_frame_chunk", side_effect=fake_encode
+        ):
+            success, _ = encode_chunks(
+                chunks,
+                24.0,
+                VideoQuality.MEDIUM,
+                0,
+                max_workers=4,
+                progress_callback=lambda p: reports.append(
+                    (p.chunks_completed, p.percent)
+                ),
+            )
+
+        assert success
+        assert active["peak"] > 1
+        assert [completed for completed, _ in reports] == [1, 2, 3, 4]
+        assert reports[-1][1] == 100
+
+    def test_failed_chunk_fails_encode(self, tmp_path):
+        """A failing chunk is reported with its file name."""
+        chunks = [FrameChunk(frames=["f"], output_path=str(tmp_path / "c0.mp4"))]
+
+        with patch.object(
+            encoder_module.ffmpeg_utils,
+            "encode_frame_chunk",
+            return_value=(False, "encoder crashed"),
+        ):
+            success, error = encode_chunks(
+                chunks, 24.0, VideoQuality.MEDIUM, 0, max_workers=2
+            )
+
+        assert not success
+        assert "c0.mp4" in error
+        assert "encoder crashed" in error
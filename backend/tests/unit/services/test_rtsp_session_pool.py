@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_rtsp_session_pool.py
+"""
+Unit tests for the persistent per-camera RTSP session pool.
+
+The OpenCV capture is mocked so the tests exercise session reuse, reopening,
+eviction and liveness checks without a live stream.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.services.capture_pipeline import rtsp_session_pool as pool_module
+from app.services.capture_pipeline.rtsp_session_pool import RTSPSessionPool
+
+OPEN_CAPTURE = "app.services.capture_pipeline.rtsp_utils.open_rtsp_capture"
+
+
+def _make_capture(opened: bool = True, grab: bool = True) -> MagicMock:
+    """Create a mock VideoCapture that delivers a small frame."""
+    cap = MagicMock()
+    cap.isOpened.return_value = opened
+    cap.grab.return_value = grab
+    cap.retrieve.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+    return cap
+
+
+QUIET_LOGGERS = [pool_module]
+
+
+@pytest.fixture
+def pool():
+    """Provide a session pool and close it after the test."""
+    session_pool = RTSPSessionPool(keepalive_seconds=60, idle_timeout_seconds=60)
+    yield session_pool
+    session_pool.close_all()
+
+
+@pytest.mark.unit
+class TestRTSPSessionPool:
+    """Test RTSPSessionPool session management."""
+
+    def test_session_reused_between_captures(self, pool):
+        """A second capture for the same camera reuses the open stream."""
+        cap = _make_capture()
+        with patch(OPEN_CAPTURE, return_value=cap) as open_capture:
+            assert pool.capture_frame(1, "rtsp://cam1") is not None
+            assert pool.capture_frame(1, "rtsp://cam1") is not None
+
+        assert open_capture.call_count == 1
+        stats = pool.get_stats()
+        assert stats["sessions_opened"] == 1
+        assert stats["sessions_reused"] == 1
+        assert stats["open_camera_ids"] == [1]
+
+    def test_changed_url_replaces_session(self, pool):
+        """Changing a camera's URL closes the old stream and opens a new one."""
+        first, second = _make_capture(), _make_capture()
+        with patch(OPEN_CAPTURE, side_effect=[first, second]) as open_capture:
+            pool.capture_frame(1, "rtsp://old")
+            pool.capture_frame(1, "rtsp://new")
+
+        assert open_capture.call_count == 2
+        first.release.assert_called()
+
+    def test_stale_session_is_reopened(self, pool):
+        """A session that stops delivering frames is transparently reopened."""
+        stale, fresh = _make_capture(), _make_capture()
+        with patch(OPEN_CAPTURE, side_effect=[stale, fresh]):
+            pool.capture_frame(1, "rtsp://cam1")
+            stale.grab.return_value = False
+            frame = pool.capture_frame(1, "rtsp://cam1")
+
+        assert frame is not None
+        assert pool.get_stats()["sessions_reopened"] == 1
+
+    def test_failed_open_returns_none(self, pool):
+        """An unreachable stream yields no frame and no lingering session."""
+        with patch(OPEN_CAPTURE, return_value=_make_capture(opened=False)):
+            assert pool.capture_frame(1, "rtsp://down") is None
+
+        assert pool.get_stats()["open_sessions"] == 0
+        assert pool.get_stats()["capture_failures"] == 1
+
+    def test_liveness_requires_open_session(self, pool):
+        """Liveness is only answered from an existing session."""
+        assert pool.check_liveness(1, "rtsp://cam1", timeout_seconds=1) is None
+
+        with patch(OPEN_CAPTURE, return_value=_make_capture()):
+            pool.capture_frame(1, "rtsp://cam1")
+
+        assert pool.check_liveness(1, "rtsp://cam1", timeout_seconds=1) is True
+        assert pool.check_liveness(1, "rtsp://other", timeout_seconds=1) is None
+
+    def test_evict_idle_sessions(self, pool):
+        """Sessions idle past the timeout are closed."""
+        cap = _make_capture()
+        with patch(OPEN_CAPTURE, return_value=cap):
+            pool.capture_frame(1, "rtsp://cam1")
+
+        pool.idle_timeout_seconds = 0
+        assert pool.evict_idle_sessions() == 1
+        assert pool.get_stats()["open_sessions"] == 0
+        cap.release.assert_called()
+
+    def test_max_sessions_evicts_least_recently_used(self, pool):
+        """Opening beyond the limit evicts the least recently used session."""
+        pool.max_sessions = 2
+        with patch(OPEN_CAPTURE, side_effect=lambda *args: _make_capture()):
+            pool.capture_frame(1, "rtsp://cam1")
+            pool.capture_frame(2, "rtsp://cam2")
+            pool.capture_frame(3, "rtsp://cam3")
+
+        assert sorted(pool.get_stats()["open_camera_ids"]) == [2, 3]
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_segment_renderer.py
+"""
+Unit tests for the segmented (incremental) video renderer.
+
+FFmpeg execution is replaced with a fake that writes the requested output
+file, so the tests exercise segment planning, reuse and invalidation.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.enums import VideoQuality
+from app.services.video_pipeline import segment_renderer as renderer_module
+from app.services.video_pipeline.segment_renderer import SegmentedVideoRenderer
+
+
+def _fake_execute(cmd, timeout=300, capture_output=True, **kwargs):
+    """Pretend to run FFmpeg by writing the output file."""
+    Path(cmd[-1]).write_bytes(b"video")
+    return True, ""
+
+
+QUIET_LOGGERS = [renderer_module]
+
+
+@pytest.fixture
+def frames(tmp_path):
+    """Ten small frame files in a flat images directory."""
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    paths = []
+    for i in range(10):
+        frame = images_dir / f"frame_{i:03d}.jpg"
+        frame.write_bytes(b"jpeg")
+        paths.append(str(frame))
+    return paths
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    """Renderer with 4-frame segments and mocked FFmpeg."""
+    with patch.object(
+        renderer_module.ffmpeg_utils,
+        "execute_ffmpeg_command",
+        side_effect=_fake_execute,
+    ) as execute, patch.object(
+        renderer_module.ffmpeg_utils,
+        "create_image_list_file",
+        side_effect=lambda files, **kwargs: str(tmp_path / f"list_{len(files)}.txt"),
+    ):
+        segment_renderer = SegmentedVideoRenderer(str(tmp_path / "segments"), 4)
+        segment_renderer.execute = execute
+        yield segment_renderer
+
+
+def _render(renderer, frames, tmp_path, **kwargs):
+    with patch.object(
+        renderer_module.ffmpeg_utils, "select_video_frames", return_value=frames
+    ):
+        return renderer.render(
+            timelapse_id=1,
+            images_directory=tmp_path / "images",
+            output_path=str(tmp_path / "out.mp4"),
+            **kwargs,
+        )
+
+
+def _plan(renderer, frames, fps=24.0):
+    return renderer.plan_segments(1, frames, fps, VideoQuality.MEDIUM, 0, "none")
+
+
+@pytest.mark.unit
+class TestSegmentedVideoRenderer:
+    """Test segment planning, reuse and invalidation."""
+
+    def test_plan_splits_into_fixed_size_segments(self, renderer, frames):
+        """Frames are split into fixed-size ranges with a short last segment."""
+        segments = _plan(renderer, frames)
+
+        assert [(s.start_frame, s.end_frame) for s in segments] == [
+            (0, 4),
+            (4, 8),
+            (8, 10),
+        ]
+        assert _plan(renderer, frames) == segments
+
+    def test_settings_change_every_key(self, renderer, frames):
+        """Different render settings never reuse segments."""
+        base = _plan(renderer, frames)
+        other_fps = _plan(renderer, frames, fps=30.0)
+
+        assert all(a.key != b.key for a, b in zip(base, other_fps))
+
+    def test_changed_frame_invalidates_only_its_segment(self, renderer, frames):
+        """Touching one frame changes only the key of the segment holding it."""
+        before = _plan(renderer, frames)
+        stat = os.stat(frames[5])
+        os.utime(frames[5], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        after = _plan(renderer, frames)
+
+        assert [a.key == b.key for a, b in zip(before, after)] == [True, False, True]
+
+    def test_rerender_encodes_only_new_frames(self, renderer, frames, tmp_path):
+        """A grown timelapse re-encodes only the trailing segments."""
+        success, _, metadata = _render(renderer, frames[:8], tmp_path)
+        assert success
+        assert metadata["segments_encoded"] == 2
+
+        success, _, metadata = _render(renderer, frames, tmp_path)
+        assert success
+        assert metadata["segments_reused"] == 2
+        assert metadata["segments_encoded"] == 1
+        assert metadata["image_count"] == 10
+
+    def test_stale_segments_are_pruned(self, renderer, frames, tmp_path):
+        """Segments from earlier settings are deleted after a render."""
+        _render(renderer, frames, tmp_path, framerate=24.0)
+        _render(renderer, frames, tmp_path, framerate=30.0)
+
+        cached = list(renderer.get_timelapse_cache_directory(1).glob("seg_*.mp4"))
+        assert len(cached) == 3
+
+    def test_failed_segment_fails_render(self, renderer, frames, tmp_path):
+        """An encoding failure is reported instead of producing a partial video."""
+        # Segments encode concurrently, so every call must fail the same way
+        renderer.execute.side_effect = lambda *args, **kwargs: (False, "boom")
+
+        success, message, _ = _render(renderer, frames, tmp_path)
+
+        assert not success
+        assert "boom" in message
+        assert not list(renderer.get_timelapse_cache_directory(1).glob("seg_*.mp4"))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_settings_snapshot.py
+"""
+Unit tests for the per-process settings snapshot.
+
+Database access is mocked, so the tests check snapshot swapping and
+ordering, that services read from the snapshot instead of the database,
+and that settings writes notify other processes in their transaction.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.constants import SETTINGS_NOTIFY_CHANNEL
+from app.database.settings_operations import SyncSettingsOperations
+from app.enums import LogLevel
+from app.services import settings_service as settings_service_module
+from app.services import settings_snapshot as snapshot_module
+from app.services.logger.utils import settings_cache as logger_cache_module
+from app.services.logger.utils.settings_cache import LoggerSettingsCache
+from app.services.settings_service import SettingsService, SyncSettingsService
+from app.services.settings_snapshot import SettingsSnapshotStore
+
+QUIET_LOGGERS = [settings_service_module]
+
+
+@pytest.fixture
+def store():
+    """Provide a fresh store wired into the services under test."""
+    snapshot_store = SettingsSnapshotStore()
+    with patch.object(
+        settings_service_module,
+        "get_settings_snapshot_store",
+        return_value=snapshot_store,
+    ), patch.object(
+        logger_cache_module,
+        "get_settings_snapshot_store",
+        return_value=snapshot_store,
+    ):
+        yield snapshot_store
+
+
+def _sync_ops_returning(values):
+    ops = MagicMock()
+    ops.get_all_settings.return_value = values
+    return ops
+
+
+@pytest.mark.unit
+class TestSettingsSnapshotStore:
+    """Test snapshot loading and swapping."""
+
+    def test_reload_swaps_in_new_immutable_snapshot(self, store):
+        """Each load produces a new, read-only snapshot with a higher version."""
+        with patch.object(
+            snapshot_module,
+            "SyncSettingsOperations",
+            side_effect=[
+                _sync_ops_returning({"timezone": "UTC"}),
+                _sync_ops_returning({"timezone": "Europe/Berlin"}),
+            ],
+        ):
+            first = store.reload_sync(MagicMock())
+            second = store.reload_sync(MagicMock())
+
+        assert first.get("timezone") == "UTC"
+        assert store.snapshot is second
+        assert second.version > first.version
+        assert second.get("timezone") == "Europe/Berlin"
+        with pytest.raises(TypeError):
+            second.values["timezone"] = "UTC"
+
+    def test_slow_older_load_does_not_replace_newer(self, store):
+        """A load that started first but finished last is discarded."""
+        older = store._begin_load()
+        newer = store._begin_load()
+
+        store._install(newer, {"timezone": "Europe/Berlin"})
+        store._install(older, {"timezone": "UTC"})
+
+        assert store.snapshot.get("timezone") == "Europe/Berlin"
+
+    def test_invalidate_discards_load_in_progress(self, store):
+        """Results of loads started before a drop are not installed."""
+        in_flight = store._begin_load()
+        store.invalidate()
+
+        store._install(in_flight, {"timezone": "UTC"})
+
+        assert store.snapshot is None
+
+
+@pytest.mark.unit
+class TestSnapshotReads:
+    """Test that services read the snapshot instead of the database."""
+
+    def test_sync_service_reads_snapshot(self, store):
+        """Loaded settings are served without a database query."""
+        service = SyncSettingsService(MagicMock())
+        service.settings_ops = MagicMock()
+        store._install(store._begin_load(), {"corruption_score_threshold": "40"})
+
+        assert service.get_setting("timezone", "UTC") == "UTC"
+        assert service.get_corruption_settings().corruption_score_threshold == 40
+        service.settings_ops.get_setting.assert_not_called()
+        service.settings_ops.get_corruption_settings.assert_not_called()
+
+    def test_sync_service_falls_back_without_snapshot(self, store):
+        """Before the first load settings are read from the database."""
+        service = SyncSettingsService(MagicMock())
+        service.settings_ops = MagicMock()
+        service.settings_ops.get_setting.return_value = "UTC"
+
+        assert service.get_setting("timezone") == "UTC"
+        service.settings_ops.get_setting.assert_called_once_with("timezone", None)
+
+    def test_logger_settings_parsed_once_per_snapshot(self, store):
+        """Logger settings follow the snapshot version without TTLs."""
+        cache = LoggerSettingsCache()
+        store._install(store._begin_load(), {"db_log_level": "debug"})
+        assert cache.get_setting_sync("db_log_level") == LogLevel.DEBUG
+
+        store._install(store._begin_load(), {"db_log_level": "error"})
+        assert cache.get_setting_sync("db_log_level") == LogLevel.ERROR
+        assert cache.get_setting_sync("file_log_max_files") == 10
+
+    def test_write_reloads_snapshot_of_writing_process(self, store):
+        """A settings write is visible to the next read in the same process."""
+        store._install(store._begin_load(), {"timezone": "UTC"})
+        service = SettingsService(MagicMock())
+        service.settings_ops = MagicMock()
+        service.settings_ops.set_setting = AsyncMock(return_value=True)
+        service.settings_ops.get_all_settings = AsyncMock(
+            return_value={"timezone": "Europe/Berlin"}
+        )
+        service.sse_ops = MagicMock()
+        service.sse_ops.create_event = AsyncMock()
+
+        async def scenario():
+            with patch.object(
+                snapshot_module, "SettingsOperations", return_value=service.settings_ops
+            ):
+                await service.set_setting("data_directory", "/data")
+            return await service.get_setting("timezone")
+
+        assert asyncio.run(scenario()) == "Europe/Berlin"
+
+
+@pytest.mark.unit
+class TestSettingsNotify:
+    """Test that settings writes notify the other processes."""
+
+    def test_sync_write_notifies_in_same_transaction(self):
+        """The NOTIFY runs on the write's connection, so it fires on commit."""
+        db = MagicMock()
+        cur = db.get_connection.return_value.__enter__.return_value.cursor.return_value
+        cur = cur.__enter__.return_value
+
+        assert SyncSettingsOperations(db).set_setting("timezone", "UTC")
+
+        notify_query, notify_params = cur.execute.call_args_list[-1].args
+        assert "pg_notify" in notify_query
+        assert notify_params == (SETTINGS_NOTIFY_CHANNEL, "timezone")
+        assert db.get_connection.call_count == 1
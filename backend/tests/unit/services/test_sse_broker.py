@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# backend/tests/unit/services/test_sse_broker.py
+"""
+Unit tests for the in-process SSE broker.
+
+Database reads are mocked so the tests exercise fan-out, per-client resume
+and slow-client handling without a LISTEN connection.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import sse_broker as broker_module
+from app.services.sse_broker import SSEBroker
+
+
+def _event(event_id: int) -> dict:
+    return {
+        "id": event_id,
+        "type": "image_captured",
+        "data": {"n": event_id},
+        "timestamp": None,
+    }
+
+
+def _drain(subscriber) -> list:
+    items = []
+    while not subscriber.queue.empty():
+        items.append(subscriber.queue.get_nowait())
+    return items
+
+
+QUIET_LOGGERS = [broker_module]
+
+
+@pytest.fixture(autouse=True)
+def quiet_cache_invalidation():
+    """Avoid requiring the cache backend."""
+    with patch.object(
+        broker_module.CacheInvalidationService,
+        "handle_sse_event",
+        AsyncMock(),
+    ):
+        yield
+
+
+@pytest.fixture
+def broker():
+    """Provide a broker with mocked event operations."""
+    sse_broker = SSEBroker(MagicMock(), queue_size=4, replay_buffer_size=10)
+    sse_broker.sse_ops = MagicMock()
+    sse_broker.sse_ops.get_latest_event_id = AsyncMock(return_value=0)
+    sse_broker.sse_ops.get_events_after = AsyncMock(return_value=[])
+    sse_broker.sse_ops.mark_events_processed = AsyncMock(return_value=0)
+    return sse_broker
+
+
+@pytest.mark.unit
+class TestSSEBroker:
+    """Test SSEBroker fan-out and resume."""
+
+    def test_events_fan_out_to_all_subscribers(self, broker):
+        """Every subscriber receives every event (no stealing)."""
+
+        async def scenario():
+            first = await broker.subscribe()
+            second = await broker.subscribe()
+            await broker._publish([_event(1), _event(2)])
+            return _drain(first), _drain(second)
+
+        first, second = asyncio.run(scenario())
+        assert [e["id"] for e in first] == [1, 2]
+        assert [e["id"] for e in second] == [1, 2]
+        broker.sse_ops.mark_events_processed.assert_awaited_once_with([1, 2])
+
+    def test_resume_from_replay_buffer(self, broker):
+        """A resuming client gets only events after its cursor, without a DB read."""
+
+        async def scenario():
+            await broker._publish([_event(1), _event(2), _event(3)])
+            broker._last_event_id = 3
+            return _drain(await broker.subscribe(last_event_id=1))
+
+        events = asyncio.run(scenario())
+        assert [e["id"] for e in events] == [2, 3]
+        broker.sse_ops.get_events_after.assert_not_awaited()
+
+    def test_resume_older_than_buffer_reads_database(self, broker):
+        """A cursor older than the buffer replays from the database first."""
+        broker.sse_ops.get_events_after = AsyncMock(return_value=[_event(2), _event(3)])
+
+        async def scenario():
+            await broker._publish([_event(3), _event(4)])
+            broker._last_event_id = 4
+            return _drain(await broker.subscribe(last_event_id=1))
+
+        events = asyncio.run(scenario())
+        assert [e["id"] for e in events] == [2, 3, 4]
+
+    def test_slow_subscriber_is_dropped(self, broker):
+        """A full queue ends the stream instead of blocking other clients."""
+
+        async def scenario():
+            slow = await broker.subscribe()
+            await broker._publish([_event(i) for i in range(1, 7)])
+            return slow
+
+        slow = asyncio.run(scenario())
+        items = _drain(slow)
+        assert items[-1] is None
+        assert slow.closed
+        assert broker.get_stats()["subscribers"] == 0
+        assert broker.get_stats()["subscribers_dropped"] == 1
+
+    def test_fetch_new_events_advances_cursor(self, broker):
+        """Fetching publishes new events and moves the broker cursor."""
+        broker._last_event_id = 5
+        broker.sse_ops.get_events_after = AsyncMock(
+            side_effect=[[_event(6), _event(7)]]
+        )
+
+        async def scenario():
+            subscriber = await broker.subscribe()
+            await broker._fetch_new_events()
+            return _drain(subscriber)
+
+        events = asyncio.run(scenario())
+        assert [e["id"] for e in events] == [6, 7]
+        assert broker.get_stats()["last_event_id"] == 7
+        assert broker._is_already_seen("7")
+
+    def test_late_commit_below_cursor_is_delivered(self, broker):
+        """An event committed after a higher ID was published still goes out."""
+        broker._last_event_id = 99
+        broker.sse_ops.get_events_after = AsyncMock(
+            side_effect=[[_event(101)], [_event(100), _event(101)]]
+        )
+
+        async def scenario():
+            subscriber = await broker.subscribe()
+            await broker._fetch_new_events()
+            assert not broker._is_already_seen("100")
+            await broker._fetch_new_events()
+            return _drain(subscriber)
+
+        events = asyncio.run(scenario())
+        assert [e["id"] for e in events] == [101, 100]
+        assert broker.sse_ops.get_events_after.await_args_list[1].args[0] == 99
+        assert broker.get_stats()["pending_gaps"] == 0
+        assert broker._is_already_seen("100")
+
+    def test_gap_expires_after_grace_period(self, broker):
+        """A skipped ID that never commits stops widening the read window."""
+        broker._last_event_id = 1
+        broker.sse_ops.get_events_after = AsyncMock(side_effect=[[_event(3)], []])
+
+        async def scenario():
+            await broker._fetch_new_events()
+            broker._pending_gaps[2] -= broker_module.SSE_BROKER_GAP_GRACE_SECONDS + 1
+            await broker._fetch_new_events()
+
+        asyncio.run(scenario())
+        assert broker.get_stats()["pending_gaps"] == 0
+        assert broker.sse_ops.get_events_after.await_args_list[1].args[0] == 3
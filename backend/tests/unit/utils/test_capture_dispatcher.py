@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_capture_dispatcher.py
+"""
+Unit tests for the heap-based timelapse capture dispatcher.
+"""
+
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.database.scheduled_job_operations import SyncScheduledJobOperations
+from app.workers.utils import capture_dispatcher as dispatcher_module
+from app.workers.utils.capture_dispatcher import (
+    CaptureDispatcher,
+    CaptureWindow,
+    build_capture_window,
+)
+
+START = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+QUIET_LOGGERS = [dispatcher_module]
+
+
+@pytest.fixture
+def dispatcher():
+    """Dispatcher in UTC at START with mocked persistence and captures."""
+    time_utils = MagicMock()
+    time_utils.get_timezone.return_value = ZoneInfo("UTC")
+    with patch.object(dispatcher_module, "utc_now", return_value=START):
+        yield CaptureDispatcher(MagicMock(), AsyncMock(), time_utils, max_batch=3)
+
+
+@pytest.mark.unit
+class TestCaptureWindow:
+    """Test window membership and next opening."""
+
+    def test_next_open_for_normal_and_overnight_windows(self):
+        """Outside times move to the next start; inside times stay."""
+        day = CaptureWindow(start=time(6, 0), end=time(18, 0))
+        night = CaptureWindow(start=time(22, 0), end=time(6, 0))
+        evening = datetime(2025, 6, 1, 20, 0, tzinfo=timezone.utc)
+
+        assert day.next_open(evening) == datetime(2025, 6, 2, 6, 0, tzinfo=timezone.utc)
+        assert night.next_open(evening) == datetime(
+            2025, 6, 1, 22, 0, tzinfo=timezone.utc
+        )
+        assert night.next_open(evening.replace(hour=23)) == evening.replace(hour=23)
+
+    def test_sun_window_applies_offsets(self):
+        """Sunrise/sunset windows use the latest sun times plus offsets."""
+        sun_times = (
+            datetime(2025, 6, 1, 3, 30, tzinfo=timezone.utc),
+            datetime(2025, 6, 1, 19, 15, tzinfo=timezone.utc),
+        )
+        window = build_capture_window(
+            {
+                "time_window_type": "sunrise_sunset",
+                "sunrise_offset_minutes": -30,
+                "sunset_offset_minutes": 45,
+            },
+            sun_times,
+            ZoneInfo("Europe/Berlin"),
+        )
+
+        assert window == CaptureWindow(start=time(5, 0), end=time(22, 0))
+        assert (
+            build_capture_window(
+                {"time_window_type": "sunrise_sunset"}, None, ZoneInfo("UTC")
+            )
+            is None
+        )
+        assert build_capture_window(
+            {"time_window_start": "08:00", "time_window_end": time(17, 30)},
+            None,
+            ZoneInfo("UTC"),
+        ) == CaptureWindow(start=time(8, 0), end=time(17, 30))
+
+
+@pytest.mark.unit
+class TestCaptureDispatcher:
+    """Test heap scheduling, batching and bulk persistence."""
+
+    def test_pops_due_timelapses_in_batches_on_cadence(self, dispatcher):
+        """Only due entries pop, at most max_batch per call, without drift."""
+        for timelapse_id in range(1, 6):
+            dispatcher.schedule(timelapse_id, 60, first_run=START)
+        dispatcher.schedule(9, 60, first_run=START + timedelta(hours=1))
+
+        late = START + timedelta(seconds=150)
+        first = dispatcher.pop_due(late)
+        second = dispatcher.pop_due(late)
+
+        assert len(first) == 3 and sorted(first + second) == [1, 2, 3, 4, 5]
+        assert dispatcher.pop_due(late) == []
+        # Missed runs are coalesced onto the original cadence
+        assert dispatcher.get_next_run_time(1) == START + timedelta(seconds=180)
+
+    def test_unscheduled_and_rescheduled_entries_are_skipped(self, dispatcher):
+        """Stale heap items never dispatch."""
+        dispatcher.schedule(1, 60, first_run=START)
+        dispatcher.schedule(2, 60, first_run=START)
+        dispatcher.unschedule(1)
+        dispatcher.schedule(2, 600, first_run=START + timedelta(hours=1))
+
+        assert dispatcher.pop_due(START + timedelta(seconds=1)) == []
+        assert dispatcher.get_scheduled_ids() == [2]
+
+    def test_due_times_are_gated_by_window(self, dispatcher):
+        """Due times outside the window jump to the window opening."""
+        window = CaptureWindow(start=time(6, 0), end=time(18, 0))
+        evening = START.replace(hour=17, minute=59)
+        dispatcher.schedule(1, 300, window=window, first_run=evening)
+
+        assert dispatcher.pop_due(evening) == [1]
+        assert dispatcher.get_next_run_time(1) == datetime(
+            2025, 6, 2, 6, 0, tzinfo=timezone.utc
+        )
+
+    async def test_tick_dispatches_and_persists_in_one_statement(self, dispatcher):
+        """A tick starts every due capture and writes all timings at once."""
+        captures_may_finish = asyncio.Event()
+
+        async def capture(_timelapse_id):
+            await captures_may_finish.wait()
+
+        dispatcher.capture_func.side_effect = capture
+        for timelapse_id in (1, 2):
+            dispatcher.schedule(timelapse_id, 60, first_run=START)
+        dispatcher.flush_timings()
+        dispatcher.scheduled_job_ops.reset_mock()
+
+        with patch.object(
+            dispatcher_module, "utc_now", return_value=START + timedelta(seconds=1)
+        ):
+            assert await dispatcher.tick() == 2
+            captures_may_finish.set()
+            await asyncio.gather(*dispatcher._tasks)
+            dispatcher.flush_timings()
+
+        assert sorted(
+            call.args[0] for call in dispatcher.capture_func.await_args_list
+        ) == [1, 2]
+        bulk = dispatcher.scheduled_job_ops.bulk_update_job_timings
+        assert bulk.call_count == 2  # Tick (next/last run) + results
+        timings = {t["job_id"]: t for t in bulk.call_args_list[0].args[0]}
+        assert timings["timelapse_capture_1"]["next_run_time"] == START + timedelta(
+            seconds=60
+        )
+        assert "last_success_time" in bulk.call_args_list[1].args[0][0]
+        dispatcher.scheduled_job_ops.update_job_timing.assert_not_called()
+
+    def test_bulk_timing_update_is_one_execute(self):
+        """All job timings are written with a single UPDATE ... FROM unnest."""
+        db = MagicMock()
+        cursor = (
+            db.get_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        )
+        cursor.rowcount = 2
+
+        updated = SyncScheduledJobOperations(db).bulk_update_job_timings(
+            [
+                {"job_id": "timelapse_capture_1", "next_run_time": START},
+                {"job_id": "timelapse_capture_2", "last_run_time": START},
+            ]
+        )
+
+        assert updated == 2
+        cursor.execute.assert_called_once()
+        query, params = cursor.execute.call_args[0]
+        assert "unnest" in query
+        assert params["job_ids"] == ["timelapse_capture_1", "timelapse_capture_2"]
+        assert params["next_run_times"] == [START, None]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_capture_executor.py
+"""
+Unit tests for the dedicated capture executor.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.workers.utils import capture_executor as executor_module
+from app.workers.utils.capture_executor import CaptureExecutor
+
+QUIET_LOGGERS = [executor_module]
+
+
+class _ConcurrencyProbe:
+    """Blocking callable that records the peak number of parallel calls."""
+
+    def __init__(self, duration: float = 0.05):
+        self.duration = duration
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, value):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.duration)
+        with self._lock:
+            self.active -= 1
+        return value
+
+
+async def _run_all(executor: CaptureExecutor, hosts, probe):
+    return await asyncio.gather(
+        *[
+            executor.run(host, probe, index, apply_jitter=False)
+            for index, host in enumerate(hosts)
+        ]
+    )
+
+
+@pytest.mark.unit
+class TestCaptureExecutor:
+    """Test CaptureExecutor limits and timing."""
+
+    def test_get_host_key(self):
+        """Host keys come from the URL host name."""
+        assert (
+            CaptureExecutor.get_host_key("rtsp://user:pw@NVR.local:554/ch1")
+            == "nvr.local"
+        )
+        assert CaptureExecutor.get_host_key(None) == "unknown"
+
+    def test_per_host_limit(self):
+        """Captures against one host never exceed the per-host limit."""
+        executor = CaptureExecutor(max_concurrent=8, max_concurrent_per_host=2)
+        probe = _ConcurrencyProbe()
+        try:
+            results = asyncio.run(_run_all(executor, ["nvr"] * 6, probe))
+        finally:
+            executor.shutdown()
+
+        assert results == list(range(6))
+        assert probe.peak == 2
+
+    def test_global_limit(self):
+        """Captures across hosts never exceed the global limit."""
+        executor = CaptureExecutor(max_concurrent=3, max_concurrent_per_host=3)
+        probe = _ConcurrencyProbe()
+        try:
+            asyncio.run(_run_all(executor, [f"cam{i}" for i in range(9)], probe))
+        finally:
+            executor.shutdown()
+
+        assert probe.peak == 3
+
+    def test_stats_report_queue_wait_and_failures(self):
+        """Queued captures report wait time and failures are counted."""
+        executor = CaptureExecutor(max_concurrent=1, max_concurrent_per_host=1)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        async def scenario():
+            await _run_all(executor, ["a", "b"], _ConcurrencyProbe(0.05))
+            with pytest.raises(RuntimeError):
+                await executor.run("a", fail, apply_jitter=False)
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        stats = executor.get_stats()
+        assert stats["completed"] == 2
+        assert stats["failed"] == 1
+        assert stats["queued"] == 0
+        assert stats["active"] == 0
+        assert stats["max_queue_wait_seconds"] >= 0.04
+
+    def test_jitter_delays_start(self):
+        """Jittered captures record the applied start offset."""
+        executor = CaptureExecutor(
+            max_concurrent=1, max_concurrent_per_host=1, max_jitter_seconds=0.01
+        )
+        try:
+            asyncio.run(executor.run("a", lambda: None))
+        finally:
+            executor.shutdown()
+
+        timing = executor.get_stats()["recent"][0]
+        assert 0 <= timing["jitter_seconds"] <= 0.01
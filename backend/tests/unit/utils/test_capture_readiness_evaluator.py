@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_capture_readiness_evaluator.py
+"""
+Unit tests for batched, async capture readiness evaluation.
+"""
+
+import asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.capture_pipeline.capture_context import build_capture_context
+from app.services.scheduling import capture_timing_service as timing_module
+from app.services.scheduling.capture_timing_service import SyncCaptureTimingService
+from app.services.scheduling.time_window_service import SyncTimeWindowService
+from app.workers.utils import capture_readiness_evaluator as evaluator_module
+from app.workers.utils.capture_readiness_evaluator import CaptureReadinessEvaluator
+
+
+def _context(timelapse_id, camera_status="active"):
+    """Capture context of a running timelapse on its own camera."""
+    return build_capture_context(
+        {
+            "id": timelapse_id,
+            "camera_id": timelapse_id + 100,
+            "status": "running",
+            "start_date": date(2025, 6, 1),
+            "capture_interval_seconds": 300,
+            "created_at": datetime(2025, 6, 1, 8, 0),
+            "updated_at": datetime(2025, 6, 1, 8, 0),
+            "camera": {
+                "id": timelapse_id + 100,
+                "name": f"Camera {timelapse_id}",
+                "rtsp_url": "rtsp://192.168.1.10/stream",
+                "status": camera_status,
+                "health_status": "online",
+                "created_at": "2025-05-01T08:00:00",
+                "updated_at": "2025-05-01T08:00:00",
+            },
+            "settings": {"timezone": "UTC"},
+        }
+    )
+
+
+QUIET_LOGGERS = [evaluator_module, timing_module]
+
+
+@pytest.fixture
+def evaluator():
+    """Evaluator using the real readiness rules and no database."""
+    scheduling_service = SyncCaptureTimingService(
+        MagicMock(),
+        MagicMock(),
+        SyncTimeWindowService(MagicMock(), MagicMock()),
+        MagicMock(),
+    )
+    return CaptureReadinessEvaluator(
+        scheduling_service, MagicMock(), batch_window_seconds=0.01
+    )
+
+
+@pytest.mark.unit
+class TestCaptureReadinessEvaluator:
+    """Test coalescing and per-timelapse verdicts."""
+
+    async def test_requests_in_one_tick_share_one_query(self, evaluator):
+        """Concurrent checks are answered from a single context load."""
+        load = AsyncMock(
+            return_value={1: _context(1), 2: _context(2, camera_status="inactive")}
+        )
+
+        with patch.object(evaluator_module, "load_capture_contexts", load):
+            ready, disabled, missing = await asyncio.gather(
+                evaluator.validate(1), evaluator.validate(2), evaluator.validate(3)
+            )
+
+        load.assert_awaited_once()
+        assert sorted(load.await_args.args[1]) == [1, 2, 3]
+        assert ready.valid and ready.capture_context.timelapse_id == 1
+        assert not disabled.valid and disabled.error_type == "camera_disabled"
+        assert not missing.valid and missing.error_type == "timelapse_not_found"
+        assert evaluator.get_stats()["largest_batch"] == 3
+
+    async def test_later_requests_start_a_new_batch(self, evaluator):
+        """Requests after a flush are not lost and get their own query."""
+        load = AsyncMock(side_effect=lambda db, ids: {i: _context(i) for i in ids})
+
+        with patch.object(evaluator_module, "load_capture_contexts", load):
+            first = await evaluator.validate(1)
+            second, duplicate = await asyncio.gather(
+                evaluator.validate(2), evaluator.validate(2)
+            )
+
+        assert first.valid and second.valid and duplicate.valid
+        assert load.await_count == 2
+        assert load.await_args.args[1] == [2]
+
+    async def test_load_failure_fails_every_request(self, evaluator):
+        """A failed query yields a validation error for each timelapse."""
+        load = AsyncMock(side_effect=RuntimeError("pool exhausted"))
+
+        with patch.object(evaluator_module, "load_capture_contexts", load):
+            results = await asyncio.gather(evaluator.validate(1), evaluator.validate(2))
+
+        assert [r.error_type for r in results] == ["validation_error"] * 2
+        assert "pool exhausted" in results[0].error
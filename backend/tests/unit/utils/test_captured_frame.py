@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_captured_frame.py
+"""
+Unit tests for the in-memory captured frame handoff.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.utils.captured_frame import (
+    CapturedFrame,
+    RecentFrameCache,
+    open_captured_image,
+    recent_frame_cache,
+)
+
+
+def _frame(width: int = 1920, height: int = 1080) -> np.ndarray:
+    """Create a BGR frame with a pure blue fill."""
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[:, :, 0] = 255
+    return frame
+
+
+@pytest.mark.unit
+class TestCapturedFrame:
+    """Test CapturedFrame derived representations."""
+
+    def test_downscaled_fits_target_and_is_cached(self):
+        """Downscaled frame fits 800x600 and is only computed once."""
+        captured = CapturedFrame(_frame())
+        downscaled = captured.downscaled
+
+        assert downscaled.shape[1] <= 800 and downscaled.shape[0] <= 600
+        assert captured.downscaled is downscaled
+
+    def test_small_frame_is_not_upscaled(self):
+        """Frames already within the target size are returned unchanged."""
+        frame = _frame(640, 480)
+        assert CapturedFrame(frame).downscaled is frame
+
+    def test_to_pil_image_converts_bgr_to_rgb(self):
+        """PIL conversion swaps channel order."""
+        image = CapturedFrame(_frame(8, 8)).to_pil_image()
+        assert image.size == (8, 8)
+        assert image.getpixel((0, 0)) == (0, 0, 255)
+
+    def test_gray_matches_resolution(self):
+        """Grayscale frame keeps the frame dimensions."""
+        captured = CapturedFrame(_frame(16, 8))
+        assert captured.gray.shape == (8, 16)
+        assert captured.resolution == (16, 8)
+
+
+@pytest.mark.unit
+class TestRecentFrameCache:
+    """Test RecentFrameCache behaviour."""
+
+    def test_put_get_and_discard(self, tmp_path):
+        """Frames are found by path until discarded."""
+        cache = RecentFrameCache(max_entries=2, ttl_seconds=60)
+        path = tmp_path / "capture.jpg"
+        captured = CapturedFrame(_frame(4, 4), path)
+
+        cache.put(path, captured)
+        assert cache.get(str(path)) is captured
+
+        cache.discard(path)
+        assert cache.get(path) is None
+        assert cache.get_stats()["hits"] == 1
+
+    def test_oldest_entry_evicted_when_full(self, tmp_path):
+        """The cache never holds more than max_entries frames."""
+        cache = RecentFrameCache(max_entries=2, ttl_seconds=60)
+        for index in range(3):
+            cache.put(tmp_path / f"{index}.jpg", CapturedFrame(_frame(4, 4)))
+
+        assert cache.get(tmp_path / "0.jpg") is None
+        assert cache.get(tmp_path / "2.jpg") is not None
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        """Entries older than the TTL are treated as missing."""
+        cache = RecentFrameCache(max_entries=2, ttl_seconds=60)
+        captured = CapturedFrame(_frame(4, 4))
+        captured.created_at -= 61
+        cache.put(tmp_path / "a.jpg", captured)
+
+        assert cache.get(tmp_path / "a.jpg") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_open_captured_image_prefers_cache(self, tmp_path):
+        """Cached frames are served without touching the file."""
+        path = tmp_path / "missing.jpg"
+        recent_frame_cache.put(path, CapturedFrame(_frame(8, 8), path))
+        try:
+            with open_captured_image(path) as image:
+                assert image.size == (8, 8)
+        finally:
+            recent_frame_cache.discard(path)
+
+    def test_open_captured_image_falls_back_to_file(self, tmp_path):
+        """Uncached paths are decoded from disk."""
+        path = tmp_path / "disk.jpg"
+        Image.new("RGB", (10, 6)).save(path)
+
+        with open_captured_image(path) as image:
+            assert image.size == (10, 6)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_dirty_rect_compositor.py
+"""
+Unit tests for dirty-rectangle overlay compositing.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image, ImageChops
+
+from app.services.overlay_pipeline.utils.dirty_rect_compositor import (
+    DirtyRectCompositor,
+    blend_over,
+)
+
+FRAME_SIZE = (200, 120)
+
+
+def _rectangle(box, fill):
+    """Draw callback filling a frame-space box."""
+
+    def draw_element(_target, draw, offset_x, offset_y):
+        draw.rectangle(
+            (
+                box[0] - offset_x,
+                box[1] - offset_y,
+                box[2] - 1 - offset_x,
+                box[3] - 1 - offset_y,
+            ),
+            fill=fill,
+        )
+
+    return draw_element
+
+
+def _compositor(*elements):
+    """Build a compositor from (box, fill) pairs."""
+    compositor = DirtyRectCompositor(FRAME_SIZE)
+    for box, fill in elements:
+        compositor.add(box, _rectangle(box, fill))
+    return compositor
+
+
+@pytest.mark.unit
+@pytest.mark.overlay
+class TestDirtyRectCompositor:
+    """Test blending parity and region bookkeeping."""
+
+    @pytest.mark.parametrize("dst_alpha", [255, None])
+    def test_blend_matches_pillow_alpha_composite(self, dst_alpha):
+        """NumPy blend is bit-identical to Image.alpha_composite."""
+        rng = np.random.default_rng(16)
+        dst = rng.integers(0, 256, (64, 64, 4), dtype=np.uint8)
+        src = rng.integers(0, 256, (64, 64, 4), dtype=np.uint8)
+        src[:8, :, 3] = 0
+        if dst_alpha is not None:
+            dst[..., 3] = dst_alpha
+
+        expected = np.array(
+            Image.alpha_composite(Image.fromarray(dst), Image.fromarray(src))
+        )
+        blend_over(dst, src)
+
+        assert np.array_equal(dst, expected)
+
+    @pytest.mark.parametrize("opacity", [100, 65])
+    def test_composite_matches_full_frame_path(self, opacity):
+        """Region blending equals the full-frame layer path, overlaps included."""
+        compositor = _compositor(
+            ((10, 10, 60, 40), (255, 0, 0, 180)),
+            ((40, 25, 90, 70), (0, 0, 255, 120)),
+            ((150, 90, 230, 140), (255, 255, 255, 255)),
+        )
+        base = Image.new("RGBA", FRAME_SIZE, (30, 120, 60, 255))
+
+        expected = compositor.composite_full_frame(base, opacity)
+        actual = compositor.composite(base.copy(), opacity)
+
+        assert ImageChops.difference(expected, actual).getbbox() is None
+
+    def test_overlapping_boxes_merge_and_clip(self):
+        """Overlapping elements share a region; off-frame parts are dropped."""
+        compositor = _compositor(
+            ((10, 10, 60, 40), "red"),
+            ((150, 90, 230, 140), "white"),
+            ((40, 25, 90, 70), "blue"),
+            ((300, 300, 320, 320), "green"),
+        )
+
+        boxes = sorted(region.box for region in compositor.regions())
+
+        assert boxes == [(10, 10, 90, 70), (150, 90, 200, 120)]
+        merged = next(r for r in compositor.regions() if r.box[0] == 10)
+        assert [order for order, _draw in merged.elements] == [0, 2]
+        assert not DirtyRectCompositor(FRAME_SIZE).render_patches()
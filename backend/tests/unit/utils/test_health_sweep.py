@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_health_sweep.py
+"""
+Unit tests for concurrent camera health sweeps.
+
+Probes are plain functions and the database is mocked, so the tests check
+the concurrency cap, per-camera backoff and that one sweep stores all its
+results with a single batched UPDATE.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.database.camera_operations import AsyncCameraOperations, CameraQueryBuilder
+from app.workers import health_worker as health_worker_module
+from app.workers.health_worker import HealthWorker
+from app.workers.utils import health_sweep as sweep_module
+from app.workers.utils.health_sweep import HealthSweep
+
+QUIET_LOGGERS = [sweep_module, (health_worker_module, "health_logger")]
+
+
+def _camera(camera_id: int):
+    return SimpleNamespace(
+        id=camera_id, name=f"cam-{camera_id}", rtsp_url=f"rtsp://10.0.0.{camera_id}/s"
+    )
+
+
+def _result(success: bool, error=None):
+    return SimpleNamespace(success=success, error=error)
+
+
+def _sweep_sequence(sweep: HealthSweep, cameras, sweeps: int):
+    """Run several sweeps and return the probed camera ids of each."""
+
+    async def scenario():
+        probed = []
+        for _ in range(sweeps):
+            results = await sweep.run(cameras)
+            probed.append([result.camera_id for result in results])
+        return probed
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.unit
+class TestHealthSweep:
+    """Test the sweep engine."""
+
+    def test_probes_run_concurrently_up_to_cap(self):
+        """Slow probes overlap, but never more than max_concurrent at once."""
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+
+        def probe(camera_id, rtsp_url):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+            return _result(True)
+
+        sweep = HealthSweep(probe, max_concurrent=3)
+        started = time.perf_counter()
+        results = asyncio.run(sweep.run([_camera(i) for i in range(1, 10)]))
+        elapsed = time.perf_counter() - started
+        sweep.shutdown()
+
+        assert len(results) == 9 and all(result.success for result in results)
+        assert running["peak"] == 3
+        assert elapsed < 9 * 0.05
+
+    def test_offline_camera_backs_off_and_recovers(self):
+        """Each failure doubles the skipped sweeps; a success resets them."""
+        online = {1: True, 2: False}
+        sweep = HealthSweep(
+            lambda camera_id, url: _result(online[camera_id], "timeout"),
+            max_concurrent=2,
+            max_backoff_sweeps=2,
+        )
+        cameras = [_camera(1), _camera(2)]
+
+        probed = _sweep_sequence(sweep, cameras, 7)
+
+        # Camera 2 fails at sweeps 1, 3 and 6: skips 1, then 2, then 2 (capped)
+        assert [2 in ids for ids in probed] == [
+            True,
+            False,
+            True,
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert all(1 in ids for ids in probed)
+
+        online[2] = True
+        sweep.record(2, True)
+        assert [2 in ids for ids in _sweep_sequence(sweep, cameras, 2)] == [True, True]
+        sweep.shutdown()
+
+    def test_probe_errors_count_as_offline(self):
+        """An exception from the probe is reported as an offline result."""
+
+        def probe(camera_id, rtsp_url):
+            raise RuntimeError("cv2 exploded")
+
+        sweep = HealthSweep(probe, max_concurrent=1)
+        [result] = asyncio.run(sweep.run([_camera(4)]))
+        sweep.shutdown()
+
+        assert result.as_connectivity_update() == (4, False, "cv2 exploded")
+        assert sweep.get_stats()["cameras_backing_off"] == 1
+
+
+@pytest.mark.unit
+class TestBatchedConnectivityUpdate:
+    """Test that a sweep writes its results in one statement."""
+
+    def test_query_joins_values_list(self):
+        """All rows are applied with one UPDATE ... FROM (VALUES ...)."""
+        query = CameraQueryBuilder.build_batch_connectivity_update_query(2)
+        params = CameraQueryBuilder.get_batch_connectivity_params(
+            [(1, True, "stale"), (2, False, "timeout")], datetime(2025, 6, 1)
+        )
+
+        assert "FROM (VALUES (%(camera_id_0)s::integer" in query
+        assert "%(camera_id_1)s::integer" in query
+        assert "WHERE c.id = v.camera_id" in query
+        assert "RETURNING c.id" in query
+        assert params["error_message_0"] is None
+        assert params["error_message_1"] == "timeout"
+
+    def test_ops_run_one_execute_and_clear_changed(self):
+        """Only cameras whose connectivity changed get their caches cleared."""
+        db = MagicMock()
+        cur = AsyncMock()
+        cur.fetchall.return_value = [{"id": 2}]
+        conn = MagicMock()
+        conn.cursor.return_value.__aenter__.return_value = cur
+        db.get_connection.return_value.__aenter__.return_value = conn
+
+        ops = AsyncCameraOperations(db, MagicMock())
+        ops._clear_camera_caches = AsyncMock()
+
+        changed = asyncio.run(
+            ops.update_cameras_connectivity([(1, True, None), (2, False, "timeout")])
+        )
+
+        assert changed == [2]
+        cur.execute.assert_awaited_once()
+        ops._clear_camera_caches.assert_awaited_once()
+        assert asyncio.run(ops.update_cameras_connectivity([])) == []
+
+    def test_worker_stores_sweep_in_one_call(self):
+        """The health worker hands all probe results to one batched update."""
+        rtsp_service = MagicMock()
+        rtsp_service.evict_idle_sessions.return_value = 0
+        rtsp_service.check_connection_liveness.side_effect = lambda camera_id, url: (
+            _result(camera_id != 2, "timeout")
+        )
+        async_camera_service = MagicMock()
+        async_camera_service.get_active_cameras = AsyncMock(
+            return_value=[_camera(1), _camera(2), _camera(3)]
+        )
+        async_camera_service.update_cameras_connectivity = AsyncMock(return_value=[2])
+
+        async def scenario():
+            worker = HealthWorker(MagicMock(), rtsp_service, async_camera_service)
+            await worker.check_camera_health()
+            await worker.cleanup()
+
+        asyncio.run(scenario())
+
+        async_camera_service.update_cameras_connectivity.assert_awaited_once_with(
+            [(1, True, None), (2, False, "timeout"), (3, True, None)]
+        )
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# backend/tests/unit/utils/test_zip_stream.py
+"""
+Unit tests for streamed ZIP exports.
+
+Files are real temporary files and the export query is mocked, so the tests
+check that the streamed archive is valid, stores media without deflating it,
+never holds a whole file in one chunk and skips missing images.
+"""
+
+import asyncio
+import io
+import os
+import zipfile
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.database.image_operations import ImageQueryBuilder
+from app.services import image_service as image_service_module
+from app.services.image_service import ImageService
+from app.utils.zip_stream import ZipStreamWriter
+
+QUIET_LOGGERS = [image_service_module]
+
+
+@pytest.fixture
+def frames(tmp_path):
+    """Two JPEG-named frames and a text file under a data directory."""
+    (tmp_path / "frames").mkdir()
+    (tmp_path / "frames" / "a.jpg").write_bytes(os.urandom(300_000))
+    (tmp_path / "frames" / "b.jpg").write_bytes(os.urandom(1_000))
+    (tmp_path / "notes.txt").write_bytes(b"timelapse " * 1_000)
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestZipStreamWriter:
+    """Test the incremental archive writer."""
+
+    def test_streamed_archive_is_valid(self, frames):
+        """Chunks concatenate to a valid ZIP; media is stored, text deflated."""
+        writer = ZipStreamWriter(chunk_size=64 * 1024)
+        chunks = list(writer.add_file(frames / "frames" / "a.jpg", "a.jpg"))
+        chunks += list(writer.add_file(frames / "notes.txt", "notes.txt"))
+        chunks.append(writer.close())
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+        assert archive.testzip() is None
+        assert archive.read("a.jpg") == (frames / "frames" / "a.jpg").read_bytes()
+        assert archive.getinfo("a.jpg").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("notes.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert max(len(chunk) for chunk in chunks) <= 64 * 1024
+        assert writer.entry_count == 2
+
+    def test_missing_file_raises_before_writing(self, frames):
+        """A file that cannot be opened leaves the archive untouched."""
+        writer = ZipStreamWriter()
+
+        with pytest.raises(OSError):
+            writer.add_file(frames / "missing.jpg", "missing.jpg")
+
+        archive = zipfile.ZipFile(io.BytesIO(writer.close()))
+        assert archive.namelist() == []
+
+
+@pytest.mark.unit
+class TestImageExport:
+    """Test the export query and the streamed bulk download."""
+
+    def test_export_query_filters_and_orders(self):
+        """Date ranges are inclusive of end_date and rows come in capture order."""
+        query, params = ImageQueryBuilder.build_export_query(
+            timelapse_id=7, start_date=date(2025, 6, 1), end_date=date(2025, 6, 30)
+        )
+
+        assert "timelapse_id = %(timelapse_id)s" in query
+        assert "captured_at < %(end_date_exclusive)s" in query
+        assert "ORDER BY captured_at ASC, id ASC" in query
+        assert params["end_date_exclusive"] == date(2025, 7, 1)
+        with pytest.raises(ValueError):
+            ImageQueryBuilder.build_export_query()
+
+    def test_stream_skips_missing_files(self, frames):
+        """Images without a file are left out instead of failing the download."""
+        rows = [
+            {"id": 1, "file_path": "frames/a.jpg"},
+            {"id": 2, "file_path": "frames/gone.jpg"},
+            {"id": 3, "file_path": "frames/b.jpg"},
+        ]
+
+        async def iter_export_images(**filters):
+            assert filters["timelapse_id"] == 7
+            for row in rows:
+                yield row
+
+        service = ImageService(MagicMock(), MagicMock())
+        service.async_image_ops = MagicMock()
+        service.async_image_ops.iter_export_images = iter_export_images
+
+        async def collect():
+            stream = service.stream_bulk_download(timelapse_id=7)
+            return [chunk async for chunk in stream]
+
+        with patch.object(service, "_get_data_directory", return_value=str(frames)):
+            chunks = asyncio.run(collect())
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert archive.namelist() == ["image_1_a.jpg", "image_3_b.jpg"]
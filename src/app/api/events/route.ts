@@ -35,11 +35,18 @@ export async function GET(request: NextRequest) {
 
         console.log(`📡 Connecting to FastAPI SSE: ${backendSSEUrl}`)
 
+        // Forward the browser's resume cursor so missed events are replayed
+        const headers: Record<string, string> = {
+          Accept: "text/event-stream",
+          "Cache-Control": "no-cache",
+        }
+        const lastEventId = request.headers.get("last-event-id")
+        if (lastEventId) {
+          headers["Last-Event-ID"] = lastEventId
+        }
+
         const response = await fetch(backendSSEUrl, {
-          headers: {
-            Accept: "text/event-stream",
-            "Cache-Control": "no-cache",
-          },
+          headers,
           // @ts-ignore - Next.js supports streaming but types might not reflect it
           signal: request.signal,
         })
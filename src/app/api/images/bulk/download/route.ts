@@ -1,14 +1,26 @@
 import { NextRequest, NextResponse } from "next/server"
-import { proxyToFastAPI } from "@/lib/fastapi-proxy"
+
+const FASTAPI_URL = process.env.NEXT_PUBLIC_FASTAPI_URL || "http://localhost:8000"
 
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json()
 
-    // Use the standardized proxy utility
-    return proxyToFastAPI("/api/images/bulk/download", {
+    // Pass the ZIP stream straight through instead of buffering the archive
+    const response = await fetch(`${FASTAPI_URL}/api/images/bulk/download`, {
       method: "POST",
-      body,
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body),
+      signal: request.signal,
+    })
+
+    return new NextResponse(response.body, {
+      status: response.status,
+      headers: {
+        "Content-Type":
+          response.headers.get("content-type") || "application/octet-stream",
+        "Content-Disposition": response.headers.get("content-disposition") || "",
+      },
     })
   } catch (error) {
     console.error("Bulk download error:", error)
@@ -0,0 +1,31 @@
+// src/app/api/images/export/route.ts
+import { NextRequest, NextResponse } from "next/server"
+
+const FASTAPI_URL = process.env.NEXT_PUBLIC_FASTAPI_URL || "http://localhost:8000"
+
+export async function GET(request: NextRequest) {
+  try {
+    const { searchParams } = new URL(request.url)
+
+    // Pass the ZIP stream straight through instead of buffering the archive
+    const response = await fetch(
+      `${FASTAPI_URL}/api/images/export?${searchParams.toString()}`,
+      { signal: request.signal }
+    )
+
+    return new NextResponse(response.body, {
+      status: response.status,
+      headers: {
+        "Content-Type":
+          response.headers.get("content-type") || "application/octet-stream",
+        "Content-Disposition": response.headers.get("content-disposition") || "",
+      },
+    })
+  } catch (error) {
+    console.error("Image export error:", error)
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    )
+  }
+}